@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""Switchmap-NG SNMP result decoding benchmark script."""
+
+# Standard libraries
+import sys
+import os
+import argparse
+import random
+import time
+from collections import namedtuple
+
+# Try to create a working PYTHONPATH
+_SYS_DIRECTORY = os.path.dirname(os.path.realpath(__file__))
+_BIN_DIRECTORY = os.path.abspath(os.path.join(_SYS_DIRECTORY, os.pardir))
+_ROOT_DIRECTORY = os.path.abspath(os.path.join(_BIN_DIRECTORY, os.pardir))
+if (
+    _SYS_DIRECTORY.endswith("{0}switchmap-ng{0}bin{0}tools".format(os.sep))
+    is True
+):
+    sys.path.append(_ROOT_DIRECTORY)
+else:
+    print(
+        'This script is not installed in the "switchmap-ng{0}bin{0}tools" '
+        "directory. Please fix.".format(os.sep)
+    )
+    sys.exit(2)
+
+# Import app libraries
+from switchmap.poller.snmp import snmp_manager
+from switchmap.core import general
+
+# Same fields as the easysnmp SNMPVariable object
+_VARBIND = namedtuple("_VARBIND", "oid oid_index value snmp_type")
+
+# dot1qTpFdbPort and dot1qTpFdbAddress
+_FDBPORT = ".1.3.6.1.2.1.17.7.1.2.2.1.2"
+_FDBADDRESS = ".1.3.6.1.2.1.17.7.1.2.2.1.1"
+
+# Number of times each test is run
+_RUNS = 5
+
+
+def main():
+    """Compare the speed of the previous and current decoding functions.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+    # Header for the help menu of the application
+    parser = argparse.ArgumentParser(
+        description="""\
+This script measures the number of SNMP varbinds per second decoded by \
+the poller when walking a large 802.1Q forwarding database.""",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    parser.add_argument(
+        "--rows",
+        default=200000,
+        type=int,
+        help="Number of rows in the forwarding database.",
+    )
+    args = parser.parse_args()
+
+    # Create the walk results
+    (ports, addresses) = _fdb(args.rows)
+
+    # Test
+    print("Decoding {} varbinds".format(args.rows))
+    _compare(
+        "dot1qTpFdbPort walk",
+        lambda: _format_results(ports, _FDBPORT),
+        lambda: snmp_manager._format_results(ports, _FDBPORT),
+        args.rows,
+    )
+    _compare(
+        "dot1qTpFdbAddress walk",
+        lambda: _format_results(addresses, _FDBADDRESS),
+        lambda: snmp_manager._format_results(addresses, _FDBADDRESS),
+        args.rows,
+    )
+    values = snmp_manager._format_results(addresses, _FDBADDRESS).values()
+    _compare(
+        "MAC address decoding",
+        lambda: [_octetstr_2_string(_) for _ in values],
+        lambda: [general.octetstr_2_string(_) for _ in values],
+        args.rows,
+    )
+
+
+def _fdb(rows):
+    """Create the results of walking an 802.1Q forwarding database.
+
+    Args:
+        rows: Number of rows
+
+    Returns:
+        result: Tuple of lists of varbinds. (dot1qTpFdbPort, dot1qTpFdbAddress)
+
+    """
+    # Initialize key variables
+    ports = []
+    addresses = []
+    generator = random.Random(rows)
+
+    # Create rows
+    for row in range(rows):
+        octets = [generator.randrange(256) for _ in range(6)]
+        index = "{}.{}".format(row % 1000 + 1, ".".join(str(_) for _ in octets))
+        ports.append(
+            _VARBIND(
+                oid=_FDBPORT,
+                oid_index=index,
+                value=str(generator.randrange(1, 49)),
+                snmp_type="INTEGER",
+            )
+        )
+        addresses.append(
+            _VARBIND(
+                oid=_FDBADDRESS,
+                oid_index=index,
+                value="".join(chr(_) for _ in octets),
+                snmp_type="OCTETSTR",
+            )
+        )
+
+    # Return
+    result = (ports, addresses)
+    return result
+
+
+def _compare(title, before, after, rows):
+    """Print the varbinds per second decoded by two functions.
+
+    Args:
+        title: Title of the test
+        before: Function using the previous decoding
+        after: Function using the current decoding
+        rows: Number of varbinds decoded by each function
+
+    Returns:
+        None
+
+    """
+    # Time each function. Use the best of several runs to reduce the
+    # effects of garbage collection and other processes.
+    timings = []
+    for function in [before, after]:
+        fastest = None
+        for _ in range(_RUNS):
+            start = time.perf_counter()
+            function()
+            duration = time.perf_counter() - start
+            if fastest is None or duration < fastest:
+                fastest = duration
+        timings.append(fastest)
+
+    # Print
+    print(
+        "{:<24} before: {:>10,.0f}/s  after: {:>10,.0f}/s  ({:.1f}x)".format(
+            title,
+            rows / timings[0],
+            rows / timings[1],
+            timings[0] / timings[1],
+        )
+    )
+
+
+def _format_results(results, mock_filter):
+    """Format SNMP walk results the way the poller used to.
+
+    Args:
+        results: List of results
+        mock_filter: The original OID to get
+
+    Returns:
+        return_results: Formatted results as OID-value pairs
+
+    """
+    # Initialize key variables
+    return_results = {}
+
+    for result in results:
+        # Recreate the OID
+        oid = "{}.{}".format(result.oid, result.oid_index)
+
+        # Ignore unwanted OIDs
+        if mock_filter not in oid:
+            continue
+
+        # Process the rest
+        return_results[oid] = _convert(result)
+
+    # Return
+    return return_results
+
+
+def _convert(result):
+    """Convert SNMP values the way the poller used to.
+
+    Args:
+        result: Named tuple containing SNMP result
+
+    Returns:
+        converted: Converted value
+
+    """
+    # Initialize key values
+    value = result.value
+    snmp_type = result.snmp_type
+
+    # Convert
+    if snmp_type.upper() == "OCTETSTR":
+        converted = bytes(value, "utf-8")
+    elif snmp_type.upper() == "OPAQUE":
+        converted = bytes(value, "utf-8")
+    elif snmp_type.upper() == "BITS":
+        converted = bytes(value, "utf-8")
+    elif snmp_type.upper() == "IPADDR":
+        converted = bytes(value, "utf-8")
+    elif snmp_type.upper() == "NETADDR":
+        converted = bytes(value, "utf-8")
+    elif snmp_type.upper() == "OBJECTID":
+        converted = bytes(str(value), "utf-8")
+    elif snmp_type.upper() == "NOSUCHOBJECT":
+        converted = None
+    elif snmp_type.upper() == "NOSUCHINSTANCE":
+        converted = None
+    elif snmp_type.upper() == "ENDOFMIBVIEW":
+        converted = None
+    elif snmp_type.upper() == "NULL":
+        converted = None
+    else:
+        converted = int(value)
+
+    # Return
+    return converted
+
+
+def _octetstr_2_string(bytes_string):
+    """Convert SNMP OCTETSTR to string the way the poller used to.
+
+    Args:
+        bytes_string: Binary value to convert
+
+    Returns:
+        result: String equivalent of bytes_string
+
+    """
+    # Convert and return
+    octet_string = bytes_string.decode("utf-8")
+    result = "".join(["%0.2x" % ord(_) for _ in octet_string])
+    return result.lower()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""Switchmap-NG poller benchmark script."""
+
+# Standard libraries
+import sys
+import os
+import argparse
+import multiprocessing
+import resource
+import shutil
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import yaml
+
+# Try to create a working PYTHONPATH
+_SYS_DIRECTORY = os.path.dirname(os.path.realpath(__file__))
+_BIN_DIRECTORY = os.path.abspath(os.path.join(_SYS_DIRECTORY, os.pardir))
+_ROOT_DIRECTORY = os.path.abspath(os.path.join(_BIN_DIRECTORY, os.pardir))
+if (
+    _SYS_DIRECTORY.endswith("{0}switchmap-ng{0}bin{0}tools".format(os.sep))
+    is True
+):
+    sys.path.append(_ROOT_DIRECTORY)
+else:
+    print(
+        'This script is not installed in the "switchmap-ng{0}bin{0}tools" '
+        "directory. Please fix.".format(os.sep)
+    )
+    sys.exit(2)
+
+# Import app libraries
+from switchmap.poller import poll
+from switchmap.poller.snmp import replay
+from switchmap.poller.snmp import synthetic
+from switchmap.poller.snmp import timing
+from switchmap.poller.configuration import ConfigPoller
+from switchmap.core import files
+
+# Polling engines. "serial" polls one device at a time.
+_ENGINES = ("threads", "multiprocessing", "serial")
+
+
+def main():
+    """Poll synthetic devices and print the cost of polling them.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+    # Header for the help menu of the application
+    parser = argparse.ArgumentParser(
+        description="""\
+This script polls synthetic devices with poll.devices(), the way the \
+poller daemon does, without a network or database. SNMP queries are \
+answered from memory and the polling data is posted to a local web server \
+that discards it. The devices polled per second, SNMP PDUs per device, \
+peak memory and CPU time are displayed on the screen.""",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    parser.add_argument(
+        "--devices",
+        default=100,
+        type=int,
+        help="Number of devices to poll.",
+    )
+    parser.add_argument(
+        "--vendor",
+        default="mixed",
+        choices=synthetic.VENDORS + ("mixed",),
+        help="Vendor flavour of the devices.",
+    )
+    parser.add_argument(
+        "--ports",
+        default=synthetic.PROFILE().ports,
+        type=int,
+        help="Number of ports of each device.",
+    )
+    parser.add_argument(
+        "--vlans",
+        default=synthetic.PROFILE().vlans,
+        type=int,
+        help="Number of VLANs of each device.",
+    )
+    parser.add_argument(
+        "--fdb",
+        default=synthetic.PROFILE().fdb,
+        type=int,
+        help="Number of MAC addresses in the forwarding database.",
+    )
+    parser.add_argument(
+        "--arp",
+        default=synthetic.PROFILE().arp,
+        type=int,
+        help="Number of ARP table entries of each device.",
+    )
+    parser.add_argument(
+        "--neighbors",
+        default=synthetic.PROFILE().neighbors,
+        type=int,
+        help="Number of LLDP or CDP neighbors of each device.",
+    )
+    parser.add_argument(
+        "--engine",
+        default="threads",
+        choices=_ENGINES,
+        help="Polling engine.",
+    )
+    parser.add_argument(
+        "--workers",
+        default=20,
+        type=int,
+        help="Number of devices polled at the same time.",
+    )
+    parser.add_argument(
+        "--latency",
+        default=0,
+        type=float,
+        help="Round trip time of each SNMP PDU in seconds.",
+    )
+    parser.add_argument(
+        "--loss",
+        default=0,
+        type=float,
+        help="Probability of each SNMP PDU being lost.",
+    )
+    parser.add_argument(
+        "--timeout",
+        default=1.0,
+        type=float,
+        help="""\
+Seconds to wait for an SNMP PDU that is lost or not answered. Cisco \
+devices don't answer queries for unused SNMP context name styles.""",
+    )
+    parser.add_argument(
+        "--batch",
+        default=0,
+        type=int,
+        help="Number of devices posted together. 0 posts one at a time.",
+    )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Compress the data posted with gzip.",
+    )
+    parser.add_argument(
+        "--seed",
+        default=0,
+        type=int,
+        help="Seed of the random number generators.",
+    )
+    args = parser.parse_args()
+
+    # Child processes must inherit the SNMP answers
+    if args.engine == "multiprocessing":
+        if multiprocessing.get_start_method() != "fork":
+            print("The multiprocessing engine needs forked processes.")
+            sys.exit(2)
+
+    # Create the devices
+    profile = synthetic.PROFILE(
+        vendor=None if args.vendor == "mixed" else args.vendor,
+        ports=args.ports,
+        vlans=args.vlans,
+        fdb=args.fdb,
+        arp=args.arp,
+        neighbors=args.neighbors,
+    )
+    captures = synthetic.captures(args.devices, profile, seed=args.seed)
+    replay.install(
+        replay.Replay(
+            captures=captures,
+            latency=args.latency,
+            loss=args.loss,
+            timeout=args.timeout,
+            seed=args.seed,
+        )
+    )
+
+    # Poll
+    directory = tempfile.mkdtemp()
+    server = _server()
+    try:
+        _configure(directory, sorted(captures), server, args)
+        del captures
+        baseline = _rusage()
+        start = time.perf_counter()
+        poll.devices(multiprocessing=args.engine != "serial")
+        duration = time.perf_counter() - start
+        usage = _rusage()
+        report = timing.aggregate(files.timing_directory(ConfigPoller()))
+    finally:
+        server.shutdown()
+        shutil.rmtree(directory, ignore_errors=True)
+
+    # Print
+    devices = max(report["devices"], 1)
+    pdus = sum(_["pdus"] for _ in report["queries"])
+    cpu = usage.cpu - baseline.cpu
+    for title, value in [
+        ("Devices polled", report["devices"]),
+        ("Posts received", server.posts),
+        ("Wall time (s)", round(duration, 3)),
+        ("Devices per second", round(report["devices"] / duration, 2)),
+        ("SNMP PDUs per device", round(pdus / devices, 1)),
+        ("CPU time (s)", round(cpu, 3)),
+        ("CPU time per device (ms)", round(cpu * 1000 / devices, 3)),
+        ("Peak RSS before polling (MiB)", round(baseline.rss / 1024, 1)),
+        ("Peak RSS (MiB)", round(usage.rss / 1024, 1)),
+        ("Peak RSS of child processes (MiB)", round(usage.children / 1024, 1)),
+        ("Data posted (MiB)", round(server.size / 1048576, 1)),
+    ]:
+        print("{:<36} {:>12}".format(title, value))
+
+
+def _configure(directory, hostnames, server, args):
+    """Create the configuration used to poll the synthetic devices.
+
+    Args:
+        directory: Directory for the configuration and data files
+        hostnames: List of hostnames to poll
+        server: Web server receiving the polling data
+        args: Parsed command line arguments
+
+    Returns:
+        None
+
+    """
+    # Initialize key variables
+    system_directory = os.path.join(directory, "system")
+    log_directory = os.path.join(directory, "log")
+    for path in [system_directory, log_directory]:
+        os.makedirs(path, mode=0o750, exist_ok=True)
+
+    # Create the configuration
+    config = {
+        "core": {
+            "agent_subprocesses": args.workers,
+            "log_directory": log_directory,
+            "log_level": "warning",
+            "system_directory": system_directory,
+        },
+        "poller": {
+            "polling_batch_size": args.batch,
+            "polling_compression": args.compress,
+            "polling_concurrency": args.workers,
+            "polling_zone_concurrency": args.workers,
+            "polling_engine": (
+                "multiprocessing"
+                if args.engine == "multiprocessing"
+                else "threads"
+            ),
+            "polling_timing": True,
+            "server_address": server.server_address[0],
+            "server_bind_port": server.server_address[1],
+            "snmp_groups": [
+                {
+                    "group_name": "synthetic",
+                    "snmp_community": "public",
+                    "snmp_version": 2,
+                    "enabled": True,
+                }
+            ],
+            "zones": [{"zone": "synthetic", "hostnames": hostnames}],
+        },
+    }
+    with open(os.path.join(directory, "config.yaml"), "w") as f_handle:
+        yaml.dump(config, f_handle, default_flow_style=False)
+
+    # Use the configuration
+    os.environ["SWITCHMAP_CONFIGDIR"] = directory
+
+
+def _server():
+    """Start a local web server that accepts and discards posted data.
+
+    Args:
+        None
+
+    Returns:
+        server: ThreadingHTTPServer object with "posts" and "size"
+            attributes counting the posts received and their bytes
+
+    """
+
+    class _Handler(BaseHTTPRequestHandler):
+        """Handler that accepts all posts."""
+
+        def do_POST(self):
+            """Accept a post.
+
+            Args:
+                None
+
+            Returns:
+                None
+
+            """
+            # Read the data
+            size = int(self.headers.get("Content-Length", 0))
+            self.rfile.read(size)
+            with self.server.lock:
+                self.server.posts += 1
+                self.server.size += size
+
+            # Reply
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            """Don't log requests.
+
+            Args:
+                *args: Log arguments
+
+            Returns:
+                None
+
+            """
+            pass
+
+    # Start the server
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.posts = 0
+    server.size = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    # Return
+    return server
+
+
+def _rusage():
+    """Get the resources used by the benchmark.
+
+    Args:
+        None
+
+    Returns:
+        result: Namespace of CPU seconds used, and peak RSS in KiB of the
+            process and its largest child process
+
+    """
+    # Get the usage. Child processes are counted once they have ended.
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+
+    # Return
+    result = argparse.Namespace(
+        cpu=own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime,
+        rss=own.ru_maxrss,
+        children=children.ru_maxrss,
+    )
+    return result
+
+
+if __name__ == "__main__":
+    main()
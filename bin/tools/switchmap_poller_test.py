@@ -24,6 +24,7 @@ else:
 
 # Import app libraries
 from switchmap.poller import poll
+from switchmap.poller.snmp import replay
 
 
 def main():
@@ -52,10 +53,32 @@ polling data for the host will be displayed on the screen.""",
         type=str,
         help="Hostname to test for pollability.",
     )
+    parser.add_argument(
+        "--timing",
+        action="store_true",
+        help="Print a JSON report of the time taken by each SNMP query.",
+    )
+    parser.add_argument(
+        "--record",
+        type=str,
+        help="""\
+Directory in which to save the SNMP answers of the device. \
+The capture can be replayed with switchmap_replay.py.""",
+    )
     args = parser.parse_args()
 
+    # Record the SNMP answers of the device if required
+    if bool(args.record) is True:
+        recorder = replay.Recorder(args.record)
+        replay.install(recorder)
+
     # Poll
-    poll.cli_device(args.hostname)
+    poll.cli_device(args.hostname, timed=args.timing)
+
+    # Save the recording
+    if bool(args.record) is True:
+        for filename in recorder.save():
+            print("Saved SNMP capture file {}".format(filename))
 
 
 if __name__ == "__main__":
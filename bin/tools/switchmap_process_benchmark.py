@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Switchmap-NG device data processing benchmark script."""
+
+# Standard libraries
+import sys
+import os
+import argparse
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+import yaml
+
+# Try to create a working PYTHONPATH
+_SYS_DIRECTORY = os.path.dirname(os.path.realpath(__file__))
+_BIN_DIRECTORY = os.path.abspath(os.path.join(_SYS_DIRECTORY, os.pardir))
+_ROOT_DIRECTORY = os.path.abspath(os.path.join(_BIN_DIRECTORY, os.pardir))
+if (
+    _SYS_DIRECTORY.endswith("{0}switchmap-ng{0}bin{0}tools".format(os.sep))
+    is True
+):
+    sys.path.append(_ROOT_DIRECTORY)
+else:
+    print(
+        'This script is not installed in the "switchmap-ng{0}bin{0}tools" '
+        "directory. Please fix.".format(os.sep)
+    )
+    sys.exit(2)
+
+# Import app libraries
+from switchmap.poller.snmp import poller
+from switchmap.poller.snmp import replay
+from switchmap.poller.snmp import synthetic
+from switchmap.poller.update import device as udevice
+
+
+def main():
+    """Process the polling data of a synthetic device and print its cost.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+    # Header for the help menu of the application
+    parser = argparse.ArgumentParser(
+        description="""\
+This script polls a synthetic device once, then processes its data with \
+Device.process() the way the poller does before posting it. The time and \
+peak memory used to process the data are displayed on the screen.""",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    parser.add_argument(
+        "--vendor",
+        default="cisco",
+        choices=synthetic.VENDORS,
+        help="Vendor flavour of the device.",
+    )
+    parser.add_argument(
+        "--ports",
+        default=synthetic.PROFILE().ports,
+        type=int,
+        help="Number of ports of the device.",
+    )
+    parser.add_argument(
+        "--vlans",
+        default=synthetic.PROFILE().vlans,
+        type=int,
+        help="Number of VLANs of the device.",
+    )
+    parser.add_argument(
+        "--fdb",
+        default=50000,
+        type=int,
+        help="Number of MAC addresses in the forwarding database.",
+    )
+    parser.add_argument(
+        "--arp",
+        default=synthetic.PROFILE().arp,
+        type=int,
+        help="Number of ARP table entries of the device.",
+    )
+    parser.add_argument(
+        "--neighbors",
+        default=synthetic.PROFILE().neighbors,
+        type=int,
+        help="Number of LLDP or CDP neighbors of the device.",
+    )
+    parser.add_argument(
+        "--repeat",
+        default=5,
+        type=int,
+        help="Number of times the data is processed. The fastest is shown.",
+    )
+    parser.add_argument(
+        "--seed",
+        default=0,
+        type=int,
+        help="Seed of the random number generators.",
+    )
+    args = parser.parse_args()
+
+    # Create the device
+    profile = synthetic.PROFILE(
+        vendor=args.vendor,
+        ports=args.ports,
+        vlans=args.vlans,
+        fdb=args.fdb,
+        arp=args.arp,
+        neighbors=args.neighbors,
+    )
+    captures = synthetic.captures(1, profile, seed=args.seed)
+    replay.install(replay.Replay(captures=captures, seed=args.seed))
+    hostname = sorted(captures)[0]
+    del captures
+
+    # Poll
+    directory = tempfile.mkdtemp()
+    try:
+        _configure(directory, hostname)
+        data = poller.Poll(hostname).query()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    if bool(data) is False:
+        print("The synthetic device returned no data.")
+        sys.exit(2)
+
+    # Time the processing without tracing memory, which slows it down
+    durations = []
+    for _ in range(max(1, args.repeat)):
+        start = time.perf_counter()
+        udevice.Device(data).process()
+        durations.append(time.perf_counter() - start)
+
+    # Measure the memory allocated while processing
+    tracemalloc.start()
+    udevice.Device(data).process()
+    (_, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Print
+    layer1 = data.get("layer1") or {}
+    macs = sum(len(_.get("l1_macs", [])) for _ in layer1.values())
+    for title, value in [
+        ("Ports", len(layer1)),
+        ("MAC addresses on ports", macs),
+        ("Fastest processing time (ms)", round(min(durations) * 1000, 2)),
+        ("Peak memory while processing (MiB)", round(peak / 1048576, 2)),
+    ]:
+        print("{:<36} {:>12}".format(title, value))
+
+
+def _configure(directory, hostname):
+    """Create the configuration used to poll the synthetic device.
+
+    Args:
+        directory: Directory for the configuration and data files
+        hostname: Hostname to poll
+
+    Returns:
+        None
+
+    """
+    # Initialize key variables
+    system_directory = os.path.join(directory, "system")
+    log_directory = os.path.join(directory, "log")
+    for path in [system_directory, log_directory]:
+        os.makedirs(path, mode=0o750, exist_ok=True)
+
+    # Create the configuration
+    config = {
+        "core": {
+            "log_directory": log_directory,
+            "log_level": "warning",
+            "system_directory": system_directory,
+        },
+        "poller": {
+            "snmp_groups": [
+                {
+                    "group_name": "synthetic",
+                    "snmp_community": "public",
+                    "snmp_version": 2,
+                    "enabled": True,
+                }
+            ],
+            "zones": [{"zone": "synthetic", "hostnames": [hostname]}],
+        },
+    }
+    with open(os.path.join(directory, "config.yaml"), "w") as f_handle:
+        yaml.dump(config, f_handle, default_flow_style=False)
+
+    # Use the configuration
+    os.environ["SWITCHMAP_CONFIGDIR"] = directory
+
+
+if __name__ == "__main__":
+    main()
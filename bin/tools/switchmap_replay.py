@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Switchmap-NG SNMP capture replay script."""
+
+# Standard libraries
+import sys
+import os
+import argparse
+import time
+
+# Try to create a working PYTHONPATH
+_SYS_DIRECTORY = os.path.dirname(os.path.realpath(__file__))
+_BIN_DIRECTORY = os.path.abspath(os.path.join(_SYS_DIRECTORY, os.pardir))
+_ROOT_DIRECTORY = os.path.abspath(os.path.join(_BIN_DIRECTORY, os.pardir))
+if (
+    _SYS_DIRECTORY.endswith("{0}switchmap-ng{0}bin{0}tools".format(os.sep))
+    is True
+):
+    sys.path.append(_ROOT_DIRECTORY)
+else:
+    print(
+        'This script is not installed in the "switchmap-ng{0}bin{0}tools" '
+        "directory. Please fix.".format(os.sep)
+    )
+    sys.exit(2)
+
+# Import app libraries
+from switchmap.poller.snmp import poller
+from switchmap.poller.snmp import replay
+from switchmap.poller.update import device as udevice
+
+
+def main():
+    """Poll recorded devices without a network.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+    # Header for the help menu of the application
+    parser = argparse.ArgumentParser(
+        description="""\
+This script polls devices using the SNMP answers recorded with the \
+--record option of switchmap_poller_test.py, then processes the data the \
+way the poller does before posting it. The time taken for each device is \
+displayed on the screen. An enabled SNMP authorization group must exist \
+in the configuration. Any group is accepted by the recorded devices.""",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    parser.add_argument(
+        "--directory",
+        required=True,
+        type=str,
+        help="Directory of SNMP capture files.",
+    )
+    parser.add_argument(
+        "--hostname",
+        action="append",
+        type=str,
+        help="Hostname to poll. Defaults to all captured devices.",
+    )
+    parser.add_argument(
+        "--latency",
+        default=0,
+        type=float,
+        help="Round trip time of each SNMP PDU in seconds.",
+    )
+    parser.add_argument(
+        "--loss",
+        default=0,
+        type=float,
+        help="Probability of each SNMP PDU being lost.",
+    )
+    parser.add_argument(
+        "--seed",
+        default=0,
+        type=int,
+        help="Seed of the packet loss random number generator.",
+    )
+    parser.add_argument(
+        "--repeat",
+        default=1,
+        type=int,
+        help="Number of times to poll each device.",
+    )
+    args = parser.parse_args()
+
+    # Get the devices to poll
+    hostnames = args.hostname or _hostnames(args.directory)
+    if bool(hostnames) is False:
+        print("No SNMP capture files found in {}".format(args.directory))
+        sys.exit(2)
+
+    # Answer SNMP queries from the captures
+    replay.install(
+        replay.Replay(
+            directory=args.directory,
+            latency=args.latency,
+            loss=args.loss,
+            seed=args.seed,
+        )
+    )
+
+    # Poll
+    total = 0
+    for _ in range(args.repeat):
+        for hostname in hostnames:
+            duration = _poll(hostname)
+            total += duration
+            print("{:<40} {:>10.3f}s".format(hostname, duration))
+    print("{:<40} {:>10.3f}s".format("Total", total))
+
+
+def _hostnames(directory):
+    """Get the hostnames of the devices captured in a directory.
+
+    Args:
+        directory: Directory of SNMP capture files
+
+    Returns:
+        result: Sorted list of hostnames
+
+    """
+    # Initialize key variables
+    result = []
+    suffix = os.path.basename(replay.capture_file("", ""))
+
+    # Return
+    if os.path.isdir(directory) is True:
+        for filename in sorted(os.listdir(directory)):
+            if filename.endswith(suffix) is True:
+                result.append(filename[: -len(suffix)])
+    return result
+
+
+def _poll(hostname):
+    """Poll a device and process its data.
+
+    Args:
+        hostname: Hostname to poll
+
+    Returns:
+        result: Seconds taken
+
+    """
+    # Poll
+    start = time.perf_counter()
+    data = poller.Poll(hostname).query()
+    if bool(data) is True:
+        udevice.Device(data).process()
+
+    # Return
+    result = time.perf_counter() - start
+    return result
+
+
+if __name__ == "__main__":
+    main()
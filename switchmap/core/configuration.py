@@ -284,6 +284,22 @@ class ConfigAPIClient(ConfigCore):
         result = self._config_api_client.get("server_bind_port", 7000)
         return result
 
+    def server_connect_timeout(self):
+        """Get server_connect_timeout.
+
+        Args:
+            None
+
+        Returns:
+            result: Seconds to wait for a connection to the server
+
+        """
+        # Get result
+        result = max(
+            1, int(self._config_api_client.get("server_connect_timeout", 10))
+        )
+        return result
+
     def server_https(self):
         """Get server_https.
 
@@ -322,6 +338,53 @@ class ConfigAPIClient(ConfigCore):
                 result = None
         return result
 
+    def server_pool_size(self):
+        """Get server_pool_size.
+
+        Args:
+            None
+
+        Returns:
+            result: Number of connections to the server kept open for reuse
+
+        """
+        # Get result
+        result = max(
+            1, int(self._config_api_client.get("server_pool_size", 10))
+        )
+        return result
+
+    def server_read_timeout(self):
+        """Get server_read_timeout.
+
+        Args:
+            None
+
+        Returns:
+            result: Seconds to wait for the server to reply
+
+        """
+        # Get result
+        result = max(
+            1, int(self._config_api_client.get("server_read_timeout", 300))
+        )
+        return result
+
+    def server_retries(self):
+        """Get server_retries.
+
+        Args:
+            None
+
+        Returns:
+            result: Number of times requests are retried after connection
+                errors and server errors
+
+        """
+        # Get result
+        result = max(0, int(self._config_api_client.get("server_retries", 3)))
+        return result
+
     def server_username(self):
         """Get server_username.
 
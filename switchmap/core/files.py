@@ -72,6 +72,90 @@ class _Directory:
         value = "{}{}snmp".format(self._system_root, os.sep)
         return value
 
+    def capabilities(self):
+        """Define the system capabilities directory.
+
+        Args:
+            None
+
+        Returns:
+            value: capabilities directory
+
+        """
+        # Return
+        value = "{}{}capabilities".format(self._system_root, os.sep)
+        return value
+
+    def backoff(self):
+        """Define the system backoff directory.
+
+        Args:
+            None
+
+        Returns:
+            value: backoff directory
+
+        """
+        # Return
+        value = "{}{}backoff".format(self._system_root, os.sep)
+        return value
+
+    def fingerprint(self):
+        """Define the system fingerprint directory.
+
+        Args:
+            None
+
+        Returns:
+            value: fingerprint directory
+
+        """
+        # Return
+        value = "{}{}fingerprint".format(self._system_root, os.sep)
+        return value
+
+    def snapshot(self):
+        """Define the system snapshot directory.
+
+        Args:
+            None
+
+        Returns:
+            value: snapshot directory
+
+        """
+        # Return
+        value = "{}{}snapshot".format(self._system_root, os.sep)
+        return value
+
+    def ingested(self):
+        """Define the system ingested directory.
+
+        Args:
+            None
+
+        Returns:
+            value: ingested directory
+
+        """
+        # Return
+        value = "{}{}ingested".format(self._system_root, os.sep)
+        return value
+
+    def timing(self):
+        """Define the system timing directory.
+
+        Args:
+            None
+
+        Returns:
+            value: timing directory
+
+        """
+        # Return
+        value = "{}{}timing".format(self._system_root, os.sep)
+        return value
+
 
 class _File:
     """A class for creating the names of system files."""
@@ -151,6 +235,112 @@ class _File:
         value = "{}{}{}.snmp".format(self._directory.snmp(), os.sep, prefix)
         return value
 
+    def capabilities(self, prefix, create=True):
+        """Define the system capabilities file.
+
+        Args:
+            prefix: Prefix of file
+            create: Create file if True
+
+        Returns:
+            value: capabilities file
+
+        """
+        # Return
+        if create is True:
+            mkdir(self._directory.capabilities())
+        value = "{}{}{}.yaml".format(
+            self._directory.capabilities(), os.sep, prefix
+        )
+        return value
+
+    def backoff(self, prefix, create=True):
+        """Define the system backoff file.
+
+        Args:
+            prefix: Prefix of file
+            create: Create file if True
+
+        Returns:
+            value: backoff file
+
+        """
+        # Return
+        if create is True:
+            mkdir(self._directory.backoff())
+        value = "{}{}{}.yaml".format(self._directory.backoff(), os.sep, prefix)
+        return value
+
+    def snapshot(self, prefix, create=True):
+        """Define the system snapshot file.
+
+        Args:
+            prefix: Prefix of file
+            create: Create file if True
+
+        Returns:
+            value: snapshot file
+
+        """
+        # Return
+        if create is True:
+            mkdir(self._directory.snapshot())
+        value = "{}{}{}.yaml".format(self._directory.snapshot(), os.sep, prefix)
+        return value
+
+    def fingerprint(self, prefix, create=True):
+        """Define the system fingerprint file.
+
+        Args:
+            prefix: Prefix of file
+            create: Create file if True
+
+        Returns:
+            value: fingerprint file
+
+        """
+        # Return
+        if create is True:
+            mkdir(self._directory.fingerprint())
+        value = "{}{}{}.yaml".format(
+            self._directory.fingerprint(), os.sep, prefix
+        )
+        return value
+
+    def ingested(self, prefix, create=True):
+        """Define the system ingested file.
+
+        Args:
+            prefix: Prefix of file
+            create: Create file if True
+
+        Returns:
+            value: ingested file
+
+        """
+        # Return
+        if create is True:
+            mkdir(self._directory.ingested())
+        value = "{}{}{}.yaml".format(self._directory.ingested(), os.sep, prefix)
+        return value
+
+    def timing(self, prefix, create=True):
+        """Define the system timing file.
+
+        Args:
+            prefix: Prefix of file
+            create: Create file if True
+
+        Returns:
+            value: timing file
+
+        """
+        # Return
+        if create is True:
+            mkdir(self._directory.timing())
+        value = "{}{}{}.json".format(self._directory.timing(), os.sep, prefix)
+        return value
+
 
 def move_yaml_files(src, dst):
     """Move all yaml files from source to destination directory.
@@ -392,6 +582,139 @@ def snmp_file(hostname, config):
     return result
 
 
+def capabilities_file(hostname, config):
+    """Get the file that caches the MIBs supported by a device.
+
+    Args:
+        hostname: hostname
+        config: Config object
+
+    Returns:
+        result: Name of capabilities file
+
+    """
+    # Return
+    f_obj = _File(config)
+    result = f_obj.capabilities(hostname)
+    return result
+
+
+def backoff_file(hostname, config):
+    """Get the file that records the polling failures of a device.
+
+    Args:
+        hostname: hostname
+        config: Config object
+
+    Returns:
+        result: Name of backoff file
+
+    """
+    # Return
+    f_obj = _File(config)
+    result = f_obj.backoff(hostname)
+    return result
+
+
+def fingerprint_file(hostname, config):
+    """Get the file that records the fingerprint of a device's last post.
+
+    Args:
+        hostname: hostname
+        config: Config object
+
+    Returns:
+        result: Name of fingerprint file
+
+    """
+    # Return
+    f_obj = _File(config)
+    result = f_obj.fingerprint(hostname)
+    return result
+
+
+def snapshot_file(hostname, config):
+    """Get the file that saves the data last polled from a device.
+
+    Args:
+        hostname: hostname
+        config: Config object
+
+    Returns:
+        result: Name of snapshot file
+
+    """
+    # Return
+    f_obj = _File(config)
+    result = f_obj.snapshot(hostname)
+    return result
+
+
+def ingested_file(name, config):
+    """Get the file that saves the data last ingested for a device.
+
+    Args:
+        name: Name of the device's cache file without its extension
+        config: Config object
+
+    Returns:
+        result: Name of ingested file
+
+    """
+    # Return
+    f_obj = _File(config)
+    result = f_obj.ingested(name)
+    return result
+
+
+def timing_file(hostname, config):
+    """Get the file that saves the timing report of a device's last poll.
+
+    Args:
+        hostname: hostname
+        config: Config object
+
+    Returns:
+        result: Name of timing file
+
+    """
+    # Return
+    f_obj = _File(config)
+    result = f_obj.timing(hostname)
+    return result
+
+
+def timing_directory(config):
+    """Get the directory containing the timing reports of devices.
+
+    Args:
+        config: Config object
+
+    Returns:
+        result: Name of timing directory
+
+    """
+    # Return
+    d_obj = _Directory(config)
+    result = d_obj.timing()
+    return result
+
+
+def timing_report_file(config):
+    """Get the file that saves the timing report of all devices.
+
+    Args:
+        config: Config object
+
+    Returns:
+        result: Name of timing report file
+
+    """
+    # Return
+    result = "{}{}timing.json".format(config.system_directory(), os.sep)
+    return result
+
+
 def execute(command, die=True):
     """Run the command UNIX CLI command and record output.
 
@@ -0,0 +1,166 @@
+"""Module to detect device data that is unchanged since it was last posted.
+
+Pollers post a short message instead of device data whose fingerprint
+matches the data last posted. The server then uses the data it last
+ingested for the device.
+
+"""
+
+import hashlib
+import json
+
+# Values that change at every poll without any change to the device's
+# configuration or topology. They aren't part of fingerprints.
+_VOLATILE = frozenset(
+    [
+        "sysUpTime",
+        "ifInOctets",
+        "ifOutOctets",
+        "ifInBroadcastPkts",
+        "ifOutBroadcastPkts",
+        "ifInMulticastPkts",
+        "ifOutMulticastPkts",
+        "ifHCInOctets",
+        "ifHCOutOctets",
+        "ifHCInUcastPkts",
+        "ifHCOutUcastPkts",
+        "ifHCInBroadcastPkts",
+        "ifHCOutBroadcastPkts",
+        "ifHCInMulticastPkts",
+        "ifHCOutMulticastPkts",
+    ]
+)
+
+
+def fingerprint(data):
+    """Create the fingerprint of device data.
+
+    The "misc" data about the poll and volatile values are ignored.
+
+    Args:
+        data: Dict of device data
+
+    Returns:
+        result: Fingerprint string
+
+    """
+    # Initialize key variables
+    stable = _stable({_: data[_] for _ in data if _ != "misc"})
+
+    # Return
+    result = hashlib.sha256(
+        json.dumps(stable, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    return result
+
+
+def unchanged(data):
+    """Create the message posted instead of unchanged device data.
+
+    Args:
+        data: Dict of device data with its fingerprint in "misc"
+
+    Returns:
+        result: Dict of the "misc" data, and the volatile values the server
+            stores
+
+    """
+    # Initialize key variables
+    result = {"misc": dict(data["misc"])}
+    result["misc"]["unchanged"] = True
+
+    # The server stores the uptime
+    try:
+        uptime = data["system"]["SNMPv2-MIB"]["sysUpTime"]
+    except (KeyError, TypeError):
+        uptime = None
+    if uptime is not None:
+        result["system"] = {"SNMPv2-MIB": {"sysUpTime": uptime}}
+
+    # Return
+    return result
+
+
+def is_unchanged(data):
+    """Determine whether device data is a message about unchanged data.
+
+    Args:
+        data: Dict of device data
+
+    Returns:
+        result: True if unchanged
+
+    """
+    # Return
+    try:
+        result = data["misc"].get("unchanged") is True
+    except (KeyError, TypeError, AttributeError):
+        result = False
+    return result
+
+
+def carry(previous, message):
+    """Recreate unchanged device data from the data previously posted.
+
+    Args:
+        previous: Dict of the device data previously posted
+        message: Dict of the message posted instead of unchanged data
+
+    Returns:
+        result: Dict of device data. None if the fingerprints of the
+            previous data and the message differ.
+
+    """
+    # Initialize key variables
+    result = None
+    value = message["misc"].get("fingerprint")
+
+    # Check the previous data is the one that is unchanged
+    try:
+        current = previous["misc"].get("fingerprint")
+    except (KeyError, TypeError, AttributeError):
+        current = None
+    if bool(value) is False or value != current:
+        return result
+
+    # Update the data about the poll and the volatile values
+    result = previous
+    result["misc"] = dict(message["misc"])
+    result["misc"].pop("unchanged", None)
+    try:
+        uptime = message["system"]["SNMPv2-MIB"]["sysUpTime"]
+    except (KeyError, TypeError):
+        uptime = None
+    if uptime is not None:
+        result.setdefault("system", {}).setdefault("SNMPv2-MIB", {})[
+            "sysUpTime"
+        ] = uptime
+
+    # Return
+    return result
+
+
+def _stable(data):
+    """Remove the volatile values from data.
+
+    Keys are converted to strings so that they can be sorted.
+
+    Args:
+        data: Data to process
+
+    Returns:
+        result: Data without volatile values
+
+    """
+    # Return
+    if isinstance(data, dict) is True:
+        result = {
+            str(key): _stable(value)
+            for key, value in data.items()
+            if key not in _VOLATILE
+        }
+    elif isinstance(data, (list, tuple)) is True:
+        result = [_stable(_) for _ in data]
+    else:
+        result = data
+    return result
@@ -97,8 +97,12 @@ def octetstr_2_string(bytes_string):
     # Initialize key variables
     octet_string = bytes_string.decode("utf-8")
 
-    # Convert and return
-    result = "".join(["%0.2x" % ord(_) for _ in octet_string])
+    # Each character is an octet. Convert them all at once
+    try:
+        result = octet_string.encode("latin-1").hex()
+    except UnicodeEncodeError:
+        # Not an octet string
+        result = "".join(["%0.2x" % ord(_) for _ in octet_string])
     return result.lower()
 
 
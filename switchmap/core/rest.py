@@ -1,18 +1,33 @@
 """Functions for creating URIs."""
 
 # Standard imports
+import gzip
+import json
+import os
 import sys
+import threading
+import zlib
 import requests
 from collections import namedtuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Import repository libraries
 # from switchmap.poller.configuration import ConfigAPIClient
 from switchmap.core import log
+from switchmap.core import stream
 from switchmap import API_PREFIX
 from switchmap.core.log import ExceptionWrapper
 
+# Session shared by all requests of the process
+_SESSION = None
+_LOCK = threading.Lock()
 
-def post(uri, data, config, server=True):
+# Server errors that are retried
+_RETRY_STATUSES = (500, 502, 503, 504)
+
+
+def post(uri, data, config, server=True, compress=False):
     """Create URI for datacenter RRD and oid_id data.
 
     Args:
@@ -20,60 +35,274 @@ def post(uri, data, config, server=True):
         data: Data to post
         config: ConfitAPIClient object
         server: Posting to a server if True, API if False
+        compress: Compress the data with gzip if True
 
     Returns:
         data: Post named tuple
 
     """
     # Initialize key variables
-    success = False
-    response = False
-    Post = namedtuple("Post", "success response")
+    url = _post_url(uri, config, server=server)
+
+    # Post compressed data
+    if bool(compress) is True:
+        result = _post(
+            url,
+            config,
+            data=gzip.compress(json.dumps(data).encode()),
+            headers={
+                "Content-Type": "application/json",
+                "Content-Encoding": "gzip",
+            },
+        )
+        if _rejected(result, url) is False:
+            return result
 
-    # Create the URL for posting
-    # config = ConfigAPIClient()
-    username = config.server_username()
-    password = config.server_password()
+    # Return
+    result = _post(url, config, json=data)
+    return result
+
+
+def post_batch(uri, items, config, server=True, compress=False):
+    """Post the data of several devices together.
+
+    Args:
+        uri: URI for posting
+        items: List of the JSON strings of each device's data
+        config: ConfitAPIClient object
+        server: Posting to a server if True, API if False
+        compress: Compress the data with gzip if True
+
+    Returns:
+        data: Post named tuple
+
+    """
+    # Initialize key variables
+    url = _post_url(uri, config, server=server)
+    body = "[{}]".format(",".join(items)).encode()
+
+    # Post compressed data
+    if bool(compress) is True:
+        result = _post(
+            url,
+            config,
+            data=gzip.compress(body),
+            headers={
+                "Content-Type": "application/json",
+                "Content-Encoding": "gzip",
+            },
+        )
+        if _rejected(result, url) is False:
+            return result
+
+    # Return
+    result = _post(
+        url, config, data=body, headers={"Content-Type": "application/json"}
+    )
+    return result
+
+
+def post_stream(uri, data, config, server=True, compress=False):
+    """Post device data as a stream of chunks.
+
+    The data is never converted to a single JSON string, which reduces
+    the memory needed to post large devices.
+
+    Args:
+        uri: URI for posting
+        data: Device data to post
+        config: ConfitAPIClient object
+        server: Posting to a server if True, API if False
+        compress: Compress the data with gzip if True
+
+    Returns:
+        data: Post named tuple
+
+    """
+    # Initialize key variables
+    url = _post_url(uri, config, server=server)
+
+    # Post compressed data
+    if bool(compress) is True:
+        result = _post(
+            url,
+            config,
+            data=_Stream(data, compress=True),
+            headers={
+                "Content-Type": stream.CONTENT_TYPE,
+                "Content-Encoding": "gzip",
+            },
+        )
+        if _rejected(result, url) is False:
+            return result
+
+    # Return
+    result = _post(
+        url,
+        config,
+        data=_Stream(data),
+        headers={"Content-Type": stream.CONTENT_TYPE},
+    )
+    return result
+
+
+class _Stream:
+    """Streamed device data that is sent again when a post is retried."""
+
+    def __init__(self, data, compress=False):
+        """Instantiate the class.
+
+        Args:
+            data: Device data to post
+            compress: Compress the data with gzip if True
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._data = data
+        self._compress = bool(compress)
+
+    def __iter__(self):
+        """Start sending the data.
+
+        Args:
+            None
+
+        Returns:
+            result: Generator of bytes
+
+        """
+        # Return
+        result = stream.encode(self._data)
+        if self._compress is True:
+            result = _gzip(result)
+        return result
+
+
+def _gzip(chunks):
+    """Compress chunks of data with gzip as they are sent.
+
+    Args:
+        chunks: Iterable of bytes
+
+    Returns:
+        result: Generator of compressed bytes
+
+    """
+    # Initialize key variables. The gzip header is added by wbits 31.
+    compressor = zlib.compressobj(wbits=31)
+
+    # Compress
+    for chunk in chunks:
+        result = compressor.compress(chunk)
+        if bool(result) is True:
+            yield result
+    yield compressor.flush()
+
+
+def _rejected(result, url):
+    """Determine whether a server refused compressed data.
+
+    Older servers don't accept compressed data. It is then posted again
+    uncompressed.
+
+    Args:
+        result: Post named tuple of the compressed post
+        url: URL for posting
+
+    Returns:
+        rejected: True if the data should be posted uncompressed
+
+    """
+    # Initialize key variables
+    rejected = False
+    response = getattr(result, "response", None)
+
+    # Check the response
+    if getattr(result, "success", False) is False and response is not None:
+        if response.status_code in [400, 415]:
+            rejected = True
+            log_message = """\
+Error {} for compressed post to {}. Posting uncompressed data.""".format(
+                response.status_code, url
+            )
+            log.log2info(2023, log_message)
+
+    # Return
+    return rejected
 
+
+def _post_url(uri, config, server=True):
+    """Create the URL for posting.
+
+    Args:
+        uri: URI for posting
+        config: ConfitAPIClient object
+        server: Posting to a server if True, API if False
+
+    Returns:
+        url: URL for posting
+
+    """
     # Create the URL for posting
     if bool(server) is True:
         url_root = config.server_url_root()
     else:
         url_root = config.api_url_root()
     url = _clean_url("{}/{}/{}".format(url_root, API_PREFIX, uri))
+    return url
+
+
+def _post(url, config, **kwargs):
+    """Post data to a URL.
+
+    Args:
+        url: URL for posting
+        config: ConfitAPIClient object
+        **kwargs: Keyword arguments for the requests post
+
+    Returns:
+        data: Post named tuple
+
+    """
+    # Initialize key variables
+    success = False
+    response = False
+    result = None
+    Post = namedtuple("Post", "success response")
+
+    # Create the URL for posting
+    # config = ConfigAPIClient()
+    username = config.server_username()
+    password = config.server_password()
 
     # Log
     log_message = "Attempting to post data to {}.".format(url)
     log.log2info(1583, log_message)
 
     # Post data save to cache if this fails
-    with requests.Session() as session:
-
-        # if bool(username) is False or bool(password) is False:
-        #     result = session.post(url, json=data)
-        # else:
-        #     result = session.post(url, json=data, auth=(username, password))
-        # response = True
-
-        try:
-            with requests.Session() as session:
-                if bool(username) is False or bool(password) is False:
-                    result = session.post(url, json=data)
-                else:
-                    result = session.post(
-                        url, json=data, auth=(username, password)
-                    )
-                response = True
-        except Exception as error:
-            log_message = "Error posting to {}".format(url)
-            log.log2warning(1537, log_message)
-            log.log2exception(1641, sys.exc_info())
-            return ExceptionWrapper(error)
-        except:
-            log_message = "Failed to post data to API server URL {}.".format(
-                url
+    try:
+        session = _session(config)
+        if bool(username) is False or bool(password) is False:
+            result = session.post(url, timeout=_timeout(config), **kwargs)
+        else:
+            result = session.post(
+                url,
+                auth=(username, password),
+                timeout=_timeout(config),
+                **kwargs,
             )
-            log.log2info(1038, log_message)
+        response = True
+    except Exception as error:
+        log_message = "Error posting to {}".format(url)
+        log.log2warning(1537, log_message)
+        log.log2exception(1641, sys.exc_info())
+        return ExceptionWrapper(error)
+    except:
+        log_message = "Failed to post data to API server URL {}.".format(url)
+        log.log2info(1038, log_message)
 
     # Define success
     if response is True:
@@ -210,19 +439,23 @@ def _get(url, config, die=True, query=None, stream=False):
 
     # Post data save to cache if this fails
     try:
-        with requests.Session() as session:
-            if bool(query) is False:
-                response = session.get(
-                    url, stream=stream, auth=(username, password)
-                )
-            else:
-                response = session.get(
-                    url,
-                    stream=stream,
-                    auth=(username, password),
-                    params={"query": query},
-                )
-            success = True
+        session = _session(config)
+        if bool(query) is False:
+            response = session.get(
+                url,
+                stream=stream,
+                auth=(username, password),
+                timeout=_timeout(config),
+            )
+        else:
+            response = session.get(
+                url,
+                stream=stream,
+                auth=(username, password),
+                params={"query": query},
+                timeout=_timeout(config),
+            )
+        success = True
     except Exception as exception_error:
         log_message = (
             "Failed to connect to server API URL {}. Error: {}"
@@ -238,6 +471,87 @@ def _get(url, config, die=True, query=None, stream=False):
     return response
 
 
+def _session(config):
+    """Get the session shared by all requests of the process.
+
+    Connections to the server are kept open and reused. Requests are
+    retried with an increasing delay after connection errors. Only GET
+    requests are retried after server errors. Posts are not, because the
+    server may already have their data.
+
+    Args:
+        config: ConfigAPIClient object
+
+    Returns:
+        result: requests.Session object
+
+    """
+    # Initialize key variables
+    global _SESSION
+
+    # Create the session once
+    with _LOCK:
+        if _SESSION is None:
+            retries = config.server_retries()
+            retry = Retry(
+                total=retries,
+                connect=retries,
+                read=0,
+                status=retries,
+                backoff_factor=0.5,
+                status_forcelist=_RETRY_STATUSES,
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=config.server_pool_size(),
+                pool_maxsize=config.server_pool_size(),
+                max_retries=retry,
+            )
+            _SESSION = requests.Session()
+            _SESSION.mount("http://", adapter)
+            _SESSION.mount("https://", adapter)
+
+    # Return
+    result = _SESSION
+    return result
+
+
+def _timeout(config):
+    """Get the timeouts of requests.
+
+    Args:
+        config: ConfigAPIClient object
+
+    Returns:
+        result: Tuple of the connect and read timeouts in seconds
+
+    """
+    # Return
+    result = (config.server_connect_timeout(), config.server_read_timeout())
+    return result
+
+
+def _forget():
+    """Stop using the session of the parent process in a forked process.
+
+    The connections of the parent can't be shared with its children.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+    # Initialize key variables
+    global _SESSION
+    global _LOCK
+
+    # Forget
+    _SESSION = None
+    _LOCK = threading.Lock()
+
+
 def _clean_url(url):
     """Remove excess / from url.
 
@@ -253,3 +567,7 @@ def _clean_url(url):
     result = result.replace("http:/", "http://")
     result = result.replace("https:/", "https://")
     return result
+
+
+# Forked poller processes create their own session
+os.register_at_fork(after_in_child=_forget)
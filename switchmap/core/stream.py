@@ -0,0 +1,139 @@
+"""Module to post device data to the server as a stream of chunks.
+
+Each chunk is a line of JSON with the "path" of keys to a dict in the
+device data, and "data" to add to that dict. The last line marks the end
+of the stream so that truncated posts can be detected.
+
+"""
+
+import json
+
+# Content type of streamed posts
+CONTENT_TYPE = "application/x-ndjson"
+
+# Largest number of dict items sent in a chunk
+_CHUNK_SIZE = 100
+
+# Top level keys of device data, in the order they are sent
+_SECTIONS = ("misc", "system", "layer1", "layer2", "layer3")
+
+# Last line of the stream
+_END = {"end": True}
+
+
+def encode(data, size=_CHUNK_SIZE):
+    """Convert device data to lines of JSON.
+
+    Args:
+        data: Dict of device data
+        size: Largest number of dict items sent in a chunk
+
+    Returns:
+        line: Generator of lines of JSON in bytes
+
+    """
+    # Initialize key variables
+    keys = [_ for _ in _SECTIONS if _ in data]
+    keys.extend([_ for _ in data if _ not in _SECTIONS])
+
+    # Send each section in chunks
+    for key in keys:
+        value = data[key]
+        if isinstance(value, dict) is True:
+            chunks = _chunks([key], value, max(1, size))
+        else:
+            chunks = [([], {key: value})]
+        for path, chunk in chunks:
+            yield _line({"path": path, "data": chunk})
+
+    # Mark the end of the stream
+    yield _line(_END)
+
+
+def decode(lines):
+    """Recreate device data from lines of JSON.
+
+    Args:
+        lines: Iterable of lines of JSON in bytes or str
+
+    Returns:
+        result: Dict of device data. None if the stream is invalid or
+            truncated.
+
+    """
+    # Initialize key variables
+    result = {}
+    complete = False
+
+    # Add each chunk to the data
+    try:
+        for line in lines:
+            if bool(line.strip()) is False:
+                continue
+            if complete is True:
+                return None
+            chunk = json.loads(line)
+            if chunk == _END:
+                complete = True
+                continue
+            target = result
+            for key in chunk["path"]:
+                target = target.setdefault(key, {})
+            target.update(chunk["data"])
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+    # Return
+    if complete is False:
+        result = None
+    return result
+
+
+def _chunks(path, data, size):
+    """Split a dict into chunks of a limited number of items.
+
+    Dicts within the dict that are too big are split too.
+
+    Args:
+        path: List of keys to the dict
+        data: Dict to split
+        size: Largest number of dict items sent in a chunk
+
+    Returns:
+        result: Generator of tuples of the path and dict of each chunk
+
+    """
+    # Initialize key variables
+    chunk = {}
+    sent = False
+
+    # Split
+    for key, value in data.items():
+        if isinstance(value, dict) is True and len(value) > size:
+            yield from _chunks(path + [str(key)], value, size)
+            sent = True
+            continue
+        chunk[key] = value
+        if len(chunk) == size:
+            yield (path, chunk)
+            chunk = {}
+            sent = True
+
+    # Send the remainder. Empty dicts are sent so that their key exists.
+    if bool(chunk) is True or sent is False:
+        yield (path, chunk)
+
+
+def _line(data):
+    """Convert a chunk to a line of JSON.
+
+    Args:
+        data: Chunk to convert
+
+    Returns:
+        result: Line of JSON in bytes
+
+    """
+    # Return
+    result = "{}\n".format(json.dumps(data)).encode()
+    return result
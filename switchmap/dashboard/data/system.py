@@ -75,6 +75,12 @@ class System:
             )
         )
 
+        # Poller node that last polled the device, if polling is sharded
+        if bool(self.poller_node()) is True:
+            rows.append(
+                SystemDataRow(parameter="Poller Node", value=self.poller_node())
+            )
+
         # Return
         return rows
 
@@ -107,6 +113,20 @@ class System:
         result = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
         return result
 
+    def poller_node(self):
+        """Return poller_node.
+
+        Args:
+            None
+
+        Returns:
+            result: poller_node
+
+        """
+        # Return
+        result = self._data.get("pollerNode", "")
+        return result
+
     def sysdescription(self):
         """Return sysdescription.
 
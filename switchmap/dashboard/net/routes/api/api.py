@@ -104,6 +104,7 @@ def devices(idx_device):
         sysObjectid
         sysUptime
         lastPolled
+        pollerNode
         device {
           event {
             tsCreated
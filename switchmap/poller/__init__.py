@@ -24,4 +24,8 @@ POLL = namedtuple(
     "hostname authorization",
 )
 
-ZONE = namedtuple("ZONE", "name hostnames")
+ZONE = namedtuple(
+    "ZONE",
+    "name hostnames polling_interval polling_intervals",
+    defaults=(None, None),
+)
@@ -0,0 +1,190 @@
+"""Module to stop polling devices that repeatedly fail to respond."""
+
+import os
+import time
+import random
+
+# PIP imports
+import yaml
+
+# Switchmap imports
+from switchmap.core import files
+from switchmap.core import log
+
+# Fraction of the backoff delay added as random jitter. This stops devices
+# that failed at the same time from all being retried at the same time.
+_JITTER = 0.1
+
+
+class Backoff:
+    """Class that tracks the consecutive polling failures of a device.
+
+    Each consecutive failure doubles the time before the device is polled
+    again, up to a configured maximum. The failure record is saved on disk
+    so that it survives daemon restarts.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+
+    def __init__(self, hostname, config, interval=None):
+        """Instantiate the class.
+
+        Args:
+            hostname: Hostname of the device
+            config: ConfigPoller object
+            interval: Polling interval of the device in seconds. Defaults
+                to the configured polling_interval
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._hostname = hostname
+        self._maximum = config.backoff_maximum()
+        self._filename = files.backoff_file(hostname, config)
+        if bool(interval) is False:
+            interval = config.polling_interval()
+        self._interval = interval
+
+        # Load the failure record
+        (self._failures, self._retry) = self._load()
+
+    def due(self):
+        """Determine whether the device should be polled.
+
+        Polling cycles don't start at exactly the same time relative to the
+        device's last failure, so a device is due if its retry time is
+        within half a polling interval.
+
+        Args:
+            None
+
+        Returns:
+            result: True if the device should be polled
+
+        """
+        # Return
+        result = time.time() + self._interval / 2 >= self._retry
+        return result
+
+    def failures(self):
+        """Get the number of consecutive polling failures of the device.
+
+        Args:
+            None
+
+        Returns:
+            result: Number of failures
+
+        """
+        # Return
+        result = self._failures
+        return result
+
+    def failure(self):
+        """Record a polling failure and schedule the next retry.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Double the delay with each consecutive failure
+        self._failures += 1
+        delay = _delay(self._failures, self._interval, self._maximum)
+        self._retry = int(time.time() + delay)
+
+        # Save
+        data = {
+            "hostname": self._hostname,
+            "failures": self._failures,
+            "retry": self._retry,
+        }
+        try:
+            with open(self._filename, "w") as f_handle:
+                yaml.dump(data, f_handle, default_flow_style=False)
+        except:
+            log_message = """\
+Unable to write backoff file {} for host {}""".format(
+                self._filename, self._hostname
+            )
+            log.log2warning(2012, log_message)
+
+    def success(self):
+        """Clear the failure record after a successful poll.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Clear
+        self._failures = 0
+        self._retry = 0
+        if os.path.isfile(self._filename) is True:
+            try:
+                os.remove(self._filename)
+            except FileNotFoundError:
+                # Another process removed it
+                pass
+
+    def _load(self):
+        """Read the failure record of the device.
+
+        Args:
+            None
+
+        Returns:
+            result: Tuple of (failures, retry) where failures is the number
+                of consecutive failures and retry is the time the device
+                can be polled again
+
+        """
+        # Initialize key variables
+        result = (0, 0)
+
+        # Read the record
+        if os.path.isfile(self._filename) is False:
+            return result
+        data = files.read_yaml_file(self._filename, die=False)
+        if isinstance(data, dict) is False:
+            return result
+
+        # Return
+        try:
+            result = (int(data["failures"]), int(data["retry"]))
+        except:
+            result = (0, 0)
+        return result
+
+
+def _delay(failures, interval, maximum):
+    """Get the time to wait before polling a failed device again.
+
+    Args:
+        failures: Number of consecutive failures
+        interval: Polling interval of the device in seconds
+        maximum: Maximum delay in seconds
+
+    Returns:
+        result: Delay in seconds
+
+    """
+    # Double the delay with each failure. Cap the exponent to avoid huge
+    # numbers for devices that have been down a long time.
+    exponent = min(max(failures - 1, 0), 32)
+    result = min(interval * (2**exponent), maximum)
+
+    # Add jitter
+    result += random.uniform(0, result * _JITTER)
+    return result
@@ -0,0 +1,194 @@
+"""Module to post the data of several devices to the server together."""
+
+import json
+import threading
+import time
+
+# Switchmap imports
+from switchmap import API_POLLER_BATCH_URI
+from switchmap.core import rest
+
+
+class Batch:
+    """Class that gathers the data of polled devices to post it in batches.
+
+    A batch is posted when it has the configured number of devices, or
+    when adding a device would make it larger than the configured number
+    of bytes. Devices can be added from several threads.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+
+    def __init__(self, config):
+        """Instantiate the class.
+
+        Args:
+            config: ConfigPoller object
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._config = config
+        self._size = config.polling_batch_size()
+        self._bytes = config.polling_batch_bytes()
+        self._items = []
+        self._total = 0
+        self._start = None
+        self._lock = threading.Lock()
+
+    def add(self, data, record=None, full=None):
+        """Add the data of a device, posting full batches.
+
+        Args:
+            data: Dict of device data
+            record: Unchanged object to acknowledge when the data is posted.
+                None if not needed.
+            full: Dict of the device's full data, posted again if the server
+                doesn't have the unchanged data. None if data is full.
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables. Devices are converted to JSON once.
+        item = json.dumps(data)
+        batches = []
+
+        # Add the device
+        with self._lock:
+            if bool(self._items) is True:
+                if self._total + len(item) > self._bytes:
+                    batches.append(self._take())
+            if bool(self._items) is False:
+                self._start = time.time()
+            self._items.append((item, record, full))
+            self._total += len(item)
+            if len(self._items) >= self._size or self._total >= self._bytes:
+                batches.append(self._take())
+
+        # Post outside the lock so other devices can be added meanwhile
+        for items in batches:
+            self._post(items)
+
+    def age(self):
+        """Get the time the oldest device has waited to be posted.
+
+        Args:
+            None
+
+        Returns:
+            result: Seconds waited. 0 if the batch is empty.
+
+        """
+        # Return
+        with self._lock:
+            result = 0 if self._start is None else time.time() - self._start
+        return result
+
+    def flush(self):
+        """Post the devices waiting in the batch.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Post
+        with self._lock:
+            items = self._take()
+        if bool(items) is True:
+            self._post(items)
+
+    def _take(self):
+        """Empty the batch. The lock must be held.
+
+        Args:
+            None
+
+        Returns:
+            result: List of tuples of the JSON string of each device in the
+                batch, its Unchanged object and its full data
+
+        """
+        # Return
+        result = self._items
+        self._items = []
+        self._total = 0
+        self._start = None
+        return result
+
+    def _post(self, items):
+        """Post a batch.
+
+        Args:
+            items: List of tuples of the JSON string of each device in the
+                batch, its Unchanged object and its full data
+
+        Returns:
+            None
+
+        """
+        # Post
+        result = rest.post_batch(
+            API_POLLER_BATCH_URI,
+            [item for (item, _, _) in items],
+            self._config,
+            compress=self._config.polling_compression(),
+        )
+
+        # Devices are acknowledged when the server has their data
+        stale = _stale(result)
+        if stale is None:
+            return
+        resend = []
+        for _, record, full in items:
+            if record is None:
+                continue
+            if record.hostname in stale:
+                record.forget()
+                if full is not None:
+                    resend.append((json.dumps(full), record, None))
+            else:
+                record.acknowledge()
+
+        # Post the full data of devices the server doesn't have unchanged
+        # data for
+        if bool(resend) is True:
+            self._post(resend)
+
+
+def _stale(result):
+    """Get the devices of a batch whose unchanged data the server lacks.
+
+    Args:
+        result: Post named tuple
+
+    Returns:
+        stale: List of the hostnames of the devices. None if the batch
+            wasn't posted.
+
+    """
+    # Initialize key variables
+    stale = None
+    response = getattr(result, "response", None)
+
+    # The server lists the devices it doesn't have unchanged data for
+    if getattr(result, "success", False) is True:
+        stale = []
+    elif response is not None and response.status_code == 409:
+        try:
+            stale = list(response.json()["stale"])
+        except:
+            stale = None
+
+    # Return
+    return stale
@@ -3,6 +3,7 @@
 from switchmap.core.configuration import ConfigAPIClient
 from switchmap.core import log
 from switchmap.poller import ZONE, SNMP
+from switchmap.poller import shard
 
 
 class ConfigPoller(ConfigAPIClient):
@@ -36,6 +37,69 @@ class ConfigPoller(ConfigAPIClient):
             )
             log.log2die_safe(1007, log_message)
 
+    def backoff_maximum(self):
+        """Get backoff_maximum.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum time in seconds to stop polling a device that
+                has repeatedly failed to respond
+
+        """
+        # Get result
+        result = max(
+            self._config_poller.get("backoff_maximum", 604800),
+            self.polling_interval(),
+        )
+        return result
+
+    def capabilities_interval(self):
+        """Get capabilities_interval.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum age in seconds of a device's cached list of
+                supported MIBs before it is validated again
+
+        """
+        # Get result
+        result = self._config_poller.get("capabilities_interval", 604800)
+        return result
+
+    def delta_polling(self):
+        """Get delta_polling.
+
+        Args:
+            None
+
+        Returns:
+            result: True if only the device data that changed since the
+                last poll should be queried
+
+        """
+        # Get result
+        result = bool(self._config_poller.get("delta_polling", False))
+        return result
+
+    def delta_polling_interval(self):
+        """Get delta_polling_interval.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum time in seconds between polls that query all
+                device data when delta_polling is enabled
+
+        """
+        # Get result
+        result = self._config_poller.get("delta_polling_interval", 86400)
+        return result
+
     def hostnames(self):
         """Get hostnames.
 
@@ -72,6 +136,263 @@ class ConfigPoller(ConfigAPIClient):
         result = self._config_poller.get("polling_interval", 86400)
         return result
 
+    def polling_batch_bytes(self):
+        """Get polling_batch_bytes.
+
+        Args:
+            None
+
+        Returns:
+            result: Largest size in bytes of a batch of device data
+
+        """
+        # Get result
+        result = max(
+            1, int(self._config_poller.get("polling_batch_bytes", 10485760))
+        )
+        return result
+
+    def polling_batch_size(self):
+        """Get polling_batch_size.
+
+        Args:
+            None
+
+        Returns:
+            result: Largest number of devices posted together. None if
+                devices are posted one at a time.
+
+        """
+        # Get result. Devices are posted one at a time by default.
+        result = self._config_poller.get("polling_batch_size")
+        if bool(result) is True and int(result) > 1:
+            result = int(result)
+        else:
+            result = None
+        return result
+
+    def polling_compression(self):
+        """Get polling_compression.
+
+        Args:
+            None
+
+        Returns:
+            result: True if device data should be compressed when posted
+
+        """
+        # Get result
+        result = bool(self._config_poller.get("polling_compression", False))
+        return result
+
+    def polling_concurrency(self):
+        """Get polling_concurrency.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum number of devices the threads polling engine
+                will poll at the same time
+
+        """
+        # Get result
+        result = max(
+            1, int(self._config_poller.get("polling_concurrency", 100))
+        )
+        return result
+
+    def polling_context_concurrency(self):
+        """Get polling_context_concurrency.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum number of SNMP contexts, such as Cisco
+                per-VLAN contexts, walked at the same time on a device
+
+        """
+        # Get result
+        result = max(
+            1, int(self._config_poller.get("polling_context_concurrency", 8))
+        )
+        return result
+
+    def polling_deadline(self):
+        """Get polling_deadline.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum time in seconds to spend polling a device. None
+                if there is no limit.
+
+        """
+        # Get result. Devices have no time limit by default.
+        result = self._config_poller.get("polling_deadline")
+        if bool(result) is True:
+            result = max(1, int(result))
+        else:
+            result = None
+        return result
+
+    def polling_engine(self):
+        """Get polling_engine.
+
+        Args:
+            None
+
+        Returns:
+            result: Engine used to poll devices concurrently. Either
+                "multiprocessing" or "threads"
+
+        """
+        # Initialize key variables
+        engines = ["multiprocessing", "threads"]
+
+        # Get result
+        result = str(
+            self._config_poller.get("polling_engine", "multiprocessing")
+        ).lower()
+
+        # Error if incorrectly configured
+        if result not in engines:
+            log_message = """\
+Invalid "polling_engine:" value "{}" in the configuration file(s). \
+Valid values are: {}""".format(
+                result, ", ".join(engines)
+            )
+            log.log2die_safe(2008, log_message)
+
+        # Return
+        return result
+
+    def polling_skip_unchanged(self):
+        """Get polling_skip_unchanged.
+
+        Args:
+            None
+
+        Returns:
+            result: True if short messages should be posted instead of
+                device data that is unchanged since it was last posted
+
+        """
+        # Get result
+        result = bool(self._config_poller.get("polling_skip_unchanged", False))
+        return result
+
+    def polling_stream(self):
+        """Get polling_stream.
+
+        Args:
+            None
+
+        Returns:
+            result: True if device data should be posted as a stream of
+                chunks
+
+        """
+        # Get result
+        result = bool(self._config_poller.get("polling_stream", False))
+        return result
+
+    def polling_timing(self):
+        """Get polling_timing.
+
+        Args:
+            None
+
+        Returns:
+            result: True if the cost of each SNMP query should be recorded
+
+        """
+        # Get result
+        result = bool(self._config_poller.get("polling_timing", False))
+        return result
+
+    def polling_zone_concurrency(self):
+        """Get polling_zone_concurrency.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum number of devices in a zone the threads polling
+                engine will poll at the same time
+
+        """
+        # Get result
+        result = max(
+            1,
+            int(
+                self._config_poller.get(
+                    "polling_zone_concurrency", self.polling_concurrency()
+                )
+            ),
+        )
+        return result
+
+    def sharding_node(self):
+        """Get sharding_node.
+
+        Args:
+            None
+
+        Returns:
+            result: ID of this poller node. None if every poller node polls
+                all the devices.
+
+        """
+        # Get result
+        result = self._config_poller.get("sharding_node")
+        if result is None:
+            return result
+        result = str(result)
+        nodes = self.sharding_nodes()
+
+        # Error if incorrectly configured
+        if result not in nodes:
+            log_message = """\
+Invalid "sharding_node:" value "{}" in the configuration file(s). \
+Valid values are the IDs of the "sharding_nodes:" value: {}""".format(
+                result, ", ".join(nodes)
+            )
+            log.log2die_safe(2029, log_message)
+
+        # Return
+        return result
+
+    def sharding_nodes(self):
+        """Get sharding_nodes.
+
+        The value is either a list of the IDs of the poller nodes, or the
+        number of poller nodes whose IDs are 0, 1, 2 and so on.
+
+        Args:
+            None
+
+        Returns:
+            result: Sorted list of the IDs of the poller nodes
+
+        """
+        # Initialize key variables
+        result = []
+        nodes = self._config_poller.get("sharding_nodes")
+
+        # Get result
+        if isinstance(nodes, list) is True:
+            result = sorted(set(str(_) for _ in nodes))
+        elif (
+            isinstance(nodes, int) is True and isinstance(nodes, bool) is False
+        ):
+            result = sorted(str(_) for _ in range(max(0, nodes)))
+
+        # Return
+        return result
+
     def snmp_auth(self):
         """Get list of dicts of SNMP information in configuration file.
 
@@ -118,6 +439,41 @@ class ConfigPoller(ConfigAPIClient):
         # Return
         return result
 
+    def snmp_max_repetitions_ceiling(self):
+        """Get snmp_max_repetitions_ceiling.
+
+        Args:
+            None
+
+        Returns:
+            result: Largest GETBULK max-repetitions value the poller will
+                learn for a device
+
+        """
+        # Get result
+        result = max(
+            self.snmp_max_repetitions_floor(),
+            int(self._config_poller.get("snmp_max_repetitions_ceiling", 100)),
+        )
+        return result
+
+    def snmp_max_repetitions_floor(self):
+        """Get snmp_max_repetitions_floor.
+
+        Args:
+            None
+
+        Returns:
+            result: Smallest GETBULK max-repetitions value the poller will
+                learn for a device
+
+        """
+        # Get result
+        result = max(
+            1, int(self._config_poller.get("snmp_max_repetitions_floor", 5))
+        )
+        return result
+
     def username(self):
         """Get username.
 
@@ -132,11 +488,12 @@ class ConfigPoller(ConfigAPIClient):
         result = self._config_poller.get("username", "switchmap")
         return result
 
-    def zones(self):
+    def zones(self, sharded=True):
         """Get list of dicts of polling zone information in configuration file.
 
         Args:
-            None
+            sharded: Only include the devices polled by this poller node if
+                True
 
         Returns:
             result: List of ZONE objects.
@@ -144,6 +501,8 @@ class ConfigPoller(ConfigAPIClient):
         """
         # Initialize key variables
         _zones = self._config_poller.get("zones", [])
+        node = self.sharding_node() if bool(sharded) is True else None
+        nodes = self.sharding_nodes()
         result = []
 
         # Read configuration. Return [] if none found
@@ -159,17 +518,130 @@ class ConfigPoller(ConfigAPIClient):
             if isinstance(_zone, dict) is False:
                 continue
 
+            # Get the devices polled by this poller node
+            hostnames = (
+                _zone.get("hostnames")
+                if isinstance(_zone.get("hostnames"), list)
+                else None
+            )
+            if node is not None and hostnames is not None:
+                hostnames = shard.share(
+                    hostnames, node, nodes, pinned=_pinned(_zone, nodes)
+                )
+
             # Assign good data
             result.append(
                 ZONE(
                     name=_zone.get("zone"),
-                    hostnames=(
-                        _zone.get("hostnames")
-                        if isinstance(_zone.get("hostnames"), list)
-                        else None
+                    hostnames=hostnames,
+                    polling_interval=_interval(
+                        _zone.get("polling_interval"),
+                        _zone.get("zone"),
+                        "polling_interval",
                     ),
+                    polling_intervals=_intervals(_zone),
                 )
             )
 
         # Return
         return result
+
+
+def _intervals(zone):
+    """Get the polling intervals of the devices of a zone.
+
+    Args:
+        zone: Dict of the zone's configuration
+
+    Returns:
+        result: Dict of polling intervals keyed by hostname. None if there
+            are none.
+
+    """
+    # Initialize key variables
+    intervals = zone.get("polling_intervals")
+    result = None
+
+    # Ignore invalid values
+    if isinstance(intervals, dict) is True:
+        result = {}
+        for hostname, value in intervals.items():
+            value = _interval(
+                value,
+                zone.get("zone"),
+                "polling_intervals:{}".format(hostname),
+            )
+            if value is not None:
+                result[hostname] = value
+
+    # Return
+    return result
+
+
+def _interval(value, zone, parameter):
+    """Validate a polling interval of a zone.
+
+    Args:
+        value: Configured polling interval
+        zone: Name of the zone
+        parameter: Name of the configuration parameter
+
+    Returns:
+        result: Polling interval in seconds. None if not configured or
+            invalid.
+
+    """
+    # Initialize key variables
+    result = None
+    if value is None:
+        return result
+
+    # Intervals must be positive integers
+    if isinstance(value, bool) is False:
+        try:
+            result = int(value)
+        except (TypeError, ValueError):
+            result = None
+    if result is None or result < 1:
+        log_message = """\
+Zone "{}" has an invalid "{}" value of "{}". It is ignored""".format(
+            zone, parameter, value
+        )
+        log.log2warning(2033, log_message)
+        result = None
+
+    # Return
+    return result
+
+
+def _pinned(zone, nodes):
+    """Get the poller node that polls all the devices of a zone.
+
+    Args:
+        zone: Dict of the zone's configuration
+        nodes: List of the IDs of the poller nodes
+
+    Returns:
+        result: ID of the node. None if the devices are shared among all
+            the nodes.
+
+    """
+    # Get result
+    result = zone.get("sharding_node")
+    if result is None:
+        return result
+    result = str(result)
+
+    # The devices are shared among the nodes when the node has left
+    if result not in nodes:
+        log_message = """\
+Zone "{}" is pinned to poller node "{}" which isn't one of the \
+"sharding_nodes:" values. Its devices are shared among all the nodes \
+instead""".format(
+            zone.get("zone"), result
+        )
+        log.log2warning(2030, log_message)
+        result = None
+
+    # Return
+    return result
@@ -6,28 +6,50 @@ Updates the database with device SNMP data.
 
 # Standard libraries
 from multiprocessing import Pool
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures import wait, FIRST_COMPLETED
 from collections import namedtuple
 from pprint import pprint
+import asyncio
+import functools
+import json
+import time
 import os
 
 # Import app libraries
 from switchmap import API_POLLER_POST_URI
 from switchmap.poller.snmp import poller
+from switchmap.poller.snmp import timing
+from switchmap.poller.backoff import Backoff
+from switchmap.poller.batch import Batch
+from switchmap.poller.unchanged import Unchanged
+from switchmap.poller import scheduler
 from switchmap.poller.update import device as udevice
 from switchmap.poller.configuration import ConfigPoller
 from switchmap.core import log
 from switchmap.core import rest
 from switchmap.core import files
+from switchmap.core import fingerprint
 from switchmap import AGENT_POLLER
 
-_META = namedtuple("_META", "zone hostname config")
+_META = namedtuple("_META", "zone hostname config interval", defaults=(None,))
+
+# Results of polling a device
+_POLLED = "polled"
+_FAILED = "failed"
+_SKIPPED = "skipped"
+
+# Longest time in seconds devices wait in a partially filled batch when
+# polling continuously
+_BATCH_AGE = 60
 
 
 def devices(multiprocessing=False):
     """Poll all devices for data using subprocesses and create YAML files.
 
     Args:
-        multiprocessing: Run multiprocessing when True
+        multiprocessing: Poll devices concurrently when True, using the
+            configured polling_engine
 
     Returns:
         None
@@ -53,32 +75,374 @@ def devices(multiprocessing=False):
         )
 
     # Process the data
+    batch = _batch(config, multiprocessing)
     if bool(multiprocessing) is False:
-        for argument in arguments:
-            device(argument)
+        results = [device(_, batch=batch) for _ in arguments]
+
+    elif config.polling_engine() == "threads":
+        # Poll many devices at once in threads of a single process
+        results = asyncio.run(_devices(arguments, config, batch=batch))
 
     else:
         # Create a multiprocessing pool of sub process resources
         with Pool(processes=pool_size) as pool:
             # Create sub processes from the pool
-            pool.map(device, arguments)
+            results = pool.map(device, arguments)
+
+    # Post the devices waiting in a partially filled batch
+    if batch is not None:
+        batch.flush()
+
+    # Summarize the polling cycle
+    _summary(arguments, results, config)
+
+
+def schedule(multiprocessing=False, lockfile=None):
+    """Poll devices continuously, each one at its own polling interval.
+
+    A fixed pool of workers polls devices as they become due, so slow
+    devices don't delay the polling of the others. The zones, devices and
+    polling intervals are read again from the configuration each time the
+    polling results are summarized.
+
+    Args:
+        multiprocessing: Poll devices concurrently when True, using the
+            configured polling_engine
+        lockfile: File that exists while devices are being polled
+
+    Returns:
+        None
+
+    """
+    # Initialize key variables
+    config = ConfigPoller()
+    default = config.polling_interval()
+    arguments = []
+    results = []
+    ts_summary = time.time()
+
+    # Schedule every device
+    (jobs, items) = _jobs(config)
+
+    # Get the pool of workers. Only the threads engine limits the number of
+    # devices polled per zone.
+    batch = _batch(config, multiprocessing)
+    if bool(multiprocessing) is False:
+        workers = 1
+        executor = ThreadPoolExecutor(max_workers=workers)
+    elif config.polling_engine() == "threads":
+        workers = config.polling_concurrency()
+        executor = ThreadPoolExecutor(max_workers=workers)
+    else:
+        workers = config.agent_subprocesses()
+        executor = ProcessPoolExecutor(max_workers=workers)
+    zone_workers = workers
+    if bool(multiprocessing) is True and config.polling_engine() == "threads":
+        zone_workers = min(config.polling_zone_concurrency(), workers)
+
+    with executor:
+        pool = scheduler.Workers(
+            functools.partial(executor.submit, device, batch=batch),
+            workers,
+            zone_workers=zone_workers,
+        )
+        while True:
+            # Summarize the polling results regularly, then use the latest
+            # configuration. Devices keep their place in the schedule.
+            if time.time() - ts_summary >= default:
+                _summary(arguments, results, config)
+                arguments = []
+                results = []
+                ts_summary = time.time()
+                config = ConfigPoller()
+                default = config.polling_interval()
+                (jobs, items) = _jobs(
+                    config,
+                    previous=jobs.jobs() + pool.waiting(),
+                    busy=[_.item for _ in pool.jobs()],
+                )
+
+            # Poll due devices while there are free workers
+            pool.start(jobs)
+
+            # Don't keep devices waiting long in partially filled batches
+            running = pool.futures()
+            _flush(batch, running)
+
+            # Signal graceful shutdowns whether polling is in progress
+            if bool(lockfile) is True:
+                if bool(running) is True:
+                    open(lockfile, "a").close()
+                elif os.path.isfile(lockfile) is True:
+                    os.remove(lockfile)
+
+            # Wait for the next device to be due, or a poll to complete,
+            # but not past the next summary
+            remaining = max(ts_summary + default - time.time(), 0)
+            timeout = None if pool.full() is True else jobs.wait()
+            timeout = remaining if timeout is None else min(timeout, remaining)
+            if bool(running) is False:
+                time.sleep(timeout)
+                continue
+            (done, _) = wait(
+                running, timeout=timeout, return_when=FIRST_COMPLETED
+            )
+
+            # Schedule the next poll of completed devices that are still
+            # configured
+            for future in done:
+                job = pool.finish(future)
+                item = items.get((job.item.zone, job.item.hostname))
+                if item is not None:
+                    jobs.reschedule(
+                        job._replace(item=item, interval=item.interval)
+                    )
+                try:
+                    result = future.result()
+                except (Exception, SystemExit) as error:
+                    # One device must not stop the polling of the others
+                    log_message = """\
+Polling of device {} in zone "{}" failed: {}""".format(
+                        job.item.hostname, job.item.zone, error
+                    )
+                    log.log2warning(2016, log_message)
+                    result = _FAILED
+                arguments.append(job.item)
+                results.append(result)
+
+
+def _flush(batch, running):
+    """Post the devices waiting in a partially filled batch when needed.
+
+    Devices are posted when no other devices are being polled to fill the
+    batch, or when the oldest device has waited too long.
+
+    Args:
+        batch: Batch object. None if devices are posted one at a time.
+        running: List of the futures of the devices being polled
+
+    Returns:
+        None
+
+    """
+    # Post
+    if batch is not None:
+        if bool(running) is False or batch.age() >= _BATCH_AGE:
+            batch.flush()
+
+
+def _jobs(config, previous=None, busy=None):
+    """Schedule the polling of the configured devices.
+
+    Devices that were already scheduled keep their due time. Devices being
+    polled aren't scheduled. They are rescheduled when their poll completes.
+
+    Args:
+        config: ConfigPoller object
+        previous: List of JOB objects of the devices already scheduled
+        busy: List of _META objects of the devices being polled
+
+    Returns:
+        result: Tuple of the Scheduler object, and a dict of the _META
+            object of each configured device keyed by zone and hostname
+
+    """
+    # Initialize key variables
+    jobs = scheduler.Scheduler()
+    items = {}
+    dues = {(_.item.zone, _.item.hostname): _.due for _ in previous or []}
+    skip = {(_.zone, _.hostname) for _ in busy or []}
+    default = config.polling_interval()
+
+    # Schedule every device
+    for zone in sorted(config.zones()):
+        for hostname in zone.hostnames or []:
+            key = (zone.name, hostname)
+            interval = scheduler.interval(zone, hostname, default)
+            items[key] = _META(
+                zone=zone.name,
+                hostname=hostname,
+                config=config,
+                interval=interval,
+            )
+            if key not in skip:
+                jobs.add(items[key], interval, due=dues.get(key))
+
+    # Return
+    result = (jobs, items)
+    return result
+
+
+async def _devices(arguments, config, batch=None):
+    """Poll devices concurrently in threads.
+
+    The SNMP library is blocking, so each device is polled in a thread of
+    an executor. The event loop only schedules the threads. Its semaphores
+    limit the number of devices polled at the same time overall and per
+    zone.
+
+    Args:
+        arguments: List of _META objects
+        config: ConfigPoller object
+        batch: Batch object gathering the data to post. None if devices
+            are posted one at a time.
+
+    Returns:
+        results: List of the results of polling each device
+
+    """
+    # Initialize key variables
+    concurrency = config.polling_concurrency()
+    zone_concurrency = config.polling_zone_concurrency()
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    zone_semaphores = {
+        _.zone: asyncio.Semaphore(zone_concurrency) for _ in arguments
+    }
+
+    async def _device(argument):
+        """Poll a single device when the concurrency limits allow it.
+
+        Args:
+            argument: _META object
+
+        Returns:
+            result: Result of polling the device, or the exception raised
+                while polling
+
+        """
+        # Wait for a free slot in the zone, then overall
+        async with zone_semaphores[argument.zone]:
+            async with semaphore:
+                try:
+                    result = await loop.run_in_executor(
+                        executor,
+                        functools.partial(device, argument, batch=batch),
+                    )
+                except SystemExit as error:
+                    # Fatal log messages exit. Don't stop the event loop.
+                    result = error
+
+        # Return
+        return result
+
+    # Poll the devices
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = await asyncio.gather(
+            *[_device(_) for _ in arguments], return_exceptions=True
+        )
+
+    # Log failures. One device must not stop the polling of the others
+    for index, (argument, result) in enumerate(zip(arguments, results)):
+        if isinstance(result, BaseException) is True:
+            log_message = """\
+Polling of device {} in zone "{}" failed: {}""".format(
+                argument.hostname, argument.zone, result
+            )
+            log.log2warning(2009, log_message)
+            results[index] = _FAILED
+
+    # Return
+    return results
+
+
+def _batch(config, multiprocessing=False):
+    """Get the batch gathering the data of polled devices.
+
+    Args:
+        config: ConfigPoller object
+        multiprocessing: Poll devices concurrently when True, using the
+            configured polling_engine
+
+    Returns:
+        result: Batch object. None if devices are posted one at a time.
+
+    """
+    # Initialize key variables
+    result = None
+
+    # Batches are gathered in a single process
+    if bool(config.polling_batch_size()) is True:
+        if (
+            bool(multiprocessing) is True
+            and config.polling_engine() == "multiprocessing"
+        ):
+            log_message = """\
+Devices are posted one at a time. The "polling_batch_size:" configuration \
+option requires the threads polling engine."""
+            log.log2info(2026, log_message)
+        else:
+            result = Batch(config)
+
+    # Return
+    return result
+
+
+def _summary(arguments, results, config):
+    """Log a summary of a polling cycle.
+
+    Args:
+        arguments: List of _META objects
+        results: List of the results of polling each device
+        config: ConfigPoller object
+
+    Returns:
+        None
+
+    """
+    # Initialize key variables
+    skipped = sorted(
+        set(
+            argument.hostname
+            for argument, result in zip(arguments, results)
+            if result == _SKIPPED
+        )
+    )
+    failed = len([_ for _ in results if _ == _FAILED])
+    polled = len([_ for _ in results if _ == _POLLED])
+
+    # Log
+    log_message = """\
+Polling cycle complete. {} device(s) polled, {} failed, {} skipped after \
+repeated failures.""".format(
+        polled, failed, len(skipped)
+    )
+    log.log2info(2013, log_message)
+    if bool(skipped) is True:
+        log_message = """\
+Devices skipped after repeated polling failures: {}""".format(
+            ", ".join(skipped)
+        )
+        log.log2info(2014, log_message)
+
+    # Rank the slowest queries of all devices
+    if config.polling_timing() is True:
+        report = timing.aggregate(files.timing_directory(config))
+        timing.save(report, files.timing_report_file(config))
 
 
-def device(poll, post=True):
+def device(poll, post=True, backoff=True, timed=False, batch=None):
     """Poll single device for data and create YAML files.
 
     Args:
         poll: _META object
         post: Post the data if True, else just print it.
+        backoff: Poll less often devices that have repeatedly failed to
+            respond if True.
+        timed: Record the cost of each SNMP query if True, or if enabled
+            in the configuration. The timing report is printed with the
+            data if post is False, else saved to a file.
+        batch: Batch object to add the data to instead of posting it.
 
     Returns:
-        None
+        result: Result of polling the device. None if not polled.
 
     """
     # Initialize key variables
     hostname = poll.hostname
     zone = poll.zone
     config = poll.config
+    result = None
 
     # Do nothing if the skip file exists
     skip_file = files.skip_file(AGENT_POLLER, config)
@@ -89,41 +453,172 @@ shutdown request was probably requested""".format(
             skip_file, hostname, zone
         )
         log.log2debug(1041, log_message)
-        return
+        return result
 
     # Poll data for obviously valid hostnames (eg. "None" used in installation)
-    if bool(hostname) is True:
-        if isinstance(hostname, str) is True:
-            if hostname.lower() != "none":
-                poll = poller.Poll(hostname)
-                snmp_data = poll.query()
-
-                # Process if we get valid data
-                if bool(snmp_data) and isinstance(snmp_data, dict):
-                    # Process device data
-                    _device = udevice.Device(snmp_data)
-                    data = _device.process()
-                    data["misc"]["zone"] = zone
-
-                    if bool(post) is True:
-                        # Update the database tables with polled data
-                        rest.post(API_POLLER_POST_URI, data, config)
-                    else:
-                        pprint(data)
-                else:
-                    log_message = """\
+    if bool(hostname) is False or isinstance(hostname, str) is False:
+        return result
+    if hostname.lower() == "none":
+        return result
+
+    # Don't pay the SNMP timeouts of devices that keep failing
+    if bool(backoff) is True:
+        failures = Backoff(hostname, config, interval=poll.interval)
+        if failures.due() is False:
+            return _SKIPPED
+
+        # Check failed devices are back with a single query before polling
+        if bool(failures.failures()) is True:
+            if poller.reachable(hostname) is False:
+                failures.failure()
+                log_message = """\
+Device {} is still unreachable after {} consecutive polling failures\
+""".format(
+                    hostname, failures.failures()
+                )
+                log.log2debug(2015, log_message)
+                return _FAILED
+
+    timed = bool(timed) or config.polling_timing()
+    poll = poller.Poll(hostname, timed=timed)
+    snmp_data = poll.query()
+
+    # Save or print the timing report
+    report = poll.timing()
+    if bool(report) is True:
+        if bool(post) is True:
+            timing.save(report, files.timing_file(hostname, config))
+        else:
+            print(json.dumps(report, indent=2, sort_keys=True))
+
+    # Process if we get valid data
+    if bool(snmp_data) and isinstance(snmp_data, dict):
+        # Process device data
+        _device = udevice.Device(snmp_data)
+        data = _device.process()
+        data["misc"]["zone"] = zone
+        data["misc"]["poller_node"] = config.sharding_node()
+
+        if bool(post) is True:
+            # Update the database tables with polled data
+            _post(hostname, data, config, batch=batch)
+        else:
+            pprint(data)
+        result = _POLLED
+    else:
+        log_message = """\
 Device {} returns no data. Check your connectivity and/or SNMP configuration\
 """.format(
-                        hostname
-                    )
-                    log.log2debug(1025, log_message)
+            hostname
+        )
+        log.log2debug(1025, log_message)
+        result = _FAILED
+
+    # Update the failure record
+    if bool(backoff) is True:
+        if result == _POLLED:
+            failures.success()
+        else:
+            failures.failure()
 
+    # Return
+    return result
 
-def cli_device(hostname):
+
+def _post(hostname, data, config, batch=None):
+    """Post the data of a device to the server.
+
+    Data unchanged since the server last acknowledged it is replaced by a
+    short message if configured.
+
+    Args:
+        hostname: Hostname of the device
+        data: Dict of device data
+        config: ConfigPoller object
+        batch: Batch object to add the data to instead of posting it.
+
+    Returns:
+        None
+
+    """
+    # Initialize key variables
+    record = None
+    payload = data
+
+    # Replace unchanged data. Partial data is always posted in full.
+    if config.polling_skip_unchanged() is True:
+        record = Unchanged(hostname, data, config)
+        if bool(data["misc"].get("partial")) is True:
+            record.forget()
+            record = None
+        else:
+            data["misc"]["fingerprint"] = record.value
+            if record.unchanged() is True:
+                payload = fingerprint.unchanged(data)
+
+    # Batches are acknowledged when posted
+    if batch is not None:
+        batch.add(
+            payload,
+            record=record,
+            full=None if payload is data else data,
+        )
+        return
+
+    # Post. Send the data in full if the server doesn't have it anymore.
+    result = _send(payload, config)
+    if payload is not data and _conflict(result) is True:
+        result = _send(data, config)
+    if record is not None and getattr(result, "success", False) is True:
+        record.acknowledge()
+
+
+def _send(data, config):
+    """Send the data of a device to the server.
+
+    Args:
+        data: Dict of device data
+        config: ConfigPoller object
+
+    Returns:
+        result: Post named tuple
+
+    """
+    # Initialize key variables
+    compress = config.polling_compression()
+
+    # Return
+    if config.polling_stream() is True:
+        result = rest.post_stream(
+            API_POLLER_POST_URI, data, config, compress=compress
+        )
+    else:
+        result = rest.post(API_POLLER_POST_URI, data, config, compress=compress)
+    return result
+
+
+def _conflict(result):
+    """Determine whether the server doesn't have a device's unchanged data.
+
+    Args:
+        result: Post named tuple
+
+    Returns:
+        conflict: True if the server doesn't have the data
+
+    """
+    # Return
+    response = getattr(result, "response", None)
+    conflict = response is not None and response.status_code == 409
+    return conflict
+
+
+def cli_device(hostname, timed=False):
     """Poll single device for data and create YAML files.
 
     Args:
         hostname: Host to poll
+        timed: Print a report of the cost of each SNMP query if True
 
     Returns:
         None
@@ -135,8 +630,9 @@ def cli_device(hostname):
     # Get configuration
     config = ConfigPoller()
 
-    # Create a list of polling objects
-    zones = sorted(config.zones())
+    # Create a list of polling objects. Devices polled by other poller
+    # nodes can be polled from the command line too.
+    zones = sorted(config.zones(sharded=False))
 
     # Create a list of arguments
     for zone in zones:
@@ -148,7 +644,7 @@ def cli_device(hostname):
 
     if bool(arguments) is True:
         for argument in arguments:
-            device(argument, post=False)
+            device(argument, post=False, backoff=False, timed=timed)
     else:
         log_message = "No hostname {} found in configuration".format(hostname)
         log.log2see(1036, log_message)
@@ -0,0 +1,361 @@
+"""Module to schedule the polling of each device at its own interval."""
+
+from collections import namedtuple, defaultdict, deque
+import heapq
+import itertools
+import time
+
+# A device to poll and when to poll it
+JOB = namedtuple("JOB", "due interval item")
+
+
+class Scheduler:
+    """Class that keeps jobs in a priority queue ordered by due time.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+
+    def __init__(self):
+        """Instantiate the class.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables. The sequence keeps jobs due at the same
+        # time in the order they were added, without comparing their items.
+        self._heap = []
+        self._sequence = itertools.count()
+
+    def __len__(self):
+        """Get the number of scheduled jobs.
+
+        Args:
+            None
+
+        Returns:
+            result: Number of jobs
+
+        """
+        # Return
+        result = len(self._heap)
+        return result
+
+    def add(self, item, interval, due=None):
+        """Schedule an item to be polled at regular intervals.
+
+        Args:
+            item: Item to schedule
+            interval: Polling interval in seconds
+            due: Time the item is first due. Defaults to now.
+
+        Returns:
+            None
+
+        """
+        # Add
+        if due is None:
+            due = time.time()
+        self.push(JOB(due=due, interval=interval, item=item))
+
+    def push(self, job):
+        """Return a job to the queue without changing its due time.
+
+        Args:
+            job: JOB object
+
+        Returns:
+            None
+
+        """
+        # Add
+        heapq.heappush(self._heap, (job.due, next(self._sequence), job))
+
+    def jobs(self):
+        """Get the scheduled jobs.
+
+        Args:
+            None
+
+        Returns:
+            result: List of JOB objects, earliest first
+
+        """
+        # Return
+        result = [job for (_, _, job) in sorted(self._heap)]
+        return result
+
+    def pop(self, now=None, limit=None):
+        """Remove the jobs that are due from the queue.
+
+        Args:
+            now: Current time. Defaults to now.
+            limit: Maximum number of jobs to return. Defaults to all.
+
+        Returns:
+            result: List of JOB objects, earliest first
+
+        """
+        # Initialize key variables
+        result = []
+        if now is None:
+            now = time.time()
+
+        # Get due jobs
+        while bool(self._heap) is True and self._heap[0][0] <= now:
+            if limit is not None and len(result) >= limit:
+                break
+            (_, _, job) = heapq.heappop(self._heap)
+            result.append(job)
+
+        # Return
+        return result
+
+    def reschedule(self, job, now=None):
+        """Schedule the next poll of a job after it has been polled.
+
+        Jobs keep to their intervals relative to when they were first due,
+        so polling time doesn't make them drift. Jobs that overran their
+        interval are due immediately.
+
+        Args:
+            job: JOB object
+            now: Current time. Defaults to now.
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        if now is None:
+            now = time.time()
+
+        # Reschedule
+        due = max(job.due + job.interval, now)
+        self.push(job._replace(due=due))
+
+    def wait(self, now=None):
+        """Get the time until the next job is due.
+
+        Args:
+            now: Current time. Defaults to now.
+
+        Returns:
+            result: Seconds until the next job is due. None if there are
+                no jobs.
+
+        """
+        # Initialize key variables
+        result = None
+        if now is None:
+            now = time.time()
+
+        # Return
+        if bool(self._heap) is True:
+            result = max(self._heap[0][0] - now, 0)
+        return result
+
+
+class Workers:
+    """Class that starts due jobs on a pool of workers.
+
+    The items of the jobs must have a zone attribute. Jobs of zones that
+    already use their share of the workers wait in a queue for their zone,
+    so they don't stop the jobs of other zones from starting.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+
+    def __init__(self, submit, workers, zone_workers=None):
+        """Instantiate the class.
+
+        Args:
+            submit: Function that starts polling an item and returns a
+                future
+            workers: Number of workers
+            zone_workers: Maximum number of workers used by a zone.
+                Defaults to all of them.
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._submit = submit
+        self._workers = workers
+        self._zone_workers = workers if zone_workers is None else zone_workers
+        self._running = {}
+        self._zones = defaultdict(int)
+        self._waiting = defaultdict(deque)
+
+    def full(self):
+        """Determine whether all the workers are busy.
+
+        Args:
+            None
+
+        Returns:
+            result: True if full
+
+        """
+        # Return
+        result = len(self._running) >= self._workers
+        return result
+
+    def futures(self):
+        """Get the futures of the jobs being run.
+
+        Args:
+            None
+
+        Returns:
+            result: List of futures
+
+        """
+        # Return
+        result = list(self._running)
+        return result
+
+    def jobs(self):
+        """Get the jobs being run.
+
+        Args:
+            None
+
+        Returns:
+            result: List of JOB objects
+
+        """
+        # Return
+        result = list(self._running.values())
+        return result
+
+    def start(self, scheduler, now=None):
+        """Start due jobs while workers are free.
+
+        Args:
+            scheduler: Scheduler object with the jobs
+            now: Current time. Defaults to now.
+
+        Returns:
+            None
+
+        """
+        # Jobs waiting for their zone's workers were due first
+        for zone in list(self._waiting):
+            queue = self._waiting[zone]
+            while bool(queue) is True and self._available(zone) is True:
+                self._start(queue.popleft())
+            if bool(queue) is False:
+                del self._waiting[zone]
+
+        # Start due jobs. The others wait for their zone's workers.
+        while self.full() is False:
+            jobs = scheduler.pop(
+                now=now, limit=self._workers - len(self._running)
+            )
+            if bool(jobs) is False:
+                break
+            for job in jobs:
+                if self._available(job.item.zone) is True:
+                    self._start(job)
+                else:
+                    self._waiting[job.item.zone].append(job)
+
+    def finish(self, future):
+        """Free the worker of a completed job.
+
+        Args:
+            future: Future of the job
+
+        Returns:
+            result: JOB object
+
+        """
+        # Return
+        result = self._running.pop(future)
+        self._zones[result.item.zone] -= 1
+        return result
+
+    def waiting(self):
+        """Remove the jobs waiting for their zone's workers.
+
+        Args:
+            None
+
+        Returns:
+            result: List of JOB objects
+
+        """
+        # Return
+        result = [job for queue in self._waiting.values() for job in queue]
+        self._waiting.clear()
+        return result
+
+    def _available(self, zone):
+        """Determine whether a zone can use another worker.
+
+        Args:
+            zone: Name of the zone
+
+        Returns:
+            result: True if available
+
+        """
+        # Return
+        result = self._zones[zone] < self._zone_workers
+        return result
+
+    def _start(self, job):
+        """Start a job.
+
+        Args:
+            job: JOB object
+
+        Returns:
+            None
+
+        """
+        # Start
+        future = self._submit(job.item)
+        self._running[future] = job
+        self._zones[job.item.zone] += 1
+
+
+def interval(zone, hostname, default):
+    """Get the polling interval of a device.
+
+    Args:
+        zone: ZONE object of the zone containing the device
+        hostname: Hostname of the device
+        default: Polling interval to use if the zone doesn't define one
+
+    Returns:
+        result: Polling interval in seconds
+
+    """
+    # Initialize key variables
+    result = default
+
+    # Per device values override per zone values
+    if bool(zone.polling_interval) is True:
+        result = zone.polling_interval
+    if bool(zone.polling_intervals) is True:
+        result = zone.polling_intervals.get(hostname, result)
+
+    # Return
+    result = max(int(result), 1)
+    return result
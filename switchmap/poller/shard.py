@@ -0,0 +1,79 @@
+"""Module to share the polling of devices among several poller nodes.
+
+Devices are assigned to nodes by rendezvous hashing of their hostnames.
+Each node scores every hostname and a device is polled by the node with
+the highest score. All nodes with the same list of node IDs agree on the
+assignments without contacting each other. When a node joins the cluster
+it only takes devices from the other nodes, and when a node leaves only
+its devices are assigned to the other nodes.
+
+"""
+
+import hashlib
+
+
+def owner(hostname, nodes):
+    """Get the node that polls a device.
+
+    Args:
+        hostname: Hostname of the device
+        nodes: List of the IDs of the poller nodes
+
+    Returns:
+        result: ID of the node. None if there are no nodes.
+
+    """
+    # Initialize key variables
+    result = None
+    best = None
+
+    # Find the node with the highest score. Ties go to the lowest node ID.
+    for node in sorted(nodes):
+        value = _score(hostname, node)
+        if best is None or value > best:
+            best = value
+            result = node
+
+    # Return
+    return result
+
+
+def share(hostnames, node, nodes, pinned=None):
+    """Get the devices a node polls.
+
+    Args:
+        hostnames: List of hostnames of the devices
+        node: ID of the node
+        nodes: List of the IDs of the poller nodes
+        pinned: ID of the node that polls all the devices. None if the
+            devices are assigned by hashing.
+
+    Returns:
+        result: List of hostnames polled by the node
+
+    """
+    # Devices pinned to a node aren't hashed
+    if pinned is not None:
+        result = list(hostnames) if pinned == node else []
+    else:
+        result = [_ for _ in hostnames if owner(_, nodes) == node]
+
+    # Return
+    return result
+
+
+def _score(hostname, node):
+    """Score a hostname for a node.
+
+    Args:
+        hostname: Hostname of the device
+        node: ID of the node
+
+    Returns:
+        result: Score as an integer
+
+    """
+    # Return
+    digest = hashlib.sha256("{}\0{}".format(node, hostname).encode()).digest()
+    result = int.from_bytes(digest[:8], "big")
+    return result
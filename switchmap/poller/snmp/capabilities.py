@@ -0,0 +1,226 @@
+"""Module to cache the MIBs supported by a device between polls."""
+
+import os
+import time
+
+# PIP imports
+import yaml
+
+# Switchmap imports
+from switchmap.poller.configuration import ConfigPoller
+from switchmap.core import files
+from switchmap.core import log
+
+
+class Capabilities:
+    """Class that tracks the MIB Query classes a device supports.
+
+    Probing for MIB support costs several round trips per Query class. The
+    results are cached on disk keyed by hostname and sysObjectID, and are
+    only probed again when the cache expires or the device has been
+    rebooted or replaced.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+
+    def __init__(self, snmp_object):
+        """Instantiate the class.
+
+        Args:
+            snmp_object: SNMP Interact class object from snmp_manager.py
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        config = ConfigPoller()
+        self._snmp_object = snmp_object
+        self._hostname = snmp_object.hostname()
+        self._interval = config.capabilities_interval()
+        self._filename = files.capabilities_file(self._hostname, config)
+        self._updated = False
+
+        # Get the values that identify a reboot or hardware change
+        self._sysobjectid = snmp_object.sysobjectid()
+        self._sysuptime = snmp_object.sysuptime()
+
+        # Load the cache
+        self._timestamp, self._supported = self._load()
+
+    def supported(self, query):
+        """Return device's support for the MIB of a Query object.
+
+        Args:
+            query: MIB Query object
+
+        Returns:
+            result: True if supported
+
+        """
+        # Initialize key variables
+        name = query.__class__.__name__
+
+        # Return the cached value
+        if name in self._supported:
+            result = self._supported[name]
+            return result
+
+        # Probe the device
+        errors = self._snmp_object.errors()
+        result = bool(query.supported())
+
+        # Only cache a lack of support when the device definitely said so.
+        # Timeouts and other errors may be transient, so the device is
+        # probed again on the next poll.
+        if result is True or self._snmp_object.errors() == errors:
+            self._supported[name] = result
+            self._updated = True
+        else:
+            log_message = """\
+Unable to determine whether host {} supports {}. Probing again on the next \
+poll.""".format(
+                self._hostname, name
+            )
+            log.log2debug(2031, log_message)
+
+        # Return
+        return result
+
+    def unsupported(self, query_class):
+        """Determine whether a MIB Query class is cached as unsupported.
+
+        Query classes cached as unsupported don't need to be instantiated,
+        which may query the device.
+
+        Args:
+            query_class: MIB Query class
+
+        Returns:
+            result: True if cached as unsupported
+
+        """
+        # Return
+        result = self._supported.get(query_class.__name__) is False
+        return result
+
+    def save(self):
+        """Save the MIBs supported by the device to the cache file.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Don't write a cache we can't validate on the next poll
+        if self._updated is False or bool(self._sysobjectid) is False:
+            return
+
+        # Create the data to save
+        data = {
+            "hostname": self._hostname,
+            "sysobjectid": self._sysobjectid,
+            "sysuptime": self._sysuptime,
+            "timestamp": self._timestamp,
+            "supported": self._supported,
+        }
+
+        # Save
+        try:
+            with open(self._filename, "w") as f_handle:
+                yaml.dump(data, f_handle, default_flow_style=False)
+        except:
+            log_message = """\
+Unable to write MIB capabilities cache file {} for host {}\
+""".format(
+                self._filename, self._hostname
+            )
+            log.log2warning(2010, log_message)
+            return
+
+        self._updated = False
+
+    def _load(self):
+        """Read the MIBs supported by the device from the cache file.
+
+        Args:
+            None
+
+        Returns:
+            result: Tuple of (timestamp, supported) where timestamp is the
+                time the device was last probed and supported is a dict
+                of support keyed by Query class name
+
+        """
+        # Initialize key variables
+        now = int(time.time())
+        result = (now, {})
+
+        # Read the cache file
+        if os.path.isfile(self._filename) is False:
+            return result
+        data = files.read_yaml_file(self._filename, die=False)
+
+        # Validate
+        oldest = now - self._interval
+        valid = _valid(data, self._sysobjectid, self._sysuptime, oldest)
+        if valid is False:
+            log_message = """\
+Validating the MIBs supported by host {} again.""".format(
+                self._hostname
+            )
+            log.log2debug(2011, log_message)
+            return result
+
+        # Return
+        result = (data["timestamp"], data["supported"])
+        return result
+
+
+def _valid(data, sysobjectid, sysuptime, oldest):
+    """Determine whether cached MIB capabilities are still valid.
+
+    Args:
+        data: Dict of cached data
+        sysobjectid: Current sysObjectID of the device
+        sysuptime: Current sysUpTime of the device
+        oldest: Oldest timestamp of a valid cache
+
+    Returns:
+        valid: True if valid
+
+    """
+    # Initialize key variables
+    valid = False
+
+    # The cache must be well formed
+    if isinstance(data, dict) is False:
+        return valid
+    if isinstance(data.get("supported"), dict) is False:
+        return valid
+    if isinstance(data.get("timestamp"), int) is False:
+        return valid
+
+    # The cache must be recent and for the same type of device
+    if data["timestamp"] < oldest:
+        return valid
+    if bool(sysobjectid) is False or data.get("sysobjectid") != sysobjectid:
+        return valid
+
+    # A lower sysUpTime means the device has been rebooted or upgraded
+    if isinstance(sysuptime, int) and isinstance(data.get("sysuptime"), int):
+        if sysuptime < data["sysuptime"]:
+            return valid
+    else:
+        return valid
+
+    # Return
+    valid = True
+    return valid
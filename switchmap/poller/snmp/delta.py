@@ -0,0 +1,440 @@
+"""Module to only query the device data that changed since the last poll."""
+
+import os
+import time
+
+# PIP imports
+import yaml
+
+# Switchmap imports
+from switchmap.poller.configuration import ConfigPoller
+from switchmap.core import files
+from switchmap.core import log
+
+# Scalar OIDs that change when the device's configuration changes
+_SYSUPTIME = ".1.3.6.1.2.1.1.3.0"
+_IFTABLELASTCHANGE = ".1.3.6.1.2.1.31.1.5.0"
+_IFSTACKLASTCHANGE = ".1.3.6.1.2.1.31.1.6.0"
+_ENTLASTCHANGETIME = ".1.3.6.1.2.1.47.1.4.1.0"
+
+# IF-MIB::ifLastChange column
+_IFLASTCHANGE = ".1.3.6.1.2.1.2.2.1.9"
+
+# The change indicators that must be unchanged to reuse the data of each
+# MIB Query class. Classes not listed here are always queried. These
+# include the MAC address, ARP and neighbor tables that change all the
+# time, and the VLAN memberships of ports, without the indicators changing.
+_INDICATORS = {
+    "interfaces": ["ifTableLastChange", "ifStackLastChange", "ifLastChange"],
+    "entity": ["entLastChangeTime"],
+}
+_QUERIES = {
+    "CiscoC2900Query": "interfaces",
+    "CiscoStackQuery": "interfaces",
+    "CiscoVlanIftableRelationshipQuery": "interfaces",
+    "EntityQuery": "entity",
+    "EssSwitchQuery": "interfaces",
+    "EtherlikeQuery": "interfaces",
+    "If64Query": "interfaces",
+    "IfQuery": "interfaces",
+}
+
+# Columns of the data of MIB Query classes that change without the change
+# indicators changing. They are queried again when the rest of the data is
+# reused. Keyed by class, then layer, then the key of the column in the
+# data, with the name of the method that queries the column.
+_REFRESH = {"IfQuery": {"layer1": {"ifAlias": "ifalias"}}}
+
+
+class Delta:
+    """Class that reuses the data of MIBs that haven't changed on a device.
+
+    The data returned by each MIB Query class is saved in a snapshot file.
+    On the next poll a few cheap change indicators are queried first.
+    Query classes whose indicators didn't change return the saved data
+    instead of querying the device.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+
+    def __init__(self, snmp_object):
+        """Instantiate the class.
+
+        Args:
+            snmp_object: SNMP Interact class object from snmp_manager.py
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        config = ConfigPoller()
+        self._enabled = config.delta_polling()
+        self._interval = config.delta_polling_interval()
+        self._snmp_object = snmp_object
+        self._hostname = snmp_object.hostname()
+        self._filename = files.snapshot_file(self._hostname, config)
+        self._timestamp = int(time.time())
+        self._indicators = {}
+        self._unchanged = set()
+        self._data = {}
+        self._fresh = set()
+
+        # Nothing more to do
+        if self._enabled is False:
+            return
+
+        # Find the MIB data that hasn't changed
+        self._indicators = _indicators(snmp_object)
+        snapshot = self._load()
+        if bool(snapshot) is True:
+            self._timestamp = snapshot["timestamp"]
+            self._data = snapshot["data"]
+            self._unchanged = _unchanged(
+                snapshot["indicators"], self._indicators
+            )
+
+    def query(self, item):
+        """Get the object to use for querying a MIB.
+
+        Args:
+            item: MIB Query object
+
+        Returns:
+            result: Object with the same layer methods as the MIB Query
+                object
+
+        """
+        # Initialize key variables
+        name = item.__class__.__name__
+
+        # Return the MIB Query object if the data isn't saved
+        if self._enabled is False:
+            return item
+
+        # Use the saved data if it hasn't changed. Query classes providing
+        # data for several layers are only checked the first time.
+        if name in self._fresh:
+            result = _Query(self._data[name], query=item)
+        elif _QUERIES.get(name) in self._unchanged and name in self._data:
+            refresh = {
+                layer: {
+                    key: getattr(item, method)
+                    for key, method in columns.items()
+                }
+                for layer, columns in _REFRESH.get(name, {}).items()
+            }
+            result = _Query(self._data[name], refresh=refresh)
+        else:
+            self._fresh.add(name)
+            self._data[name] = {}
+            result = _Query(self._data[name], query=item)
+        return result
+
+    def save(self):
+        """Save the data of the poll to the snapshot file.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Nothing to do
+        if self._enabled is False:
+            return
+
+        # Don't save snapshots that can't be validated on the next poll
+        if self._indicators.get("sysUpTime") is None:
+            return
+
+        # The timestamp is the time all the data was last queried
+        if all(_ in self._fresh for _ in self._data) is True:
+            self._timestamp = int(time.time())
+
+        # Create the data to save
+        data = {
+            "hostname": self._hostname,
+            "timestamp": self._timestamp,
+            "indicators": self._indicators,
+            "data": _plain(self._data),
+        }
+
+        # Save
+        try:
+            with open(self._filename, "w") as f_handle:
+                yaml.safe_dump(data, f_handle, default_flow_style=False)
+        except:
+            log_message = """\
+Unable to write snapshot file {} for host {}""".format(
+                self._filename, self._hostname
+            )
+            log.log2warning(2017, log_message)
+
+    def _load(self):
+        """Read the data of the last poll from the snapshot file.
+
+        Args:
+            None
+
+        Returns:
+            result: Snapshot dict, None if it can't be used
+
+        """
+        # Initialize key variables
+        result = None
+        oldest = int(time.time()) - self._interval
+
+        # Read the snapshot file
+        if os.path.isfile(self._filename) is False:
+            return result
+        data = files.read_yaml_file(self._filename, die=False)
+
+        # Validate
+        if _valid(data, self._indicators, oldest) is False:
+            log_message = """\
+Querying all the data of host {}.""".format(
+                self._hostname
+            )
+            log.log2debug(2018, log_message)
+            return result
+
+        # Return
+        result = data
+        return result
+
+
+class _Query:
+    """Class that returns saved MIB data, or saves queried MIB data.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+
+    def __init__(self, data, query=None, refresh=None):
+        """Instantiate the class.
+
+        Args:
+            data: Dict of MIB data keyed by layer
+            query: MIB Query object. The saved data is used if None
+            refresh: Dict of the methods querying the columns of the saved
+                data that are queried again, keyed by layer and the key of
+                the column. None if there are none.
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._data = data
+        self._query = query
+        self._refresh = refresh or {}
+
+    def layer1(self):
+        """Get layer 1 data.
+
+        Args:
+            None
+
+        Returns:
+            result: Layer data
+
+        """
+        # Return
+        result = self._layer("layer1")
+        return result
+
+    def layer2(self):
+        """Get layer 2 data.
+
+        Args:
+            None
+
+        Returns:
+            result: Layer data
+
+        """
+        # Return
+        result = self._layer("layer2")
+        return result
+
+    def layer3(self):
+        """Get layer 3 data.
+
+        Args:
+            None
+
+        Returns:
+            result: Layer data
+
+        """
+        # Return
+        result = self._layer("layer3")
+        return result
+
+    def system(self):
+        """Get system data.
+
+        Args:
+            None
+
+        Returns:
+            result: Layer data
+
+        """
+        # Return
+        result = self._layer("system")
+        return result
+
+    def _layer(self, layer):
+        """Get the data of a layer.
+
+        Args:
+            layer: Name of the layer
+
+        Returns:
+            result: Layer data
+
+        """
+        # Query the device
+        if self._query is not None:
+            self._data[layer] = getattr(self._query, layer)()
+
+        # Update the saved data with the columns queried again
+        for key, method in self._refresh.get(layer, {}).items():
+            rows = self._data.get(layer) or {}
+            for index, value in method().items():
+                if index in rows:
+                    rows[index][key] = value
+
+        # Return
+        result = self._data.get(layer, {})
+        return result
+
+
+def _indicators(snmp_object):
+    """Get the values that change when the device's configuration changes.
+
+    Args:
+        snmp_object: SNMP Interact class object from snmp_manager.py
+
+    Returns:
+        result: Dict of values keyed by MIB object name
+
+    """
+    # Get the scalar values in a single request
+    oids = {
+        "sysUpTime": _SYSUPTIME,
+        "ifTableLastChange": _IFTABLELASTCHANGE,
+        "ifStackLastChange": _IFSTACKLASTCHANGE,
+        "entLastChangeTime": _ENTLASTCHANGETIME,
+    }
+    values = snmp_object.get(list(oids.values()), check_reachability=True)
+    if isinstance(values, dict) is False:
+        values = {}
+    result = {key: values.get(oid) for key, oid in oids.items()}
+
+    # Get the time each interface last changed status
+    values = snmp_object.swalk(_IFLASTCHANGE, normalized=True)
+    result["ifLastChange"] = {
+        int(key): value for key, value in values.items()
+    } or None
+
+    # Return
+    return result
+
+
+def _unchanged(previous, current):
+    """Get the groups of change indicators that haven't changed.
+
+    Args:
+        previous: Dict of change indicators saved in the snapshot
+        current: Dict of change indicators from the device
+
+    Returns:
+        result: Set of the names of unchanged groups
+
+    """
+    # Initialize key variables
+    result = set()
+
+    # Groups need at least one indicator the device supports
+    for group, keys in _INDICATORS.items():
+        if all(current.get(_) is None for _ in keys) is True:
+            continue
+        if all(current.get(_) == previous.get(_) for _ in keys) is True:
+            result.add(group)
+
+    # Return
+    return result
+
+
+def _valid(data, indicators, oldest):
+    """Determine whether the snapshot can be used.
+
+    Args:
+        data: Dict read from the snapshot file
+        indicators: Dict of change indicators from the device
+        oldest: Oldest valid timestamp for a snapshot
+
+    Returns:
+        result: True if valid
+
+    """
+    # Initialize key variables
+    result = False
+
+    # Check the format of the data
+    if isinstance(data, dict) is False:
+        return result
+    for key in ["timestamp", "indicators", "data"]:
+        if key not in data:
+            return result
+    if isinstance(data["indicators"], dict) is False:
+        return result
+    if isinstance(data["data"], dict) is False:
+        return result
+
+    # Query all the data regularly
+    if bool(data["timestamp"]) is False or data["timestamp"] < oldest:
+        return result
+
+    # The data of rebooted devices can't be trusted
+    uptime = indicators.get("sysUpTime")
+    previous = data["indicators"].get("sysUpTime")
+    if uptime is None or previous is None or uptime < previous:
+        return result
+
+    # Return
+    result = True
+    return result
+
+
+def _plain(data):
+    """Convert nested dict subclasses to dicts so they can be saved.
+
+    Args:
+        data: Data to convert
+
+    Returns:
+        result: Converted data
+
+    """
+    # Return
+    if isinstance(data, dict) is True:
+        result = {key: _plain(value) for key, value in data.items()}
+    elif isinstance(data, (list, tuple)) is True:
+        result = [_plain(_) for _ in data]
+    else:
+        result = data
+    return result
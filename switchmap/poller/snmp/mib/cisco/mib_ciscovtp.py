@@ -84,20 +84,24 @@ class CiscoVtpQuery(Query):
         # Initialize key variables
         final = defaultdict(lambda: defaultdict(dict))
 
-        # Get interface vtpVlanName data
-        values = self.vtpvlanname()
-        for key, value in values.items():
-            final[key]["vtpVlanName"] = value
-
-        # Get interface vtpVlanType data
-        values = self.vtpvlantype()
-        for key, value in values.items():
-            final[key]["vtpVlanType"] = value
-
-        # Get interface vtpVlanState data
-        values = self.vtpvlanstate()
-        for key, value in values.items():
-            final[key]["vtpVlanState"] = value
+        # Map the vtpVlanTable columns to their keys
+        columns = {
+            self.vtpvlanname(oidonly=True): "vtpVlanName",
+            self.vtpvlantype(oidonly=True): "vtpVlanType",
+            self.vtpvlanstate(oidonly=True): "vtpVlanState",
+        }
+
+        # Get all the VLAN data in a single table walk. Rows are indexed by
+        # managementDomainIndex and vtpVlanIndex. Use the VLAN as the key.
+        rows = self.snmp_object.table(list(columns.keys()))
+        for key, row in rows.items():
+            vlan = int(key.split(".")[-1])
+            for oid, value in row.items():
+                title = columns[oid]
+                if title == "vtpVlanName":
+                    final[vlan][title] = str(bytes(value), encoding="utf-8")
+                else:
+                    final[vlan][title] = value
 
         # Return
         return final
@@ -115,30 +119,37 @@ class CiscoVtpQuery(Query):
         # Initialize key variables
         final = defaultdict(lambda: defaultdict(dict))
 
-        # Get interface vlanTrunkPortDynamicState data
-        values = self.vlantrunkportdynamicstate()
-        for key, value in values.items():
-            final[key]["vlanTrunkPortDynamicState"] = value
-
-        # Get interface vlanTrunkPortDynamicStatus data
-        values = self.vlantrunkportdynamicstatus()
-        for key, value in values.items():
-            final[key]["vlanTrunkPortDynamicStatus"] = value
-
-        # Get interface vlanTrunkPortNativeVlan data
-        values = self.vlantrunkportnativevlan()
-        for key, value in values.items():
-            final[key]["vlanTrunkPortNativeVlan"] = value
-
-        # Get interface vlanTrunkPortEncapsulationType data
-        values = self.vlantrunkportencapsulationtype()
-        for key, value in values.items():
-            final[key]["vlanTrunkPortEncapsulationType"] = value
+        # Map the vlanTrunkPortTable columns to their keys
+        columns = {
+            self.vlantrunkportdynamicstate(
+                oidonly=True
+            ): "vlanTrunkPortDynamicState",
+            self.vlantrunkportdynamicstatus(
+                oidonly=True
+            ): "vlanTrunkPortDynamicStatus",
+            self.vlantrunkportnativevlan(
+                oidonly=True
+            ): "vlanTrunkPortNativeVlan",
+            self.vlantrunkportencapsulationtype(
+                oidonly=True
+            ): "vlanTrunkPortEncapsulationType",
+        }
+        status_oid = self.vlantrunkportdynamicstatus(oidonly=True)
+        enabled_oid = self.vlantrunkportvlansenabled(oidonly=True)
+
+        # Get all the trunk data in a single table walk
+        rows = self.snmp_object.table(list(columns.keys()) + [enabled_oid])
+        for key, row in rows.items():
+            ifindex = int(key)
+            for oid, value in row.items():
+                if oid in columns:
+                    final[ifindex][columns[oid]] = value
 
-        # Get interface vlanTrunkPortVlansEnabled data
-        values = self.vlantrunkportvlansenabled()
-        for key, value in values.items():
-            final[key]["vlanTrunkPortVlansEnabled"] = value
+            # Only trunking interfaces have enabled VLANs
+            if row.get(status_oid) == 1 and enabled_oid in row:
+                vlans = _vlans(row[enabled_oid])
+                if bool(vlans) is True:
+                    final[ifindex]["vlanTrunkPortVlansEnabled"] = vlans
 
         # Return
         return final
@@ -356,11 +367,6 @@ class CiscoVtpQuery(Query):
         """
         # Initialize key variables
         data_dict = defaultdict(dict)
-        length_in_bits = 1024
-        base = 16
-
-        # Get the trunk status for all ifIndex values
-        trunkstatus = self.vlantrunkportdynamicstatus()
 
         # OID to Process
         oid = ".1.3.6.1.4.1.9.9.46.1.6.1.1.4"
@@ -369,25 +375,48 @@ class CiscoVtpQuery(Query):
         if oidonly is True:
             return oid
 
+        # Get the trunk status for all ifIndex values
+        trunkstatus = self.vlantrunkportdynamicstatus()
+
         # Process results
         results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Get the ifindex value
             ifindex = int(key)
 
-            # Convert hex value to right justified 1024 character binary string
-            vlans_hex = binascii.hexlify(value).decode("utf-8")
-            binary_string = bin(int(vlans_hex, base))[2:].zfill(length_in_bits)
-
             # Assign flag vlans on interface
             if trunkstatus[ifindex] == 1:
-                for svlan, state in enumerate(binary_string):
-                    vlan = int(svlan)
-                    if int(state) == 1:
-                        if ifindex in data_dict:
-                            data_dict[ifindex].append(vlan)
-                        else:
-                            data_dict[ifindex] = [vlan]
+                vlans = _vlans(value)
+                if bool(vlans) is True:
+                    data_dict[ifindex] = vlans
 
         # Return the interface descriptions
         return data_dict
+
+
+def _vlans(value):
+    """Convert a CISCO-VTP-MIB vlanTrunkPortVlansEnabled bitmap to VLANs.
+
+    Args:
+        value: vlanTrunkPortVlansEnabled value
+
+    Returns:
+        vlans: List of enabled VLAN tags
+
+    """
+    # Initialize key variables
+    vlans = []
+    length_in_bits = 1024
+    base = 16
+
+    # Convert hex value to right justified 1024 character binary string
+    vlans_hex = binascii.hexlify(value).decode("utf-8")
+    binary_string = bin(int(vlans_hex, base))[2:].zfill(length_in_bits)
+
+    # Flag vlans on interface
+    for svlan, state in enumerate(binary_string):
+        if int(state) == 1:
+            vlans.append(int(svlan))
+
+    # Return
+    return vlans
@@ -221,12 +221,8 @@ class BridgeQuery(Query):
                 # Convert decimal mac to hex
                 # (Only use the last 6 digits in the decimal_macaddress, first
                 # digit is the vlan number)
-                hex_macaddress = ""
                 mac_bytes = decimal_macaddress.split(".")[-6:]
-                for mac_byte in mac_bytes:
-                    hex_macaddress = "{}{}".format(
-                        hex_macaddress, hex(int(mac_byte))[2:].zfill(2)
-                    )
+                hex_macaddress = bytes(int(_) for _ in mac_bytes).hex()
 
                 # Assign MAC to baseport index
                 if dot1dbaseport in dot1dbaseport_macs:
@@ -261,12 +257,9 @@ class BridgeQuery(Query):
             context_names = [""]
         data_dict = defaultdict(dict)
 
-        # Process values
+        # Process values. Walk the contexts concurrently
         oid = ".1.3.6.1.2.1.17.4.3.1.2"
-        for context_name in context_names:
-            results = self._snmp_object.swalk(
-                oid, normalized=False, context_name=context_name
-            )
+        for results in self._snmp_object.context_walks(oid, context_names):
             for key, value in results.items():
                 new_key = key[len(oid) :]
                 data_dict[new_key] = value
@@ -302,15 +295,26 @@ class BridgeQuery(Query):
             for key, _ in vlan_dict.items():
                 vlans.append(key)
 
-            # Process values
+            # Get the whole table in a single walk. The index of each row
+            # starts with the FID of the VLAN.
             oid = ".1.3.6.1.2.1.17.7.1.2.2.1.2"
-            for vlan in vlans:
-                new_oid = "{}.{}".format(oid, vlan)
-                results = self._snmp_object.swalk(new_oid, normalized=False)
-                for key, value in results.items():
-                    new_key = key[len(oid) :]
+            errors = self._snmp_object.errors()
+            results = self._snmp_object.swalk(oid, normalized=False)
+            for key, value in results.items():
+                new_key = key[len(oid) :]
+                if _fid(new_key) in vlan_dict:
                     data_dict[new_key] = value
 
+            # Some devices only return the table one VLAN at a time. Walks
+            # that failed, such as timeouts, aren't repeated for each VLAN.
+            if bool(results) is False and self._snmp_object.errors() == errors:
+                for vlan in vlans:
+                    new_oid = "{}.{}".format(oid, vlan)
+                    results = self._snmp_object.swalk(new_oid, normalized=False)
+                    for key, value in results.items():
+                        new_key = key[len(oid) :]
+                        data_dict[new_key] = value
+
         # Return data
         return data_dict
 
@@ -330,12 +334,9 @@ class BridgeQuery(Query):
             context_names = [""]
         data_dict = defaultdict(dict)
 
-        # Process values
+        # Process values. Walk the contexts concurrently
         oid = ".1.3.6.1.2.1.17.4.3.1.1"
-        for context_name in context_names:
-            results = self._snmp_object.swalk(
-                oid, normalized=False, context_name=context_name
-            )
+        for results in self._snmp_object.context_walks(oid, context_names):
             for key, mac_value in results.items():
                 # Assign the mac address to the dictionary
                 new_key = key[len(oid) :]
@@ -389,11 +390,12 @@ class BridgeQuery(Query):
         # Initialize key variables
         cisco_style = 0
         styles = [0, 1]
+        oid = ".1.3.6.1.2.1.17.4.3.1.1"
 
-        # Try all available styles
-        for style in styles:
-            context_names = [_cisco_vlan_context(vlan, style)]
-            result = self._dot1dtpfdbaddress(context_names=context_names)
+        # Try all available styles concurrently. Use the first that works.
+        context_names = [_cisco_vlan_context(vlan, _) for _ in styles]
+        results = self._snmp_object.context_walks(oid, context_names)
+        for style, result in zip(styles, results):
             if bool(result) is True:
                 cisco_style = style
                 break
@@ -425,6 +427,21 @@ def _cisco_vlan_context(vlan, context_style):
     return cisco_context
 
 
+def _fid(key):
+    """Get the FID from the index of a dot1qTpFdbTable row.
+
+    Args:
+        key: Row index starting with a period. eg. ".10.0.1.2.3.4.5"
+
+    Returns:
+        result: FID as a string
+
+    """
+    # Return
+    result = key.lstrip(".").split(".", 1)[0]
+    return result
+
+
 def _snmp_octetstr_2_string(binary_value):
     """Convert SNMP OCTETSTR to string.
 
@@ -436,5 +453,5 @@ def _snmp_octetstr_2_string(binary_value):
 
     """
     # Convert and return
-    result = "".join(["%0.2x" % ord(_) for _ in binary_value.decode("utf-8")])
-    return result.lower()
+    result = general.octetstr_2_string(binary_value)
+    return result
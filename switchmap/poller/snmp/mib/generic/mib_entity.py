@@ -86,41 +86,49 @@ class EntityQuery(Query):
         """
         # Initialize key variables
         data_dict = defaultdict(lambda: defaultdict(dict))
+        values = defaultdict(dict)
         final = {}
 
-        # Get data
-        hw_rev = self.entphysicalhardwarerev()
-        fw_rev = self.entphysicalfirmwarerev()
-        sw_rev = self.entphysicalsoftwarerev()
-        name = self.entphysicalname()
-        model = self.entphysicalmodelname()
-        serial = self.entphysicalserialnum()
-        classtype = self.entphysicalclass()
-        description = self.entphysicaldescr()
+        # Map the entPhysicalTable columns to their keys
+        columns = {
+            self.entphysicalserialnum(oidonly=True): "entPhysicalSerialNum",
+            self.entphysicalname(oidonly=True): "entPhysicalName",
+            self.entphysicalmodelname(oidonly=True): "entPhysicalModelName",
+            self.entphysicalhardwarerev(oidonly=True): "entPhysicalHardwareRev",
+            self.entphysicalsoftwarerev(oidonly=True): "entPhysicalSoftwareRev",
+            self.entphysicalfirmwarerev(oidonly=True): "entPhysicalFirmwareRev",
+            self.entphysicalclass(oidonly=True): "entPhysicalClass",
+            self.entphysicaldescr(oidonly=True): "entPhysicalDescr",
+        }
+
+        # Get all the entity data in a single table walk
+        rows = self.snmp_object.table(list(columns.keys()))
+        for key, row in rows.items():
+            for oid, value in row.items():
+                title = columns[oid]
+                if title == "entPhysicalClass":
+                    values[title][int(key)] = value
+                else:
+                    values[title][int(key)] = _string(value)
 
         # Only process if a serial number is found
         count = 0
+        serial = values["entPhysicalSerialNum"]
         for key, value in sorted(serial.items()):
             if bool(value) is True:
-                data_dict["entPhysicalSerialNum"][count] = serial[key]
-                data_dict["entPhysicalName"][count] = name[key]
-                data_dict["entPhysicalModelName"][count] = model[key]
-                data_dict["entPhysicalHardwareRev"][count] = hw_rev[key]
-                data_dict["entPhysicalSoftwareRev"][count] = sw_rev[key]
-                data_dict["entPhysicalFirmwareRev"][count] = fw_rev[key]
-                data_dict["entPhysicalClass"][count] = classtype[key]
-                data_dict["entPhysicalDescr"][count] = description[key]
+                for title in columns.values():
+                    data_dict[title][count] = values[title].get(key)
                 count = count + 1
 
         # Return
         final["ENTITY-MIB"] = data_dict
         return final
 
-    def entphysicaldescr(self):
+    def entphysicaldescr(self, oidonly=False):
         """Return dict of ENTITY-MIB entPhysicalDescr for device.
 
         Args:
-            None
+            oidonly: Return OID's value, not results, if True
 
         Returns:
             data_dict: Dict of entPhysicalDescr using
@@ -132,19 +140,25 @@ class EntityQuery(Query):
 
         # Descriptions
         oid = ".1.3.6.1.2.1.47.1.1.1.1.2"
+
+        # Return OID value. Used for unittests
+        if oidonly is True:
+            return oid
+
+        # Process results
         results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
-            data_dict[int(key)] = str(bytes(value), encoding="utf-8").strip()
+            data_dict[int(key)] = _string(value)
 
         # Return the interface descriptions
         return data_dict
 
-    def entphysicalclass(self):
+    def entphysicalclass(self, oidonly=False):
         """Return dict of ENTITY-MIB entPhysicalClass for device.
 
         Args:
-            None
+            oidonly: Return OID's value, not results, if True
 
         Returns:
             data_dict: Dict of entPhysicalClass using
@@ -156,6 +170,12 @@ class EntityQuery(Query):
 
         # Descriptions
         oid = ".1.3.6.1.2.1.47.1.1.1.1.5"
+
+        # Return OID value. Used for unittests
+        if oidonly is True:
+            return oid
+
+        # Process results
         results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
@@ -164,11 +184,11 @@ class EntityQuery(Query):
         # Return the interface descriptions
         return data_dict
 
-    def entphysicalsoftwarerev(self):
+    def entphysicalsoftwarerev(self, oidonly=False):
         """Return dict of ENTITY-MIB entPhysicalSoftwareRev for device.
 
         Args:
-            None
+            oidonly: Return OID's value, not results, if True
 
         Returns:
             data_dict: Dict of entPhysicalSoftwareRev using
@@ -180,19 +200,25 @@ class EntityQuery(Query):
 
         # Descriptions
         oid = ".1.3.6.1.2.1.47.1.1.1.1.10"
+
+        # Return OID value. Used for unittests
+        if oidonly is True:
+            return oid
+
+        # Process results
         results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
-            data_dict[int(key)] = str(bytes(value), encoding="utf-8").strip()
+            data_dict[int(key)] = _string(value)
 
         # Return the interface descriptions
         return data_dict
 
-    def entphysicalserialnum(self):
+    def entphysicalserialnum(self, oidonly=False):
         """Return dict of ENTITY-MIB entPhysicalSerialNum for device.
 
         Args:
-            None
+            oidonly: Return OID's value, not results, if True
 
         Returns:
             data_dict: Dict of entPhysicalSerialNum using
@@ -204,19 +230,25 @@ class EntityQuery(Query):
 
         # Descriptions
         oid = ".1.3.6.1.2.1.47.1.1.1.1.11"
+
+        # Return OID value. Used for unittests
+        if oidonly is True:
+            return oid
+
+        # Process results
         results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
-            data_dict[int(key)] = str(bytes(value), encoding="utf-8").strip()
+            data_dict[int(key)] = _string(value)
 
         # Return the interface descriptions
         return data_dict
 
-    def entphysicalmodelname(self):
+    def entphysicalmodelname(self, oidonly=False):
         """Return dict of ENTITY-MIB entPhysicalModelName for device.
 
         Args:
-            None
+            oidonly: Return OID's value, not results, if True
 
         Returns:
             data_dict: Dict of entPhysicalModelName using
@@ -228,19 +260,25 @@ class EntityQuery(Query):
 
         # Descriptions
         oid = ".1.3.6.1.2.1.47.1.1.1.1.13"
+
+        # Return OID value. Used for unittests
+        if oidonly is True:
+            return oid
+
+        # Process results
         results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
-            data_dict[int(key)] = str(bytes(value), encoding="utf-8").strip()
+            data_dict[int(key)] = _string(value)
 
         # Return the interface descriptions
         return data_dict
 
-    def entphysicalname(self):
+    def entphysicalname(self, oidonly=False):
         """Return dict of ENTITY-MIB entPhysicalName for device.
 
         Args:
-            None
+            oidonly: Return OID's value, not results, if True
 
         Returns:
             data_dict: Dict of entPhysicalName using
@@ -252,19 +290,25 @@ class EntityQuery(Query):
 
         # Descriptions
         oid = ".1.3.6.1.2.1.47.1.1.1.1.7"
+
+        # Return OID value. Used for unittests
+        if oidonly is True:
+            return oid
+
+        # Process results
         results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
-            data_dict[int(key)] = str(bytes(value), encoding="utf-8").strip()
+            data_dict[int(key)] = _string(value)
 
         # Return the interface descriptions
         return data_dict
 
-    def entphysicalhardwarerev(self):
+    def entphysicalhardwarerev(self, oidonly=False):
         """Return dict of ENTITY-MIB entPhysicalHardwareRev for device.
 
         Args:
-            None
+            oidonly: Return OID's value, not results, if True
 
         Returns:
             data_dict: Dict of entPhysicalHardwareRev using
@@ -276,19 +320,25 @@ class EntityQuery(Query):
 
         # Descriptions
         oid = ".1.3.6.1.2.1.47.1.1.1.1.8"
+
+        # Return OID value. Used for unittests
+        if oidonly is True:
+            return oid
+
+        # Process results
         results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
-            data_dict[int(key)] = str(bytes(value), encoding="utf-8").strip()
+            data_dict[int(key)] = _string(value)
 
         # Return the interface descriptions
         return data_dict
 
-    def entphysicalfirmwarerev(self):
+    def entphysicalfirmwarerev(self, oidonly=False):
         """Return dict of ENTITY-MIB entPhysicalFirmwareRev for device.
 
         Args:
-            None
+            oidonly: Return OID's value, not results, if True
 
         Returns:
             data_dict: Dict of entPhysicalFirmwareRev using
@@ -300,10 +350,31 @@ class EntityQuery(Query):
 
         # Descriptions
         oid = ".1.3.6.1.2.1.47.1.1.1.1.9"
+
+        # Return OID value. Used for unittests
+        if oidonly is True:
+            return oid
+
+        # Process results
         results = self.snmp_object.swalk(oid, normalized=True)
         for key, value in results.items():
             # Process OID
-            data_dict[int(key)] = str(bytes(value), encoding="utf-8").strip()
+            data_dict[int(key)] = _string(value)
 
         # Return the interface descriptions
         return data_dict
+
+
+def _string(value):
+    """Convert an SNMP OCTETSTR value to a stripped string.
+
+    Args:
+        value: Value to convert
+
+    Returns:
+        result: String equivalent of value
+
+    """
+    # Return
+    result = str(bytes(value), encoding="utf-8").strip()
+    return result
@@ -98,53 +98,48 @@ class IfQuery(Query):
         # Initialize key variables
         final = defaultdict(lambda: defaultdict(dict))
 
-        # Get interface ifDescr data
-        _get_data("ifDescr", self.ifdescr, final)
-
-        # Get interface ifAlias data
-        _get_data("ifAlias", self.ifalias, final)
-
-        # Get interface ifSpeed data
-        _get_data("ifSpeed", self.ifspeed, final)
-
-        # Get interface ifOperStatus data
-        _get_data("ifOperStatus", self.ifoperstatus, final)
-
-        # Get interface ifAdminStatus data
-        _get_data("ifAdminStatus", self.ifadminstatus, final)
-
-        # Get interface ifType data
-        _get_data("ifType", self.iftype, final)
-
-        # Get interface ifName data
-        _get_data("ifName", self.ifname, final)
-
-        # Get interface ifIndex data
-        _get_data("ifIndex", self.ifindex, final)
-
-        # Get interface ifPhysAddress data
-        _get_data("ifPhysAddress", self.ifphysaddress, final)
-
-        # Get interface ifInOctets data
-        _get_data("ifInOctets", self.ifinoctets, final)
-
-        # Get interface ifOutOctets data
-        _get_data("ifOutOctets", self.ifoutoctets, final)
-
-        # Get interface ifInBroadcastPkts data
-        _get_data("ifInBroadcastPkts", self.ifinbroadcastpkts, final)
-
-        # Get interface ifOutBroadcastPkts data
-        _get_data("ifOutBroadcastPkts", self.ifoutbroadcastpkts, final)
-
-        # Get interface ifInMulticastPkts data
-        _get_data("ifInMulticastPkts", self.ifinmulticastpkts, final)
-
-        # Get interface ifOutMulticastPkts data
-        _get_data("ifOutMulticastPkts", self.ifoutmulticastpkts, final)
-
-        # Get interface ifLastChange data
-        _get_data("ifLastChange", self.iflastchange, final)
+        # Map the ifTable and ifXTable columns to their keys and the
+        # functions used to convert their values
+        columns = {
+            self.ifdescr(oidonly=True): ("ifDescr", _string),
+            self.ifalias(oidonly=True): ("ifAlias", _string),
+            self.ifspeed(oidonly=True): ("ifSpeed", _value),
+            self.ifoperstatus(oidonly=True): ("ifOperStatus", _value),
+            self.ifadminstatus(oidonly=True): ("ifAdminStatus", _value),
+            self.iftype(oidonly=True): ("ifType", _value),
+            self.ifname(oidonly=True): ("ifName", _string),
+            self.ifindex(oidonly=True): ("ifIndex", _value),
+            self.ifphysaddress(oidonly=True): (
+                "ifPhysAddress",
+                general.octetstr_2_string,
+            ),
+            self.ifinoctets(oidonly=True): ("ifInOctets", _value),
+            self.ifoutoctets(oidonly=True): ("ifOutOctets", _value),
+            self.ifinbroadcastpkts(oidonly=True): (
+                "ifInBroadcastPkts",
+                _value,
+            ),
+            self.ifoutbroadcastpkts(oidonly=True): (
+                "ifOutBroadcastPkts",
+                _value,
+            ),
+            self.ifinmulticastpkts(oidonly=True): (
+                "ifInMulticastPkts",
+                _value,
+            ),
+            self.ifoutmulticastpkts(oidonly=True): (
+                "ifOutMulticastPkts",
+                _value,
+            ),
+            self.iflastchange(oidonly=True): ("ifLastChange", _value),
+        }
+
+        # Get all the interface data in a single table walk
+        rows = self.snmp_object.table(list(columns.keys()))
+        for key, row in rows.items():
+            for oid, value in row.items():
+                (title, convert) = columns[oid]
+                final[int(key)][title] = convert(value)
 
         # Return
         return final
@@ -715,21 +710,30 @@ class IfQuery(Query):
         return final
 
 
-def _get_data(title, func, dest):
-    """Populate dest with data from the given function.
+def _string(value):
+    """Convert an SNMP OCTETSTR value to a string.
 
     Args:
-        title: The name of the data
-        func: The function which will return the data
-        dest: a dict which will store the data
+        value: Value to convert
 
     Returns:
-        dest: The modified destination dict
+        result: String equivalent of value
 
     """
-    # Get interface data
-    values = func()
-    for key, value in values.items():
-        dest[key][title] = value
+    # Return
+    result = str(bytes(value), encoding="utf-8")
+    return result
+
+
+def _value(value):
+    """Return an SNMP value that needs no conversion.
 
-    return dest
+    Args:
+        value: Value to return
+
+    Returns:
+        value: Unchanged value
+
+    """
+    # Return
+    return value
@@ -99,32 +99,24 @@ class If64Query(Query):
         # Initialize key variables
         final = defaultdict(lambda: defaultdict(dict))
 
-        # Get interface ifHCOutBroadcastPkts data
-        _get_data("ifHCOutBroadcastPkts", self.ifhcoutbroadcastpkts, final)
-
-        # Get interface ifHCOutMulticastPkts data
-        _get_data("ifHCOutMulticastPkts", self.ifhcoutmulticastpkts, final)
-
-        # Get interface ifHCOutUcastPkts data
-        _get_data("ifHCOutUcastPkts", self.ifhcoutucastpkts, final)
-
-        # Get interface ifHCOutOctets data
-        _get_data("ifHCOutOctets", self.ifhcoutoctets, final)
-
-        # Get interface ifHCInBroadcastPkts data
-        _get_data("ifHCInBroadcastPkts", self.ifhcinbroadcastpkts, final)
-
-        # Get interface ifHCInMulticastPkts data
-        _get_data("ifHCInMulticastPkts", self.ifhcinmulticastpkts, final)
-
-        # Get interface ifHCInUcastPkts data
-        _get_data("ifHCInUcastPkts", self.ifhcinucastpkts, final)
-
-        # Get interface ifHCInOctets data
-        _get_data("ifHCInOctets", self.ifhcinoctets, final)
-
-        # Get interface ifHighSpeed data
-        _get_data("ifHighSpeed", self.ifhighspeed, final)
+        # Map the ifXTable columns to their keys
+        columns = {
+            self.ifhcoutbroadcastpkts(oidonly=True): "ifHCOutBroadcastPkts",
+            self.ifhcoutmulticastpkts(oidonly=True): "ifHCOutMulticastPkts",
+            self.ifhcoutucastpkts(oidonly=True): "ifHCOutUcastPkts",
+            self.ifhcoutoctets(oidonly=True): "ifHCOutOctets",
+            self.ifhcinbroadcastpkts(oidonly=True): "ifHCInBroadcastPkts",
+            self.ifhcinmulticastpkts(oidonly=True): "ifHCInMulticastPkts",
+            self.ifhcinucastpkts(oidonly=True): "ifHCInUcastPkts",
+            self.ifhcinoctets(oidonly=True): "ifHCInOctets",
+            self.ifhighspeed(oidonly=True): "ifHighSpeed",
+        }
+
+        # Get all the interface data in a single table walk
+        rows = self.snmp_object.table(list(columns.keys()))
+        for key, row in rows.items():
+            for oid, value in row.items():
+                final[int(key)][columns[oid]] = value
 
         # Return
         return final
@@ -401,23 +393,3 @@ class If64Query(Query):
 
         # Return
         return data_dict
-
-
-def _get_data(title, func, dest):
-    """Populate dest with data from the given function.
-
-    Args:
-        title: The name of the data
-        func: The function which will return the data
-        dest: a dict which will store the data
-
-    Returns:
-        dest: The modified destination dict
-
-    """
-    # Process data
-    values = func()
-    for key, value in values.items():
-        dest[key][title] = value
-
-    return dest
@@ -95,27 +95,34 @@ class LldpQuery(Query):
         # Initialize key variables
         final = defaultdict(lambda: defaultdict(dict))
 
-        # Get interface lldpRemSysName data
-        values = self.lldpremsysname()
-        for key, value in values.items():
-            final[key]["lldpRemSysName"] = value
-
-        # Get interface lldpRemSysDesc data
-        values = self.lldpremsysdesc()
-        for key, value in values.items():
-            final[key]["lldpRemSysDesc"] = value
-
-        # Get interface lldpRemPortDesc data
-        values = self.lldpremportdesc()
-        if values is not None:
-            for key, value in values.items():
-                final[key]["lldpRemPortDesc"] = value
-
-        # Get interface lldpRemSysCapEnabled data
-        values = self.lldpremsyscapenabled()
-        if values is not None:
-            for key, value in values.items():
-                final[key]["lldpRemSysCapEnabled"] = value
+        # Map the lldpRemTable columns to their keys and value converters
+        columns = {
+            self.lldpremsysname(oidonly=True): ("lldpRemSysName", _string),
+            self.lldpremsysdesc(oidonly=True): ("lldpRemSysDesc", _cleanstring),
+            self.lldpremportdesc(oidonly=True): (
+                "lldpRemPortDesc",
+                _cleanstring,
+            ),
+            self.lldpremsyscapenabled(oidonly=True): (
+                "lldpRemSysCapEnabled",
+                _binary_string,
+            ),
+        }
+
+        # Get all the LLDP neighbor data in a single table walk
+        rows = self._snmp_object.table(list(columns.keys()))
+        for key, row in rows.items():
+            # Check if this OID is indexed using iFindex or dot1dBasePort
+            ifindex = self._ifindex(key)
+
+            # We have seen issues where self._baseportifindex doesn't always
+            # return a complete dict of values that include all ifindexes
+            if bool(ifindex) is False:
+                continue
+
+            for oid, value in row.items():
+                (title, convert) = columns[oid]
+                final[ifindex][title] = convert(value)
 
         # Return
         return final
@@ -149,7 +156,7 @@ class LldpQuery(Query):
             # We have seen issues where self._baseportifindex doesn't always
             # return a complete dict of values that include all ifindexes
             if bool(ifindex) is True:
-                data_dict[ifindex] = str(bytes(value), encoding="utf-8")
+                data_dict[ifindex] = _string(value)
 
         # Return the interface descriptions
         return data_dict
@@ -166,8 +173,6 @@ class LldpQuery(Query):
         """
         # Initialize key variables
         data_dict = defaultdict(dict)
-        length_in_bits = 16
-        base = 16
 
         # Descriptions
         oid = ".1.0.8802.1.1.2.1.4.1.1.12"
@@ -184,15 +189,8 @@ class LldpQuery(Query):
 
             # We have seen issues where self._baseportifindex doesn't always
             # return a complete dict of values that include all ifindexes
-            if bool(ifindex) is False:
-                continue
-
-            # Convert binary data to hex value
-            hex_value = binascii.hexlify(value).decode("utf-8")
-
-            # Convert hex value to right justified 16 character binary string
-            binary_string = bin(int(hex_value, base))[2:].zfill(length_in_bits)
-            data_dict[ifindex] = binary_string
+            if bool(ifindex) is True:
+                data_dict[ifindex] = _binary_string(value)
 
         # Return the interface descriptions
         return data_dict
@@ -226,9 +224,7 @@ class LldpQuery(Query):
             # We have seen issues where self._baseportifindex doesn't always
             # return a complete dict of values that include all ifindexes
             if bool(ifindex) is True:
-                data_dict[ifindex] = general.cleanstring(
-                    str(bytes(value), encoding="utf-8")
-                )
+                data_dict[ifindex] = _cleanstring(value)
 
         # Return the interface descriptions
         return data_dict
@@ -262,9 +258,7 @@ class LldpQuery(Query):
             # We have seen issues where self._baseportifindex doesn't always
             # return a complete dict of values that include all ifindexes
             if bool(ifindex) is True:
-                data_dict[ifindex] = general.cleanstring(
-                    str(bytes(value), encoding="utf-8")
-                )
+                data_dict[ifindex] = _cleanstring(value)
 
         # Return the interface descriptions
         return data_dict
@@ -307,9 +301,7 @@ class LldpQuery(Query):
             # We have seen issues where self._baseportifindex doesn't always
             # return a complete dict of values that include all ifindexes
             if bool(ifindex) is True:
-                data_dict[ifindex] = general.cleanstring(
-                    str(bytes(value), encoding="utf-8")
-                )
+                data_dict[ifindex] = _cleanstring(value)
 
         # Return the interface descriptions
         return data_dict
@@ -389,3 +381,55 @@ def _penultimate_node(oid):
 
     # Return
     return value
+
+
+def _string(value):
+    """Return the string equivalent of an SNMP OCTETSTR value.
+
+    Args:
+        value: Value to convert
+
+    Returns:
+        result: String value
+
+    """
+    # Return
+    result = str(bytes(value), encoding="utf-8")
+    return result
+
+
+def _cleanstring(value):
+    """Return a cleaned string equivalent of an SNMP OCTETSTR value.
+
+    Args:
+        value: Value to convert
+
+    Returns:
+        result: String value with excess whitespace removed
+
+    """
+    # Return
+    result = general.cleanstring(_string(value))
+    return result
+
+
+def _binary_string(value):
+    """Convert an SNMP lldpRemSysCapEnabled bitmap to a binary string.
+
+    Args:
+        value: Value to convert
+
+    Returns:
+        result: Right justified 16 character binary string
+
+    """
+    # Initialize key variables
+    length_in_bits = 16
+    base = 16
+
+    # Convert binary data to hex value
+    hex_value = binascii.hexlify(value).decode("utf-8")
+
+    # Convert hex value to right justified 16 character binary string
+    result = bin(int(hex_value, base))[2:].zfill(length_in_bits)
+    return result
@@ -23,11 +23,12 @@ class Poll:
         post:
     """
 
-    def __init__(self, hostname):
+    def __init__(self, hostname, timed=False):
         """Initialize the class.
 
         Args:
             hostname: Hostname to poll
+            timed: Record the cost of each query if True
 
         Returns:
             None
@@ -53,7 +54,9 @@ class Poll:
                 POLL(
                     hostname=hostname,
                     authorization=authorization,
-                )
+                ),
+                timed=timed,
+                config=self._server_config,
             )
         else:
             log_message = (
@@ -86,11 +89,70 @@ Querying topology data from host {}.""".format(
         )
         log.log2info(1078, log_message)
 
-        # Return the data polled from the device
-        status = snmp_info.Query(self._snmp_object)
-        _data = status.everything()
+        # Get the data polled from the device. Release the SNMP sessions
+        # cached during the poll when done.
+        status = snmp_info.Query(
+            self._snmp_object,
+            deadline=self._server_config.polling_deadline(),
+        )
+        try:
+            _data = status.everything()
+        finally:
+            self._snmp_object.close()
+
+        # Log the number of SNMP sessions used and queries avoided
+        log_message = """\
+Created {} SNMP session(s) while polling host {}. {} queries were sent to \
+the device, {} were answered from the poll's cache.""".format(
+            self._snmp_object.sessions_created(),
+            self._hostname,
+            self._snmp_object.cache_misses(),
+            self._snmp_object.cache_hits(),
+        )
+        log.log2debug(2007, log_message)
+
+        # Return
         return _data
 
+    def timing(self):
+        """Get the timing report of the poll.
+
+        Args:
+            None
+
+        Returns:
+            result: Dict of timing data. None if not recorded.
+
+        """
+        # Initialize key variables
+        result = None
+
+        # Return
+        if bool(self._snmp_object) is True:
+            result = self._snmp_object.timing().report()
+        return result
+
+
+def reachable(hostname):
+    """Cheaply determine whether a host answers SNMP queries.
+
+    Args:
+        hostname: Hostname to check
+
+    Returns:
+        result: True if reachable
+
+    """
+    # Check
+    validate = snmp_manager.Validate(
+        POLLING_OPTIONS(
+            hostname=hostname,
+            authorizations=ConfigPoller().snmp_auth(),
+        )
+    )
+    result = validate.reachable()
+    return result
+
 
 def _do_poll(authorization):
     """Determine whether doing a poll is valid.
@@ -0,0 +1,696 @@
+"""Module to record SNMP answers from devices and replay them later.
+
+Recorded devices can be polled without a network. This makes it possible
+to benchmark poller changes repeatably against copies of real devices.
+
+"""
+
+from bisect import bisect_left
+from collections import namedtuple, defaultdict
+import gzip
+import json
+import os
+import random
+import threading
+import time
+
+# PIP imports
+from easysnmp import exceptions
+
+# Same fields as the easysnmp SNMPVariable object
+VARBIND = namedtuple("VARBIND", "oid oid_index value snmp_type")
+
+# Default timeout and retries of easysnmp sessions
+_TIMEOUT = 1.0
+_RETRIES = 3
+
+# Backend used by all SNMP sessions. None if devices are queried directly.
+_BACKEND = None
+
+
+class Recorder:
+    """Class that records the SNMP answers of devices while polling them.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+
+    def __init__(self, directory):
+        """Instantiate the class.
+
+        Args:
+            directory: Directory in which to save the captures
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._directory = directory
+        self._captures = defaultdict(lambda: defaultdict(dict))
+        self._lock = threading.Lock()
+
+    def session(self, hostname, context_name, create):
+        """Get an SNMP session that records the answers of a device.
+
+        Args:
+            hostname: Hostname of the device
+            context_name: SNMP context name of the session
+            create: Function that creates an easysnmp session
+
+        Returns:
+            result: Session object
+
+        """
+        # Return
+        result = _RecordingSession(self, hostname, context_name, create())
+        return result
+
+    def record(self, hostname, context_name, results):
+        """Record the answers of a device.
+
+        Args:
+            hostname: Hostname of the device
+            context_name: SNMP context name of the answers
+            results: List of easysnmp SNMPVariable objects
+
+        Returns:
+            None
+
+        """
+        # Record. Missing values are recorded too, as devices may return
+        # them when walking empty tables.
+        with self._lock:
+            rows = self._captures[hostname][context_name]
+            for result in results:
+                rows[_oid(result)] = [
+                    result.oid,
+                    result.oid_index,
+                    result.value,
+                    result.snmp_type,
+                ]
+
+    def save(self):
+        """Save a capture file for each recorded device.
+
+        Args:
+            None
+
+        Returns:
+            result: List of capture filenames
+
+        """
+        # Initialize key variables
+        result = []
+
+        # Save
+        with self._lock:
+            for hostname, contexts in sorted(self._captures.items()):
+                filename = capture_file(self._directory, hostname)
+                capture = {
+                    "hostname": hostname,
+                    "timestamp": int(time.time()),
+                    "contexts": {
+                        context_name: [rows[_] for _ in _sorted(rows)]
+                        for context_name, rows in contexts.items()
+                    },
+                }
+                save(capture, filename)
+                result.append(filename)
+
+        # Return
+        return result
+
+
+class Replay:
+    """Class that answers SNMP queries from recorded captures.
+
+    Answers are served from memory the way an agent would, so queries that
+    weren't made while recording are answered too. Network latency and
+    packet loss can be simulated.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+
+    def __init__(
+        self,
+        directory=None,
+        captures=None,
+        latency=0,
+        loss=0,
+        timeout=_TIMEOUT,
+        retries=_RETRIES,
+        seed=None,
+    ):
+        """Instantiate the class.
+
+        Args:
+            directory: Directory of capture files. Captures are read from
+                it when a device is first queried.
+            captures: Dict of captures keyed by hostname
+            latency: Round trip time of each PDU in seconds
+            loss: Probability of each PDU being lost
+            timeout: Seconds to wait for a lost PDU before retrying
+            retries: Number of retries before a query times out
+            seed: Seed of the packet loss random number generator
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._directory = directory
+        self._agents = {}
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self.latency = latency
+        self.loss = loss
+        self.timeout = timeout
+        self.retries = retries
+
+        # Load the captures provided
+        for hostname, capture in (captures or {}).items():
+            self._agents[hostname] = _agents(capture)
+
+    def session(self, hostname, context_name, create=None):
+        """Get an SNMP session that answers from a capture.
+
+        Args:
+            hostname: Hostname of the device
+            context_name: SNMP context name of the session
+            create: Function that creates an easysnmp session. Not used.
+
+        Returns:
+            result: Session object
+
+        """
+        # Read the capture of the device
+        with self._lock:
+            if hostname not in self._agents:
+                capture = None
+                if bool(self._directory) is True:
+                    filename = capture_file(self._directory, hostname)
+                    if os.path.isfile(filename) is True:
+                        capture = load(filename)
+                self._agents[hostname] = _agents(capture)
+            agents = self._agents[hostname]
+
+        # Devices and contexts without a capture don't answer, like
+        # unreachable devices and unknown SNMPv2 community strings
+        result = _ReplaySession(self, agents.get(context_name))
+        return result
+
+    def delay(self, pdus):
+        """Wait for the PDUs of a query to be answered.
+
+        Args:
+            pdus: Number of PDUs
+
+        Returns:
+            None
+
+        """
+        # Simulate each round trip. Lost PDUs are retried after a timeout.
+        for _ in range(pdus):
+            attempts = 0
+            while bool(self.loss) is True and self._lost() is True:
+                attempts += 1
+                if attempts > self.retries:
+                    raise exceptions.EasySNMPTimeoutError(
+                        "timed out while connecting to remote host"
+                    )
+                time.sleep(self.timeout)
+            if bool(self.latency) is True:
+                time.sleep(self.latency)
+
+    def _lost(self):
+        """Determine whether a PDU is lost.
+
+        Args:
+            None
+
+        Returns:
+            result: True if lost
+
+        """
+        # Return
+        with self._lock:
+            result = self._random.random() < self.loss
+        return result
+
+
+class _RecordingSession:
+    """Class that records the answers of an easysnmp session.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+
+    def __init__(self, recorder, hostname, context_name, session):
+        """Instantiate the class.
+
+        Args:
+            recorder: Recorder object
+            hostname: Hostname of the device
+            context_name: SNMP context name of the session
+            session: easysnmp session
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._recorder = recorder
+        self._hostname = hostname
+        self._context_name = context_name
+        self._session = session
+
+    def get(self, oids):
+        """Do an SNMP GET.
+
+        Args:
+            oids: OID or list of OIDs
+
+        Returns:
+            results: SNMPVariable object, or a list of them
+
+        """
+        # Query and record
+        results = self._session.get(oids)
+        if isinstance(results, list) is True:
+            self._record(results)
+        else:
+            self._record([results])
+        return results
+
+    def walk(self, oids):
+        """Do an SNMP walk.
+
+        Args:
+            oids: OID or list of OIDs
+
+        Returns:
+            results: List of SNMPVariable objects
+
+        """
+        # Query and record
+        results = self._session.walk(oids)
+        self._record(results)
+        return results
+
+    def bulkwalk(self, oids, non_repeaters=0, max_repetitions=10):
+        """Do an SNMP bulkwalk.
+
+        Args:
+            oids: OID or list of OIDs
+            non_repeaters: Number of OIDs that aren't repeated
+            max_repetitions: Number of repetitions of each OID per PDU
+
+        Returns:
+            results: List of SNMPVariable objects
+
+        """
+        # Query and record
+        results = self._session.bulkwalk(
+            oids, non_repeaters=non_repeaters, max_repetitions=max_repetitions
+        )
+        self._record(results)
+        return results
+
+    def _record(self, results):
+        """Record the answers of the device.
+
+        Args:
+            results: List of SNMPVariable objects
+
+        Returns:
+            None
+
+        """
+        # Record
+        self._recorder.record(self._hostname, self._context_name, results)
+
+
+class _ReplaySession:
+    """Class that answers SNMP queries like an easysnmp session.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+
+    def __init__(self, replay, agent):
+        """Instantiate the class.
+
+        Args:
+            replay: Replay object
+            agent: _Agent object. None if the device doesn't answer.
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._replay = replay
+        self._agent = agent
+
+    def get(self, oids):
+        """Do an SNMP GET.
+
+        Args:
+            oids: OID or list of OIDs
+
+        Returns:
+            results: VARBIND object, or a list of them
+
+        """
+        # Answer
+        self._answering()
+        self._replay.delay(1)
+        if isinstance(oids, list) is True:
+            results = [self._agent.get(_) for _ in oids]
+        else:
+            results = self._agent.get(oids)
+        return results
+
+    def walk(self, oids):
+        """Do an SNMP walk.
+
+        Args:
+            oids: OID or list of OIDs
+
+        Returns:
+            results: List of VARBIND objects
+
+        """
+        # Each GETNEXT request returns a single value
+        results = []
+        self._answering()
+        for oid in _listed(oids):
+            rows = self._agent.walk(oid)
+            self._replay.delay(len(rows) + 1)
+            results.extend(rows)
+        return results
+
+    def bulkwalk(self, oids, non_repeaters=0, max_repetitions=10):
+        """Do an SNMP bulkwalk.
+
+        Args:
+            oids: OID or list of OIDs
+            non_repeaters: Number of OIDs that aren't repeated
+            max_repetitions: Number of repetitions of each OID per PDU
+
+        Returns:
+            results: List of VARBIND objects
+
+        """
+        # Each GETBULK request returns up to max_repetitions values
+        results = []
+        self._answering()
+        for oid in _listed(oids):
+            rows = self._agent.walk(oid)
+            self._replay.delay(len(rows) // max(max_repetitions, 1) + 1)
+            results.extend(rows)
+        return results
+
+    def _answering(self):
+        """Time out if the device doesn't answer.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Devices without a capture never answer
+        if self._agent is None:
+            time.sleep(self._replay.timeout * (self._replay.retries + 1))
+            raise exceptions.EasySNMPTimeoutError(
+                "timed out while connecting to remote host"
+            )
+
+
+class _Agent:
+    """Class that answers SNMP queries from the rows of a capture.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+
+    def __init__(self, rows):
+        """Instantiate the class.
+
+        Args:
+            rows: List of [oid, oid_index, value, snmp_type] lists
+
+        Returns:
+            None
+
+        """
+        # Rows are sorted the way agents order them, so walks are a
+        # binary search followed by a slice
+        self._rows = {}
+        for row in rows:
+            varbind = VARBIND(*row)
+            self._rows[_oid(varbind)] = varbind
+        self._oids = _sorted(self._rows)
+        self._keys = [_key(_) for _ in self._oids]
+
+    def get(self, oid):
+        """Get the value of an OID.
+
+        Args:
+            oid: OID
+
+        Returns:
+            result: VARBIND object
+
+        """
+        # Return
+        result = self._rows.get(oid)
+        if result is None:
+            (prefix, _, index) = oid.rpartition(".")
+            result = VARBIND(
+                oid=prefix,
+                oid_index=index,
+                value="NOSUCHOBJECT",
+                snmp_type="NOSUCHOBJECT",
+            )
+        return result
+
+    def walk(self, oid):
+        """Get the values of the OIDs below an OID.
+
+        Args:
+            oid: OID
+
+        Returns:
+            result: List of VARBIND objects
+
+        """
+        # Initialize key variables
+        result = []
+        prefix = _key(oid)
+        size = len(prefix)
+
+        # Get the OIDs below the OID
+        position = bisect_left(self._keys, prefix)
+        while position < len(self._keys):
+            key = self._keys[position]
+            if key[:size] != prefix:
+                break
+            if len(key) > size:
+                result.append(self._rows[self._oids[position]])
+            position += 1
+
+        # Like net-snmp, get the OID itself if nothing is below it. Missing
+        # tables return a NOSUCHOBJECT value.
+        if bool(result) is False:
+            result.append(self.get(oid))
+        return result
+
+
+def install(backend):
+    """Use a backend for all SNMP sessions.
+
+    Args:
+        backend: Recorder or Replay object. None to query devices directly.
+
+    Returns:
+        None
+
+    """
+    # Install
+    global _BACKEND
+    _BACKEND = backend
+
+
+def installed():
+    """Get the backend used for SNMP sessions.
+
+    Args:
+        None
+
+    Returns:
+        result: Recorder or Replay object. None if devices are queried
+            directly.
+
+    """
+    # Return
+    result = _BACKEND
+    return result
+
+
+def capture_file(directory, hostname):
+    """Get the name of the capture file of a device.
+
+    Args:
+        directory: Directory of capture files
+        hostname: Hostname of the device
+
+    Returns:
+        result: Filename
+
+    """
+    # Return
+    result = os.path.join(directory, "{}.json.gz".format(hostname))
+    return result
+
+
+def save(capture, filename):
+    """Save a capture to a compressed file.
+
+    Args:
+        capture: Dict of recorded answers
+        filename: Name of file
+
+    Returns:
+        None
+
+    """
+    # Save
+    with gzip.open(filename, "wt", encoding="utf-8") as f_handle:
+        json.dump(capture, f_handle, separators=(",", ":"))
+
+
+def load(filename):
+    """Read a capture from a compressed file.
+
+    Args:
+        filename: Name of file
+
+    Returns:
+        result: Dict of recorded answers
+
+    """
+    # Return
+    with gzip.open(filename, "rt", encoding="utf-8") as f_handle:
+        result = json.load(f_handle)
+    return result
+
+
+def _agents(capture):
+    """Create the agents answering the queries of each SNMP context.
+
+    Args:
+        capture: Dict of recorded answers. None if there is no capture.
+
+    Returns:
+        result: Dict of _Agent objects keyed by SNMP context name
+
+    """
+    # Initialize key variables
+    result = {}
+
+    # Return
+    if bool(capture) is True:
+        for context_name, rows in capture.get("contexts", {}).items():
+            result[context_name] = _Agent(rows)
+    return result
+
+
+def _oid(varbind):
+    """Get the full OID of a varbind.
+
+    Args:
+        varbind: SNMPVariable or VARBIND object
+
+    Returns:
+        result: OID
+
+    """
+    # Return
+    if bool(varbind.oid_index) is True:
+        result = "{}.{}".format(varbind.oid, varbind.oid_index)
+    else:
+        result = varbind.oid
+    return result
+
+
+def _key(oid):
+    """Get the key used to sort an OID.
+
+    Args:
+        oid: OID
+
+    Returns:
+        result: Tuple of OID node numbers
+
+    """
+    # Return
+    result = tuple(int(_) for _ in oid.strip(".").split(".") if bool(_))
+    return result
+
+
+def _sorted(oids):
+    """Sort OIDs the way SNMP agents do.
+
+    Args:
+        oids: Iterable of OIDs
+
+    Returns:
+        result: Sorted list of OIDs
+
+    """
+    # Return
+    result = sorted(oids, key=_key)
+    return result
+
+
+def _listed(oids):
+    """Convert one or more OIDs to a list.
+
+    Args:
+        oids: OID or list of OIDs
+
+    Returns:
+        result: List of OIDs
+
+    """
+    # Return
+    if isinstance(oids, list) is True:
+        result = oids
+    else:
+        result = [oids]
+    return result
@@ -3,9 +3,16 @@
 import time
 from collections import defaultdict
 
+from switchmap.core import log
 from . import iana_enterprise
+from . import capabilities
+from . import delta
+from . import timing
 from . import get_queries
 
+# Layers in the order they are polled
+_LAYERS = ("layer1", "layer2", "layer3", "system")
+
 
 class Query:
     """Class interacts with IfMIB devices.
@@ -18,11 +25,13 @@ class Query:
 
     """
 
-    def __init__(self, snmp_object):
+    def __init__(self, snmp_object, deadline=None):
         """Instantiate the class.
 
         Args:
             snmp_object: SNMP Interact class object from snmp_manager.py
+            deadline: Maximum time in seconds to spend polling the device.
+                There is no limit if None.
 
         Returns:
             None
@@ -31,6 +40,24 @@ class Query:
         # Define query object
         self.snmp_object = snmp_object
 
+        # Start the clock of the time allowed for polling the device
+        self._deadline = None
+        if deadline is not None:
+            self._deadline = time.monotonic() + deadline
+        self._incomplete = set()
+
+        # Record the cost of each MIB Query class
+        self._timing = snmp_object.timing()
+
+        # Get the cached MIB Query classes supported by the device
+        self._capabilities = capabilities.Capabilities(snmp_object)
+
+        # Create each MIB query object only once per poll
+        self._plan = Plan(snmp_object, self._capabilities, self._timing)
+
+        # Reuse the MIB data that hasn't changed since the last poll
+        self._delta = delta.Delta(snmp_object)
+
     def everything(self):
         """Get all information from device.
 
@@ -43,13 +70,39 @@ class Query:
         """
         # Initialize key variables
         data = {}
+        skipped = []
 
-        # Append data
+        # Append data. Skip the remaining layers when the time allowed for
+        # polling the device runs out, and drop the layer being polled.
         data["misc"] = self.misc()
-        data["layer1"] = self.layer1()
-        data["layer2"] = self.layer2()
-        data["layer3"] = self.layer3()
-        data["system"] = self.system()
+        for layer in _LAYERS:
+            if self._expired() is True:
+                self._incomplete.add(layer)
+            else:
+                data[layer] = getattr(self, layer)()
+            if layer in self._incomplete:
+                data[layer] = None
+                skipped.append(layer)
+
+        # Flag the data as partial so that the data previously polled is
+        # used for the layers skipped
+        if bool(skipped) is True:
+            data["misc"]["partial"] = skipped
+            log_message = """\
+Polling of host {} took longer than its deadline. Posting partial data \
+without: {}""".format(
+                self.snmp_object.hostname(), ", ".join(skipped)
+            )
+            log.log2warning(2020, log_message)
+
+        # Cache the MIB Query classes supported by the device
+        self._capabilities.save()
+
+        # Save the data for the next poll. The data of partial polls isn't
+        # saved, as MIB Query classes may not have been queried for all
+        # their layers.
+        if bool(skipped) is False:
+            self._delta.save()
 
         # Return
         return data
@@ -92,13 +145,10 @@ class Query:
         processed = False
 
         # Get system information from SNMPv2-MIB, ENTITY-MIB, IF-MIB
-        # Instantiate a query object for each system query
-        for item in [
-            Query(self.snmp_object) for Query in get_queries("system")
-        ]:
-            if item.supported():
-                processed = True
-                data = _add_system(item, data)
+        for item in self._queries("system"):
+            processed = True
+            with self._timing.query(item):
+                data = _add_system(self._delta.query(item), data)
 
         # Return
         if processed is True:
@@ -121,13 +171,10 @@ class Query:
         processed = False
 
         # Get information layer1 queries
-
-        for item in [
-            Query(self.snmp_object) for Query in get_queries("layer1")
-        ]:
-            if item.supported():
-                processed = True
-                data = _add_layer1(item, data)
+        for item in self._queries("layer1"):
+            processed = True
+            with self._timing.query(item):
+                data = _add_layer1(self._delta.query(item), data)
 
         # Return
         if processed is True:
@@ -149,12 +196,10 @@ class Query:
         data = defaultdict(lambda: defaultdict(dict))
         processed = False
 
-        for item in [
-            Query(self.snmp_object) for Query in get_queries("layer2")
-        ]:
-            if item.supported():
-                processed = True
-                data = _add_layer2(item, data)
+        for item in self._queries("layer2"):
+            processed = True
+            with self._timing.query(item):
+                data = _add_layer2(self._delta.query(item), data)
 
         # Return
         if processed is True:
@@ -176,12 +221,10 @@ class Query:
         data = defaultdict(lambda: defaultdict(dict))
         processed = False
 
-        for item in [
-            Query(self.snmp_object) for Query in get_queries("layer3")
-        ]:
-            if item.supported():
-                processed = True
-                data = _add_layer3(item, data)
+        for item in self._queries("layer3"):
+            processed = True
+            with self._timing.query(item):
+                data = _add_layer3(self._delta.query(item), data)
 
         # Return
         if processed is True:
@@ -189,6 +232,108 @@ class Query:
         else:
             return None
 
+    def _queries(self, layer):
+        """Get the MIB query objects for a layer while there is time left.
+
+        Args:
+            layer: The layer of queries needed
+
+        Returns:
+            item: Generator of MIB query objects
+
+        """
+        # Stop when the time allowed for polling the device has run out.
+        # The layer is then incomplete.
+        for item in self._plan.queries(layer):
+            if self._expired() is True:
+                self._incomplete.add(layer)
+                return
+            yield item
+
+    def _expired(self):
+        """Determine whether the time allowed for polling has run out.
+
+        Args:
+            None
+
+        Returns:
+            result: True if the deadline has passed
+
+        """
+        # Return
+        result = False
+        if self._deadline is not None:
+            result = time.monotonic() >= self._deadline
+        return result
+
+
+class Plan:
+    """Class that creates the MIB query objects used in a poll.
+
+    Each MIB Query class is instantiated and probed for support only once,
+    no matter how many layers it provides data for.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+
+    def __init__(self, snmp_object, cache, timing_object=None):
+        """Instantiate the class.
+
+        Args:
+            snmp_object: SNMP Interact class object from snmp_manager.py
+            cache: capabilities.Capabilities object for the device
+            timing_object: timing.Timing object recording the cost of
+                creating and probing each MIB Query class. Nothing is
+                recorded if None.
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._snmp_object = snmp_object
+        self._cache = cache
+        self._timing = timing_object
+        if timing_object is None:
+            self._timing = timing.Timing(None)
+        self._queries = {}
+
+    def queries(self, layer):
+        """Get the supported MIB query objects for a layer.
+
+        Args:
+            layer: The layer of queries needed
+
+        Returns:
+            result: List of MIB query objects
+
+        """
+        # Initialize key variables
+        result = []
+
+        # Create each query object once, and only use supported ones.
+        # Creating query objects may query the device, so classes cached as
+        # unsupported aren't created.
+        for query_class in get_queries(layer):
+            if query_class not in self._queries:
+                self._queries[query_class] = None
+                if self._cache.unsupported(query_class) is False:
+                    with self._timing.query(query_class):
+                        item = query_class(self._snmp_object)
+                        if self._cache.supported(item) is True:
+                            self._queries[query_class] = item
+
+            if self._queries[query_class] is not None:
+                result.append(self._queries[query_class])
+
+        # Return
+        return result
+
 
 def _add_data(source, target):
     """Add data from source to target dict. Both dicts must have two keys.
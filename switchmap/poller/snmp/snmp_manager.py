@@ -2,6 +2,10 @@
 
 import os
 import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import easysnmp
 from easysnmp import exceptions
@@ -12,6 +16,22 @@ from switchmap.poller import POLL
 from switchmap.core import log
 from switchmap.core import files
 from . import iana_enterprise
+from . import timing
+from . import replay
+
+# Default GETBULK max-repetitions for devices without a learned value
+_MAX_REPETITIONS = 25
+
+# Increase max-repetitions for walks requiring more round trips than this
+_ROUND_TRIPS = 10
+
+# Errors that are a definite answer that an OID doesn't exist
+_ABSENT = (
+    exceptions.EasySNMPUnknownObjectIDError,
+    exceptions.EasySNMPNoSuchNameError,
+    exceptions.EasySNMPNoSuchObjectError,
+    exceptions.EasySNMPNoSuchInstanceError,
+)
 
 
 class Validate:
@@ -58,9 +78,7 @@ class Validate:
 
         else:
             # Read credentials from cache
-            if os.path.isfile(filename):
-                with open(filename) as f_handle:
-                    group = f_handle.readline()
+            (group, _) = _read_cache(filename)
 
             # Get credentials
             authentication = self.validation(group)
@@ -76,6 +94,26 @@ class Validate:
         # Return
         return authentication
 
+    def reachable(self):
+        """Cheaply determine whether a host answers SNMP queries.
+
+        Only the cached credentials are tried if they exist. The cache is
+        not updated.
+
+        Args:
+            None
+
+        Returns:
+            result: True if the host returns its sysObjectID
+        """
+        # Read credentials from cache
+        filename = files.snmp_file(self._options.hostname, ConfigPoller())
+        (group, _) = _read_cache(filename)
+
+        # Return
+        result = bool(self.validation(group))
+        return result
+
     def validation(self, group=None):
         """Determine valid SNMP authorization for a host.
 
@@ -89,32 +127,37 @@ class Validate:
         """
         # Initialize key variables
         result = None
+        candidates = []
 
-        # Probe device with all SNMP options
+        # Only process enabled SNMP values
         for authorization in self._options.authorizations:
-            # Only process enabled SNMP values
             if bool(authorization.enabled) is False:
                 continue
 
-            # Setup contact with the remote device
-            device = Interact(
-                POLL(
-                    hostname=self._options.hostname,
-                    authorization=authorization,
-                )
-            )
-
             # Try successive groups
-            if group is None:
-                # Verify connectivity
-                if device.contactable() is True:
-                    result = authorization
+            if group is None or authorization.group == group:
+                candidates.append(authorization)
+
+        # Nothing to do
+        if bool(candidates) is False:
+            return result
+
+        # Probe the device with all candidates at once. Wrong credentials
+        # only cost a single timeout instead of one each.
+        executor = ThreadPoolExecutor(max_workers=len(candidates))
+        futures = {
+            executor.submit(_contactable, self._options.hostname, _): _
+            for _ in candidates
+        }
+        try:
+            # The first valid authorization wins
+            for future in as_completed(futures):
+                if future.result() is True:
+                    result = futures[future]
                     break
-            else:
-                if authorization.group == group:
-                    # Verify connectivity
-                    if device.contactable() is True:
-                        result = authorization
+        finally:
+            # Don't wait for the remaining probes to time out
+            executor.shutdown(wait=False, cancel_futures=True)
 
         # Return
         return result
@@ -123,17 +166,49 @@ class Validate:
 class Interact:
     """Class Gets SNMP data."""
 
-    def __init__(self, _poll):
+    def __init__(self, _poll, timed=False, config=None):
         """Initialize the Interact class.
 
         Args:
             _poll: POLL object containing SNMP configuration and target info
+            timed: Record the cost of each query if True
+            config: ConfigPoller object. The configuration is read if None.
 
         Returns:
             None
         """
         # Initialize key variables
         self._poll = _poll
+        self._timing = timing.Timing(_poll.hostname, enabled=timed)
+        self._config = ConfigPoller() if config is None else config
+
+        # Cache of SNMP sessions keyed by (authorization, context_name).
+        # Sessions are reused for the lifetime of the poll and released by
+        # the close() method.
+        self._sessions = {}
+        self._sessions_created = 0
+
+        # Cache of successful query results for the lifetime of the poll.
+        # The same OIDs are often requested by several MIB Query classes.
+        self._results = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+        # Number of queries that failed without a definite answer, such as
+        # timeouts
+        self._errors = 0
+
+        # Failed table walks are only retried one column at a time once the
+        # device has answered other queries
+        self._answered = False
+
+        # Queries in different SNMP contexts may run in concurrent threads
+        self._lock = threading.Lock()
+
+        # GETBULK max-repetitions learned for the device. Loaded from the
+        # credentials cache file on first use.
+        self._max_repetitions = None
+        self._max_repetitions_cached = None
 
         # Fail if there is no authentication
         if bool(self._poll.authorization) is False:
@@ -142,6 +217,113 @@ class Interact:
             )
             log.log2die(1045, log_message)
 
+    def close(self):
+        """Release all SNMP sessions and results cached during the poll.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        # Dropping the references frees the underlying net-snmp sessions
+        self._sessions.clear()
+        self._results.clear()
+
+        # Save the GETBULK max-repetitions learned during the poll
+        if self._max_repetitions != self._max_repetitions_cached:
+            filename = files.snmp_file(self._poll.hostname, self._config)
+            _update_cache(
+                filename,
+                self._poll.authorization.group,
+                max_repetitions=self._max_repetitions,
+            )
+            self._max_repetitions_cached = self._max_repetitions
+
+    def max_repetitions(self):
+        """Get the GETBULK max-repetitions value used for the device.
+
+        Args:
+            None
+
+        Returns:
+            int: max-repetitions value
+        """
+        # Load the value learned in previous polls
+        with self._lock:
+            if self._max_repetitions is None:
+                filename = files.snmp_file(self._poll.hostname, self._config)
+                (_, cached) = _read_cache(filename)
+                self._max_repetitions_cached = cached
+                self._max_repetitions = _bounded_repetitions(
+                    cached if bool(cached) else _MAX_REPETITIONS, self._config
+                )
+
+        # Return
+        return self._max_repetitions
+
+    def cache_hits(self):
+        """Get the number of queries answered from the poll's result cache.
+
+        Args:
+            None
+
+        Returns:
+            int: Number of cache hits
+        """
+        # Return
+        return self._cache_hits
+
+    def cache_misses(self):
+        """Get the number of queries sent to the device during the poll.
+
+        Args:
+            None
+
+        Returns:
+            int: Number of cache misses
+        """
+        # Return
+        return self._cache_misses
+
+    def errors(self):
+        """Get the number of queries that failed without a definite answer.
+
+        Queries for OIDs that don't exist aren't counted.
+
+        Args:
+            None
+
+        Returns:
+            int: Number of failed queries
+        """
+        # Return
+        return self._errors
+
+    def timing(self):
+        """Get the object recording the cost of the queries of the poll.
+
+        Args:
+            None
+
+        Returns:
+            timing.Timing: Timing object
+        """
+        # Return
+        return self._timing
+
+    def sessions_created(self):
+        """Get the number of SNMP sessions created during the poll.
+
+        Args:
+            None
+
+        Returns:
+            int: Number of SNMP sessions created
+        """
+        # Return
+        return self._sessions_created
+
     def enterprise_number(self):
         """Get SNMP enterprise number for the device.
 
@@ -233,6 +415,28 @@ class Interact:
         # Return
         return object_id
 
+    def sysuptime(self):
+        """Get the sysUpTime of the device.
+
+        Args:
+            None
+
+        Returns:
+            int: sysUpTime value in hundredths of a second, or None if not
+                available
+        """
+        # Initialize key variables
+        oid = ".1.3.6.1.2.1.1.3.0"
+        uptime = None
+
+        # Get sysUpTime
+        results = self.get(oid, check_reachability=True)
+        if bool(results) is True:
+            uptime = results[oid]
+
+        # Return
+        return uptime
+
     def oid_exists(self, oid_to_get, context_name=""):
         """Determine if an OID exists on the device.
 
@@ -362,6 +566,102 @@ class Interact:
         # Return
         return results
 
+    def context_walks(self, oid_to_get, context_names, normalized=False):
+        """Perform safe SNMPwalks of an OID in several contexts concurrently.
+
+        The number of concurrent walks is limited by the
+        polling_context_concurrency configuration value.
+
+        Args:
+            oid_to_get: OID to get
+            context_names: List of contextNames to walk
+            normalized: If True, then return results as a dict keyed by
+                only the last node of an OID, otherwise return results
+                keyed by the entire OID string.
+
+        Returns:
+            results: List of SNMP walk results in the order of context_names
+        """
+        # Initialize key variables
+        concurrency = self._config.polling_context_concurrency()
+        workers = min(concurrency, len(context_names))
+
+        def _walk(context_name):
+            """Perform a safe SNMPwalk in a context.
+
+            Args:
+                context_name: contextName to walk
+
+            Returns:
+                dict: Results of SNMP walk as OID-value pairs
+            """
+            return self.swalk(
+                oid_to_get, normalized=normalized, context_name=context_name
+            )
+
+        # Walk the contexts in sequence when concurrency isn't possible
+        if workers <= 1:
+            results = [_walk(_) for _ in context_names]
+            return results
+
+        # Walk the contexts concurrently
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_walk, context_names))
+
+        # Return
+        return results
+
+    def table(self, oids, context_name=""):
+        """Perform a safe walk of several table columns in one GETBULK stream.
+
+        Args:
+            oids: List of OIDs of the table columns to walk
+            context_name: Set the contextName used for SNMPv3 messages.
+                The default contextName is the empty string "".  Overrides the
+                defContext token in the snmp.conf file.
+
+        Returns:
+            rows: Dict of table rows keyed by the row index, being the OID
+                nodes that follow the column OID. Each row is a dict of
+                values keyed by column OID.
+        """
+        # Initialize key variables
+        rows = defaultdict(dict)
+        errors = self.errors()
+
+        # Process data
+        results = self.walk(
+            list(oids),
+            check_reachability=True,
+            check_existence=True,
+            context_name=context_name,
+            safe=True,
+        )
+
+        # A failed walk loses all the columns. Walk the columns one at a
+        # time instead, so that a column the device can't return only loses
+        # its own values. Devices that haven't answered any query yet, or
+        # that fail two columns in a row, aren't queried any further.
+        if self.errors() > errors and self._answered is True:
+            failures = 0
+            for oid in oids:
+                errors = self.errors()
+                results.update(self.swalk(oid, context_name=context_name))
+                failures = failures + 1 if self.errors() > errors else 0
+                if failures >= 2:
+                    break
+
+        # Assign each value to its column in the row
+        prefixes = [(oid, "{}.".format(oid)) for oid in oids]
+        for key, value in results.items():
+            for oid, prefix in prefixes:
+                if key.startswith(prefix) is True:
+                    rows[key[len(prefix) :]][oid] = value
+                    break
+
+        # Return
+        return rows
+
     def walk(
         self,
         oid_to_get,
@@ -374,7 +674,7 @@ class Interact:
         """Do an SNMPwalk.
 
         Args:
-            oid_to_get: OID to walk
+            oid_to_get: OID to walk, or a list of OIDs to walk together
             normalized: If True, then return results as a dict keyed by
                 only the last node of an OID, otherwise return results
                 keyed by the entire OID string. Normalization is useful
@@ -418,7 +718,7 @@ class Interact:
         """Do an SNMPget.
 
         Args:
-            oid_to_get: OID to get
+            oid_to_get: OID to get, or a list of OIDs to get together
             check_reachability: Set if testing for connectivity. Some session
                 errors are ignored so that a null result is returned
             check_existence: Set if checking for the existence of the OID
@@ -459,7 +759,8 @@ class Interact:
         """Do an SNMP query.
 
         Args:
-            oid_to_get: OID to walk
+            oid_to_get: OID to query. A list of OIDs may be provided, in
+                which case they are retrieved together.
             get: Flag determining whether to do a GET or WALK
             check_reachability: Set if testing for connectivity. Some session
                 errors are ignored so that a null result is returned
@@ -485,29 +786,56 @@ class Interact:
         exists = True
         results = []
 
-        # Check if OID is valid
-        if _oid_valid_format(oid_to_get) is False:
-            log_message = "OID {} has an invalid format".format(oid_to_get)
-            log.log2die(1057, log_message)
+        # Walks may retrieve several OIDs at once
+        if isinstance(oid_to_get, list) is True:
+            oids = oid_to_get
+        else:
+            oids = [oid_to_get]
 
-        # Create SNMP session
-        session = _Session(self._poll, context_name=context_name).session
+        # Check if OID is valid
+        for oid in oids:
+            if _oid_valid_format(oid) is False:
+                log_message = "OID {} has an invalid format".format(oid)
+                log.log2die(1057, log_message)
+
+        # Return the results of the same query done earlier in the poll
+        key = (get, tuple(oids), context_name, normalized)
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is None:
+                self._cache_misses += 1
+            else:
+                self._cache_hits += 1
+        if cached is not None:
+            (_contactable, exists, values) = cached
+            return_value = (_contactable, exists, dict(values))
+            return return_value
+        cacheable = True
+        if self._timing.enabled is True:
+            started = time.perf_counter()
+
+        # Get SNMP session
+        session = self._session(context_name=context_name)
 
         # Fill the results object by getting OID data
         try:
             # Get the data
             if get is True:
-                results = [session.get(oid_to_get)]
+                if isinstance(oid_to_get, list) is True:
+                    # Get all the OIDs in a single request
+                    results = session.get(oids)
+                else:
+                    results = [session.get(oid_to_get)]
 
             else:
                 if self._poll.authorization.version != 1:
                     # Bulkwalk for SNMPv2 and SNMPv3
-                    results = session.bulkwalk(
-                        oid_to_get, non_repeaters=0, max_repetitions=25
-                    )
+                    results = self._bulkwalk(session, oid_to_get)
                 else:
                     # Bulkwalk not supported in SNMPv1
-                    results = session.walk(oid_to_get)
+                    results = []
+                    for oid in oids:
+                        results.extend(session.walk(oid))
 
         # Crash on error, return blank results if doing certain types of
         # connectivity checks
@@ -520,6 +848,11 @@ class Interact:
             exceptions.EasySNMPNoSuchInstanceError,
             exceptions.EasySNMPUndeterminedTypeError,
         ) as exception_error:
+            cacheable = False
+            if isinstance(exception_error, _ABSENT) is False:
+                with self._lock:
+                    self._errors += 1
+
             # Update the error message
             log_message = _exception_message(
                 self._poll.hostname,
@@ -537,6 +870,9 @@ class Interact:
             )
 
         except SystemError as exception_error:
+            cacheable = False
+            with self._lock:
+                self._errors += 1
             log_message = _exception_message(
                 self._poll.hostname,
                 oid_to_get,
@@ -554,6 +890,10 @@ class Interact:
             )
 
         except:
+            cacheable = False
+            with self._lock:
+                self._errors += 1
+
             # Update the error message
             log_message = _exception_message(
                 self._poll.hostname,
@@ -571,10 +911,141 @@ class Interact:
         # Format results
         values = _format_results(results, oid_to_get, normalized=normalized)
 
+        # Record the cost of the query
+        if self._timing.enabled is True:
+            self._timing.oid(
+                oid_to_get,
+                time.perf_counter() - started,
+                pdus=self._pdus(results, get, _columns(oid_to_get)),
+                varbinds=len(values),
+                errors=int(cacheable is False),
+            )
+
+        # Only cache successful queries. Errors may be transient.
+        if cacheable is True:
+            with self._lock:
+                self._results[key] = (_contactable, exists, dict(values))
+                self._answered = True
+
         # Return
         return_value = (_contactable, exists, values)
         return return_value
 
+    def _bulkwalk(self, session, oid_to_get):
+        """Do an SNMP bulkwalk, adapting max-repetitions to the device.
+
+        Args:
+            session: SNMP session
+            oid_to_get: OID to walk, or a list of OIDs to walk together
+
+        Returns:
+            results: List of SNMP results
+
+        """
+        # Initialize key variables
+        max_repetitions = self.max_repetitions()
+        columns = _columns(oid_to_get)
+
+        try:
+            results = session.bulkwalk(
+                oid_to_get, non_repeaters=0, max_repetitions=max_repetitions
+            )
+
+        except exceptions.EasySNMPError as exception_error:
+            # Some devices can't handle large responses. Retry once with
+            # smaller ones before giving up
+            if _response_too_big(exception_error) is False:
+                raise
+            smaller = _bounded_repetitions(max_repetitions // 2, self._config)
+            if smaller >= max_repetitions:
+                raise
+            results = session.bulkwalk(
+                oid_to_get, non_repeaters=0, max_repetitions=smaller
+            )
+
+            # Only use smaller responses once they have worked
+            self._adapt_repetitions(smaller)
+
+        else:
+            # Use larger responses if the walk took many round trips. Each
+            # response holds max-repetitions values of every column.
+            if len(results) // columns > max_repetitions * _ROUND_TRIPS:
+                self._adapt_repetitions(max_repetitions + max_repetitions // 2)
+
+        # Return
+        return results
+
+    def _pdus(self, results, get, columns):
+        """Estimate the number of PDUs used by a query.
+
+        Args:
+            results: List of SNMP results
+            get: True if the query was a GET
+            columns: Number of OIDs queried together
+
+        Returns:
+            result: Number of PDUs
+
+        """
+        # Gets use a single request. Walks need one more request than the
+        # number of responses containing data. Each response holds a value
+        # of every column walked together.
+        if get is True:
+            result = 1
+        elif self._poll.authorization.version == 1:
+            result = len(results) + columns
+        else:
+            rows = len(results) // columns
+            result = rows // self.max_repetitions() + 1
+        return result
+
+    def _adapt_repetitions(self, value):
+        """Set the GETBULK max-repetitions value used for the device.
+
+        Args:
+            value: Desired max-repetitions value
+
+        Returns:
+            result: max-repetitions value within the configured limits
+
+        """
+        # Update
+        result = _bounded_repetitions(value, self._config)
+        with self._lock:
+            self._max_repetitions = result
+
+        # Return
+        return result
+
+    def _session(self, context_name=""):
+        """Get a cached SNMP session, creating it if necessary.
+
+        Args:
+            context_name: Set the contextName used for SNMPv3 messages.
+                The default contextName is the empty string "".  Overrides the
+                defContext token in the snmp.conf file.
+
+        Returns:
+            session: SNMP session
+
+        """
+        # Initialize key variables
+        key = (self._poll.authorization, context_name)
+
+        # Create the session only once per poll. This avoids repeating the
+        # SNMPv3 USM key localization for every query.
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = _Session(
+                    self._poll, context_name=context_name
+                ).session
+                self._sessions[key] = session
+                self._sessions_created += 1
+
+        # Return
+        return session
+
 
 class _Session:
     """Class to create an SNMP session with a device."""
@@ -610,6 +1081,28 @@ class _Session:
     def _session(self):
         """Create an SNMP session for queries.
 
+        Args:
+            None
+
+        Returns:
+            session: SNMP session
+
+        """
+        # Record or replay the answers of the device if required
+        backend = replay.installed()
+        if backend is None:
+            session = self._easysnmp()
+        else:
+            session = backend.session(
+                self._poll.hostname, self._context_name, self._easysnmp
+            )
+
+        # Return
+        return session
+
+    def _easysnmp(self):
+        """Create an easysnmp session for queries.
+
         Args:
             None
 
@@ -834,8 +1327,8 @@ def _format_results(results, mock_filter, normalized=False):
 
     Args:
         results: List of lists of results
-        mock_filter: The original OID to get. Facilitates unittesting by
-            filtering Mock values.
+        mock_filter: The original OID to get, or list of OIDs. Facilitates
+            unittesting by filtering Mock values.
         normalized: If True, then return results as a dict keyed by
             only the last node of an OID, otherwise return results
             keyed by the entire OID string. Normalization is useful
@@ -848,13 +1341,23 @@ def _format_results(results, mock_filter, normalized=False):
     """
     # Initialize key variables
     return_results = {}
+    if isinstance(mock_filter, list) is True:
+        filters = mock_filter
+    else:
+        filters = [mock_filter]
+
+    # Only keep OIDs equal to, or below, the requested OIDs. Comparing
+    # whole nodes stops .1.3.6.1.2.1.2.2.1.1 from matching ifInOctets
+    # (.1.3.6.1.2.1.2.2.1.10)
+    exact = set(filters)
+    prefixes = tuple("{}.".format(_) for _ in filters)
 
     for result in results:
         # Recreate the OID
-        oid = "{}.{}".format(result.oid, result.oid_index)
+        oid = result.oid + "." + result.oid_index
 
         # Ignore unwanted OIDs
-        if mock_filter not in oid:
+        if oid not in exact and oid.startswith(prefixes) is False:
             continue
 
         # Process the rest
@@ -877,52 +1380,78 @@ def _convert(result):
         converted: Value converted to appropriate Python type (bytes or int),
             or None for null/empty values
     """
-    # Initialieze key values
-    converted = None
-    value = result.value
+    # Get the function that converts the type. Everything not listed is an
+    # integer (Integer, Integer32, Counter32, Gauge32, Unsigned32,
+    # TimeTicks, Counter64)
     snmp_type = result.snmp_type
-
-    # Convert string type values to bytes
-    if snmp_type.upper() == "OCTETSTR":
-        converted = bytes(value, "utf-8")
-    elif snmp_type.upper() == "OPAQUE":
-        converted = bytes(value, "utf-8")
-    elif snmp_type.upper() == "BITS":
-        converted = bytes(value, "utf-8")
-    elif snmp_type.upper() == "IPADDR":
-        converted = bytes(value, "utf-8")
-    elif snmp_type.upper() == "NETADDR":
-        converted = bytes(value, "utf-8")
-    elif snmp_type.upper() == "OBJECTID":
-        # DO NOT CHANGE !!!
-        converted = bytes(str(value), "utf-8")
-    elif snmp_type.upper() == "NOSUCHOBJECT":
-        # Nothing if OID not found
-        converted = None
-    elif snmp_type.upper() == "NOSUCHINSTANCE":
-        # Nothing if OID not found
-        converted = None
-    elif snmp_type.upper() == "ENDOFMIBVIEW":
-        # Nothing
-        converted = None
-    elif snmp_type.upper() == "NULL":
-        # Nothing
-        converted = None
-    else:
-        # Convert everything else into integer values
-        # rfc1902.Integer
-        # rfc1902.Integer32
-        # rfc1902.Counter32
-        # rfc1902.Gauge32
-        # rfc1902.Unsigned32
-        # rfc1902.TimeTicks
-        # rfc1902.Counter64
-        converted = int(value)
+    convert = _CONVERTERS.get(snmp_type)
+    if convert is None:
+        convert = _CONVERTERS.get(snmp_type.upper(), int)
 
     # Return
+    converted = convert(result.value)
     return converted
 
 
+def _to_bytes(value):
+    """Convert an SNMP string value to bytes.
+
+    Args:
+        value: Value to convert
+
+    Returns:
+        result: bytes
+
+    """
+    # Return
+    result = value.encode("utf-8")
+    return result
+
+
+def _oid_to_bytes(value):
+    """Convert an SNMP OBJECTID value to bytes.
+
+    Args:
+        value: Value to convert
+
+    Returns:
+        result: bytes
+
+    """
+    # Return. DO NOT CHANGE !!!
+    result = bytes(str(value), "utf-8")
+    return result
+
+
+def _to_none(_):
+    """Convert SNMP values of OIDs that weren't found to None.
+
+    Args:
+        _: Value to convert
+
+    Returns:
+        None
+
+    """
+    # Return
+    return None
+
+
+# Functions that convert SNMP values keyed by SNMP type
+_CONVERTERS = {
+    "OCTETSTR": _to_bytes,
+    "OPAQUE": _to_bytes,
+    "BITS": _to_bytes,
+    "IPADDR": _to_bytes,
+    "NETADDR": _to_bytes,
+    "OBJECTID": _oid_to_bytes,
+    "NOSUCHOBJECT": _to_none,
+    "NOSUCHINSTANCE": _to_none,
+    "ENDOFMIBVIEW": _to_none,
+    "NULL": _to_none,
+}
+
+
 def _oid_valid_format(oid):
     """Validate OID string format.
 
@@ -964,16 +1493,123 @@ def _oid_valid_format(oid):
     return True
 
 
-def _update_cache(filename, group):
+def _contactable(hostname, authorization):
+    """Determine whether a device is contactable with SNMP credentials.
+
+    Args:
+        hostname: Hostname of the device
+        authorization: SNMP authorization object to try
+
+    Returns:
+        result: True if contactable
+    """
+    # Setup contact with the remote device
+    device = Interact(
+        POLL(
+            hostname=hostname,
+            authorization=authorization,
+        )
+    )
+
+    # Verify connectivity
+    result = device.contactable()
+    return result
+
+
+def _read_cache(filename):
+    """Read SNMP credentials cache file.
+
+    Args:
+        filename: String containing path to cache file
+
+    Returns:
+        result: Tuple of (group, max_repetitions). The SNMP group name and
+            the GETBULK max-repetitions learned for the device. None if
+            not found.
+    """
+    # Initialize key variables
+    group = None
+    max_repetitions = None
+
+    # Read the group name on the first line, max-repetitions on the second
+    if os.path.isfile(filename) is True:
+        with open(filename) as f_handle:
+            lines = f_handle.read().splitlines()
+        if bool(lines) is True:
+            group = lines[0]
+        if len(lines) > 1 and lines[1].strip().isdigit() is True:
+            max_repetitions = int(lines[1].strip())
+
+    # Return
+    result = (group, max_repetitions)
+    return result
+
+
+def _update_cache(filename, group, max_repetitions=None):
     """Update SNMP credentials cache file.
 
     Args:
         filename: String containing path to cache file
         group: String containing SNMP group name to cache
+        max_repetitions: GETBULK max-repetitions learned for the device.
+            The cached value is kept if None.
 
     Returns:
         None
     """
+    # Keep the learned max-repetitions value
+    if max_repetitions is None:
+        (_, max_repetitions) = _read_cache(filename)
+
     # Do update
     with open(filename, "w+") as env:
         env.write(group)
+        if bool(max_repetitions) is True:
+            env.write("\n{}".format(max_repetitions))
+
+
+def _bounded_repetitions(value, config):
+    """Limit a GETBULK max-repetitions value to the configured range.
+
+    Args:
+        value: max-repetitions value
+        config: ConfigPoller object
+
+    Returns:
+        result: max-repetitions value
+    """
+    # Return
+    result = min(
+        max(value, config.snmp_max_repetitions_floor()),
+        config.snmp_max_repetitions_ceiling(),
+    )
+    return result
+
+
+def _columns(oid_to_get):
+    """Get the number of OIDs queried together.
+
+    Args:
+        oid_to_get: OID to query, or a list of OIDs to query together
+
+    Returns:
+        result: Number of OIDs
+
+    """
+    # Return
+    result = len(oid_to_get) if isinstance(oid_to_get, list) else 1
+    return max(result, 1)
+
+
+def _response_too_big(exception_error):
+    """Determine whether an SNMP error reports a response that is too big.
+
+    Args:
+        exception_error: easysnmp exception
+
+    Returns:
+        result: True if the device reported a tooBig error
+    """
+    # Return
+    result = "toobig" in str(exception_error).lower().replace(" ", "")
+    return result
@@ -0,0 +1,628 @@
+"""Module to create the SNMP data of synthetic devices.
+
+The data is in the capture format of the replay module, so synthetic
+devices of any size can be polled without a network.
+
+"""
+
+from collections import namedtuple, defaultdict
+import random
+
+# Size and vendor of a synthetic device
+PROFILE = namedtuple(
+    "PROFILE",
+    "vendor ports vlans fdb arp neighbors",
+    defaults=("qbridge", 48, 10, 500, 100, 4),
+)
+
+# Vendor flavours. Cisco devices use VTP and per VLAN SNMP contexts,
+# Juniper devices use jnxExVlan and the others only use Q-BRIDGE.
+VENDORS = ("cisco", "juniper", "qbridge")
+
+# sysObjectID and interface name format of each vendor
+_SYSOBJECTID = {
+    "cisco": ".1.3.6.1.4.1.9.1.1208",
+    "juniper": ".1.3.6.1.4.1.2636.1.1.1.2.31",
+    "qbridge": ".1.3.6.1.4.1.11.2.3.7.11.87",
+}
+_IFNAME = {
+    "cisco": "GigabitEthernet1/0/{}",
+    "juniper": "ge-0/0/{}",
+    "qbridge": "{}",
+}
+
+# Number of uplink ports trunking all VLANs
+_UPLINKS = 2
+
+# SNMP types
+_INTEGER = "INTEGER"
+_OCTETSTR = "OCTETSTR"
+_OBJECTID = "OBJECTID"
+_TIMETICKS = "TIMETICKS"
+_COUNTER = "COUNTER"
+_COUNTER64 = "COUNTER64"
+_GAUGE = "GAUGE"
+
+
+def captures(count, profile=None, prefix="synthetic", seed=0):
+    """Create the captures of several synthetic devices.
+
+    Args:
+        count: Number of devices
+        profile: PROFILE object. Mixes the vendor flavours if its vendor
+            is None.
+        prefix: Prefix of the hostnames of the devices
+        seed: Seed of the random number generator
+
+    Returns:
+        result: Dict of captures keyed by hostname
+
+    """
+    # Initialize key variables
+    result = {}
+    if profile is None:
+        profile = PROFILE()
+
+    # Create the devices
+    for number in range(count):
+        hostname = "{}-{:05d}".format(prefix, number + 1)
+        if profile.vendor is None:
+            _profile = profile._replace(vendor=VENDORS[number % len(VENDORS)])
+        else:
+            _profile = profile
+        result[hostname] = capture(hostname, _profile, seed=seed + number)
+
+    # Return
+    return result
+
+
+def capture(hostname, profile, seed=0):
+    """Create the capture of a synthetic device.
+
+    Args:
+        hostname: Hostname of the device
+        profile: PROFILE object
+        seed: Seed of the random number generator
+
+    Returns:
+        result: Capture dict
+
+    """
+    # Initialize key variables
+    if profile.vendor not in VENDORS:
+        raise ValueError("Unknown vendor {}".format(profile.vendor))
+    device = _Device(hostname, profile, random.Random(seed))
+
+    # Return
+    result = device.capture()
+    return result
+
+
+class _Device:
+    """Class that creates the SNMP data of a synthetic device.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+
+    def __init__(self, hostname, profile, generator):
+        """Instantiate the class.
+
+        Args:
+            hostname: Hostname of the device
+            profile: PROFILE object
+            generator: random.Random object
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._hostname = hostname
+        self._profile = profile
+        self._vendor = profile.vendor
+        self._random = generator
+        self._contexts = defaultdict(list)
+
+        # Ports are ifIndex 1 upwards, followed by a management interface.
+        # The last ports are uplinks.
+        self._ports = list(range(1, max(profile.ports, 1) + 1))
+        self._management = len(self._ports) + 1
+        self._uplinks = self._ports[-_UPLINKS:]
+
+        # VLAN 1 is always present. Access ports are spread over the VLANs.
+        self._vlans = list(range(1, max(profile.vlans, 1) + 1))
+        self._access = {
+            port: self._vlans[number % len(self._vlans)]
+            for number, port in enumerate(self._ports)
+            if port not in self._uplinks
+        }
+
+    def capture(self):
+        """Create the capture of the device.
+
+        Args:
+            None
+
+        Returns:
+            result: Capture dict
+
+        """
+        # Create the MIB data
+        self._system()
+        self._interfaces()
+        self._entity()
+        self._bridge()
+        self._arp()
+        self._neighbors()
+        if self._vendor == "cisco":
+            self._cisco()
+        else:
+            self._qbridge()
+            if self._vendor == "juniper":
+                self._juniper()
+
+        # Return
+        result = {
+            "hostname": self._hostname,
+            "timestamp": 0,
+            "contexts": dict(self._contexts),
+        }
+        return result
+
+    def _add(self, oid, index, value, snmp_type, context_name=""):
+        """Add a value to the data of the device.
+
+        Args:
+            oid: OID of the MIB object
+            index: Index of the value
+            value: Value
+            snmp_type: easysnmp SNMP type
+            context_name: SNMP context name
+
+        Returns:
+            None
+
+        """
+        # easysnmp only uses the last node of numeric OIDs as the index
+        oid, _, index = "{}.{}".format(oid, index).rpartition(".")
+        self._contexts[context_name].append([oid, index, str(value), snmp_type])
+
+    def _system(self):
+        """Create SNMPv2-MIB data.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Add
+        values = [
+            ("Synthetic {} switch".format(self._vendor), _OCTETSTR),
+            (_SYSOBJECTID[self._vendor], _OBJECTID),
+            (self._random.randrange(10**6, 10**9), _TIMETICKS),
+            ("noc@example.org", _OCTETSTR),
+            (self._hostname, _OCTETSTR),
+            ("Synthetic rack", _OCTETSTR),
+            (6, _INTEGER),
+        ]
+        for node, (value, snmp_type) in enumerate(values, start=1):
+            self._add(".1.3.6.1.2.1.1.{}".format(node), 0, value, snmp_type)
+
+    def _interfaces(self):
+        """Create IF-MIB and EtherLike-MIB data.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Add the interfaces
+        for ifindex in self._ports + [self._management]:
+            if ifindex == self._management:
+                name = "mgmt0"
+                iftype = 53
+            else:
+                name = _IFNAME[self._vendor].format(ifindex)
+                iftype = 6
+            status = 1 if self._random.random() < 0.7 else 2
+            ifmib = ".1.3.6.1.2.1.2.2.1"
+            ifxmib = ".1.3.6.1.2.1.31.1.1.1"
+            for oid, value, snmp_type in [
+                ("{}.1".format(ifmib), ifindex, _INTEGER),
+                ("{}.2".format(ifmib), name, _OCTETSTR),
+                ("{}.3".format(ifmib), iftype, _INTEGER),
+                ("{}.5".format(ifmib), 1000000000, _GAUGE),
+                ("{}.6".format(ifmib), self._mac(), _OCTETSTR),
+                ("{}.7".format(ifmib), 1, _INTEGER),
+                ("{}.8".format(ifmib), status, _INTEGER),
+                ("{}.9".format(ifmib), self._ticks(), _TIMETICKS),
+                ("{}.10".format(ifmib), self._count(32), _COUNTER),
+                ("{}.16".format(ifmib), self._count(32), _COUNTER),
+                ("{}.1".format(ifxmib), name, _OCTETSTR),
+                ("{}.2".format(ifxmib), self._count(32), _COUNTER),
+                ("{}.3".format(ifxmib), self._count(32), _COUNTER),
+                ("{}.4".format(ifxmib), self._count(32), _COUNTER),
+                ("{}.5".format(ifxmib), self._count(32), _COUNTER),
+                ("{}.6".format(ifxmib), self._count(64), _COUNTER64),
+                ("{}.7".format(ifxmib), self._count(64), _COUNTER64),
+                ("{}.8".format(ifxmib), self._count(64), _COUNTER64),
+                ("{}.9".format(ifxmib), self._count(64), _COUNTER64),
+                ("{}.10".format(ifxmib), self._count(64), _COUNTER64),
+                ("{}.11".format(ifxmib), self._count(64), _COUNTER64),
+                ("{}.12".format(ifxmib), self._count(64), _COUNTER64),
+                ("{}.13".format(ifxmib), self._count(64), _COUNTER64),
+                ("{}.15".format(ifxmib), 1000, _GAUGE),
+                ("{}.18".format(ifxmib), "Port {}".format(name), _OCTETSTR),
+                (".1.3.6.1.2.1.10.7.2.1.19", 3, _INTEGER),
+            ]:
+                self._add(oid, ifindex, value, snmp_type)
+
+        # Juniper logical units are stacked on the physical interfaces
+        if self._vendor == "juniper":
+            for ifindex in self._ports:
+                self._add(
+                    ".1.3.6.1.2.1.31.1.2.1.3",
+                    "{}.{}".format(ifindex + 1000, ifindex),
+                    1,
+                    _INTEGER,
+                )
+
+        # ifTableLastChange
+        self._add(".1.3.6.1.2.1.31.1.5", 0, self._ticks(), _TIMETICKS)
+
+    def _entity(self):
+        """Create ENTITY-MIB data for the chassis.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Add
+        entity = ".1.3.6.1.2.1.47.1.1.1.1"
+        for node, value, snmp_type in [
+            (2, "Synthetic {} chassis".format(self._vendor), _OCTETSTR),
+            (5, 3, _INTEGER),
+            (7, "Chassis", _OCTETSTR),
+            (8, "V01", _OCTETSTR),
+            (9, "1.0", _OCTETSTR),
+            (10, "1.0", _OCTETSTR),
+            (11, "SN{:08d}".format(self._random.randrange(10**8)), _OCTETSTR),
+            (13, "SYN-{}".format(len(self._ports)), _OCTETSTR),
+        ]:
+            self._add("{}.{}".format(entity, node), 1, value, snmp_type)
+
+    def _bridge(self):
+        """Create BRIDGE-MIB port and forwarding database data.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # dot1dBasePortIfIndex. Base ports are the same as ifIndexes.
+        for ifindex in self._ports:
+            self._add(".1.3.6.1.2.1.17.1.4.1.2", ifindex, ifindex, _INTEGER)
+
+        # The BRIDGE-MIB forwarding database has the default VLAN. Cisco
+        # devices also have one per VLAN context. Others use the Q-BRIDGE
+        # table for all VLANs.
+        for vlan, mac, port in self._fdb():
+            index = _decimal(mac)
+            contexts = []
+            if vlan == 1:
+                contexts.append("")
+            if self._vendor == "cisco":
+                contexts.append("vlan-{}".format(vlan))
+            else:
+                self._add(
+                    ".1.3.6.1.2.1.17.7.1.2.2.1.2",
+                    "{}.{}".format(vlan, index),
+                    port,
+                    _INTEGER,
+                )
+            for context_name in contexts:
+                self._add(
+                    ".1.3.6.1.2.1.17.4.3.1.1",
+                    index,
+                    mac,
+                    _OCTETSTR,
+                    context_name=context_name,
+                )
+                self._add(
+                    ".1.3.6.1.2.1.17.4.3.1.2",
+                    index,
+                    port,
+                    _INTEGER,
+                    context_name=context_name,
+                )
+
+    def _fdb(self):
+        """Create the entries of the forwarding database.
+
+        Args:
+            None
+
+        Returns:
+            result: List of (VLAN, MAC address, port) tuples
+
+        """
+        # Initialize key variables
+        result = []
+
+        # Most MAC addresses are learned on the uplinks
+        for _ in range(self._profile.fdb):
+            if self._random.random() < 0.8 or bool(self._access) is False:
+                port = self._random.choice(self._uplinks)
+                vlan = self._random.choice(self._vlans)
+            else:
+                port = self._random.choice(list(self._access))
+                vlan = self._access[port]
+            result.append((vlan, self._mac(), port))
+
+        # Return
+        return result
+
+    def _arp(self):
+        """Create IP-MIB ARP table data.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Add dual stack entries. ipNetToPhysicalTable has both.
+        for number in range(self._profile.arp):
+            mac = self._mac()
+            octets = [number // 65536 % 256, number // 256 % 256, number % 256]
+            ipv4 = "10.{}.{}.{}".format(*octets)
+            ipv6 = ".".join(str(_) for _ in [253] + [0] * 12 + octets)
+            self._add(
+                ".1.3.6.1.2.1.4.22.1.2",
+                "{}.{}".format(self._management, ipv4),
+                mac,
+                _OCTETSTR,
+            )
+            for index in ["1.4.{}".format(ipv4), "2.16.{}".format(ipv6)]:
+                self._add(
+                    ".1.3.6.1.2.1.4.35.1.4",
+                    "{}.{}".format(self._management, index),
+                    mac,
+                    _OCTETSTR,
+                )
+
+    def _neighbors(self):
+        """Create LLDP-MIB or CISCO-CDP-MIB neighbor data.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Neighbors are on the uplinks first
+        ports = list(reversed(self._ports))
+        for number in range(min(self._profile.neighbors, len(ports))):
+            port = ports[number]
+            name = "neighbor-{}.example.org".format(number + 1)
+            remote = _IFNAME[self._vendor].format(number + 1)
+
+            # Cisco devices use CDP
+            if self._vendor == "cisco":
+                cdp = ".1.3.6.1.4.1.9.9.23.1.2.1.1"
+                index = "{}.1".format(port)
+                self._add("{}.6".format(cdp), index, name, _OCTETSTR)
+                self._add("{}.7".format(cdp), index, remote, _OCTETSTR)
+                self._add("{}.8".format(cdp), index, "synthetic", _OCTETSTR)
+                continue
+
+            # Others use LLDP
+            lldp = ".1.0.8802.1.1.2.1.4.1.1"
+            index = "0.{}.1".format(port)
+            self._add("{}.8".format(lldp), index, remote, _OCTETSTR)
+            self._add("{}.9".format(lldp), index, name, _OCTETSTR)
+            self._add("{}.10".format(lldp), index, "synthetic", _OCTETSTR)
+            self._add("{}.12".format(lldp), index, chr(0x28), _OCTETSTR)
+
+        # lldpLocPortDesc shows LLDP is indexed by ifIndex
+        if self._vendor != "cisco":
+            for ifindex in self._ports:
+                self._add(
+                    ".1.0.8802.1.1.2.1.3.7.1.4",
+                    ifindex,
+                    _IFNAME[self._vendor].format(ifindex),
+                    _OCTETSTR,
+                )
+
+    def _cisco(self):
+        """Create Cisco VTP and VLAN membership data.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # vtpVlanTable. Rows are indexed by management domain and VLAN.
+        vtp = ".1.3.6.1.4.1.9.9.46.1.3.1.1"
+        for vlan in self._vlans:
+            index = "1.{}".format(vlan)
+            self._add("{}.2".format(vtp), index, 1, _INTEGER)
+            self._add("{}.3".format(vtp), index, 1, _INTEGER)
+            self._add(
+                "{}.4".format(vtp), index, "VLAN{:04d}".format(vlan), _OCTETSTR
+            )
+
+        # vlanTrunkPortTable
+        trunk = ".1.3.6.1.4.1.9.9.46.1.6.1.1"
+        enabled = _bitmap(self._vlans)
+        for ifindex in self._ports:
+            trunking = ifindex in self._uplinks
+            self._add("{}.3".format(trunk), ifindex, 4, _INTEGER)
+            self._add("{}.4".format(trunk), ifindex, enabled, _OCTETSTR)
+            self._add("{}.5".format(trunk), ifindex, 1, _INTEGER)
+            self._add(
+                "{}.13".format(trunk), ifindex, 1 if trunking else 2, _INTEGER
+            )
+            self._add(
+                "{}.14".format(trunk), ifindex, 1 if trunking else 2, _INTEGER
+            )
+
+        # vmVlan
+        for ifindex, vlan in sorted(self._access.items()):
+            self._add(".1.3.6.1.4.1.9.9.68.1.2.2.1.2", ifindex, vlan, _INTEGER)
+
+    def _qbridge(self):
+        """Create Q-BRIDGE-MIB VLAN data.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # dot1qVlanStaticName
+        for vlan in self._vlans:
+            self._add(
+                ".1.3.6.1.2.1.17.7.1.4.3.1.1",
+                vlan,
+                "VLAN{:04d}".format(vlan),
+                _OCTETSTR,
+            )
+
+        # dot1qPvid
+        for ifindex in self._ports:
+            self._add(
+                ".1.3.6.1.2.1.17.7.1.4.5.1.1",
+                ifindex,
+                self._access.get(ifindex, 1),
+                _GAUGE,
+            )
+
+    def _juniper(self):
+        """Create JUNIPER-VLAN-MIB data.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # VLANs have an internal ID that differs from their tag
+        jnx = ".1.3.6.1.4.1.2636.3.40.1.5.1"
+        ids = {vlan: vlan + 1 for vlan in self._vlans}
+        for vlan, vlan_id in ids.items():
+            self._add(
+                "{}.5.1.2".format(jnx),
+                vlan_id,
+                "VLAN{:04d}".format(vlan),
+                _OCTETSTR,
+            )
+            self._add("{}.5.1.5".format(jnx), vlan_id, vlan, _INTEGER)
+
+        # Port membership of each VLAN
+        for ifindex in self._ports:
+            if ifindex in self._uplinks:
+                vlans, mode = (self._vlans, 2)
+            else:
+                vlans, mode = ([self._access[ifindex]], 1)
+            for vlan in vlans:
+                index = "{}.{}".format(ids[vlan], ifindex)
+                self._add("{}.7.1.3".format(jnx), index, 1, _INTEGER)
+                self._add("{}.7.1.5".format(jnx), index, mode, _INTEGER)
+
+    def _mac(self):
+        """Create a random MAC address.
+
+        Args:
+            None
+
+        Returns:
+            result: MAC address as an SNMP OCTETSTR value
+
+        """
+        # Return
+        result = "".join(chr(self._random.randrange(256)) for _ in range(6))
+        return result
+
+    def _ticks(self):
+        """Create a random TimeTicks value.
+
+        Args:
+            None
+
+        Returns:
+            result: TimeTicks value
+
+        """
+        # Return
+        result = self._random.randrange(10**6)
+        return result
+
+    def _count(self, bits):
+        """Create a random counter value.
+
+        Args:
+            bits: Size of the counter in bits
+
+        Returns:
+            result: Counter value
+
+        """
+        # Return
+        result = self._random.randrange(2**bits)
+        return result
+
+
+def _decimal(mac):
+    """Convert a MAC address to an OID index.
+
+    Args:
+        mac: MAC address as an SNMP OCTETSTR value
+
+    Returns:
+        result: OID index of dotted decimal octets
+
+    """
+    # Return
+    result = ".".join(str(ord(_)) for _ in mac)
+    return result
+
+
+def _bitmap(vlans):
+    """Create a Cisco VLAN bitmap.
+
+    Args:
+        vlans: List of VLANs
+
+    Returns:
+        result: 128 octet bitmap of the VLANs as an SNMP OCTETSTR value
+
+    """
+    # Set the bit of each VLAN. VLAN 0 is the most significant bit.
+    octets = [0] * 128
+    for vlan in vlans:
+        octets[vlan // 8] |= 0x80 >> (vlan % 8)
+
+    # Return
+    result = "".join(chr(_) for _ in octets)
+    return result
@@ -0,0 +1,272 @@
+"""Module to measure the time taken by each part of a device poll."""
+
+from collections import defaultdict
+from contextlib import nullcontext, contextmanager
+import json
+import os
+import threading
+import time
+
+# Switchmap imports
+from switchmap.core import log
+
+# Name used for queries made outside MIB Query class layer methods
+_UNATTRIBUTED = "(none)"
+
+
+class Timing:
+    """Class that records the cost of the SNMP queries of a device poll.
+
+    The wall time, number of PDUs, number of varbinds and number of errors
+    are recorded for each MIB Query class and each OID queried. Nothing
+    is recorded when disabled.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+
+    def __init__(self, hostname, enabled=False):
+        """Instantiate the class.
+
+        Args:
+            hostname: Hostname of the device
+            enabled: Record timing data if True
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self.enabled = bool(enabled)
+        self._hostname = hostname
+        self._start = time.time()
+        self._current = _UNATTRIBUTED
+        self._queries = defaultdict(_counters)
+        self._oids = defaultdict(_counters)
+        self._lock = threading.Lock()
+
+    def query(self, item):
+        """Attribute the SNMP queries made in a block to a MIB Query class.
+
+        Args:
+            item: MIB Query object or class
+
+        Returns:
+            result: Context manager
+
+        """
+        # Return
+        if self.enabled is False:
+            result = nullcontext()
+        elif isinstance(item, type) is True:
+            result = self._query(item.__name__)
+        else:
+            result = self._query(item.__class__.__name__)
+        return result
+
+    def oid(self, oid, duration, pdus=0, varbinds=0, errors=0):
+        """Record the cost of an SNMP query.
+
+        Args:
+            oid: OID queried. A list of OIDs queried together is recorded
+                as a comma separated string.
+            duration: Wall time of the query in seconds
+            pdus: Number of PDUs sent
+            varbinds: Number of varbinds returned
+            errors: Number of errors
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        if isinstance(oid, list) is True:
+            oid = ",".join(oid)
+
+        # Record
+        with self._lock:
+            for counters in [self._oids[oid], self._queries[self._current]]:
+                counters["duration"] += duration
+                counters["queries"] += 1
+                counters["pdus"] += pdus
+                counters["varbinds"] += varbinds
+                counters["errors"] += errors
+
+    def report(self):
+        """Create the timing report of the poll.
+
+        Args:
+            None
+
+        Returns:
+            result: Dict of timing data. None if disabled.
+
+        """
+        # Initialize key variables
+        result = None
+
+        # Create the report
+        if self.enabled is True:
+            result = {
+                "hostname": self._hostname,
+                "timestamp": int(self._start),
+                "duration": round(time.time() - self._start, 6),
+                "queries": _rounded(self._queries),
+                "oids": _rounded(self._oids),
+            }
+        return result
+
+    @contextmanager
+    def _query(self, name):
+        """Attribute the SNMP queries made in a block to a MIB Query class.
+
+        Args:
+            name: Name of MIB Query class
+
+        Returns:
+            None
+
+        """
+        # Queries are made in layer order. Restore the previous name when
+        # done in case of nesting.
+        previous = self._current
+        self._current = name
+        try:
+            yield
+        finally:
+            self._current = previous
+
+
+def save(report, filename):
+    """Save a timing report to a JSON file.
+
+    Args:
+        report: Dict of timing data
+        filename: Name of file
+
+    Returns:
+        None
+
+    """
+    # Save
+    try:
+        with open(filename, "w") as f_handle:
+            json.dump(report, f_handle, indent=2, sort_keys=True)
+    except:
+        log_message = "Unable to write timing report file {}".format(filename)
+        log.log2warning(2019, log_message)
+
+
+def aggregate(directory):
+    """Combine the timing reports of devices to rank the slowest OIDs.
+
+    Args:
+        directory: Directory with the JSON timing reports of each device
+
+    Returns:
+        result: Dict of timing data for MIB Query classes and OIDs, summed
+            over all devices and sorted by descending wall time
+
+    """
+    # Initialize key variables
+    devices = 0
+    queries = defaultdict(_counters)
+    oids = defaultdict(_counters)
+
+    # Read each report
+    if os.path.isdir(directory) is True:
+        for filename in sorted(os.listdir(directory)):
+            if filename.endswith(".json") is False:
+                continue
+            try:
+                with open(os.path.join(directory, filename)) as f_handle:
+                    report = json.load(f_handle)
+            except:
+                continue
+            if isinstance(report, dict) is False:
+                continue
+
+            # Add the values
+            devices += 1
+            for source, target in [
+                (report.get("queries", {}), queries),
+                (report.get("oids", {}), oids),
+            ]:
+                for key, counters in source.items():
+                    for name, value in counters.items():
+                        if name in target[key]:
+                            target[key][name] += value
+
+    # Return
+    result = {
+        "devices": devices,
+        "timestamp": int(time.time()),
+        "queries": _ranked(queries),
+        "oids": _ranked(oids),
+    }
+    return result
+
+
+def _counters():
+    """Create a dict of counters for a MIB Query class or OID.
+
+    Args:
+        None
+
+    Returns:
+        result: Dict of counters
+
+    """
+    # Return
+    result = {
+        "duration": 0.0,
+        "queries": 0,
+        "pdus": 0,
+        "varbinds": 0,
+        "errors": 0,
+    }
+    return result
+
+
+def _rounded(data):
+    """Round the durations of a dict of counters to microseconds.
+
+    Args:
+        data: Dict of counters keyed by MIB Query class or OID
+
+    Returns:
+        result: Dict of counters
+
+    """
+    # Return
+    result = {}
+    for key, counters in data.items():
+        result[key] = dict(counters)
+        result[key]["duration"] = round(counters["duration"], 6)
+    return result
+
+
+def _ranked(data):
+    """Rank a dict of counters by descending duration.
+
+    Args:
+        data: Dict of counters keyed by MIB Query class or OID
+
+    Returns:
+        result: List of dicts of counters, each with a "name" key
+
+    """
+    # Return
+    result = []
+    for key, counters in sorted(
+        data.items(), key=lambda _: _[1]["duration"], reverse=True
+    ):
+        item = {"name": key}
+        item.update(counters)
+        item["duration"] = round(item["duration"], 6)
+        result.append(item)
+    return result
@@ -0,0 +1,105 @@
+"""Module to post short messages for devices whose data is unchanged."""
+
+import os
+
+# PIP imports
+import yaml
+
+# Switchmap imports
+from switchmap.core import files
+from switchmap.core import fingerprint
+from switchmap.core import log
+
+
+class Unchanged:
+    """Class that tracks the fingerprint of the data posted for a device.
+
+    The fingerprint of the data last acknowledged by the server is saved
+    on disk so that it survives daemon restarts.
+
+    Args:
+        None
+
+    Returns:
+        None
+
+    """
+
+    def __init__(self, hostname, data, config):
+        """Instantiate the class.
+
+        Args:
+            hostname: Hostname of the device
+            data: Dict of device data to post
+            config: ConfigPoller object
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self.hostname = hostname
+        self.value = fingerprint.fingerprint(data)
+        self._filename = files.fingerprint_file(hostname, config)
+
+    def unchanged(self):
+        """Determine whether the data is the one last acknowledged.
+
+        Args:
+            None
+
+        Returns:
+            result: True if unchanged
+
+        """
+        # Initialize key variables
+        result = False
+
+        # Read the record
+        if os.path.isfile(self._filename) is True:
+            data = files.read_yaml_file(self._filename, die=False)
+            if isinstance(data, dict) is True:
+                result = data.get("fingerprint") == self.value
+
+        # Return
+        return result
+
+    def acknowledge(self):
+        """Record that the server has the data.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Save
+        data = {"hostname": self.hostname, "fingerprint": self.value}
+        try:
+            with open(self._filename, "w") as f_handle:
+                yaml.dump(data, f_handle, default_flow_style=False)
+        except:
+            log_message = """\
+Unable to write fingerprint file {} for host {}""".format(
+                self._filename, self.hostname
+            )
+            log.log2warning(2027, log_message)
+
+    def forget(self):
+        """Post the device's data in full next time.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Clear
+        if os.path.isfile(self._filename) is True:
+            try:
+                os.remove(self._filename)
+            except FileNotFoundError:
+                # Another process removed it
+                pass
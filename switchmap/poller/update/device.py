@@ -1,7 +1,7 @@
 """Module for preparing polled device data for the database."""
 
 # Standard imports
-from copy import deepcopy
+from copy import copy, deepcopy
 
 # Application imports
 from switchmap.core import log
@@ -37,7 +37,7 @@ class Device:
         """
         # Initialize key variables
         self._devicename = data["misc"]["host"]
-        self._data = deepcopy(data)
+        self._data = data
 
     def process(self):
         """Initialize class.
@@ -113,18 +113,32 @@ class Device:
             l1_duplex: A vendor agnostic status code for the duplex setting
 
         """
-        # Initialize key variables
-        updated_device_data = deepcopy(self._data)
-        layer1_data = updated_device_data["layer1"]
+        # Initialize key variables. Partial polls may not have layer 1 or
+        # system data. Ports are updated in shallow copies of the polled
+        # data, which is left unchanged.
+        updated_device_data = copy(self._data)
+        if bool(self._data["layer1"]) is True:
+            updated_device_data["layer1"] = copy(self._data["layer1"])
+        layer1_data = updated_device_data["layer1"] or {}
+
+        # _process_trunk() extends the VLAN lists of ports that are one of
+        # several higher layers of a port in place. Give these ports their
+        # own copies of the polled data.
+        stacked = _stacked(updated_device_data)
+        for ifindex in stacked.intersection(layer1_data):
+            layer1_data[ifindex] = deepcopy(layer1_data[ifindex])
 
         # Send log message
         log_message = "Processing data from host {}".format(self._devicename)
         log.log2debug(1048, log_message)
 
         # Create dict for layer1 Ethernet data
-        for ifindex, _port_data in sorted(layer1_data.items()):
-            # Make a copy of the port data to reduce the risk of corruption
-            port_data = deepcopy(_port_data)
+        for ifindex in sorted(layer1_data):
+            # Make a copy of the port data so the polled data isn't changed
+            if ifindex in stacked:
+                port_data = deepcopy(layer1_data[ifindex])
+            else:
+                port_data = copy(layer1_data[ifindex])
 
             # Process port_data
             if _is_ethernet(port_data) is True:
@@ -152,7 +166,7 @@ class Device:
                     higherlayers = updated_device_data["system"]["IF-MIB"][
                         "ifStackStatus"
                     ][ifindex]
-                except KeyError:
+                except (KeyError, TypeError):
                     log_message = f"""\
 Host {self._devicename} is missing ifindex {ifindex} in \
 the IF-MIB::ifStackStatus OID"""
@@ -185,7 +199,7 @@ the IF-MIB::ifStackStatus OID"""
                 #############################################################
 
                 # Update duplex to universal switchmap.port_data value
-                port_data["l1_duplex"] = _duplex(deepcopy(port_data))
+                port_data["l1_duplex"] = _duplex(port_data)
 
             else:
                 # Update Ethernet status
@@ -222,6 +236,35 @@ def _process_non_trunk(port_data):
     return result
 
 
+def _stacked(device_data):
+    """Get the ifIndexes that are one of several higher layers of a port.
+
+    Args:
+        device_data: Data dict related to the device
+
+    Returns:
+        result: Set of ifIndexes
+
+    """
+    # Initialize key variables
+    result = set()
+
+    # Get the ifStackStatus data
+    try:
+        stack = device_data["system"]["IF-MIB"]["ifStackStatus"]
+        higherlayers = list(stack.values())
+    except (KeyError, TypeError, AttributeError):
+        higherlayers = []
+
+    # Process
+    for layers in higherlayers:
+        if isinstance(layers, list) is True and len(layers) > 1:
+            result.update(_ for _ in layers if bool(_) is True)
+
+    # Return
+    return result
+
+
 def _process_trunk(port_data, higherlayers):
     """Assign trunk values to the trunk Ethernet port.
 
@@ -268,9 +311,10 @@ def _juniper_fix(device_data):
         result: Result of assignments
 
     """
-    # Initialize key variables
-    source = deepcopy(device_data)
-    result = deepcopy(device_data)
+    # Initialize key variables. Ports are updated in shallow copies of the
+    # device data, which is left unchanged.
+    source = device_data
+    result = copy(device_data)
     valid = False
 
     # Send log message
@@ -294,6 +338,10 @@ def _juniper_fix(device_data):
 
     # Get a list of ifIndex values to Process
     status_values = source["system"]["IF-MIB"]["ifStackStatus"]
+    if isinstance(source.get("layer1"), dict) is True:
+        result["layer1"] = copy(source["layer1"])
+        for ifindex, port_data in source["layer1"].items():
+            result["layer1"][ifindex] = copy(port_data)
 
     # Get the ones that are non Ethernet and have Ethernet parents
     for parent, children in status_values.items():
@@ -301,9 +349,12 @@ def _juniper_fix(device_data):
             if bool(child) is False:
                 continue
             else:
-                # Copy key values from child to parent
+                # Copy key values from child to parent. Children aren't
+                # added to the layer 1 data of the device if missing.
                 if source["layer1"][parent]["ifType"] == 6:
-                    for parameter, value in source["layer1"][child].items():
+                    for parameter, value in (
+                        source["layer1"].get(child, {}).items()
+                    ):
                         if parameter not in result["layer1"][parent]:
                             result["layer1"][parent][parameter] = value
 
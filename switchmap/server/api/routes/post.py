@@ -2,15 +2,25 @@
 
 # Standard imports
 import os
+import io
+import gzip
 import hashlib
+import json
+import zlib
 
 # PIP3 imports
 from flask import Blueprint, request, jsonify
+from werkzeug.exceptions import RequestEntityTooLarge
 import yaml
 
 # Repository imports
 from switchmap.core import log
+from switchmap.core import files
+from switchmap.core import fingerprint
+from switchmap.core import general
+from switchmap.core import stream
 from switchmap import API_POLLER_POST_URI
+from switchmap import API_POLLER_BATCH_URI
 from switchmap import API_POLLER_SEARCH_URI
 from switchmap.server.configuration import ConfigServer
 from switchmap.server.db.misc import search
@@ -34,50 +44,303 @@ def post_device_data():
     # Initialize key variables
     config = ConfigServer()
 
-    # Get data
-    data = request.json
-    try:
-        hostname = data["misc"]["host"]
-    except:
-        hostname = None
+    # Only gzip compression is supported
+    if _supported() is False:
+        return "Unsupported Media Type", 415
+
+    # Get data. Large devices may be posted as a stream of chunks.
+    if (
+        request.mimetype == stream.CONTENT_TYPE
+        or request.content_encoding == "gzip"
+    ):
+        data = _device_data(config)
+        if data is None:
+            log_message = "Invalid or truncated device data received."
+            log.log2warning(2022, log_message)
+            return "Bad Request", 400
+    else:
+        data = request.json
+
+    # Write data to file. Unchanged data must be posted in full if the
+    # server doesn't have it.
+    stale = _cache([data], config)
+    if bool(stale) is True:
+        return "Conflict", 409
+
+    # Return
+    return "OK"
+
+
+@API_POST.route(API_POLLER_BATCH_URI, methods=["POST"])
+def post_device_batch():
+    """Accept posts of the data of several network devices from pollers.
+
+    Args:
+        None
+
+    Returns:
+        _response: OK message when successful
+
+    """
+    # Initialize key variables
+    config = ConfigServer()
+
+    # Only gzip compression is supported
+    if _supported() is False:
+        return "Unsupported Media Type", 415
+
+    # Get data. Batches are lists of device data.
+    data = _device_data(config)
+    if isinstance(data, list) is False:
+        log_message = "Invalid or truncated device data batch received."
+        log.log2warning(2025, log_message)
+        return "Bad Request", 400
+
+    # Write data to files. List the devices posted as unchanged whose
+    # data the server doesn't have.
+    stale = _cache(data, config)
+    if bool(stale) is True:
+        return jsonify({"stale": stale}), 409
+
+    # Return
+    return "OK"
+
+
+def _supported():
+    """Determine whether the content encoding of a post is supported.
+
+    Args:
+        None
+
+    Returns:
+        result: True if supported
+
+    """
+    # Only gzip compression is supported
+    result = request.content_encoding in [None, "", "identity", "gzip"]
+    if result is False:
+        log_message = """\
+Unsupported content encoding "{}" of device data received.""".format(
+            request.content_encoding
+        )
+        log.log2warning(2024, log_message)
+
+    # Return
+    return result
+
+
+def _cache(items, config):
+    """Write device data to cache files for the ingester.
+
+    Each file is written under a temporary name, then renamed, so that the
+    ingester never reads partially written files. No file is renamed until
+    all the files of a batch are written.
+
+    Args:
+        items: List of dicts of device data
+        config: ConfigServer object
+
+    Returns:
+        stale: List of the hostnames of devices posted as unchanged whose
+            data the server doesn't have
+
+    """
+    # Initialize key variables
+    pending = {}
+    stale = []
+
+    # Write the files
     try:
-        zone = data["misc"]["zone"]
+        for data in items:
+            try:
+                hostname = data["misc"]["host"]
+            except:
+                hostname = None
+            try:
+                zone = data["misc"]["zone"]
+            except:
+                zone = None
+            if bool(hostname) is False:
+                continue
+
+            # Only write data if file doesn't exist. This reduces the risk
+            # of duplicate data if data from a previously existing file is
+            # still being ingested.
+            filepath = "{}{}{}-{}.yaml".format(
+                config.cache_directory(),
+                os.sep,
+                hostname,
+                hashlib.md5(zone.encode("utf-8")).hexdigest()[:5],
+            )
+            if os.path.exists(filepath) is True or filepath in pending:
+                # Log
+                log_message = (
+                    "Cache file {} already exists. Will not update.".format(
+                        filepath
+                    )
+                )
+                log.log2info(1042, log_message)
+                continue
+
+            # Unchanged data is the data last ingested for the device
+            if fingerprint.is_unchanged(data) is True:
+                data = _carried(filepath, data, config)
+                if data is None:
+                    stale.append(hostname)
+                    continue
+
+            # Write data to a temporary file
+            temporary = "{}.{}.tmp".format(filepath, general.random_hash())
+            pending[filepath] = temporary
+            with open(temporary, "w") as f_handle:
+                yaml.dump(data, f_handle)
     except:
-        zone = None
-
-    if bool(hostname):
-        # Only write data if file doesn't exist. This reduces the risk of
-        # duplicate data if data from a previously existing file is still
-        # being ingested.
-        filepath = "{}{}{}-{}.yaml".format(
-            config.cache_directory(),
-            os.sep,
-            hostname,
-            hashlib.md5(zone.encode("utf-8")).hexdigest()[:5],
+        for temporary in pending.values():
+            if os.path.isfile(temporary) is True:
+                os.remove(temporary)
+        raise
+
+    # Make the files available to the ingester
+    for filepath, temporary in pending.items():
+        os.replace(temporary, filepath)
+
+        # Log
+        log_message = "Successfully created data cache file {}.".format(
+            filepath
         )
-        if os.path.exists(filepath) is False:
-            # Write data to file
-            # data_as_string = json.dumps(data)
-            with open(filepath, "w") as f_handle:
-                yaml.dump(data, f_handle)
+        log.log2info(1043, log_message)
 
-            # Log
-            log_message = "Successfully created data cache file {}.".format(
-                filepath
-            )
-            log.log2info(1043, log_message)
+    # Return
+    return stale
+
+
+def _carried(filepath, message, config):
+    """Recreate unchanged device data from the data last ingested.
+
+    Args:
+        filepath: Cache file of the device
+        message: Dict of the message posted instead of unchanged data
+        config: ConfigServer object
+
+    Returns:
+        result: Dict of device data. None if the data last ingested isn't
+            the unchanged data.
+
+    """
+    # Initialize key variables
+    result = None
+    name = os.path.splitext(os.path.basename(filepath))[0]
+    filename = files.ingested_file(name, config)
+
+    # Get the data last ingested
+    if os.path.isfile(filename) is True:
+        previous = files.read_yaml_file(filename, die=False)
+        if isinstance(previous, dict) is True:
+            result = fingerprint.carry(previous, message)
+
+    # Log
+    if result is None:
+        log_message = """\
+Device {} was posted as unchanged, but its data isn't the data last \
+ingested. It must be posted in full.""".format(
+            message["misc"].get("host")
+        )
+        log.log2info(2028, log_message)
+
+    # Return
+    return result
+
+
+def _device_data(config):
+    """Read device data that is streamed, compressed or batched.
+
+    Args:
+        config: ConfigServer object
+
+    Returns:
+        data: Device data. None if invalid.
 
+    """
+    # Compressed data is decompressed as it is read. Stop reading data
+    # larger than the configured limit.
+    body = request.stream
+    if request.content_encoding == "gzip":
+        body = gzip.GzipFile(fileobj=request.stream)
+    body = io.BufferedReader(_Limited(body, config.api_max_data_size()))
+
+    # Return
+    try:
+        if request.mimetype == stream.CONTENT_TYPE:
+            data = stream.decode(body)
         else:
-            # Log
+            data = json.loads(body.read())
+    except (OSError, EOFError, zlib.error, ValueError):
+        data = None
+    return data
+
+
+class _Limited(io.RawIOBase):
+    """Read a file object up to a maximum number of bytes."""
+
+    def __init__(self, fileobj, limit):
+        """Initialize the class.
+
+        Args:
+            fileobj: File object to read
+            limit: Maximum number of bytes to read
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self._fileobj = fileobj
+        self._limit = limit
+        self._size = 0
+
+    def readable(self):
+        """Determine whether the file object can be read.
+
+        Args:
+            None
+
+        Returns:
+            result: True
+
+        """
+        # Return
+        result = True
+        return result
+
+    def readinto(self, buffer):
+        """Read bytes into a buffer.
+
+        Args:
+            buffer: Writable buffer
+
+        Returns:
+            result: Number of bytes read
+
+        """
+        # Read no more than one byte past the limit
+        data = self._fileobj.read(
+            max(0, min(len(buffer), self._limit + 1 - self._size))
+        )
+        self._size += len(data)
+
+        # Reject data that is too large
+        if self._size > self._limit:
             log_message = (
-                "Cache file {} already exists. Will not update.".format(
-                    filepath
-                )
+                "Device data larger than the api_max_data_size of {} bytes "
+                "received.".format(self._limit)
             )
-            log.log2info(1042, log_message)
+            log.log2warning(2032, log_message)
+            raise RequestEntityTooLarge()
 
-    # Return
-    return "OK"
+        # Return
+        result = len(data)
+        buffer[:result] = data
+        return result
 
 
 @API_POST.route(API_POLLER_SEARCH_URI, methods=["POST"])
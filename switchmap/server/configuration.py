@@ -55,6 +55,26 @@ class ConfigServer(ConfigAPI):
         result = self._config_server.get("api_bind_port", 7000)
         return result
 
+    def api_max_data_size(self):
+        """Get the maximum size of the device data posted to the API.
+
+        Args:
+            None
+
+        Returns:
+            result: Maximum size in bytes of decompressed device data
+
+        """
+        # Get parameter
+        _result = self._config_server.get("api_max_data_size", 1024)
+        value = int(_result)
+
+        # Convert megabytes to bytes
+        result = max(1, abs(value)) * 1048576
+
+        # Return
+        return result
+
     def cache_directory(self):
         """Determine the cache_directory.
 
@@ -245,6 +245,19 @@ def resolve_oui(obj, _):
     return obj.oui.decode() if bool(obj.oui) else ""
 
 
+def resolve_poller_node(obj, _):
+    """Convert 'poller_node' from bytes to string.
+
+    Args:
+        obj: Object containing poller_node attribute
+        _: Unused GraphQL parameter
+
+    Returns:
+        str: Decoded poller_node string or empty string
+    """
+    return obj.poller_node.decode() if bool(obj.poller_node) else ""
+
+
 def resolve_sys_description(obj, _):
     """Convert 'sys_description' from bytes to string.
 
@@ -398,6 +411,10 @@ class DeviceAttribute:
         resolver=resolve_sys_uptime, description="System uptime"
     )
     last_polled = graphene.Int(description="Timestamp of last poll")
+    poller_node = graphene.String(
+        resolver=resolve_poller_node,
+        description="ID of the poller node that last polled the device",
+    )
     enabled = graphene.Boolean(description="Enabled")
     ts_modified = graphene.DateTime(description="Row Modification Timestamp")
     ts_created = graphene.DateTime(description="Row Creation Timestamp")
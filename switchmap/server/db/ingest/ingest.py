@@ -2,15 +2,18 @@
 
 import os.path
 import os
+import shutil
 import tempfile
 from operator import attrgetter
 
+import yaml
+
 # Import project libraries
 from multiprocessing import get_context
 from switchmap.core import log
 from switchmap.core import files
 from switchmap.core import general
-from switchmap import AGENT_INGESTER, AGENT_POLLER
+from switchmap import AGENT_INGESTER
 from switchmap.server.db.table import IZone
 from switchmap.server.db.table import IRoot
 from switchmap.server.db.table import IMacIp
@@ -72,52 +75,41 @@ class Ingest:
             if bool(self._test) is False
             else self._test_cache_directory
         )
-        poller_lock_file = files.lock_file(AGENT_POLLER, self._config)
         arguments = []
 
-        # Process files
+        # Process files. The server writes cache files under temporary
+        # names and renames them when they are complete, so they can be
+        # ingested while the poller is still polling other devices.
         with tempfile.TemporaryDirectory(
             dir=self._config.ingest_directory()
         ) as tmpdir:
-            # Only run the ingest if there is no poller lock file
-            # This helps to prevent ingesting files while polling is
-            # still running. This is only effective when the poller
-            # and ingester are running on the same machine
-            if os.path.isfile(poller_lock_file) is False:
-                # Copy files from cache to ingest
-                files.move_yaml_files(cache_directory, tmpdir)
-
-                # Parallel process the files
-                setup_success = setup(tmpdir, self._config)
-
-                if bool(setup_success) is True:
-                    # Populate the arguments
-                    arguments = [
-                        [item.idx_zone, item.data, item.filepath, item.config]
-                        for item in setup_success.zones
-                    ]
-
-                    # Process the device independent zone data in the
-                    # database first
-                    if bool(arguments) is True:
-                        pairmacips = self.zone(arguments)
-
-                    # Process the device dependent in the database second
-                    if bool(pairmacips):
-                        self.device(arguments)
-
-                    # Update the IpPort table
-                    insert_ipports(pairmacips)
-
-                    # Cleanup
-                    self.cleanup(setup_success.event)
-            else:
-                log_message = (
-                    "Poller lock file {} exists. Skipping processing of cache "
-                    "files. Is the poller running or did it crash "
-                    "unexpectedly?".format(poller_lock_file)
-                )
-                log.log2info(1077, log_message)
+            # Copy files from cache to ingest
+            files.move_yaml_files(cache_directory, tmpdir)
+
+            # Parallel process the files
+            setup_success = setup(tmpdir, self._config)
+
+            if bool(setup_success) is True:
+                # Populate the arguments
+                arguments = [
+                    [item.idx_zone, item.data, item.filepath, item.config]
+                    for item in setup_success.zones
+                ]
+
+                # Process the device independent zone data in the
+                # database first
+                if bool(arguments) is True:
+                    pairmacips = self.zone(arguments)
+
+                # Process the device dependent in the database second
+                if bool(pairmacips):
+                    self.device(arguments)
+
+                # Update the IpPort table
+                insert_ipports(pairmacips)
+
+                # Cleanup
+                self.cleanup(setup_success.event)
 
     def zone(self, arguments):
         """Ingest the files' zone data.
@@ -351,7 +343,10 @@ def setup(src, config):
 
         # Get the _zone data from each file
         for filepath in filepaths:
-            _zone = _get_zone(event, filepath)
+            data = _complete(files.read_yaml_file(filepath), filepath, config)
+            if bool(data) is False:
+                continue
+            _zone = _get_zone(event, data)
             _zones.append(
                 ZoneDevice(
                     idx_zone=_zone.idx_zone,
@@ -392,20 +387,95 @@ def _filepaths(src):
     return filepaths
 
 
-def _get_zone(event, filepath):
+def _complete(data, filepath, config):
+    """Add the data last ingested to the layers missing from partial polls.
+
+    Devices that take longer than their polling deadline post partial
+    data. The layers that weren't polled keep their previous values instead
+    of being emptied.
+
+    Args:
+        data: Device data (dict) read from the cache file
+        filepath: Cache file filepath that contains the data
+        config: Configuration object
+
+    Returns:
+        result: Device data. None if partial data can't be completed.
+
+    """
+    # Initialize key variables
+    result = data
+    name = os.path.splitext(os.path.basename(filepath))[0]
+    filename = files.ingested_file(name, config)
+    partial = data.get("misc", {}).get("partial")
+
+    # Complete data is saved for future partial polls as is. The cache
+    # file is discarded after ingesting, so it is moved instead of copied.
+    if bool(partial) is False:
+        _replace(filepath, filename)
+        return result
+
+    # Get the previous data
+    previous = {}
+    if os.path.isfile(filename) is True:
+        previous = files.read_yaml_file(filename, die=False)
+    if bool(previous) is False:
+        log_message = """\
+Skipping partial data in file {} with no previously ingested data for \
+its missing layers: {}""".format(
+            filepath, ", ".join(partial)
+        )
+        log.log2warning(2021, log_message)
+        return None
+
+    # Use the previous values of the missing layers
+    for layer in partial:
+        result[layer] = previous.get(layer)
+    temporary = "{}.{}.tmp".format(filename, general.random_hash())
+    with open(temporary, "w") as f_handle:
+        yaml.dump(result, f_handle)
+    os.replace(temporary, filename)
+
+    # Return
+    return result
+
+
+def _replace(src, dst):
+    """Replace a file with another so that it is never partially written.
+
+    Args:
+        src: File to move
+        dst: File to replace
+
+    Returns:
+        None
+
+    """
+    # Move the file. Files on different filesystems are copied next to the
+    # file they replace first.
+    try:
+        os.replace(src, dst)
+    except OSError:
+        temporary = "{}.{}.tmp".format(dst, general.random_hash())
+        try:
+            shutil.copyfile(src, temporary)
+            os.replace(temporary, dst)
+        finally:
+            if os.path.isfile(temporary) is True:
+                os.remove(temporary)
+
+
+def _get_zone(event, data):
     """Create an RZone object from YAML file data.
 
     Args:
         event: RZone object
-        filepath: YAML filepath
+        data: Device data (dict) read from the YAML file
 
     Returns:
         result: ZoneData object
 
     """
-    # Read the yaml file
-    data = files.read_yaml_file(filepath)
-
     # Get the zone information
     name = data["misc"]["zone"]
     exists = _zone.exists(event.idx_event, name)
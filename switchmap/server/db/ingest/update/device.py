@@ -65,6 +65,11 @@ def device(idx_zone, data):
         sys_objectid=data["system"]["SNMPv2-MIB"]["sysObjectID"][0],
         sys_uptime=data["system"]["SNMPv2-MIB"]["sysUpTime"][0],
         last_polled=data["misc"]["timestamp"],
+        poller_node=(
+            None
+            if data["misc"].get("poller_node") is None
+            else str(data["misc"]["poller_node"])
+        ),
         enabled=1,
     )
 
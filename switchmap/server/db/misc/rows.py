@@ -48,6 +48,9 @@ def device(row):
         ),
         sys_uptime=row.sys_uptime,
         last_polled=row.last_polled,
+        poller_node=(
+            None if bool(row.poller_node) is False else row.poller_node.decode()
+        ),
         enabled=int(bool(row.enabled) is True),
         ts_created=row.ts_created,
         ts_modified=row.ts_modified,
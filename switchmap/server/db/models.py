@@ -5,11 +5,13 @@ import datetime
 
 # SQLalchemy imports
 from sqlalchemy import Column, DateTime, ForeignKey, text, UniqueConstraint
+from sqlalchemy import inspect
 from sqlalchemy.dialects.mysql import BIGINT, VARBINARY, BIT
 from sqlalchemy.orm import backref, relationship
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql.expression import Null
 from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateColumn
 
 # Project imports
 from switchmap.server.db import SCOPED_SESSION, ENGINE
@@ -177,6 +179,7 @@ class Device(BASE):
     sys_objectid = Column(VARBINARY(256), nullable=True, default=Null)
     sys_uptime = Column(BIGINT(20, unsigned=True))
     last_polled = Column(BIGINT(20, unsigned=True))
+    poller_node = Column(VARBINARY(256), nullable=True, default=Null)
     enabled = Column(BIT(1), default=1)
     ts_modified = Column(
         DateTime,
@@ -632,6 +635,11 @@ class MacIp(BASE):
     )
 
 
+# Columns added to tables after they were first released. Databases created
+# by older versions don't have them.
+_UPGRADES = [(Device, "poller_node")]
+
+
 def create_all_tables():
     """Ensure all tables are created.
 
@@ -644,3 +652,37 @@ def create_all_tables():
     with ENGINE.connect() as connection:
         with Session(bind=connection) as session:
             BASE.metadata.create_all(session.get_bind(), checkfirst=True)
+
+    # Upgrade tables created by older versions
+    with ENGINE.begin() as connection:
+        upgrade_tables(connection)
+
+
+def upgrade_tables(connection):
+    """Add the columns that tables created by older versions don't have.
+
+    Args:
+        connection: Database connection
+    Returns:
+        result: List of the added columns as "table.column" strings
+    """
+    # Initialize key variables
+    result = []
+    inspector = inspect(connection)
+
+    # Add missing columns
+    for model, name in _UPGRADES:
+        table = model.__table__
+        columns = [_["name"] for _ in inspector.get_columns(table.name)]
+        if name in columns:
+            continue
+        column = CreateColumn(table.columns[name]).compile(
+            dialect=connection.dialect
+        )
+        connection.execute(
+            text("ALTER TABLE {} ADD COLUMN {}".format(table.name, column))
+        )
+        result.append("{}.{}".format(table.name, name))
+
+    # Return
+    return result
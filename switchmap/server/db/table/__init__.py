@@ -34,13 +34,14 @@ IEvent = namedtuple("IEvent", "name epoch_utc enabled")
 RDevice = namedtuple(
     "RDevice",
     """idx_device idx_zone  sys_name hostname name \
-sys_description sys_objectid sys_uptime last_polled \
+sys_description sys_objectid sys_uptime last_polled poller_node \
 enabled ts_modified ts_created""",
 )
 IDevice = namedtuple(
     "IDevice",
     """idx_zone  sys_name hostname name \
-sys_description sys_objectid sys_uptime last_polled enabled""",
+sys_description sys_objectid sys_uptime last_polled poller_node \
+enabled""",
 )
 
 RL1Interface = namedtuple(
@@ -133,6 +133,11 @@ def insert_row(rows):
                     null() if row.sys_uptime is None else row.sys_uptime
                 ),
                 last_polled=(0 if row.last_polled is None else row.last_polled),
+                poller_node=(
+                    null()
+                    if row.poller_node is None
+                    else row.poller_node.encode()
+                ),
                 enabled=int(bool(row.enabled) is True),
             )
         )
@@ -189,6 +194,11 @@ def update_row(idx, row):
                 "last_polled": (
                     0 if bool(row.last_polled) is False else row.last_polled
                 ),
+                "poller_node": (
+                    null()
+                    if bool(row.poller_node) is False
+                    else row.poller_node.encode()
+                ),
                 "enabled": int(bool(row.enabled) is True),
             }
         )
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""Test the fingerprint module."""
+
+import unittest
+import os
+import sys
+
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}core".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from copy import deepcopy
+from switchmap.core import fingerprint
+
+
+def _data():
+    """Create device data.
+
+    Args:
+        None
+
+    Returns:
+        result: Dict of device data
+
+    """
+    # Return
+    result = {
+        "misc": {"host": "test", "zone": "zone", "timestamp": 100},
+        "system": {
+            "SNMPv2-MIB": {"sysName": {0: "test"}, "sysUpTime": {0: 1000}}
+        },
+        "layer1": {
+            1: {"ifName": "ge-0/0/1", "ifInOctets": 5, "ifHCInOctets": 6},
+            2: {"ifName": "ge-0/0/2", "l1_macs": ["00:00:00:00:00:01"]},
+        },
+        "layer2": {},
+        "layer3": {"ipNetToMediaTable": {"10.0.0.1": "00:00:00:00:00:01"}},
+    }
+    return result
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    def test_fingerprint(self):
+        """Testing function fingerprint."""
+        # Initialize key variables
+        expected = fingerprint.fingerprint(_data())
+        self.assertEqual(len(expected), 64)
+
+        # Data about the poll and volatile values are ignored
+        data = _data()
+        data["misc"]["timestamp"] = 200
+        data["system"]["SNMPv2-MIB"]["sysUpTime"][0] = 2000
+        data["layer1"][1]["ifInOctets"] = 50
+        data["layer1"][1]["ifHCInOctets"] = 60
+        self.assertEqual(fingerprint.fingerprint(data), expected)
+
+        # The order of keys is ignored
+        data = _data()
+        data["layer1"] = {2: data["layer1"][2], 1: data["layer1"][1]}
+        self.assertEqual(fingerprint.fingerprint(data), expected)
+
+        # Changes are detected
+        for path, value in [
+            (["layer1", 2, "l1_macs"], ["00:00:00:00:00:02"]),
+            (["layer1", 1, "ifName"], "ge-0/0/3"),
+            (["layer3", "ipNetToMediaTable", "10.0.0.2"], "00:00:00:00:00:02"),
+            (["system", "SNMPv2-MIB", "sysName", 0], "changed"),
+        ]:
+            data = _data()
+            target = data
+            for key in path[:-1]:
+                target = target[key]
+            target[path[-1]] = value
+            self.assertNotEqual(fingerprint.fingerprint(data), expected)
+
+    def test_unchanged(self):
+        """Testing function unchanged."""
+        # Initialize key variables
+        data = _data()
+        data["misc"]["fingerprint"] = "abc"
+
+        # Only the data about the poll and the uptime are sent
+        result = fingerprint.unchanged(data)
+        self.assertEqual(
+            result,
+            {
+                "misc": {
+                    "host": "test",
+                    "zone": "zone",
+                    "timestamp": 100,
+                    "fingerprint": "abc",
+                    "unchanged": True,
+                },
+                "system": {"SNMPv2-MIB": {"sysUpTime": {0: 1000}}},
+            },
+        )
+        self.assertNotIn("unchanged", data["misc"])
+
+        # Test without an uptime
+        del data["system"]
+        result = fingerprint.unchanged(data)
+        self.assertEqual(list(result), ["misc"])
+
+    def test_is_unchanged(self):
+        """Testing function is_unchanged."""
+        # Initialize key variables
+        data = _data()
+        data["misc"]["fingerprint"] = "abc"
+
+        # Run test
+        self.assertTrue(fingerprint.is_unchanged(fingerprint.unchanged(data)))
+        self.assertFalse(fingerprint.is_unchanged(data))
+        self.assertFalse(fingerprint.is_unchanged({}))
+        self.assertFalse(fingerprint.is_unchanged(None))
+        self.assertFalse(fingerprint.is_unchanged({"misc": None}))
+
+    def test_carry(self):
+        """Testing function carry."""
+        # Initialize key variables
+        previous = _data()
+        previous["misc"]["fingerprint"] = "abc"
+        data = _data()
+        data["misc"]["timestamp"] = 200
+        data["misc"]["fingerprint"] = "abc"
+        data["system"]["SNMPv2-MIB"]["sysUpTime"][0] = 2000
+        message = fingerprint.unchanged(data)
+
+        # The data about the poll and the uptime are updated
+        expected = deepcopy(previous)
+        expected["misc"] = dict(data["misc"])
+        expected["system"]["SNMPv2-MIB"]["sysUpTime"] = {0: 2000}
+        result = fingerprint.carry(deepcopy(previous), message)
+        self.assertEqual(result, expected)
+
+        # The previous data must be the unchanged data
+        previous["misc"]["fingerprint"] = "def"
+        self.assertIsNone(fingerprint.carry(previous, message))
+        del previous["misc"]["fingerprint"]
+        self.assertIsNone(fingerprint.carry(previous, message))
+        self.assertIsNone(fingerprint.carry({}, message))
+
+    def test__stable(self):
+        """Testing function _stable."""
+        # Run test
+        data = {1: [{"sysUpTime": 1, "a": (1, 2)}], "ifOutOctets": 3, "b": 4}
+        result = fingerprint._stable(data)
+        self.assertEqual(result, {"1": [{"a": [1, 2]}], "b": 4})
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
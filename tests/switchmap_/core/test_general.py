@@ -109,7 +109,14 @@ class TestFunctions(unittest.TestCase):
 
     def test_octetstr_2_string(self):
         """Testing function octetstr_2_string."""
-        pass
+        # Test MAC addresses
+        value = bytes("".join(chr(_) for _ in [0, 17, 170, 255, 1, 2]), "utf-8")
+        result = general.octetstr_2_string(value)
+        self.assertEqual(result, "0011aaff0102")
+
+        # Test values that aren't octets
+        result = general.octetstr_2_string(bytes("\u0100", "utf-8"))
+        self.assertEqual(result, "100")
 
     def test_random_hash(self):
         """Testing function random_hash."""
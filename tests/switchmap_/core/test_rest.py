@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""Test the rest module."""
+
+import unittest
+import os
+import sys
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}core".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+# Import other required libraries
+from mock import MagicMock
+from switchmap.core import rest as testimport
+from switchmap.core import stream
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Record requests and reply with the statuses the server is given."""
+
+    # Keep connections open
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        """Reply to GET requests.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Reply
+        self._reply(b"")
+
+    def do_POST(self):
+        """Reply to POST requests.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Get the body. Streams are chunked.
+        if self.headers.get("Transfer-Encoding") == "chunked":
+            body = b""
+            while True:
+                size = int(self.rfile.readline().strip(), 16)
+                body += self.rfile.read(size)
+                self.rfile.readline()
+                if size == 0:
+                    break
+        else:
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        # Reply
+        self._reply(body)
+
+    def log_request(self, code="-", size="-"):
+        """Don't log requests.
+
+        Args:
+            code: Status code of the reply
+            size: Size of the reply
+
+        Returns:
+            None
+
+        """
+        # Nothing to log
+        return
+
+    def _reply(self, body):
+        """Record a request and reply to it.
+
+        Args:
+            body: Body of the request
+
+        Returns:
+            None
+
+        """
+        # Record
+        self.server.requests.append(
+            (self.command, self.client_address, dict(self.headers), body)
+        )
+
+        # Reply
+        status = 200
+        if bool(self.server.statuses) is True:
+            status = self.server.statuses.pop(0)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+
+class TestRest(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def setUp(self):
+        """Execute these steps before each test."""
+        # Start a server
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.daemon_threads = True
+        self.server.requests = []
+        self.server.statuses = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        # Configuration of the client
+        self.config = MagicMock()
+        self.config.server_url_root.return_value = "http://{}:{}".format(
+            *self.server.server_address
+        )
+        self.config.server_username.return_value = None
+        self.config.server_password.return_value = None
+        self.config.server_connect_timeout.return_value = 5
+        self.config.server_read_timeout.return_value = 5
+        self.config.server_pool_size.return_value = 2
+        self.config.server_retries.return_value = 1
+        testimport._forget()
+
+    def tearDown(self):
+        """Execute these steps after each test."""
+        # Stop the server
+        if testimport._SESSION is not None:
+            testimport._SESSION.close()
+        testimport._forget()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_post(self):
+        """Testing function post."""
+        # Connections are reused
+        for _ in range(2):
+            result = testimport.post("/test", {"a": 1}, self.config)
+            self.assertTrue(result.success)
+        self.assertEqual(
+            [json.loads(_[3]) for _ in self.server.requests],
+            [{"a": 1}, {"a": 1}],
+        )
+        self.assertEqual(self.server.requests[0][1], self.server.requests[1][1])
+
+        # Posts aren't retried after server errors
+        self.server.requests = []
+        self.server.statuses = [503]
+        result = testimport.post("/test", {"a": 1}, self.config)
+        self.assertFalse(result.success)
+        self.assertEqual(result.response.status_code, 503)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_post_stream(self):
+        """Testing function post_stream."""
+        # Compressed streams are posted uncompressed when rejected
+        data = {"misc": {"host": "test"}, "layer1": {"1": {"ifIndex": 1}}}
+        self.server.statuses = [415]
+        result = testimport.post_stream(
+            "/test", data, self.config, compress=True
+        )
+        self.assertTrue(result.success)
+        (first, second) = self.server.requests
+        self.assertEqual(first[2]["Content-Encoding"], "gzip")
+        self.assertEqual(
+            stream.decode(gzip.decompress(first[3]).splitlines()), data
+        )
+        self.assertNotIn("Content-Encoding", second[2])
+        self.assertEqual(second[2]["Content-Type"], stream.CONTENT_TYPE)
+        self.assertEqual(stream.decode(second[3].splitlines()), data)
+
+    def test__Stream(self):
+        """Testing class _Stream."""
+        # Data is sent again each time the stream is iterated
+        data = {"misc": {"host": "test"}, "layer1": {"1": {"ifIndex": 1}}}
+        for compress in [False, True]:
+            item = testimport._Stream(data, compress=compress)
+            result = b"".join(item)
+            self.assertEqual(result, b"".join(item))
+            if compress is True:
+                result = gzip.decompress(result)
+            self.assertEqual(stream.decode(result.splitlines()), data)
+
+    def test__get(self):
+        """Testing function _get."""
+        # Requests are retried after server errors
+        url = "{}/test".format(self.config.server_url_root())
+        self.server.statuses = [503]
+        result = testimport._get(url, self.config, die=False)
+        self.assertTrue(result.success)
+        self.assertEqual(result.response.status_code, 200)
+        self.assertEqual([_[0] for _ in self.server.requests], ["GET", "GET"])
+
+        # Requests are retried after connection errors
+        self.server.shutdown()
+        self.server.server_close()
+        testimport._SESSION.close()
+        testimport._forget()
+        result = testimport._get(url, self.config, die=False)
+        self.assertFalse(result.success)
+
+    def test__session(self):
+        """Testing function _session."""
+        # The session is shared
+        result = testimport._session(self.config)
+        self.assertIs(testimport._session(self.config), result)
+
+        # Only GET requests are retried after server errors
+        retry = result.get_adapter("http://test").max_retries
+        self.assertEqual(retry.total, 1)
+        self.assertEqual(retry.read, 0)
+        self.assertIn(503, retry.status_forcelist)
+        self.assertTrue(retry.is_retry("GET", 503))
+        self.assertFalse(retry.is_retry("POST", 503))
+
+    def test__forget(self):
+        """Testing function _forget."""
+        # Forked processes create their own session
+        lock = testimport._LOCK
+        result = testimport._session(self.config)
+        testimport._forget()
+        self.assertIsNone(testimport._SESSION)
+        self.assertIsNot(testimport._LOCK, lock)
+        self.assertIsNot(testimport._session(self.config), result)
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""Test the stream module."""
+
+import unittest
+import os
+import sys
+import json
+
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}core".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from switchmap.core import stream
+
+
+def _data():
+    """Create device data.
+
+    Args:
+        None
+
+    Returns:
+        result: Dict of device data
+
+    """
+    # Return
+    result = {
+        "layer3": {
+            "ipNetToMediaTable": {
+                "10.0.0.{}".format(_): "00:00:00:00:00:{:02x}".format(_)
+                for _ in range(25)
+            },
+            "ipNetToPhysicalPhysAddress": {},
+        },
+        "layer1": {
+            _: {"ifIndex": _, "l1_macs": ["00:00:00:00:01:{:02x}".format(_)]}
+            for _ in range(1, 12)
+        },
+        "layer2": {1: {"dot1qVlanStaticName": "default"}},
+        "misc": {"host": "test", "zone": "zone", "timestamp": 0},
+        "system": {"SNMPv2-MIB": {"sysName": {"0": "test"}}},
+        "other": 1,
+    }
+    return result
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    def test_encode(self):
+        """Testing function encode."""
+        # Initialize key variables
+        data = _data()
+        lines = list(stream.encode(data, size=10))
+        chunks = [json.loads(_) for _ in lines]
+
+        # Each chunk is a line of JSON. Sections are sent in order.
+        for line in lines:
+            self.assertTrue(line.endswith(b"\n"))
+            self.assertEqual(line.count(b"\n"), 1)
+        self.assertEqual(chunks[0], {"path": ["misc"], "data": data["misc"]})
+        self.assertEqual(chunks[1]["path"], ["system"])
+        self.assertEqual(chunks[-2], {"path": [], "data": {"other": 1}})
+        self.assertEqual(chunks[-1], {"end": True})
+
+        # Large dicts are split
+        for chunk in chunks[:-1]:
+            self.assertLessEqual(len(chunk["data"]), 10)
+        paths = [_["path"] for _ in chunks[:-1]]
+        self.assertEqual(paths.count(["layer1"]), 2)
+        self.assertEqual(paths.count(["layer3", "ipNetToMediaTable"]), 3)
+
+        # The data is recreated as if it was posted in one JSON document
+        result = stream.decode(lines)
+        self.assertEqual(result, json.loads(json.dumps(data)))
+
+    def test_decode(self):
+        """Testing function decode."""
+        # Initialize key variables
+        data = _data()
+        lines = list(stream.encode(data, size=5))
+        expected = json.loads(json.dumps(data))
+
+        # Test with bytes, strings and blank lines
+        self.assertEqual(stream.decode(lines), expected)
+        self.assertEqual(
+            stream.decode([_.decode() for _ in lines] + ["\n"]), expected
+        )
+
+        # Truncated streams are invalid
+        self.assertIsNone(stream.decode(lines[:-1]))
+        self.assertIsNone(stream.decode([]))
+
+        # Data after the end is invalid
+        self.assertIsNone(stream.decode(lines + lines[:1]))
+
+        # Invalid lines are invalid
+        for line in [b"{", b"[]", b'{"path": ["misc"]}', b'{"data": {}}']:
+            self.assertIsNone(stream.decode([line] + lines))
+
+    def test__chunks(self):
+        """Testing function _chunks."""
+        # Empty dicts are sent so that their key exists
+        result = list(stream._chunks(["layer3"], {}, 2))
+        self.assertEqual(result, [(["layer3"], {})])
+
+        # Dicts are split
+        data = {1: "a", 2: "b", 3: "c"}
+        result = list(stream._chunks(["a"], data, 2))
+        self.assertEqual(result, [(["a"], {1: "a", 2: "b"}), (["a"], {3: "c"})])
+
+        # Large dicts within dicts are split
+        data = {1: "a", 2: {3: "c", 4: "d", 5: "e"}}
+        result = list(stream._chunks(["a"], data, 2))
+        self.assertEqual(
+            result,
+            [
+                (["a", "2"], {3: "c", 4: "d"}),
+                (["a", "2"], {5: "e"}),
+                (["a"], {1: "a"}),
+            ],
+        )
+
+        # Nothing more is sent when all items were sent as large dicts
+        data = {1: {2: "b", 3: "c", 4: "d"}}
+        result = list(stream._chunks(["a"], data, 2))
+        self.assertEqual(
+            result, [(["a", "1"], {2: "b", 3: "c"}), (["a", "1"], {4: "d"})]
+        )
+
+    def test__line(self):
+        """Testing function _line."""
+        # Run test
+        result = stream._line({"end": True})
+        self.assertEqual(result, b'{"end": true}\n')
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -83,6 +83,13 @@ class Test_ConfigDashboard(unittest.TestCase):
         result = self.config.server_bind_port()
         self.assertEqual(result, expected)
 
+    def test_server_connect_timeout(self):
+        """Testing function server_connect_timeout."""
+        # Run test
+        expected = 10
+        result = self.config.server_connect_timeout()
+        self.assertEqual(result, expected)
+
     def test_server_https(self):
         """Testing function server_https."""
         # Run test
@@ -97,6 +104,27 @@ class Test_ConfigDashboard(unittest.TestCase):
         result = self.config.server_password()
         self.assertEqual(result, expected)
 
+    def test_server_pool_size(self):
+        """Testing function server_pool_size."""
+        # Run test
+        expected = 10
+        result = self.config.server_pool_size()
+        self.assertEqual(result, expected)
+
+    def test_server_read_timeout(self):
+        """Testing function server_read_timeout."""
+        # Run test
+        expected = 300
+        result = self.config.server_read_timeout()
+        self.assertEqual(result, expected)
+
+    def test_server_retries(self):
+        """Testing function server_retries."""
+        # Run test
+        expected = 3
+        result = self.config.server_retries()
+        self.assertEqual(result, expected)
+
     def test_server_url_root(self):
         """Testing function server_url_root."""
         # Run test
@@ -117,6 +117,17 @@ class Query:
         """
         pass
 
+    def table(self):
+        """Do a failsafe walk of several table columns.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        pass
+
 
 class TestMibCiscoVTPFunctions(unittest.TestCase):
     """Checks all methods."""
@@ -412,6 +423,12 @@ class TestMibCiscoVTP(unittest.TestCase):
         """Testing function vlantrunkportvlansenabled."""
         pass
 
+    def test__vlans(self):
+        """Testing function _vlans."""
+        # VLANs 1 and 10 are enabled in the 1024 bit bitmap
+        value = b"\x40\x20" + bytes(126)
+        self.assertEqual(testimport._vlans(value), [1, 10])
+
 
 if __name__ == "__main__":
     # Do the unit test
@@ -4,6 +4,7 @@
 import unittest
 import os
 import sys
+from mock import Mock
 
 # Try to create a working PYTHONPATH
 EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
@@ -60,6 +61,7 @@ CONFIG = setup.config()
 CONFIG.save()
 
 # Import other required libraries
+from switchmap.poller.snmp.mib.generic import mib_bridge as testimport
 
 
 class Query:
@@ -114,6 +116,28 @@ class Query:
         """
         pass
 
+    def context_walks(self):
+        """Do failsafe SNMPwalks in several contexts.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        pass
+
+    def errors(self):
+        """Get the number of failed queries.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        pass
+
 
 class TestMibBridgeFunctions(unittest.TestCase):
     """Checks all methods."""
@@ -200,11 +224,80 @@ class TestMibBridge(unittest.TestCase):
 
     def test__dot1dtpfdbport(self):
         """Testing function _dot1dtpfdbport."""
-        pass
+        # Initialize key variables
+        oid = ".1.3.6.1.2.1.17.4.3.1.2"
+        snmpobj = Mock(spec=Query)
+        snmpobj.configure_mock(
+            **{
+                "swalk.return_value": {},
+                "context_walks.return_value": [
+                    {"{}.0.1.2.3.4.5".format(oid): 1},
+                    {"{}.0.1.2.3.4.6".format(oid): 2},
+                ],
+            }
+        )
+
+        # The results of all contexts are merged
+        testobj = testimport.init_query(snmpobj)
+        result = testobj._dot1dtpfdbport(context_names=["", "vlan-10"])
+        self.assertEqual(dict(result), {".0.1.2.3.4.5": 1, ".0.1.2.3.4.6": 2})
+        snmpobj.context_walks.assert_called_once_with(oid, ["", "vlan-10"])
 
     def test__dot1qtpfdbport(self):
         """Testing function _dot1qtpfdbport."""
-        pass
+        # Initialize key variables
+        oid = ".1.3.6.1.2.1.17.7.1.2.2.1.2"
+        table = {
+            "{}.10.0.1.2.3.4.5".format(oid): 1,
+            "{}.20.0.1.2.3.4.6".format(oid): 2,
+            "{}.99.0.1.2.3.4.7".format(oid): 3,
+        }
+        snmpobj = Mock(spec=Query)
+        snmpobj.configure_mock(**{"swalk.return_value": {}})
+        testobj = testimport.init_query(snmpobj)
+        snmpobj.reset_mock()
+        snmpobj.configure_mock(
+            **{
+                "oid_exists.return_value": True,
+                "errors.return_value": 0,
+                "swalk.side_effect": [{"10": "ten", "20": "twenty"}, table],
+            }
+        )
+
+        # The table is walked once. Only rows of known VLANs are used.
+        result = testobj._dot1qtpfdbport()
+        self.assertEqual(
+            dict(result), {".10.0.1.2.3.4.5": 1, ".20.0.1.2.3.4.6": 2}
+        )
+        self.assertEqual(snmpobj.swalk.call_count, 2)
+
+        # Devices that don't return the whole table are walked per VLAN
+        snmpobj.configure_mock(
+            **{
+                "swalk.side_effect": [
+                    {"10": "ten", "20": "twenty"},
+                    {},
+                    {"{}.10.0.1.2.3.4.5".format(oid): 1},
+                    {"{}.20.0.1.2.3.4.6".format(oid): 2},
+                ]
+            }
+        )
+        result = testobj._dot1qtpfdbport()
+        self.assertEqual(
+            dict(result), {".10.0.1.2.3.4.5": 1, ".20.0.1.2.3.4.6": 2}
+        )
+
+        # Walks that time out aren't repeated for each VLAN
+        snmpobj.reset_mock()
+        snmpobj.configure_mock(
+            **{
+                "errors.side_effect": [0, 1],
+                "swalk.side_effect": [{"10": "ten", "20": "twenty"}, {}],
+            }
+        )
+        result = testobj._dot1qtpfdbport()
+        self.assertEqual(dict(result), {})
+        self.assertEqual(snmpobj.swalk.call_count, 2)
 
     def test__dot1dtpfdbaddress(self):
         """Testing function _dot1dtpfdbaddress."""
@@ -216,15 +309,40 @@ class TestMibBridge(unittest.TestCase):
 
     def test__cisco_context_style(self):
         """Testing function _cisco_context_style."""
-        pass
+        # Initialize key variables
+        oid = ".1.3.6.1.2.1.17.4.3.1.1"
+        snmpobj = Mock(spec=Query)
+        snmpobj.configure_mock(
+            **{
+                "swalk.return_value": {},
+                "context_walks.return_value": [
+                    {},
+                    {"{}.0.1.2.3.4.5".format(oid): b"123456"},
+                ],
+            }
+        )
+
+        # Only the second style returns data
+        testobj = testimport.init_query(snmpobj)
+        self.assertEqual(testobj._cisco_context_style(10), 1)
+        snmpobj.context_walks.assert_called_once_with(oid, ["10", "vlan-10"])
 
     def test__cisco_vlan_context(self):
         """Testing function _cisco_vlan_context."""
         pass
 
+    def test__fid(self):
+        """Testing function _fid."""
+        # Test
+        self.assertEqual(testimport._fid(".10.0.1.2.3.4.5"), "10")
+        self.assertEqual(testimport._fid("10.0.1.2.3.4.5"), "10")
+
     def test__snmp_octetstr_2_string(self):
         """Testing function _snmp_octetstr_2_string."""
-        pass
+        # Test
+        value = bytes("".join(chr(_) for _ in [0, 17, 170, 255, 1, 2]), "utf-8")
+        result = testimport._snmp_octetstr_2_string(value)
+        self.assertEqual(result, "0011aaff0102")
 
 
 if __name__ == "__main__":
@@ -60,6 +60,7 @@ CONFIG = setup.config()
 CONFIG.save()
 
 # Import other required libraries
+from switchmap.poller.snmp.mib.generic import mib_entity as testimport
 
 
 class Query:
@@ -114,6 +115,17 @@ class Query:
         """
         pass
 
+    def table(self):
+        """Do a failsafe walk of several table columns.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        pass
+
 
 class TestMibEntityFunctions(unittest.TestCase):
     """Checks all methods."""
@@ -218,6 +230,10 @@ class TestMibEntity(unittest.TestCase):
         """Testing function entphysicalfirmwarerev."""
         pass
 
+    def test__string(self):
+        """Testing function _string."""
+        self.assertEqual(testimport._string(b" ABC123 "), "ABC123")
+
 
 if __name__ == "__main__":
     # Do the unit test
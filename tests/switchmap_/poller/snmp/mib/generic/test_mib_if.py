@@ -117,6 +117,17 @@ class Query:
         """
         pass
 
+    def table(self):
+        """Do a failsafe walk of several table columns.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        pass
+
 
 class TestMibIfFunctions(unittest.TestCase):
     """Checks all methods."""
@@ -285,9 +296,35 @@ class TestMibIf(unittest.TestCase):
 
     def test_layer1(self):
         """Testing function layer1."""
-        # Layer 1 testing only seems to work when all the methods return
-        # the same type of results (eg. int, string, hex)
-        pass
+        # Initialize key variables
+        strings = ["ifAlias", "ifName", "ifDescr"]
+        testobj = testimport.init_query(self.snmpobj_integer)
+
+        # Create the table walk rows keyed by ifIndex. The OID of each
+        # column is provided by the method of the same name.
+        rows = {}
+        for ifindex, values in self.expected_dict.items():
+            row = {}
+            for key, value in values.items():
+                oid = getattr(testobj, key.lower())(oidonly=True)
+                if key in strings:
+                    row[oid] = bytes(value, encoding="utf-8")
+                elif key == "ifPhysAddress":
+                    row[oid] = binascii.unhexlify(value)
+                else:
+                    row[oid] = value
+            rows[str(ifindex)] = row
+
+        # Set the stage for the table walk
+        snmpobj = Mock(spec=Query)
+        snmpobj.configure_mock(**{"table.return_value": rows})
+
+        # Get results
+        testobj = testimport.init_query(snmpobj)
+        results = testobj.layer1()
+
+        # Basic testing of results
+        self.assertEqual(results, self.expected_dict)
 
     def test_iflastchange(self):
         """Testing function iflastchange."""
@@ -601,10 +638,13 @@ class TestMibIf(unittest.TestCase):
         """Testing function ifstackstatus."""
         pass
 
-    def test__get_data(self):
-        """Testing function _get_data."""
-        # Tested by all other methods
-        pass
+    def test__string(self):
+        """Testing function _string."""
+        self.assertEqual(testimport._string(b"1234"), "1234")
+
+    def test__value(self):
+        """Testing function _value."""
+        self.assertEqual(testimport._value(1234), 1234)
 
 
 if __name__ == "__main__":
@@ -116,6 +116,17 @@ class Query:
         """
         pass
 
+    def table(self):
+        """Do a failsafe walk of several table columns.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        pass
+
 
 class TestMibIf64Functions(unittest.TestCase):
     """Checks all methods."""
@@ -233,9 +244,26 @@ class TestMibIf64(unittest.TestCase):
 
     def test_layer1(self):
         """Testing method / function layer1."""
+        # Initializing key variables
+        oids = {
+            ".1.3.6.1.2.1.31.1.1.1.6": "ifHCInOctets",
+            ".1.3.6.1.2.1.31.1.1.1.10": "ifHCOutOctets",
+            ".1.3.6.1.2.1.31.1.1.1.15": "ifHighSpeed",
+        }
+
+        # Table walk rows keyed by ifIndex
+        rows = {}
+        for ifindex, values in self.expected_dict.items():
+            rows[str(ifindex)] = {oid: values[key] for oid, key in oids.items()}
+
+        # Set the stage for the table walk
+        snmpobj = Mock(spec=Query)
+        snmpobj.configure_mock(**{"table.return_value": rows})
+
         # Get results
-        testobj = testimport.init_query(self.snmpobj_integer)
+        testobj = testimport.init_query(snmpobj)
         results = testobj.layer1()
+        self.assertEqual(sorted(results.keys()), [100, 200])
 
         # Basic testing of results
         for primary in results.keys():
@@ -416,11 +444,6 @@ class TestMibIf64(unittest.TestCase):
         results = testobj.ifhcoutoctets(oidonly=True)
         self.assertEqual(results, oid)
 
-    def test__get_data(self):
-        """Testing method / function _get_data."""
-        # Initializing key variables
-        pass
-
 
 if __name__ == "__main__":
     # Do the unit test
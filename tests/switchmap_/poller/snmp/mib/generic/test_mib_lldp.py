@@ -117,6 +117,17 @@ class Query:
         """
         pass
 
+    def table(self):
+        """Do a failsafe walk of several table columns.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        pass
+
 
 class TestMibTestMibLldp(unittest.TestCase):
     """Checks all methods."""
@@ -320,6 +331,20 @@ class TestMibLldp(unittest.TestCase):
         result = testimport._penultimate_node(oid)
         self.assertEqual(result, 9)
 
+    def test__string(self):
+        """Testing method / function _string."""
+        self.assertEqual(testimport._string(b"switch1"), "switch1")
+
+    def test__cleanstring(self):
+        """Testing method / function _cleanstring."""
+        result = testimport._cleanstring(b"Cisco  IOS   Software")
+        self.assertEqual(result, "Cisco IOS Software")
+
+    def test__binary_string(self):
+        """Testing method / function _binary_string."""
+        result = testimport._binary_string(b"\x00\x14")
+        self.assertEqual(result, "0000000000010100")
+
 
 if __name__ == "__main__":
     # Do the unit test
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""Test the capabilities module."""
+
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(os.path.join(EXEC_DIR, os.pardir)),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller{0}snmp".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+# Import other required libraries
+import time
+from mock import Mock
+from switchmap.poller.snmp import capabilities as testimport
+from switchmap.poller.configuration import ConfigPoller
+from switchmap.core import files
+
+
+class Interact:
+    """Class for snmp_manager.Interact mock."""
+
+    def hostname(self):
+        """Get SNMP hostname for the interaction.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        pass
+
+    def sysobjectid(self):
+        """Get the sysObjectID of the device.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        pass
+
+    def sysuptime(self):
+        """Get the sysUpTime of the device.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        pass
+
+    def errors(self):
+        """Get the number of queries that failed without a definite answer.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        pass
+
+
+class MibQuery:
+    """Class for MIB Query mock."""
+
+    def supported(self):
+        """Return device's support for the MIB.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        pass
+
+
+def _snmp_object(sysobjectid=".1.3.6.1.4.1.9.1.1", sysuptime=1000):
+    """Create a mock Interact object.
+
+    Args:
+        sysobjectid: sysObjectID to return
+        sysuptime: sysUpTime to return
+
+    Returns:
+        snmp_object: Mock object
+
+    """
+    # Return
+    snmp_object = Mock(spec=Interact)
+    snmp_object.configure_mock(
+        **{
+            "hostname.return_value": "capabilities.example.org",
+            "sysobjectid.return_value": sysobjectid,
+            "sysuptime.return_value": sysuptime,
+            "errors.return_value": 0,
+        }
+    )
+    return snmp_object
+
+
+def _query(supported=True):
+    """Create a mock MIB Query object.
+
+    Args:
+        supported: Value returned by the supported method
+
+    Returns:
+        query: Mock object
+
+    """
+    # Return
+    query = Mock(spec=MibQuery)
+    query.configure_mock(**{"supported.return_value": supported})
+    return query
+
+
+class TestCapabilities(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def setUp(self):
+        """Execute these steps before each test."""
+        # Start each test without a cache file
+        filename = files.capabilities_file(
+            "capabilities.example.org", ConfigPoller()
+        )
+        if os.path.isfile(filename) is True:
+            os.remove(filename)
+
+    def test___init__(self):
+        """Testing function __init__."""
+        pass
+
+    def test_supported(self):
+        """Testing function supported."""
+        # The device is only probed once per Query class
+        query = _query(supported=True)
+        testobj = testimport.Capabilities(_snmp_object())
+        self.assertTrue(testobj.supported(query))
+        self.assertTrue(testobj.supported(query))
+        self.assertEqual(query.supported.call_count, 1)
+
+        # Unsupported MIBs are cached too
+        testobj = testimport.Capabilities(_snmp_object())
+        query = _query(supported=False)
+        self.assertFalse(testobj.supported(query))
+
+    def test_supported_inconclusive(self):
+        """Testing function supported when the probe fails."""
+        # A probe that times out isn't cached as unsupported
+        snmp_object = _snmp_object()
+        snmp_object.errors.side_effect = [0, 1]
+        testobj = testimport.Capabilities(snmp_object)
+        self.assertFalse(testobj.supported(_query(supported=False)))
+        self.assertFalse(testobj.unsupported(MibQuery))
+        testobj.save()
+
+        # The device is probed again on the next poll
+        query = _query(supported=True)
+        testobj = testimport.Capabilities(_snmp_object(sysuptime=2000))
+        self.assertTrue(testobj.supported(query))
+        self.assertEqual(query.supported.call_count, 1)
+
+    def test_unsupported(self):
+        """Testing function unsupported."""
+        # Nothing is known before probing
+        testobj = testimport.Capabilities(_snmp_object())
+        self.assertFalse(testobj.unsupported(MibQuery))
+
+        # A definite lack of support is cached
+        testobj.supported(_query(supported=False))
+        self.assertTrue(testobj.unsupported(MibQuery))
+
+    def test_save(self):
+        """Testing function save."""
+        # Probe and save the results
+        testobj = testimport.Capabilities(_snmp_object())
+        testobj.supported(_query(supported=True))
+        testobj.save()
+
+        # The next poll of the device uses the cached value
+        query = _query(supported=False)
+        testobj = testimport.Capabilities(_snmp_object(sysuptime=2000))
+        self.assertTrue(testobj.supported(query))
+        self.assertEqual(query.supported.call_count, 0)
+
+        # A reboot causes the device to be probed again
+        testobj = testimport.Capabilities(_snmp_object(sysuptime=10))
+        self.assertFalse(testobj.supported(query))
+        self.assertEqual(query.supported.call_count, 1)
+
+        # So does a change in sysObjectID
+        query = _query(supported=False)
+        testobj = testimport.Capabilities(
+            _snmp_object(sysobjectid=".1.3.6.1.4.1.2636.1.1")
+        )
+        self.assertFalse(testobj.supported(query))
+        self.assertEqual(query.supported.call_count, 1)
+
+    def test__load(self):
+        """Testing function _load."""
+        pass
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    def test__valid(self):
+        """Testing function _valid."""
+        # Initialize key variables
+        now = int(time.time())
+        sysobjectid = ".1.3.6.1.4.1.9.1.1"
+        data = {
+            "sysobjectid": sysobjectid,
+            "sysuptime": 1000,
+            "timestamp": now,
+            "supported": {"IfQuery": True},
+        }
+
+        # Test
+        self.assertTrue(testimport._valid(data, sysobjectid, 1000, now))
+        self.assertTrue(testimport._valid(data, sysobjectid, 2000, now))
+
+        # Expired
+        self.assertFalse(testimport._valid(data, sysobjectid, 2000, now + 1))
+
+        # Rebooted
+        self.assertFalse(testimport._valid(data, sysobjectid, 10, now))
+        self.assertFalse(testimport._valid(data, sysobjectid, None, now))
+
+        # Different device
+        self.assertFalse(testimport._valid(data, ".1.3.6.1.4.1.9", 2000, now))
+        self.assertFalse(testimport._valid(data, None, 2000, now))
+
+        # Bad data
+        self.assertFalse(testimport._valid({}, sysobjectid, 2000, now))
+        self.assertFalse(testimport._valid(None, sysobjectid, 2000, now))
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""Test the delta module."""
+
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(os.path.join(EXEC_DIR, os.pardir)),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller{0}snmp".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+# Import other required libraries
+import time
+from collections import defaultdict
+from mock import Mock, patch
+from switchmap.poller.snmp import delta as testimport
+from switchmap.poller.configuration import ConfigPoller
+from switchmap.core import files
+
+_HOSTNAME = "delta.example.org"
+
+
+class Interact:
+    """Class for snmp_manager.Interact mock."""
+
+    def hostname(self):
+        """Get SNMP hostname for the interaction.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        pass
+
+    def get(self):
+        """Do an SNMPget.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        pass
+
+    def swalk(self):
+        """Do a safe SNMPwalk.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        pass
+
+
+class IfQuery:
+    """Class for MIB Query mock. The name matches a Query class."""
+
+    def layer1(self):
+        """Get layer 1 data.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        pass
+
+    def system(self):
+        """Get system data.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        pass
+
+    def ifalias(self):
+        """Get the ifAlias of each interface.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        pass
+
+
+class BridgeQuery(IfQuery):
+    """Class for MIB Query mock. The name matches a Query class."""
+
+    pass
+
+
+class QbridgeQuery(IfQuery):
+    """Class for MIB Query mock. The name matches a Query class."""
+
+    pass
+
+
+def _snmp_object(sysuptime=1000, iftablelastchange=500, iflastchange=None):
+    """Create a mock Interact object.
+
+    Args:
+        sysuptime: sysUpTime to return
+        iftablelastchange: ifTableLastChange to return
+        iflastchange: Dict of ifLastChange values keyed by ifIndex
+
+    Returns:
+        snmp_object: Mock object
+
+    """
+    # Initialize key variables
+    if iflastchange is None:
+        iflastchange = {"1": 100, "2": 200}
+
+    # Return
+    snmp_object = Mock(spec=Interact)
+    snmp_object.configure_mock(
+        **{
+            "hostname.return_value": _HOSTNAME,
+            "get.return_value": {
+                testimport._SYSUPTIME: sysuptime,
+                testimport._IFTABLELASTCHANGE: iftablelastchange,
+                testimport._IFSTACKLASTCHANGE: 400,
+                testimport._ENTLASTCHANGETIME: None,
+            },
+            "swalk.return_value": iflastchange,
+        }
+    )
+    return snmp_object
+
+
+def _query(query_class, data, alias=None):
+    """Create a mock MIB Query object.
+
+    Args:
+        query_class: Class to mock
+        data: Value returned by the layer1 method
+        alias: Value returned by the ifalias method
+
+    Returns:
+        query: Mock object
+
+    """
+    # Return
+    query = Mock(spec=query_class)
+    query.__class__ = query_class
+    query.configure_mock(
+        **{
+            "layer1.return_value": data,
+            "system.return_value": {"system": 1},
+            "ifalias.return_value": alias or {},
+        }
+    )
+    return query
+
+
+class TestDelta(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def setUp(self):
+        """Execute these steps before each test."""
+        # Start each test without a snapshot file
+        filename = files.snapshot_file(_HOSTNAME, ConfigPoller())
+        if os.path.isfile(filename) is True:
+            os.remove(filename)
+
+    def test___init__(self):
+        """Testing function __init__."""
+        pass
+
+    def test_query(self):
+        """Testing function query."""
+        # MIB Query objects are used as is when delta polling is disabled
+        query = _query(IfQuery, {1: {"ifDescr": "Gi1/1"}})
+        testobj = testimport.Delta(_snmp_object())
+        self.assertIs(testobj.query(query), query)
+
+    @patch.object(ConfigPoller, "delta_polling", return_value=True)
+    def test_save(self, _):
+        """Testing function save."""
+        # Poll and save the data
+        testobj = testimport.Delta(_snmp_object())
+        for query in [
+            _query(IfQuery, {1: {"ifDescr": "Gi1/1", "ifAlias": "a"}}),
+            _query(BridgeQuery, {1: {"l1_macs": ["a"]}}),
+            _query(QbridgeQuery, {1: {"l1_vlans": [1]}}),
+        ]:
+            proxy = testobj.query(query)
+            proxy.layer1()
+            proxy.system()
+        testobj.save()
+
+        # Unchanged interface data is reused, but interface descriptions
+        # are queried again
+        testobj = testimport.Delta(_snmp_object(sysuptime=2000))
+        query = _query(IfQuery, {}, alias={1: "b", 3: "c"})
+        proxy = testobj.query(query)
+        self.assertEqual(
+            proxy.layer1(), {1: {"ifDescr": "Gi1/1", "ifAlias": "b"}}
+        )
+        self.assertEqual(proxy.system(), {"system": 1})
+        self.assertEqual(query.layer1.call_count, 0)
+        self.assertEqual(query.system.call_count, 0)
+        self.assertEqual(query.ifalias.call_count, 1)
+
+        # MAC addresses and VLANs are queried
+        for query_class, expected in [
+            (BridgeQuery, {1: {"l1_macs": ["b"]}}),
+            (QbridgeQuery, {1: {"l1_vlans": [2]}}),
+        ]:
+            query = _query(query_class, expected)
+            proxy = testobj.query(query)
+            self.assertEqual(proxy.layer1(), expected)
+            self.assertEqual(query.layer1.call_count, 1)
+
+        # Interface descriptions queried again are saved
+        testobj.save()
+        testobj = testimport.Delta(_snmp_object(sysuptime=3000))
+        query = _query(IfQuery, {})
+        proxy = testobj.query(query)
+        self.assertEqual(
+            proxy.layer1(), {1: {"ifDescr": "Gi1/1", "ifAlias": "b"}}
+        )
+
+        # Interface changes cause the interface data to be queried
+        for snmp_object in [
+            _snmp_object(sysuptime=2000, iftablelastchange=600),
+            _snmp_object(sysuptime=2000, iflastchange={"1": 100}),
+            _snmp_object(sysuptime=10),
+        ]:
+            testobj = testimport.Delta(snmp_object)
+            query = _query(IfQuery, {1: {"ifDescr": "Gi1/2"}})
+            proxy = testobj.query(query)
+            self.assertEqual(proxy.layer1(), {1: {"ifDescr": "Gi1/2"}})
+            self.assertEqual(query.layer1.call_count, 1)
+            self.assertEqual(query.ifalias.call_count, 0)
+
+        # All data is queried regularly
+        with patch.object(testimport.time, "time", return_value=10**10):
+            testobj = testimport.Delta(_snmp_object(sysuptime=2000))
+        query = _query(IfQuery, {})
+        proxy = testobj.query(query)
+        proxy.layer1()
+        self.assertEqual(query.layer1.call_count, 1)
+
+    def test__load(self):
+        """Testing function _load."""
+        pass
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    def test__indicators(self):
+        """Testing function _indicators."""
+        # Test
+        result = testimport._indicators(_snmp_object())
+        self.assertEqual(
+            result,
+            {
+                "sysUpTime": 1000,
+                "ifTableLastChange": 500,
+                "ifStackLastChange": 400,
+                "entLastChangeTime": None,
+                "ifLastChange": {1: 100, 2: 200},
+            },
+        )
+
+    def test__unchanged(self):
+        """Testing function _unchanged."""
+        # Initialize key variables
+        previous = {
+            "ifTableLastChange": 500,
+            "ifStackLastChange": 400,
+            "ifLastChange": {1: 100},
+            "entLastChangeTime": None,
+        }
+
+        # Groups without supported indicators are never unchanged
+        result = testimport._unchanged(previous, dict(previous))
+        self.assertEqual(result, {"interfaces"})
+
+        # Test
+        current = dict(previous)
+        current["ifLastChange"] = {1: 101}
+        self.assertEqual(testimport._unchanged(previous, current), set())
+        current = dict(previous)
+        current["ifStackLastChange"] = None
+        self.assertEqual(testimport._unchanged(previous, current), set())
+
+    def test__valid(self):
+        """Testing function _valid."""
+        # Initialize key variables
+        now = int(time.time())
+        data = {
+            "timestamp": now,
+            "indicators": {"sysUpTime": 1000},
+            "data": {},
+        }
+
+        # Test
+        self.assertTrue(testimport._valid(data, {"sysUpTime": 1000}, now))
+
+        # Expired
+        self.assertFalse(testimport._valid(data, {"sysUpTime": 1000}, now + 1))
+
+        # Rebooted
+        self.assertFalse(testimport._valid(data, {"sysUpTime": 10}, now))
+        self.assertFalse(testimport._valid(data, {}, now))
+
+        # Bad data
+        self.assertFalse(testimport._valid({}, {"sysUpTime": 1000}, now))
+        self.assertFalse(testimport._valid(None, {"sysUpTime": 1000}, now))
+
+    def test__plain(self):
+        """Testing function _plain."""
+        # Test
+        data = defaultdict(lambda: defaultdict(dict))
+        data[1]["ifDescr"] = "Gi1/1"
+        data[1]["vlans"] = (1, 2)
+        result = testimport._plain(data)
+        self.assertEqual(result, {1: {"ifDescr": "Gi1/1", "vlans": [1, 2]}})
+        self.assertEqual(type(result[1]), dict)
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
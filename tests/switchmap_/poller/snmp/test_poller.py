@@ -75,6 +75,10 @@ class TestSnmpPollerFunctions(unittest.TestCase):
         # Cleanup the
         CONFIG.cleanup()
 
+    def test_reachable(self):
+        """Testing function reachable."""
+        pass
+
     def test__do_poll(self):
         """Testing function _do_poll."""
         pass
@@ -115,6 +119,10 @@ class TestSnmpPoller(unittest.TestCase):
         """Testing function query."""
         pass
 
+    def test_timing(self):
+        """Testing function timing."""
+        pass
+
 
 if __name__ == "__main__":
     # Do the unit test
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""Test the replay module."""
+
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(os.path.join(EXEC_DIR, os.pardir)),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller{0}snmp".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+# Import other required libraries
+import tempfile
+from mock import Mock
+from easysnmp import exceptions
+from switchmap.poller.snmp import replay as testimport
+
+# Rows of a capture
+_ROWS = [
+    [".1.3.6.1.2.1.2.2.1.2", "10", "Gi1/10", "OCTETSTR"],
+    [".1.3.6.1.2.1.2.2.1.2", "2", "Gi1/2", "OCTETSTR"],
+    [".1.3.6.1.2.1.2.2.1.3", "2", "6", "INTEGER"],
+    [".1.3.6.1.2.1.1.3", "0", "100", "TIMETICKS"],
+]
+_CAPTURE = {
+    "hostname": "replay.example.org",
+    "contexts": {"": _ROWS, "vlan-1": _ROWS[:1]},
+}
+
+
+def _session():
+    """Create a replay session.
+
+    Args:
+        None
+
+    Returns:
+        result: _ReplaySession object
+
+    """
+    # Return
+    backend = testimport.Replay(captures={"replay.example.org": _CAPTURE})
+    result = backend.session("replay.example.org", "")
+    return result
+
+
+class TestRecorder(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    def test___init__(self):
+        """Testing function __init__."""
+        pass
+
+    def test_session(self):
+        """Testing function session."""
+        # Answers are returned unchanged
+        session = Mock()
+        session.bulkwalk.return_value = [testimport.VARBIND(*_ROWS[0])]
+        session.get.return_value = testimport.VARBIND(*_ROWS[3])
+        with tempfile.TemporaryDirectory() as directory:
+            recorder = testimport.Recorder(directory)
+            testobj = recorder.session(
+                "replay.example.org", "", lambda: session
+            )
+            self.assertEqual(
+                testobj.bulkwalk(".1.3.6.1.2.1.2.2.1.2", max_repetitions=5),
+                session.bulkwalk.return_value,
+            )
+            session.bulkwalk.assert_called_once_with(
+                ".1.3.6.1.2.1.2.2.1.2", non_repeaters=0, max_repetitions=5
+            )
+            self.assertEqual(
+                testobj.get(".1.3.6.1.2.1.1.3.0"), session.get.return_value
+            )
+
+            # Test the recording
+            (filename,) = recorder.save()
+            self.assertEqual(
+                testimport.load(filename)["contexts"],
+                {"": [_ROWS[3], _ROWS[0]]},
+            )
+
+    def test_record(self):
+        """Testing function record."""
+        pass
+
+    def test_save(self):
+        """Testing function save."""
+        # Record the answers of several contexts
+        with tempfile.TemporaryDirectory() as directory:
+            testobj = testimport.Recorder(directory)
+            testobj.record(
+                "replay.example.org",
+                "",
+                [testimport.VARBIND(*_) for _ in _ROWS]
+                + [
+                    testimport.VARBIND(
+                        ".1.3.6.1.2.1.1.5", "0", "", "NOSUCHOBJECT"
+                    )
+                ],
+            )
+            testobj.record(
+                "replay.example.org",
+                "vlan-1",
+                [testimport.VARBIND(*_ROWS[0])],
+            )
+            (filename,) = testobj.save()
+            self.assertEqual(
+                filename,
+                os.path.join(directory, "replay.example.org.json.gz"),
+            )
+            result = testimport.load(filename)
+
+        # Test. Rows are in SNMP order.
+        self.assertEqual(result["hostname"], "replay.example.org")
+        self.assertEqual(
+            result["contexts"],
+            {
+                "": [
+                    _ROWS[3],
+                    [".1.3.6.1.2.1.1.5", "0", "", "NOSUCHOBJECT"],
+                    _ROWS[1],
+                    _ROWS[0],
+                    _ROWS[2],
+                ],
+                "vlan-1": [_ROWS[0]],
+            },
+        )
+
+
+class TestReplay(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    def test___init__(self):
+        """Testing function __init__."""
+        pass
+
+    def test_session(self):
+        """Testing function session."""
+        # Captures are read from the directory
+        with tempfile.TemporaryDirectory() as directory:
+            testimport.save(
+                _CAPTURE,
+                testimport.capture_file(directory, "replay.example.org"),
+            )
+            backend = testimport.Replay(directory=directory)
+            testobj = backend.session("replay.example.org", "vlan-1")
+            self.assertEqual(
+                testobj.walk(".1.3.6.1.2.1.2.2.1"),
+                [testimport.VARBIND(*_ROWS[0])],
+            )
+
+            # Devices and contexts without captures don't answer
+            backend.timeout = 0
+            for hostname, context_name in [
+                ("missing.example.org", ""),
+                ("replay.example.org", "vlan-2"),
+            ]:
+                testobj = backend.session(hostname, context_name)
+                with self.assertRaises(exceptions.EasySNMPTimeoutError):
+                    testobj.get(".1.3.6.1.2.1.1.3.0")
+
+    def test_delay(self):
+        """Testing function delay."""
+        # Queries time out when all the retries are lost
+        testobj = testimport.Replay(loss=1, timeout=0, retries=2)
+        with self.assertRaises(exceptions.EasySNMPTimeoutError):
+            testobj.delay(1)
+        testobj.delay(0)
+
+        # Nothing is lost by default
+        testobj = testimport.Replay()
+        testobj.delay(100)
+
+    def test__lost(self):
+        """Testing function _lost."""
+        pass
+
+
+class TestReplaySession(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    def test___init__(self):
+        """Testing function __init__."""
+        pass
+
+    def test_get(self):
+        """Testing function get."""
+        # Test
+        testobj = _session()
+        self.assertEqual(
+            testobj.get(".1.3.6.1.2.1.1.3.0"), testimport.VARBIND(*_ROWS[3])
+        )
+        self.assertEqual(
+            testobj.get([".1.3.6.1.2.1.2.2.1.2.2", ".1.3.6.1.2.1.1.5.0"]),
+            [
+                testimport.VARBIND(*_ROWS[1]),
+                testimport.VARBIND(
+                    ".1.3.6.1.2.1.1.5", "0", "NOSUCHOBJECT", "NOSUCHOBJECT"
+                ),
+            ],
+        )
+
+    def test_walk(self):
+        """Testing function walk."""
+        # Test
+        testobj = _session()
+        self.assertEqual(
+            testobj.walk(".1.3.6.1.2.1.2.2.1.2"),
+            [testimport.VARBIND(*_ROWS[1]), testimport.VARBIND(*_ROWS[0])],
+        )
+
+        # OIDs without anything below them are returned themselves
+        self.assertEqual(
+            testobj.walk(".1.3.6.1.2.1.1.3.0"), [testimport.VARBIND(*_ROWS[3])]
+        )
+
+        # Missing OIDs return a missing value. Nodes are compared whole.
+        self.assertEqual(
+            testobj.walk(".1.3.6.1.2.1.2.2.1.2.1"),
+            [
+                testimport.VARBIND(
+                    ".1.3.6.1.2.1.2.2.1.2", "1", "NOSUCHOBJECT", "NOSUCHOBJECT"
+                )
+            ],
+        )
+
+    def test_bulkwalk(self):
+        """Testing function bulkwalk."""
+        # Test
+        testobj = _session()
+        self.assertEqual(
+            testobj.bulkwalk(
+                [".1.3.6.1.2.1.2.2.1.3", ".1.3.6.1.2.1.1"], max_repetitions=1
+            ),
+            [testimport.VARBIND(*_ROWS[2]), testimport.VARBIND(*_ROWS[3])],
+        )
+
+    def test__answering(self):
+        """Testing function _answering."""
+        pass
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    def test_install(self):
+        """Testing function install."""
+        # Test
+        backend = testimport.Replay()
+        testimport.install(backend)
+        self.assertIs(testimport.installed(), backend)
+        testimport.install(None)
+        self.assertIsNone(testimport.installed())
+
+    def test_installed(self):
+        """Testing function installed."""
+        pass
+
+    def test_capture_file(self):
+        """Testing function capture_file."""
+        pass
+
+    def test_save(self):
+        """Testing function save."""
+        pass
+
+    def test_load(self):
+        """Testing function load."""
+        # Values that aren't valid UTF-8 are kept
+        capture = {"contexts": {"": [[".1.3", "1", "\udc80\x00a", "OCTETSTR"]]}}
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "capture.json.gz")
+            testimport.save(capture, filename)
+            self.assertEqual(testimport.load(filename), capture)
+
+    def test__agents(self):
+        """Testing function _agents."""
+        pass
+
+    def test__oid(self):
+        """Testing function _oid."""
+        pass
+
+    def test__key(self):
+        """Testing function _key."""
+        # Test
+        self.assertEqual(testimport._key(".1.3.6.1"), (1, 3, 6, 1))
+
+    def test__sorted(self):
+        """Testing function _sorted."""
+        # Test
+        self.assertEqual(
+            testimport._sorted([".1.3.10", ".1.3.9.1", ".1.3.9"]),
+            [".1.3.9", ".1.3.9.1", ".1.3.10"],
+        )
+
+    def test__listed(self):
+        """Testing function _listed."""
+        pass
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
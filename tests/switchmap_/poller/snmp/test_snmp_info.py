@@ -46,6 +46,131 @@ CONFIG = setup.config()
 CONFIG.save()
 
 # Import other required libraries
+import time
+from mock import Mock, MagicMock, patch
+from switchmap.poller.snmp import snmp_info as testimport
+from switchmap.poller.configuration import ConfigPoller
+from switchmap.core import files
+
+
+class _Query:
+    """Class for MIB Query mock."""
+
+    instances = 0
+
+    def __init__(self, snmp_object):
+        """Instantiate the class.
+
+        Args:
+            snmp_object: SNMP Interact class object
+
+        Returns:
+            None
+
+        """
+        _Query.instances += 1
+
+    def layer1(self):
+        """Get layer 1 data from device.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        pass
+
+
+class _UnsupportedQuery(_Query):
+    """Class for unsupported MIB Query mock."""
+
+    pass
+
+
+class Capabilities:
+    """Class for capabilities.Capabilities mock."""
+
+    def unsupported(self, query_class):
+        """Determine whether a MIB Query class is cached as unsupported.
+
+        Args:
+            query_class: MIB Query class
+
+        Returns:
+            None
+        """
+        pass
+
+    def supported(self, query):
+        """Return device's support for the MIB of a Query object.
+
+        Args:
+            query: MIB Query object
+
+        Returns:
+            None
+        """
+        pass
+
+
+class IfQuery:
+    """Class for MIB Query mock. The name matches a Query class."""
+
+    def __init__(self, alias, delay=0):
+        """Instantiate the class.
+
+        Args:
+            alias: ifAlias of the interface
+            delay: Time taken to query layer 1 data
+
+        Returns:
+            None
+
+        """
+        # Initialize key variables
+        self.alias = alias
+        self.delay = delay
+        self.calls = []
+
+    def layer1(self):
+        """Get layer 1 data from device.
+
+        Args:
+            None
+
+        Returns:
+            result: Layer 1 data
+        """
+        self.calls.append("layer1")
+        time.sleep(self.delay)
+        result = {1: {"ifAlias": self.alias}}
+        return result
+
+    def system(self):
+        """Get system data from device.
+
+        Args:
+            None
+
+        Returns:
+            result: System data
+        """
+        self.calls.append("system")
+        result = {"IF-MIB": {"ifStackStatus": {1: self.alias}}}
+        return result
+
+    def ifalias(self):
+        """Get the ifAlias of each interface.
+
+        Args:
+            None
+
+        Returns:
+            result: Dict of ifAlias values keyed by ifIndex. There are none.
+        """
+        result = {}
+        return result
 
 
 class TestSnmpInfo(unittest.TestCase):
@@ -81,7 +206,134 @@ class TestSnmpInfo(unittest.TestCase):
 
     def test_everything(self):
         """Testing function everything."""
-        pass
+        # Initialize key variables
+        snmp_object = MagicMock()
+        snmp_object.hostname.return_value = "test"
+        snmp_object.sysobjectid.return_value = ".1.3.6.1.4.1.9.1.1"
+        slow = MagicMock()
+        slow.layer1.side_effect = lambda: time.sleep(0.2) or {1: {"a": 1}}
+        fast = MagicMock()
+        fast.layer1.return_value = {2: {"b": 2}}
+        for layer in ["layer2", "layer3", "system"]:
+            getattr(fast, layer).return_value = {}
+
+        # Create the object to test
+        def _query(deadline, layer1):
+            """Create a Query object for the test MIB Query objects.
+
+            Args:
+                deadline: Deadline of the poll
+                layer1: List of MIB query objects for layer 1
+
+            Returns:
+                result: Query object
+
+            """
+            # Return
+            with patch.object(testimport.capabilities, "Capabilities"):
+                with patch.object(testimport.delta, "Delta") as _delta:
+                    with patch.object(testimport, "Plan") as plan:
+                        _delta.return_value.query.side_effect = lambda _: _
+                        plan.return_value.queries.side_effect = lambda _: (
+                            layer1 if _ == "layer1" else [fast]
+                        )
+                        result = testimport.Query(
+                            snmp_object, deadline=deadline
+                        )
+            return result
+
+        # All layers are polled without a deadline
+        result = _query(None, [slow, fast]).everything()
+        self.assertEqual(sorted(result["layer1"]), [1, 2])
+        self.assertNotIn("partial", result["misc"])
+
+        # Layers polled after the deadline are skipped
+        result = _query(0.1, [fast, slow]).everything()
+        self.assertEqual(sorted(result["layer1"]), [1, 2])
+        for layer in ["layer2", "layer3", "system"]:
+            self.assertIsNone(result[layer])
+        self.assertEqual(
+            result["misc"]["partial"], ["layer2", "layer3", "system"]
+        )
+
+        # Layers being polled when the deadline passes are incomplete
+        result = _query(0.1, [slow, fast]).everything()
+        self.assertIsNone(result["layer1"])
+        self.assertEqual(
+            result["misc"]["partial"], ["layer1", "layer2", "layer3", "system"]
+        )
+
+    @patch.object(ConfigPoller, "delta_polling", return_value=True)
+    def test_everything_delta(self, _):
+        """Testing function everything with delta polling."""
+        # Initialize key variables
+        filename = files.snapshot_file("test", ConfigPoller())
+        if os.path.isfile(filename) is True:
+            os.remove(filename)
+
+        def _everything(query, deadline=None, change=500):
+            """Poll a device with a single MIB Query object.
+
+            Args:
+                query: MIB Query object
+                deadline: Deadline of the poll
+                change: ifTableLastChange of the device
+
+            Returns:
+                result: Data of the poll
+
+            """
+            # Initialize key variables
+            snmp_object = MagicMock()
+            snmp_object.hostname.return_value = "test"
+            snmp_object.sysobjectid.return_value = ".1.3.6.1.4.1.9.1.1"
+            snmp_object.get.return_value = {
+                testimport.delta._SYSUPTIME: 1000,
+                testimport.delta._IFTABLELASTCHANGE: change,
+            }
+            snmp_object.swalk.return_value = {}
+
+            # Return
+            with patch.object(testimport.capabilities, "Capabilities"):
+                with patch.object(testimport, "Plan") as plan:
+                    plan.return_value.queries.side_effect = lambda _: (
+                        [query] if _ in ["layer1", "system"] else []
+                    )
+                    result = testimport.Query(
+                        snmp_object, deadline=deadline
+                    ).everything()
+            return result
+
+        try:
+            # Complete polls are saved for the next poll
+            query = IfQuery("a")
+            result = _everything(query)
+            self.assertEqual(result["layer1"][1]["ifAlias"], "a")
+            query = IfQuery("b")
+            result = _everything(query)
+            self.assertEqual(result["layer1"][1]["ifAlias"], "a")
+            self.assertEqual(query.calls, [])
+
+            # The interfaces change, but the poll ends before the system
+            # data is queried
+            query = IfQuery("c", delay=0.2)
+            result = _everything(query, deadline=0.1, change=600)
+            self.assertEqual(
+                result["misc"]["partial"], ["layer2", "layer3", "system"]
+            )
+            self.assertEqual(query.calls, ["layer1"])
+
+            # The data of the partial poll isn't reused
+            query = IfQuery("d")
+            result = _everything(query, change=600)
+            self.assertEqual(result["layer1"][1]["ifAlias"], "d")
+            self.assertEqual(
+                result["system"]["IF-MIB"]["ifStackStatus"], {1: "d"}
+            )
+            self.assertEqual(query.calls, ["layer1", "system"])
+        finally:
+            if os.path.isfile(filename) is True:
+                os.remove(filename)
 
     def test_misc(self):
         """Testing function misc."""
@@ -103,6 +355,89 @@ class TestSnmpInfo(unittest.TestCase):
         """Testing function layer3."""
         pass
 
+    def test__queries(self):
+        """Testing function _queries."""
+        pass
+
+    def test__expired(self):
+        """Testing function _expired."""
+        pass
+
+    def test_queries(self):
+        """Testing function queries."""
+        # Initialize key variables
+        cache = Mock(spec=Capabilities)
+        cache.configure_mock(
+            **{
+                "supported.side_effect": lambda query: not isinstance(
+                    query, _UnsupportedQuery
+                ),
+                "unsupported.return_value": False,
+            }
+        )
+        testobj = testimport.Plan(None, cache)
+        _Query.instances = 0
+
+        # Each query object is created and probed once, then reused
+        with patch.object(
+            testimport,
+            "get_queries",
+            return_value=[_Query, _UnsupportedQuery],
+        ):
+            first = testobj.queries("layer1")
+            second = testobj.queries("layer2")
+
+        self.assertEqual(len(first), 1)
+        self.assertTrue(isinstance(first[0], _Query))
+        self.assertIs(first[0], second[0])
+        self.assertEqual(_Query.instances, 2)
+        self.assertEqual(cache.supported.call_count, 2)
+
+        # Classes cached as unsupported aren't created, as creating them
+        # may query the device
+        cache.configure_mock(
+            **{
+                "unsupported.side_effect": lambda query_class: (
+                    query_class is _UnsupportedQuery
+                )
+            }
+        )
+        testobj = testimport.Plan(None, cache)
+        _Query.instances = 0
+        with patch.object(
+            testimport,
+            "get_queries",
+            return_value=[_Query, _UnsupportedQuery],
+        ):
+            result = testobj.queries("layer1")
+        self.assertEqual(len(result), 1)
+        self.assertEqual(_Query.instances, 1)
+
+    def test_queries_timing(self):
+        """Testing function queries when recording the cost of queries."""
+        # Initialize key variables
+        recorder = testimport.timing.Timing("info.example.org", enabled=True)
+        cache = Mock(spec=Capabilities)
+        cache.configure_mock(
+            **{
+                "supported.return_value": True,
+                "unsupported.return_value": False,
+            }
+        )
+
+        # Queries made while creating a MIB Query object are attributed to
+        # its class
+        with patch.object(
+            _Query,
+            "__init__",
+            lambda _, __: recorder.oid(".1.3.6.1.2.1.1.2.0", 0.1, pdus=1),
+        ):
+            with patch.object(testimport, "get_queries", return_value=[_Query]):
+                testimport.Plan(None, cache, recorder).queries("layer1")
+        result = recorder.report()
+        self.assertEqual(result["queries"]["_Query"]["pdus"], 1)
+        self.assertNotIn("(none)", result["queries"])
+
     def test__add_data(self):
         """Testing function _add_data."""
         pass
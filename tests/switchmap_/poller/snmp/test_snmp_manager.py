@@ -46,6 +46,45 @@ CONFIG = setup.config()
 CONFIG.save()
 
 # Import other required libraries
+from mock import Mock, patch
+from easysnmp import exceptions
+from switchmap.poller.snmp import snmp_manager as testimport
+from switchmap.poller import POLL, SNMP
+
+_HOSTNAME = "manager.example.org"
+_OID = ".1.3.6.1.2.1.1.2.0"
+
+
+def _interact(session):
+    """Create an Interact object using an SNMP session.
+
+    Args:
+        session: SNMP session used by the object
+
+    Returns:
+        result: Interact object
+
+    """
+    # Initialize key variables
+    authorization = SNMP(
+        enabled=True,
+        group="manager",
+        authpassword=None,
+        authprotocol=None,
+        community="public",
+        port=161,
+        privpassword=None,
+        privprotocol=None,
+        secname=None,
+        version=2,
+    )
+
+    # Return
+    result = testimport.Interact(
+        POLL(hostname=_HOSTNAME, authorization=authorization)
+    )
+    result._session = Mock(return_value=session)
+    return result
 
 
 class TestSnmpManagerValidate(unittest.TestCase):
@@ -87,6 +126,10 @@ class TestSnmpManagerValidate(unittest.TestCase):
         """Testing function _credentials."""
         pass
 
+    def test_reachable(self):
+        """Testing function reachable."""
+        pass
+
 
 class TestSnmpManagerInteract(unittest.TestCase):
     """Checks all methods."""
@@ -119,6 +162,46 @@ class TestSnmpManagerInteract(unittest.TestCase):
         """Testing function __init__."""
         pass
 
+    def test_close(self):
+        """Testing function close."""
+        pass
+
+    def test_sessions_created(self):
+        """Testing function sessions_created."""
+        pass
+
+    def test_errors(self):
+        """Testing function errors."""
+        # OIDs that don't exist aren't errors
+        session = Mock()
+        session.get.side_effect = exceptions.EasySNMPNoSuchObjectError("")
+        testobj = _interact(session)
+        (_, exists, _) = testobj.query(
+            _OID, get=True, check_reachability=True, check_existence=True
+        )
+        self.assertFalse(exists)
+        self.assertEqual(testobj.errors(), 0)
+
+        # Timeouts are
+        session.get.side_effect = exceptions.EasySNMPTimeoutError("")
+        (_, exists, _) = testobj.query(
+            _OID, get=True, check_reachability=True, check_existence=True
+        )
+        self.assertFalse(exists)
+        self.assertEqual(testobj.errors(), 1)
+
+    def test_timing(self):
+        """Testing function timing."""
+        pass
+
+    def test_cache_hits(self):
+        """Testing function cache_hits."""
+        pass
+
+    def test_cache_misses(self):
+        """Testing function cache_misses."""
+        pass
+
     def test_enterprise_number(self):
         """Testing function enterprise_number."""
         pass
@@ -135,6 +218,10 @@ class TestSnmpManagerInteract(unittest.TestCase):
         """Testing function sysobjectid."""
         pass
 
+    def test_sysuptime(self):
+        """Testing function sysuptime."""
+        pass
+
     def test_oid_exists(self):
         """Testing function oid_exists."""
         pass
@@ -151,6 +238,79 @@ class TestSnmpManagerInteract(unittest.TestCase):
         """Testing function swalk."""
         pass
 
+    def test_context_walks(self):
+        """Testing function context_walks."""
+        pass
+
+    def test_table(self):
+        """Testing function table."""
+        # Initialize key variables
+        columns = [".1.3.6.1.2.1.2.2.1.{}".format(_) for _ in [2, 3, 5, 7]]
+        failed = [columns[1]]
+
+        def _bulkwalk(oid_to_get, non_repeaters=0, max_repetitions=0):
+            """Walk table columns, failing to walk some of them.
+
+            Args:
+                oid_to_get: OID to walk, or a list of OIDs to walk together
+                non_repeaters: Number of non repeating OIDs
+                max_repetitions: Number of values per response
+
+            Returns:
+                result: List of SNMP results
+
+            """
+            oids = oid_to_get if isinstance(oid_to_get, list) else [oid_to_get]
+            if bool(set(oids) & set(failed)) is True:
+                raise exceptions.EasySNMPTimeoutError("")
+            result = [
+                Mock(oid=_, oid_index="1", value="1", snmp_type="INTEGER")
+                for _ in oids
+            ]
+            return result
+
+        # Columns are walked together
+        session = Mock()
+        session.get.return_value = Mock(
+            oid=".1.3.6.1.2.1.1.2",
+            oid_index="0",
+            value="1",
+            snmp_type="INTEGER",
+        )
+        session.bulkwalk.side_effect = _bulkwalk
+        testobj = _interact(session)
+        testobj.query(_OID, get=True)
+        result = testobj.table(columns[2:])
+        self.assertEqual(list(result), ["1"])
+        self.assertEqual(sorted(result["1"]), columns[2:])
+        self.assertEqual(testobj.errors(), 0)
+
+        # Columns are walked one at a time when the table walk fails, so
+        # only the failed column is missing
+        result = testobj.table(columns)
+        self.assertEqual(
+            sorted(result["1"]), [columns[0], columns[2], columns[3]]
+        )
+
+        # Devices failing several columns in a row aren't queried further
+        failed = columns[1:3]
+        session.bulkwalk.reset_mock()
+        testobj = _interact(session)
+        testobj.query(_OID, get=True)
+        result = testobj.table(columns)
+        self.assertEqual(sorted(result["1"]), [columns[0]])
+        self.assertEqual(
+            [_.args[0] for _ in session.bulkwalk.call_args_list][-3:],
+            columns[:3],
+        )
+
+        # Devices that haven't answered yet aren't queried further
+        session = Mock()
+        session.bulkwalk.side_effect = exceptions.EasySNMPTimeoutError("")
+        testobj = _interact(session)
+        self.assertEqual(testobj.table(columns), {})
+        self.assertEqual(session.bulkwalk.call_count, 1)
+
     def test_walk(self):
         """Testing function walk."""
         pass
@@ -163,6 +323,72 @@ class TestSnmpManagerInteract(unittest.TestCase):
         """Testing function query."""
         pass
 
+    def test_max_repetitions(self):
+        """Testing function max_repetitions."""
+        pass
+
+    def test__bulkwalk(self):
+        """Testing function _bulkwalk."""
+        # Devices reporting tooBig errors are retried with smaller responses
+        session = Mock()
+        session.bulkwalk.side_effect = [
+            exceptions.EasySNMPError("tooBig"),
+            [],
+        ]
+        testobj = _interact(session)
+        expected = testobj.max_repetitions()
+        self.assertEqual(testobj._bulkwalk(session, _OID), [])
+        self.assertEqual(session.bulkwalk.call_count, 2)
+        self.assertEqual(testobj.max_repetitions(), expected // 2)
+
+        # Timeouts aren't retried
+        session = Mock()
+        session.get.return_value = Mock(
+            oid=".1.3.6.1.2.1.1.2",
+            oid_index="0",
+            value="1",
+            snmp_type="INTEGER",
+        )
+        testobj = _interact(session)
+        testobj.query(_OID, get=True)
+        expected = testobj.max_repetitions()
+        session.bulkwalk.side_effect = exceptions.EasySNMPTimeoutError("")
+        with self.assertRaises(exceptions.EasySNMPTimeoutError):
+            testobj._bulkwalk(session, _OID)
+        self.assertEqual(session.bulkwalk.call_count, 1)
+        self.assertEqual(testobj.max_repetitions(), expected)
+
+        # Walks taking many round trips use larger responses. Responses hold
+        # values of every column walked together.
+        columns = [_OID, ".1.3.6.1.2.1.2.2.1.3"]
+        results = [Mock()] * (expected * testimport._ROUND_TRIPS + 1)
+        session.bulkwalk.side_effect = None
+        session.bulkwalk.return_value = results
+        testobj._bulkwalk(session, columns)
+        self.assertEqual(testobj.max_repetitions(), expected)
+        testobj._bulkwalk(session, _OID)
+        self.assertEqual(testobj.max_repetitions(), expected + expected // 2)
+
+    def test__pdus(self):
+        """Testing function _pdus."""
+        # Initialize key variables
+        testobj = _interact(Mock())
+        max_repetitions = testobj.max_repetitions()
+        results = [Mock()] * max_repetitions * 3
+
+        # Test
+        self.assertEqual(testobj._pdus(results[:1], True, 1), 1)
+        self.assertEqual(testobj._pdus(results, False, 1), 4)
+        self.assertEqual(testobj._pdus(results, False, 3), 2)
+
+    def test__adapt_repetitions(self):
+        """Testing function _adapt_repetitions."""
+        pass
+
+    def test__session(self):
+        """Testing function _session."""
+        pass
+
 
 class TestSnmpManagerSession(unittest.TestCase):
     """Checks all methods."""
@@ -199,6 +425,10 @@ class TestSnmpManagerSession(unittest.TestCase):
         """Testing function _session."""
         pass
 
+    def test__easysnmp(self):
+        """Testing function _easysnmp."""
+        pass
+
     def test__security_level(self):
         """Testing function _security_level."""
         pass
@@ -255,10 +485,41 @@ class TestSnmpManagerFunctions(unittest.TestCase):
         """Testing function _oid_valid_format."""
         pass
 
+    def test__contactable(self):
+        """Testing function _contactable."""
+        pass
+
+    def test__read_cache(self):
+        """Testing function _read_cache."""
+        pass
+
     def test__update_cache(self):
         """Testing function _update_cache."""
         pass
 
+    def test__bounded_repetitions(self):
+        """Testing function _bounded_repetitions."""
+        pass
+
+    def test__columns(self):
+        """Testing function _columns."""
+        # Test
+        self.assertEqual(testimport._columns(_OID), 1)
+        self.assertEqual(testimport._columns([_OID, _OID]), 2)
+        self.assertEqual(testimport._columns([]), 1)
+
+    def test__response_too_big(self):
+        """Testing function _response_too_big."""
+        # Test
+        for error, expected in [
+            (exceptions.EasySNMPError("tooBig"), True),
+            (exceptions.EasySNMPError("Too Big"), True),
+            (exceptions.EasySNMPTimeoutError("timed out"), False),
+            (exceptions.EasySNMPError("genErr"), False),
+        ]:
+            result = testimport._response_too_big(error)
+            self.assertEqual(result, expected)
+
 
 if __name__ == "__main__":
     # Do the unit test
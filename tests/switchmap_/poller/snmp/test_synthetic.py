@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""Test the synthetic module."""
+
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(os.path.join(EXEC_DIR, os.pardir)),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller{0}snmp".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+# Import other required libraries
+from switchmap.poller.snmp import synthetic as testimport
+
+# A small device
+_PROFILE = testimport.PROFILE(
+    vendor="cisco", ports=4, vlans=3, fdb=20, arp=5, neighbors=2
+)
+
+
+def _rows(capture, oid, context_name=""):
+    """Get the rows of a MIB object from a capture.
+
+    Args:
+        capture: Capture dict
+        oid: OID of the MIB object
+        context_name: SNMP context name
+
+    Returns:
+        result: List of rows
+
+    """
+    # Return
+    result = [
+        _
+        for _ in capture["contexts"].get(context_name, [])
+        if "{}.{}".format(_[0], _[1]).startswith("{}.".format(oid))
+    ]
+    return result
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    def test_captures(self):
+        """Testing function captures."""
+        # Each device gets a numbered hostname
+        result = testimport.captures(3, profile=_PROFILE, prefix="test")
+        self.assertEqual(
+            list(result), ["test-00001", "test-00002", "test-00003"]
+        )
+        for hostname, capture in result.items():
+            self.assertEqual(capture["hostname"], hostname)
+
+        # Devices are created the same way each time
+        self.assertEqual(
+            testimport.captures(3, profile=_PROFILE, prefix="test"), result
+        )
+        self.assertNotEqual(
+            testimport.captures(3, profile=_PROFILE, prefix="test", seed=1),
+            result,
+        )
+
+        # Vendor flavours are mixed if no vendor is given
+        result = testimport.captures(3, profile=_PROFILE._replace(vendor=None))
+        self.assertEqual(
+            [_rows(_, ".1.3.6.1.2.1.1.2")[0][2] for _ in result.values()],
+            [
+                ".1.3.6.1.4.1.9.1.1208",
+                ".1.3.6.1.4.1.2636.1.1.1.2.31",
+                ".1.3.6.1.4.1.11.2.3.7.11.87",
+            ],
+        )
+
+    def test_capture(self):
+        """Testing function capture."""
+        # Test the sizes of a Cisco device
+        result = testimport.capture("test", _PROFILE)
+        self.assertEqual(len(_rows(result, ".1.3.6.1.2.1.2.2.1.1")), 5)
+        self.assertEqual(len(_rows(result, ".1.3.6.1.4.1.9.9.46.1.3.1.1.2")), 3)
+        self.assertEqual(len(_rows(result, ".1.3.6.1.2.1.4.22.1.2")), 5)
+        self.assertEqual(len(_rows(result, ".1.3.6.1.4.1.9.9.23.1.2.1.1.6")), 2)
+
+        # The forwarding database is in the VLAN contexts
+        fdb = 0
+        for vlan in range(1, 4):
+            fdb += len(
+                _rows(
+                    result,
+                    ".1.3.6.1.2.1.17.4.3.1.2",
+                    context_name="vlan-{}".format(vlan),
+                )
+            )
+        self.assertEqual(fdb, 20)
+        self.assertEqual(_rows(result, ".1.3.6.1.2.1.17.7.1.2.2.1.2"), [])
+
+        # Other vendors use Q-BRIDGE
+        for vendor in ["juniper", "qbridge"]:
+            result = testimport.capture(
+                "test", _PROFILE._replace(vendor=vendor)
+            )
+            self.assertEqual(
+                len(_rows(result, ".1.3.6.1.2.1.17.7.1.2.2.1.2")), 20
+            )
+            self.assertEqual(
+                len(_rows(result, ".1.3.6.1.2.1.17.7.1.4.3.1.1")), 3
+            )
+            self.assertEqual(len(_rows(result, ".1.0.8802.1.1.2.1.4.1.1.9")), 2)
+            self.assertEqual(list(result["contexts"]), [""])
+
+        # Juniper VLANs
+        self.assertEqual(
+            len(_rows(result, ".1.3.6.1.4.1.2636.3.40.1.5.1.5.1.5")), 0
+        )
+        result = testimport.capture("test", _PROFILE._replace(vendor="juniper"))
+        self.assertEqual(
+            len(_rows(result, ".1.3.6.1.4.1.2636.3.40.1.5.1.5.1.5")), 3
+        )
+
+        # Indexes are the last node of each OID, like easysnmp
+        for rows in result["contexts"].values():
+            for row in rows:
+                self.assertTrue(row[1].isdigit())
+
+        # Unknown vendors
+        with self.assertRaises(ValueError):
+            testimport.capture("test", _PROFILE._replace(vendor="unknown"))
+
+    def test__decimal(self):
+        """Testing function _decimal."""
+        # Test
+        self.assertEqual(
+            testimport._decimal("\x00\x1b\xff\x01\x02\x03"),
+            "0.27.255.1.2.3",
+        )
+
+    def test__bitmap(self):
+        """Testing function _bitmap."""
+        # Test
+        result = testimport._bitmap([0, 1, 9, 1023])
+        self.assertEqual(len(result), 128)
+        self.assertEqual(ord(result[0]), 0xC0)
+        self.assertEqual(ord(result[1]), 0x40)
+        self.assertEqual(ord(result[127]), 0x01)
+
+
+class TestDevice(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    def test___init__(self):
+        """Testing function __init__."""
+        # The last ports are uplinks. Access ports are spread over VLANs.
+        testobj = testimport._Device("test", _PROFILE, None)
+        self.assertEqual(testobj._uplinks, [3, 4])
+        self.assertEqual(testobj._access, {1: 1, 2: 2})
+        self.assertEqual(testobj._management, 5)
+
+    def test_capture(self):
+        """Testing function capture."""
+        pass
+
+    def test__add(self):
+        """Testing function _add."""
+        pass
+
+    def test__system(self):
+        """Testing function _system."""
+        pass
+
+    def test__interfaces(self):
+        """Testing function _interfaces."""
+        pass
+
+    def test__entity(self):
+        """Testing function _entity."""
+        pass
+
+    def test__bridge(self):
+        """Testing function _bridge."""
+        pass
+
+    def test__fdb(self):
+        """Testing function _fdb."""
+        pass
+
+    def test__arp(self):
+        """Testing function _arp."""
+        pass
+
+    def test__neighbors(self):
+        """Testing function _neighbors."""
+        pass
+
+    def test__cisco(self):
+        """Testing function _cisco."""
+        pass
+
+    def test__qbridge(self):
+        """Testing function _qbridge."""
+        pass
+
+    def test__juniper(self):
+        """Testing function _juniper."""
+        pass
+
+    def test__mac(self):
+        """Testing function _mac."""
+        pass
+
+    def test__ticks(self):
+        """Testing function _ticks."""
+        pass
+
+    def test__count(self):
+        """Testing function _count."""
+        pass
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""Test the timing module."""
+
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(os.path.join(EXEC_DIR, os.pardir)),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller{0}snmp".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+# Import other required libraries
+import json
+import tempfile
+from switchmap.poller.snmp import timing as testimport
+
+
+class IfQuery:
+    """Class for MIB Query mock. The name matches a Query class."""
+
+    pass
+
+
+class TestTiming(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    def test___init__(self):
+        """Testing function __init__."""
+        pass
+
+    def test_query(self):
+        """Testing function query."""
+        # Queries are attributed to the MIB Query class
+        testobj = testimport.Timing("timing.example.org", enabled=True)
+        with testobj.query(IfQuery()):
+            testobj.oid(".1.3.6.1.2.1.2.2.1.2", 0.5, pdus=2, varbinds=48)
+        testobj.oid(".1.3.6.1.2.1.1.2.0", 0.1, pdus=1, varbinds=1)
+        result = testobj.report()
+        self.assertEqual(
+            result["queries"]["IfQuery"],
+            {
+                "duration": 0.5,
+                "queries": 1,
+                "pdus": 2,
+                "varbinds": 48,
+                "errors": 0,
+            },
+        )
+        self.assertEqual(result["queries"]["(none)"]["pdus"], 1)
+
+        # Queries made while creating a MIB Query object are attributed to
+        # its class
+        with testobj.query(IfQuery):
+            testobj.oid(".1.3.6.1.2.1.2.2.1.2", 0.5, pdus=2, varbinds=48)
+        result = testobj.report()
+        self.assertEqual(result["queries"]["IfQuery"]["queries"], 2)
+
+    def test_oid(self):
+        """Testing function oid."""
+        # Test
+        testobj = testimport.Timing("timing.example.org", enabled=True)
+        oids = [".1.3.6.1.2.1.2.2.1.2", ".1.3.6.1.2.1.2.2.1.8"]
+        testobj.oid(oids, 0.25, pdus=1, varbinds=10)
+        testobj.oid(oids, 0.25, pdus=1, varbinds=10, errors=1)
+        result = testobj.report()
+        self.assertEqual(
+            result["oids"][",".join(oids)],
+            {
+                "duration": 0.5,
+                "queries": 2,
+                "pdus": 2,
+                "varbinds": 20,
+                "errors": 1,
+            },
+        )
+
+    def test_report(self):
+        """Testing function report."""
+        # Nothing is recorded when disabled
+        testobj = testimport.Timing("timing.example.org")
+        with testobj.query(IfQuery()):
+            pass
+        self.assertIsNone(testobj.report())
+
+        # Test
+        testobj = testimport.Timing("timing.example.org", enabled=True)
+        result = testobj.report()
+        self.assertEqual(result["hostname"], "timing.example.org")
+        self.assertEqual(result["queries"], {})
+        self.assertEqual(result["oids"], {})
+
+    def test__query(self):
+        """Testing function _query."""
+        pass
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    def test_save(self):
+        """Testing function save."""
+        pass
+
+    def test_aggregate(self):
+        """Testing function aggregate."""
+        # Create reports for two devices
+        with tempfile.TemporaryDirectory() as directory:
+            for hostname, duration in [("a", 1.0), ("b", 3.0)]:
+                testobj = testimport.Timing(hostname, enabled=True)
+                with testobj.query(IfQuery()):
+                    testobj.oid(".1.3.6.1.2.1.2.2.1.2", duration, pdus=1)
+                testobj.oid(".1.3.6.1.2.1.1.2.0", 1.0, pdus=1)
+                testimport.save(
+                    testobj.report(),
+                    os.path.join(directory, "{}.json".format(hostname)),
+                )
+
+            # Ignore files that aren't reports
+            with open(os.path.join(directory, "bad.json"), "w") as f_handle:
+                f_handle.write("not json")
+
+            result = testimport.aggregate(directory)
+
+        # Test. The slowest is first
+        self.assertEqual(result["devices"], 2)
+        self.assertEqual(
+            result["oids"][0],
+            {
+                "name": ".1.3.6.1.2.1.2.2.1.2",
+                "duration": 4.0,
+                "queries": 2,
+                "pdus": 2,
+                "varbinds": 0,
+                "errors": 0,
+            },
+        )
+        self.assertEqual(result["oids"][1]["duration"], 2.0)
+        self.assertEqual(result["queries"][0]["name"], "IfQuery")
+        json.dumps(result)
+
+    def test__counters(self):
+        """Testing function _counters."""
+        pass
+
+    def test__rounded(self):
+        """Testing function _rounded."""
+        pass
+
+    def test__ranked(self):
+        """Testing function _ranked."""
+        pass
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
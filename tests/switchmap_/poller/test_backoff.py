@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""Test the backoff module."""
+
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+# Import other required libraries
+import time
+from mock import patch
+from switchmap.poller import backoff as testimport
+from switchmap.poller.configuration import ConfigPoller
+from switchmap.core import files
+
+_HOSTNAME = "backoff.example.org"
+
+
+class TestBackoff(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def setUp(self):
+        """Execute these steps before each test."""
+        # Start each test without a failure record
+        filename = files.backoff_file(_HOSTNAME, ConfigPoller())
+        if os.path.isfile(filename) is True:
+            os.remove(filename)
+
+    def test___init__(self):
+        """Testing function __init__."""
+        pass
+
+    def test_due(self):
+        """Testing function due."""
+        # Initialize key variables
+        now = time.time()
+
+        # Devices without failures are always due
+        testobj = testimport.Backoff(_HOSTNAME, ConfigPoller(), interval=300)
+        self.assertTrue(testobj.due())
+
+        # The first failure only delays the device by one interval. It is
+        # polled again in the next cycle.
+        testobj.failure()
+        self.assertFalse(testobj.due())
+        with patch.object(testimport.time, "time", return_value=now + 300):
+            self.assertTrue(testobj.due())
+
+        # Consecutive failures skip cycles
+        testobj.failure()
+        with patch.object(testimport.time, "time", return_value=now + 300):
+            self.assertFalse(testobj.due())
+        with patch.object(testimport.time, "time", return_value=now + 600):
+            self.assertTrue(testobj.due())
+
+        # The failure record is persistent
+        testobj = testimport.Backoff(_HOSTNAME, ConfigPoller(), interval=300)
+        self.assertFalse(testobj.due())
+
+    def test_failures(self):
+        """Testing function failures."""
+        # Test
+        testobj = testimport.Backoff(_HOSTNAME, ConfigPoller(), interval=300)
+        self.assertEqual(testobj.failures(), 0)
+        testobj.failure()
+        testobj.failure()
+        self.assertEqual(testobj.failures(), 2)
+
+    def test_failure(self):
+        """Testing function failure."""
+        # Test
+        testobj = testimport.Backoff(_HOSTNAME, ConfigPoller(), interval=300)
+        testobj.failure()
+        testobj = testimport.Backoff(_HOSTNAME, ConfigPoller(), interval=300)
+        self.assertEqual(testobj.failures(), 1)
+
+    def test_success(self):
+        """Testing function success."""
+        # Test
+        testobj = testimport.Backoff(_HOSTNAME, ConfigPoller(), interval=300)
+        for _ in range(5):
+            testobj.failure()
+        self.assertFalse(testobj.due())
+        testobj.success()
+        self.assertTrue(testobj.due())
+        self.assertEqual(testobj.failures(), 0)
+
+        # The failure record is removed
+        testobj = testimport.Backoff(_HOSTNAME, ConfigPoller(), interval=300)
+        self.assertTrue(testobj.due())
+        self.assertEqual(testobj.failures(), 0)
+
+    def test__load(self):
+        """Testing function _load."""
+        pass
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    def test__delay(self):
+        """Testing function _delay."""
+        # The delay doubles with each failure, plus up to 10% jitter
+        for failures, expected in [(1, 300), (2, 600), (3, 1200)]:
+            result = testimport._delay(failures, 300, 86400)
+            self.assertGreaterEqual(result, expected)
+            self.assertLessEqual(result, expected * 1.1)
+
+        # The delay is limited
+        result = testimport._delay(100, 300, 86400)
+        self.assertGreaterEqual(result, 86400)
+        self.assertLessEqual(result, 86400 * 1.1)
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
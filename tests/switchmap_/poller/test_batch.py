@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""Test the batch module."""
+
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+# Import other required libraries
+import json
+import threading
+from mock import patch, MagicMock
+from switchmap.poller import batch as testimport
+
+
+def _config(size=3, limit=1000):
+    """Create a poller configuration.
+
+    Args:
+        size: Largest number of devices in a batch
+        limit: Largest size of a batch in bytes
+
+    Returns:
+        result: Configuration object
+
+    """
+    # Return
+    result = MagicMock()
+    result.polling_batch_size.return_value = size
+    result.polling_batch_bytes.return_value = limit
+    result.polling_compression.return_value = False
+    return result
+
+
+def _device(index, size=0):
+    """Create device data.
+
+    Args:
+        index: Number of the device
+        size: Number of bytes of padding
+
+    Returns:
+        result: Dict of device data
+
+    """
+    # Return
+    result = {"misc": {"host": "device{}".format(index)}, "pad": "x" * size}
+    return result
+
+
+def _posted(mock_post):
+    """Get the devices posted in each batch.
+
+    Args:
+        mock_post: Mock of rest.post_batch
+
+    Returns:
+        result: List of lists of the hostnames in each batch
+
+    """
+    # Return
+    result = []
+    for call in mock_post.call_args_list:
+        items = call.args[1]
+        result.append([json.loads(_)["misc"]["host"] for _ in items])
+    return result
+
+
+def _response(status_code, data):
+    """Create the result of a failed post.
+
+    Args:
+        status_code: HTTP status code
+        data: JSON data of the response, or the exception raised when
+            reading it
+
+    Returns:
+        result: Post named tuple
+
+    """
+    # Return
+    response = MagicMock(status_code=status_code)
+    if isinstance(data, Exception) is True:
+        response.json.side_effect = data
+    else:
+        response.json.return_value = data
+    result = MagicMock(success=False, response=response)
+    return result
+
+
+class TestBatch(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    def test___init__(self):
+        """Testing function __init__."""
+        pass
+
+    def test_add(self):
+        """Testing function add."""
+        # Batches are posted when they have enough devices
+        with patch.object(testimport.rest, "post_batch") as mock_post:
+            batch = testimport.Batch(_config(size=3))
+            for index in range(7):
+                batch.add(_device(index))
+            self.assertEqual(
+                _posted(mock_post),
+                [
+                    ["device0", "device1", "device2"],
+                    ["device3", "device4", "device5"],
+                ],
+            )
+
+        # Batches are posted before they get too big
+        with patch.object(testimport.rest, "post_batch") as mock_post:
+            batch = testimport.Batch(_config(size=10, limit=250))
+            for index in range(4):
+                batch.add(_device(index, size=60))
+            self.assertEqual(
+                _posted(mock_post),
+                [["device0", "device1"]],
+            )
+
+            # Devices too big for a batch are posted on their own
+            batch.add(_device(4, size=300))
+            batch.add(_device(5))
+            self.assertEqual(
+                _posted(mock_post),
+                [["device0", "device1"], ["device2", "device3"], ["device4"]],
+            )
+
+        # Devices can be added from several threads
+        with patch.object(testimport.rest, "post_batch") as mock_post:
+            batch = testimport.Batch(_config(size=7))
+            threads = [
+                threading.Thread(
+                    target=lambda start: [
+                        batch.add(_device(_)) for _ in range(start, start + 50)
+                    ],
+                    args=(_ * 50,),
+                )
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            batch.flush()
+            posted = _posted(mock_post)
+            hostnames = sorted([_ for items in posted for _ in items])
+            self.assertEqual(
+                hostnames, sorted(["device{}".format(_) for _ in range(400)])
+            )
+            self.assertEqual(max(len(_) for _ in posted), 7)
+
+    def test_age(self):
+        """Testing function age."""
+        with patch.object(testimport.rest, "post_batch"):
+            batch = testimport.Batch(_config(size=3))
+            self.assertEqual(batch.age(), 0)
+            with patch.object(testimport.time, "time", return_value=100):
+                batch.add(_device(0))
+            with patch.object(testimport.time, "time", return_value=130):
+                self.assertEqual(batch.age(), 30)
+                batch.add(_device(1))
+                self.assertEqual(batch.age(), 30)
+            batch.flush()
+            self.assertEqual(batch.age(), 0)
+
+    def test_flush(self):
+        """Testing function flush."""
+        with patch.object(testimport.rest, "post_batch") as mock_post:
+            batch = testimport.Batch(_config(size=3))
+
+            # Nothing is posted when empty
+            batch.flush()
+            self.assertEqual(mock_post.call_count, 0)
+
+            # Waiting devices are posted
+            batch.add(_device(0))
+            batch.flush()
+            batch.flush()
+            self.assertEqual(_posted(mock_post), [["device0"]])
+
+    def test__take(self):
+        """Testing function _take."""
+        pass
+
+    def test__post(self):
+        """Testing function _post."""
+        with patch.object(testimport.rest, "post_batch") as mock_post:
+            config = _config()
+            config.polling_compression.return_value = True
+            batch = testimport.Batch(config)
+            batch._post([("{}", None, None)])
+            mock_post.assert_called_once_with(
+                testimport.API_POLLER_BATCH_URI, ["{}"], config, compress=True
+            )
+
+        # Devices are acknowledged when the server has their data
+        for response, acknowledged, forgotten in [
+            (MagicMock(success=True), [0, 1], []),
+            (MagicMock(success=False, response=None), [], []),
+            (_response(409, {"stale": ["device1"]}), [0], [1]),
+            (_response(500, None), [], []),
+        ]:
+            records = [MagicMock(hostname="device{}".format(_)) for _ in [0, 1]]
+            with patch.object(
+                testimport.rest, "post_batch", return_value=response
+            ):
+                batch = testimport.Batch(_config())
+                batch._post(
+                    [("{}", None, None)] + [("{}", _, None) for _ in records]
+                )
+            for index, record in enumerate(records):
+                self.assertEqual(
+                    record.acknowledge.called, index in acknowledged
+                )
+                self.assertEqual(record.forget.called, index in forgotten)
+
+        # Devices posted as unchanged are posted again in full when the
+        # server doesn't have their data
+        records = [MagicMock(hostname="device{}".format(_)) for _ in [0, 1]]
+        with patch.object(
+            testimport.rest,
+            "post_batch",
+            side_effect=[
+                _response(409, {"stale": ["device1"]}),
+                MagicMock(success=True),
+            ],
+        ) as mock_post:
+            batch = testimport.Batch(_config())
+            batch.add({"misc": {"host": "device0"}}, record=records[0])
+            batch.add(
+                {"misc": {"host": "device1", "unchanged": True}},
+                record=records[1],
+                full=_device(1, size=10),
+            )
+            batch.flush()
+        self.assertEqual(
+            _posted(mock_post), [["device0", "device1"], ["device1"]]
+        )
+        self.assertEqual(
+            json.loads(mock_post.call_args_list[1].args[1][0]),
+            _device(1, size=10),
+        )
+        self.assertEqual(records[0].acknowledge.call_count, 1)
+        self.assertEqual(records[1].forget.call_count, 1)
+        self.assertEqual(records[1].acknowledge.call_count, 1)
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    def test__stale(self):
+        """Testing function _stale."""
+        # Run test
+        for result, expected in [
+            (MagicMock(success=True), []),
+            (MagicMock(success=False, response=None), None),
+            (_response(409, {"stale": ["device1"]}), ["device1"]),
+            (_response(409, ValueError()), None),
+            (_response(500, None), None),
+            (None, None),
+        ]:
+            self.assertEqual(testimport._stale(result), expected)
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -63,6 +63,34 @@ class Test_ConfigPoller(unittest.TestCase):
         """Testing function __init__."""
         pass
 
+    def test_backoff_maximum(self):
+        """Testing function backoff_maximum."""
+        # Run test
+        expected = 604800
+        result = self.config.backoff_maximum()
+        self.assertEqual(result, expected)
+
+    def test_capabilities_interval(self):
+        """Testing function capabilities_interval."""
+        # Run test
+        expected = 604800
+        result = self.config.capabilities_interval()
+        self.assertEqual(result, expected)
+
+    def test_delta_polling(self):
+        """Testing function delta_polling."""
+        # Run test
+        expected = False
+        result = self.config.delta_polling()
+        self.assertEqual(result, expected)
+
+    def test_delta_polling_interval(self):
+        """Testing function delta_polling_interval."""
+        # Run test
+        expected = 86400
+        result = self.config.delta_polling_interval()
+        self.assertEqual(result, expected)
+
     def test_polling_interval(self):
         """Testing function polling_interval."""
         # Run test
@@ -70,6 +98,108 @@ class Test_ConfigPoller(unittest.TestCase):
         result = self.config.polling_interval()
         self.assertEqual(result, expected)
 
+    def test_polling_batch_bytes(self):
+        """Testing function polling_batch_bytes."""
+        # Run test
+        expected = 10485760
+        result = self.config.polling_batch_bytes()
+        self.assertEqual(result, expected)
+
+    def test_polling_batch_size(self):
+        """Testing function polling_batch_size."""
+        # Devices are posted one at a time by default
+        result = self.config.polling_batch_size()
+        self.assertIsNone(result)
+
+    def test_polling_compression(self):
+        """Testing function polling_compression."""
+        # Run test
+        expected = False
+        result = self.config.polling_compression()
+        self.assertEqual(result, expected)
+
+    def test_polling_concurrency(self):
+        """Testing function polling_concurrency."""
+        # Run test
+        expected = 50
+        result = self.config.polling_concurrency()
+        self.assertEqual(result, expected)
+
+    def test_polling_context_concurrency(self):
+        """Testing function polling_context_concurrency."""
+        # Run test
+        expected = 8
+        result = self.config.polling_context_concurrency()
+        self.assertEqual(result, expected)
+
+    def test_polling_deadline(self):
+        """Testing function polling_deadline."""
+        # There is no limit by default
+        result = self.config.polling_deadline()
+        self.assertIsNone(result)
+
+    def test_polling_engine(self):
+        """Testing function polling_engine."""
+        # Run test
+        expected = "threads"
+        result = self.config.polling_engine()
+        self.assertEqual(result, expected)
+
+    def test_polling_skip_unchanged(self):
+        """Testing function polling_skip_unchanged."""
+        # Run test
+        expected = False
+        result = self.config.polling_skip_unchanged()
+        self.assertEqual(result, expected)
+
+    def test_polling_stream(self):
+        """Testing function polling_stream."""
+        # Run test
+        expected = False
+        result = self.config.polling_stream()
+        self.assertEqual(result, expected)
+
+    def test_polling_timing(self):
+        """Testing function polling_timing."""
+        # Run test
+        expected = False
+        result = self.config.polling_timing()
+        self.assertEqual(result, expected)
+
+    def test_polling_zone_concurrency(self):
+        """Testing function polling_zone_concurrency."""
+        # Defaults to the value of polling_concurrency
+        expected = 50
+        result = self.config.polling_zone_concurrency()
+        self.assertEqual(result, expected)
+
+    def test_sharding_node(self):
+        """Testing function sharding_node."""
+        # Every poller polls all the devices by default
+        result = self.config.sharding_node()
+        self.assertIsNone(result)
+
+    def test_sharding_nodes(self):
+        """Testing function sharding_nodes."""
+        # Run test
+        expected = []
+        result = self.config.sharding_nodes()
+        self.assertEqual(result, expected)
+
+    def test_snmp_max_repetitions_ceiling(self):
+        """Testing function snmp_max_repetitions_ceiling."""
+        # Run test
+        expected = 100
+        result = self.config.snmp_max_repetitions_ceiling()
+        self.assertEqual(result, expected)
+
+    def test_snmp_max_repetitions_floor(self):
+        """Testing function snmp_max_repetitions_floor."""
+        # Run test
+        expected = 5
+        result = self.config.snmp_max_repetitions_floor()
+        self.assertEqual(result, expected)
+
     def test_server_address(self):
         """Testing function server_address."""
         # Run test
@@ -84,6 +214,13 @@ class Test_ConfigPoller(unittest.TestCase):
         result = self.config.server_bind_port()
         self.assertEqual(result, expected)
 
+    def test_server_connect_timeout(self):
+        """Testing function server_connect_timeout."""
+        # Run test
+        expected = 10
+        result = self.config.server_connect_timeout()
+        self.assertEqual(result, expected)
+
     def test_server_https(self):
         """Testing function server_https."""
         # Run test
@@ -98,6 +235,27 @@ class Test_ConfigPoller(unittest.TestCase):
         result = self.config.server_password()
         self.assertEqual(result, expected)
 
+    def test_server_pool_size(self):
+        """Testing function server_pool_size."""
+        # Run test
+        expected = 10
+        result = self.config.server_pool_size()
+        self.assertEqual(result, expected)
+
+    def test_server_read_timeout(self):
+        """Testing function server_read_timeout."""
+        # Run test
+        expected = 300
+        result = self.config.server_read_timeout()
+        self.assertEqual(result, expected)
+
+    def test_server_retries(self):
+        """Testing function server_retries."""
+        # Run test
+        expected = 3
+        result = self.config.server_retries()
+        self.assertEqual(result, expected)
+
     def test_server_url_root(self):
         """Testing function server_url_root."""
         # Run test
@@ -159,6 +317,8 @@ class Test_ConfigPoller(unittest.TestCase):
             ZONE(
                 name="SITE-A",
                 hostnames=["hostname1", "hostname2", "hostname3"],
+                polling_interval=300,
+                polling_intervals={"hostname1": 60},
             ),
             ZONE(
                 name="SITE-B",
@@ -170,6 +330,73 @@ class Test_ConfigPoller(unittest.TestCase):
         result = self.config.zones()
         self.assertEqual(result, expected)
 
+    def test_zones_sharded(self):
+        """Testing function zones with devices shared among poller nodes."""
+        # Initialize key variables. Zone SITE-B is pinned to node "1".
+        config = data.configtester()
+        config["poller"]["sharding_nodes"] = 3
+        config["poller"]["zones"][1]["sharding_node"] = 1
+        polled = []
+
+        # Get the devices of each node
+        for node in range(3):
+            config["poller"]["sharding_node"] = node
+            _config = setup.Config(config, randomizer=True)
+            _config.save()
+            try:
+                _poller = test_module.ConfigPoller()
+                self.assertEqual(_poller.sharding_node(), str(node))
+                self.assertEqual(_poller.sharding_nodes(), ["0", "1", "2"])
+                zones = {_.name: _.hostnames for _ in _poller.zones()}
+                everything = {
+                    _.name: _.hostnames for _ in _poller.zones(sharded=False)
+                }
+            finally:
+                _config.cleanup()
+                setup.setenv(directory=self._config.metadata.config_directory)
+
+            # All the devices are listed if not sharded
+            self.assertEqual(
+                everything["SITE-A"], ["hostname1", "hostname2", "hostname3"]
+            )
+            self.assertIsNone(zones["SITE-C"])
+
+            # Only node "1" polls the devices of the pinned zone
+            self.assertEqual(
+                zones["SITE-B"],
+                everything["SITE-B"] if node == 1 else [],
+            )
+            polled.extend(zones["SITE-A"])
+
+        # Each device is polled by a single node
+        self.assertEqual(
+            sorted(polled), ["hostname1", "hostname2", "hostname3"]
+        )
+
+    def test_zones_intervals(self):
+        """Testing function zones with invalid polling intervals."""
+        # Initialize key variables
+        config = data.configtester()
+        config["poller"]["zones"][0]["polling_interval"] = "often"
+        config["poller"]["zones"][0]["polling_intervals"] = {
+            "hostname1": 0,
+            "hostname2": "120",
+            "hostname3": None,
+        }
+        config["poller"]["zones"][1]["polling_interval"] = True
+        _config = setup.Config(config, randomizer=True)
+        _config.save()
+        try:
+            zones = test_module.ConfigPoller().zones()
+        finally:
+            _config.cleanup()
+            setup.setenv(directory=self._config.metadata.config_directory)
+
+        # Invalid values are ignored
+        self.assertIsNone(zones[0].polling_interval)
+        self.assertEqual(zones[0].polling_intervals, {"hostname2": 120})
+        self.assertIsNone(zones[1].polling_interval)
+
     ######################################################################
     ######################################################################
     # All 'core:' configuration file parameters must pass. Tests below
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""Test the poll module."""
+
+import time
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+# Import other required libraries
+from mock import MagicMock, patch
+from switchmap.poller import ZONE
+from switchmap.poller import poll as testimport
+from switchmap.poller import scheduler
+
+
+def _config(zones, interval=300):
+    """Create a poller configuration.
+
+    Args:
+        zones: List of ZONE objects
+        interval: Default polling interval
+
+    Returns:
+        result: Configuration object
+
+    """
+    # Return
+    result = MagicMock()
+    result.zones.return_value = zones
+    result.polling_interval.return_value = interval
+    return result
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test__flush(self):
+        """Testing function _flush."""
+        # Devices are posted one at a time
+        testimport._flush(None, [])
+
+        # Devices are posted when nothing else is being polled
+        batch = MagicMock()
+        batch.age.return_value = 0
+        testimport._flush(batch, [])
+        batch.flush.assert_called_once_with()
+
+        # Devices wait while others are polled to fill the batch
+        batch = MagicMock()
+        batch.age.return_value = testimport._BATCH_AGE - 1
+        testimport._flush(batch, [MagicMock()])
+        batch.flush.assert_not_called()
+
+        # Devices don't wait too long
+        batch.age.return_value = testimport._BATCH_AGE
+        testimport._flush(batch, [MagicMock()])
+        batch.flush.assert_called_once_with()
+
+    def test__post(self):
+        """Testing function _post."""
+        # Initialize key variables
+        config = _config([])
+        config.polling_skip_unchanged.return_value = True
+        data = {"misc": {"host": "test"}, "layer1": {1: {"ifIndex": 1}}}
+
+        # Unchanged devices are batched with their full data, which is
+        # posted if the server doesn't have the unchanged data
+        for unchanged in [False, True]:
+            batch = MagicMock()
+            with patch.object(testimport, "Unchanged") as record:
+                record.return_value.value = "fingerprint"
+                record.return_value.unchanged.return_value = unchanged
+                testimport._post("test", dict(data), config, batch=batch)
+            (payload,) = batch.add.call_args.args
+            full = batch.add.call_args.kwargs["full"]
+            self.assertIs(
+                batch.add.call_args.kwargs["record"], record.return_value
+            )
+            if unchanged is True:
+                self.assertTrue(payload["misc"]["unchanged"])
+                self.assertEqual(full["layer1"], data["layer1"])
+            else:
+                self.assertEqual(payload["layer1"], data["layer1"])
+                self.assertIsNone(full)
+
+    def test__jobs(self):
+        """Testing function _jobs."""
+        # Every device is due
+        config = _config(
+            [
+                ZONE(name="core", hostnames=["a", "b"], polling_interval=60),
+                ZONE(name="edge", hostnames=["c"]),
+            ]
+        )
+        (jobs, items) = testimport._jobs(config)
+        self.assertEqual(
+            sorted(items), [("core", "a"), ("core", "b"), ("edge", "c")]
+        )
+        self.assertEqual(items[("core", "a")].interval, 60)
+        self.assertEqual(items[("edge", "c")].interval, 300)
+        self.assertEqual(len(jobs.pop()), 3)
+
+        # Devices keep their due time when the configuration is read again.
+        # Removed devices aren't scheduled, and added ones are due now.
+        due = time.time() + 3600
+        previous = [
+            scheduler.JOB(due=due, interval=60, item=items[("core", "a")]),
+            scheduler.JOB(due=due + 1, interval=300, item=items[("edge", "c")]),
+        ]
+        config = _config(
+            [
+                ZONE(
+                    name="core",
+                    hostnames=["a", "b", "d"],
+                    polling_intervals={"a": 120},
+                ),
+            ]
+        )
+        (jobs, items) = testimport._jobs(
+            config, previous=previous, busy=[items[("core", "b")]]
+        )
+        self.assertEqual(
+            sorted(items), [("core", "a"), ("core", "b"), ("core", "d")]
+        )
+        self.assertEqual(
+            [(_.item.hostname, _.interval) for _ in jobs.pop()],
+            [("d", 300)],
+        )
+        result = jobs.jobs()
+        self.assertEqual([_.item.hostname for _ in result], ["a"])
+        self.assertEqual(result[0].due, due)
+        self.assertEqual(result[0].interval, 120)
+        self.assertEqual(result[0].item.config, config)
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""Test the scheduler module."""
+
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+from collections import namedtuple
+
+from switchmap.poller import scheduler as testimport
+from switchmap.poller import ZONE
+
+_ITEM = namedtuple("_ITEM", "zone hostname")
+
+
+class TestScheduler(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    def test___init__(self):
+        """Testing function __init__."""
+        pass
+
+    def test___len__(self):
+        """Testing function __len__."""
+        # Test
+        testobj = testimport.Scheduler()
+        self.assertEqual(len(testobj), 0)
+        testobj.add("core", 300, due=0)
+        testobj.add("closet", 1800, due=0)
+        self.assertEqual(len(testobj), 2)
+
+    def test_add(self):
+        """Testing function add."""
+        # Test
+        testobj = testimport.Scheduler()
+        testobj.add("closet", 1800, due=100)
+        testobj.add("core", 300, due=50)
+        result = testobj.pop(now=100)
+        self.assertEqual(
+            result,
+            [
+                testimport.JOB(due=50, interval=300, item="core"),
+                testimport.JOB(due=100, interval=1800, item="closet"),
+            ],
+        )
+
+    def test_push(self):
+        """Testing function push."""
+        # Test
+        testobj = testimport.Scheduler()
+        job = testimport.JOB(due=10, interval=300, item="core")
+        testobj.push(job)
+        self.assertEqual(testobj.pop(now=10), [job])
+
+    def test_jobs(self):
+        """Testing function jobs."""
+        # Test
+        testobj = testimport.Scheduler()
+        testobj.add("closet", 1800, due=100)
+        testobj.add("core", 300, due=0)
+        self.assertEqual([_.item for _ in testobj.jobs()], ["core", "closet"])
+        self.assertEqual(len(testobj), 2)
+
+    def test_pop(self):
+        """Testing function pop."""
+        # Initialize key variables
+        testobj = testimport.Scheduler()
+        for item in ["a", "b", "c"]:
+            testobj.add(item, 300, due=0)
+        testobj.add("d", 300, due=1000)
+
+        # Devices due at the same time are returned in the order added
+        result = testobj.pop(now=0, limit=2)
+        self.assertEqual([_.item for _ in result], ["a", "b"])
+        result = testobj.pop(now=0)
+        self.assertEqual([_.item for _ in result], ["c"])
+
+        # Nothing else is due
+        self.assertEqual(testobj.pop(now=999), [])
+        self.assertEqual(len(testobj), 1)
+
+    def test_reschedule(self):
+        """Testing function reschedule."""
+        # Initialize key variables
+        testobj = testimport.Scheduler()
+        testobj.add("core", 300, due=0)
+        testobj.add("closet", 1800, due=0)
+
+        # Each device is next due after its own interval
+        for job in testobj.pop(now=0):
+            testobj.reschedule(job, now=10)
+        self.assertEqual([_.item for _ in testobj.pop(now=300)], ["core"])
+
+        # Devices that overran their interval are due immediately
+        job = testimport.JOB(due=0, interval=300, item="slow")
+        testobj.reschedule(job, now=500)
+        self.assertEqual([_.item for _ in testobj.pop(now=500)], ["slow"])
+        self.assertEqual([_.item for _ in testobj.pop(now=1800)], ["closet"])
+
+    def test_wait(self):
+        """Testing function wait."""
+        # Test
+        testobj = testimport.Scheduler()
+        self.assertIsNone(testobj.wait(now=0))
+        testobj.add("core", 300, due=100)
+        self.assertEqual(testobj.wait(now=40), 60)
+        self.assertEqual(testobj.wait(now=200), 0)
+
+
+class TestWorkers(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    def _workers(self, workers, zone_workers=None):
+        """Create a Workers object whose futures are the polled items.
+
+        Args:
+            workers: Number of workers
+            zone_workers: Maximum number of workers used by a zone
+
+        Returns:
+            result: Workers object
+
+        """
+        # Return
+        result = testimport.Workers(
+            lambda item: item, workers, zone_workers=zone_workers
+        )
+        return result
+
+    def test___init__(self):
+        """Testing function __init__."""
+        pass
+
+    def test_full(self):
+        """Testing function full."""
+        # Test
+        jobs = testimport.Scheduler()
+        jobs.add(_ITEM("core", "a"), 300, due=0)
+        testobj = self._workers(1)
+        self.assertFalse(testobj.full())
+        testobj.start(jobs, now=0)
+        self.assertTrue(testobj.full())
+
+    def test_futures(self):
+        """Testing function futures."""
+        pass
+
+    def test_jobs(self):
+        """Testing function jobs."""
+        pass
+
+    def test_start(self):
+        """Testing function start."""
+        # Initialize key variables. The "core" zone has the earliest devices.
+        jobs = testimport.Scheduler()
+        for hostname in ["a", "b", "c", "d"]:
+            jobs.add(_ITEM("core", hostname), 300, due=0)
+        jobs.add(_ITEM("edge", "e"), 300, due=1)
+        jobs.add(_ITEM("edge", "f"), 300, due=1)
+        testobj = self._workers(3, zone_workers=2)
+
+        # Devices of a busy zone don't stop the others from being polled
+        testobj.start(jobs, now=1)
+        self.assertEqual(
+            [_.hostname for _ in testobj.futures()], ["a", "b", "e"]
+        )
+        self.assertTrue(testobj.full())
+        self.assertEqual(len(jobs), 1)
+
+        # Devices waiting for their zone are polled first
+        testobj.finish(_ITEM("core", "a"))
+        testobj.start(jobs, now=1)
+        self.assertEqual(
+            [_.hostname for _ in testobj.futures()], ["b", "e", "c"]
+        )
+        testobj.finish(_ITEM("edge", "e"))
+        testobj.start(jobs, now=1)
+        self.assertEqual(
+            [_.hostname for _ in testobj.futures()], ["b", "c", "f"]
+        )
+        self.assertEqual([_.item.hostname for _ in testobj.waiting()], ["d"])
+        self.assertEqual(testobj.waiting(), [])
+
+        # Without zone limits, devices are polled in the order they are due
+        jobs = testimport.Scheduler()
+        for hostname in ["a", "b", "c"]:
+            jobs.add(_ITEM("core", hostname), 300, due=0)
+        testobj = self._workers(2)
+        testobj.start(jobs, now=0)
+        self.assertEqual([_.hostname for _ in testobj.futures()], ["a", "b"])
+
+    def test_finish(self):
+        """Testing function finish."""
+        # Test
+        jobs = testimport.Scheduler()
+        jobs.add(_ITEM("core", "a"), 300, due=0)
+        jobs.add(_ITEM("core", "b"), 300, due=0)
+        testobj = self._workers(2, zone_workers=1)
+        testobj.start(jobs, now=0)
+        result = testobj.finish(_ITEM("core", "a"))
+        self.assertEqual(result.item, _ITEM("core", "a"))
+        self.assertEqual(testobj.futures(), [])
+        testobj.start(jobs, now=0)
+        self.assertEqual([_.item for _ in testobj.jobs()], [_ITEM("core", "b")])
+
+    def test_waiting(self):
+        """Testing function waiting."""
+        pass
+
+    def test__available(self):
+        """Testing function _available."""
+        pass
+
+    def test__start(self):
+        """Testing function _start."""
+        pass
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    def test_interval(self):
+        """Testing function interval."""
+        # Initialize key variables
+        zone = ZONE(
+            name="core",
+            hostnames=["switch1", "switch2"],
+            polling_interval=300,
+            polling_intervals={"switch1": 60},
+        )
+
+        # Test
+        self.assertEqual(testimport.interval(zone, "switch1", 1800), 60)
+        self.assertEqual(testimport.interval(zone, "switch2", 1800), 300)
+        zone = ZONE(name="closet", hostnames=["switch3"])
+        self.assertEqual(testimport.interval(zone, "switch3", 1800), 1800)
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Test the shard module."""
+
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+# Import other required libraries
+from switchmap.poller import shard as testimport
+
+# Hostnames of the devices to share among the nodes
+_HOSTNAMES = ["device{}.example.org".format(_) for _ in range(1000)]
+
+
+class TestFunctions(unittest.TestCase):
+    """Checks all functions."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    def test_owner(self):
+        """Testing function owner."""
+        # Nodes agree on the owner whatever the order of the node IDs
+        nodes = ["0", "1", "2", "3"]
+        for hostname in _HOSTNAMES[:20]:
+            result = testimport.owner(hostname, nodes)
+            self.assertIn(result, nodes)
+            self.assertEqual(
+                testimport.owner(hostname, list(reversed(nodes))), result
+            )
+
+        # The devices are spread evenly
+        for node in nodes:
+            result = testimport.share(_HOSTNAMES, node, nodes)
+            self.assertTrue(200 <= len(result) <= 300)
+
+        # There is no owner without nodes
+        self.assertIsNone(testimport.owner(_HOSTNAMES[0], []))
+
+    def test_owner_rebalance(self):
+        """Testing function owner when nodes join and leave."""
+        # Initialize key variables
+        nodes = ["0", "1", "2", "3"]
+        before = {_: testimport.owner(_, nodes) for _ in _HOSTNAMES}
+
+        # A node joining only takes devices from the other nodes
+        after = {_: testimport.owner(_, nodes + ["4"]) for _ in _HOSTNAMES}
+        moved = [_ for _ in _HOSTNAMES if before[_] != after[_]]
+        self.assertTrue(150 <= len(moved) <= 250)
+        self.assertEqual({after[_] for _ in moved}, {"4"})
+
+        # A node leaving only gives its devices to the other nodes
+        after = {_: testimport.owner(_, ["0", "1", "3"]) for _ in _HOSTNAMES}
+        moved = [_ for _ in _HOSTNAMES if before[_] != after[_]]
+        self.assertEqual({before[_] for _ in moved}, {"2"})
+        self.assertEqual(
+            sorted(moved), sorted(_ for _ in _HOSTNAMES if before[_] == "2")
+        )
+
+    def test_share(self):
+        """Testing function share."""
+        # Each device is polled by a single node
+        nodes = ["a", "b", "c"]
+        result = []
+        for node in nodes:
+            result.extend(testimport.share(_HOSTNAMES, node, nodes))
+        self.assertEqual(sorted(result), sorted(_HOSTNAMES))
+
+        # Devices pinned to a node are all polled by it
+        self.assertEqual(
+            testimport.share(_HOSTNAMES[:5], "b", nodes, pinned="b"),
+            _HOSTNAMES[:5],
+        )
+        self.assertEqual(
+            testimport.share(_HOSTNAMES[:5], "a", nodes, pinned="b"), []
+        )
+
+    def test__score(self):
+        """Testing function _score."""
+        # Scores differ between nodes and don't change
+        result = testimport._score(_HOSTNAMES[0], "0")
+        self.assertEqual(testimport._score(_HOSTNAMES[0], "0"), result)
+        self.assertNotEqual(testimport._score(_HOSTNAMES[0], "1"), result)
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
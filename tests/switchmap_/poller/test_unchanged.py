@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Test the unchanged module."""
+
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(os.path.join(EXEC_DIR, os.pardir)), os.pardir
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}poller".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+# Import other required libraries
+from switchmap.poller import unchanged as testimport
+from switchmap.poller.configuration import ConfigPoller
+from switchmap.core import files
+
+_HOSTNAME = "unchanged.example.org"
+
+
+def _data(name="test"):
+    """Create device data.
+
+    Args:
+        name: System name of the device
+
+    Returns:
+        result: Dict of device data
+
+    """
+    # Return
+    result = {
+        "misc": {"host": _HOSTNAME},
+        "system": {"SNMPv2-MIB": {"sysName": {0: name}}},
+    }
+    return result
+
+
+class TestUnchanged(unittest.TestCase):
+    """Checks all methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def setUp(self):
+        """Execute these steps before each test."""
+        # Start each test without a fingerprint record
+        filename = files.fingerprint_file(_HOSTNAME, ConfigPoller())
+        if os.path.isfile(filename) is True:
+            os.remove(filename)
+
+    def test___init__(self):
+        """Testing function __init__."""
+        pass
+
+    def test_unchanged(self):
+        """Testing function unchanged."""
+        # Data is changed until acknowledged
+        testobj = testimport.Unchanged(_HOSTNAME, _data(), ConfigPoller())
+        self.assertFalse(testobj.unchanged())
+        testobj.acknowledge()
+        self.assertTrue(testobj.unchanged())
+
+        # The record is persistent
+        testobj = testimport.Unchanged(_HOSTNAME, _data(), ConfigPoller())
+        self.assertTrue(testobj.unchanged())
+
+        # Changes are detected
+        testobj = testimport.Unchanged(
+            _HOSTNAME, _data(name="changed"), ConfigPoller()
+        )
+        self.assertFalse(testobj.unchanged())
+
+    def test_acknowledge(self):
+        """Testing function acknowledge."""
+        # Acknowledging replaces the previous record
+        testobj = testimport.Unchanged(_HOSTNAME, _data(), ConfigPoller())
+        testobj.acknowledge()
+        testobj = testimport.Unchanged(
+            _HOSTNAME, _data(name="changed"), ConfigPoller()
+        )
+        testobj.acknowledge()
+        self.assertTrue(testobj.unchanged())
+        testobj = testimport.Unchanged(_HOSTNAME, _data(), ConfigPoller())
+        self.assertFalse(testobj.unchanged())
+
+    def test_forget(self):
+        """Testing function forget."""
+        # Test
+        testobj = testimport.Unchanged(_HOSTNAME, _data(), ConfigPoller())
+        testobj.acknowledge()
+        testobj.forget()
+        self.assertFalse(testobj.unchanged())
+
+        # Forgetting twice is harmless
+        testobj.forget()
+        self.assertFalse(testobj.unchanged())
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -109,6 +109,48 @@ class TestPollUpdateDevice(unittest.TestCase):
         expected = data.polled_data(strip=False)
         self.assertEqual(result, expected)
 
+        # The polled data isn't changed, so processing it again gives the
+        # same result
+        polled_data = deepcopy(self.polled_data)
+        result = testimport.Device(polled_data).process()
+        self.assertEqual(polled_data, self.polled_data)
+        self.assertEqual(result, expected)
+        self.assertEqual(testimport.Device(polled_data).process(), expected)
+
+        # Partial polls may not have layer 1 or system data
+        partial = deepcopy(self.polled_data)
+        partial["system"] = None
+        result = testimport.Device(partial).process()
+        self.assertIsNone(result["system"])
+        self.assertEqual(sorted(result["layer1"]), sorted(expected["layer1"]))
+        partial["layer1"] = None
+        result = testimport.Device(partial).process()
+        self.assertIsNone(result["layer1"])
+
+        # Ethernet port 2 has Ethernet port 1 as one of several higher
+        # layers. The VLANs of port 1 are extended in the processed data,
+        # not in the polled data.
+        polled_data = {
+            "misc": {"host": "stacked"},
+            "system": {"IF-MIB": {"ifStackStatus": {1: [0], 2: [0, 1]}}},
+            "layer1": {
+                1: {
+                    "ifName": "Gi1",
+                    "ifType": 6,
+                    "vlanTrunkPortVlansEnabled": [10, 20],
+                },
+                2: {"ifName": "Po2", "ifType": 6},
+            },
+        }
+        original = deepcopy(polled_data)
+        result = testimport.Device(polled_data).process()
+        self.assertEqual(polled_data, original)
+        self.assertEqual(result["layer1"][1]["l1_vlans"], [10, 20])
+        self.assertEqual(
+            result["layer1"][1]["vlanTrunkPortVlansEnabled"], [10, 20, 10, 20]
+        )
+        self.assertEqual(result["layer1"][2]["l1_vlans"], [10, 20, 10, 20])
+
 
 class TestSuite(unittest.TestCase):
     """Checks all functions and methods."""
@@ -159,13 +201,70 @@ class TestSuite(unittest.TestCase):
         return
         self.assertEqual(results, expecteds)
 
+    def test__stacked(self):
+        """Testing function _stacked."""
+        # Test
+        device_data = {
+            "system": {
+                "IF-MIB": {"ifStackStatus": {1: [0], 2: [0, 3, 4], 5: [6]}}
+            }
+        }
+        self.assertEqual(testimport._stacked(device_data), {3, 4})
+
+        # Partial polls may not have system data
+        self.assertEqual(testimport._stacked({"system": None}), set())
+        self.assertEqual(testimport._stacked({}), set())
+
     def test__process_trunk(self):
         """Testing function _process_trunk."""
-        pass
+        # Ports with a single higher layer
+        port_data = {"vlanTrunkPortVlansEnabled": [10, 20], "l1_vlans": []}
+        result = testimport._process_trunk(port_data, [2])
+        self.assertEqual(
+            result, TrunkInterface(vlan=[10, 20], nativevlan=None, trunk=False)
+        )
+
+        # Ports with several higher layers
+        port_data = {
+            "vlanTrunkPortVlansEnabled": [10, 20],
+            "vlanTrunkPortNativeVlan": 10,
+            "vlanTrunkPortDynamicStatus": 1,
+        }
+        result = testimport._process_trunk(port_data, [2, 3])
+        self.assertEqual(
+            result, TrunkInterface(vlan=[10, 20], nativevlan=10, trunk=True)
+        )
+        port_data["l1_vlans"] = [10, 20]
+        result = testimport._process_trunk(port_data, [2, 3])
+        self.assertEqual(result.vlan, [10, 20, 10, 20])
 
     def test__juniper_fix(self):
         """Testing function _juniper_fix."""
-        pass
+        # Initialize key variables. ifIndex 2 is a subinterface of
+        # Ethernet port 1. ifIndex 3 doesn't exist.
+        device_data = {
+            "misc": {"host": "juniper"},
+            "system": {"IF-MIB": {"ifStackStatus": {1: [0, 2, 3]}}},
+            "layer1": {
+                1: {"ifType": 6, "ifName": "ge-0/0/0"},
+                2: {"ifType": 53, "ifName": "ge-0/0/0.0", "jnxExVlanTag": [5]},
+            },
+        }
+        original = deepcopy(device_data)
+
+        # Values of the subinterface are copied to the Ethernet port
+        result = testimport._juniper_fix(device_data)
+        self.assertEqual(
+            result["layer1"][1],
+            {"ifType": 6, "ifName": "ge-0/0/0", "jnxExVlanTag": [5]},
+        )
+        self.assertEqual(result["layer1"][2], original["layer1"][2])
+        self.assertEqual(device_data, original)
+
+        # Data without ifStackStatus isn't changed
+        del device_data["system"]["IF-MIB"]
+        result = testimport._juniper_fix(device_data)
+        self.assertEqual(result["layer1"], original["layer1"])
 
     def test__is_ethernet(self):
         """Testing function _is_ethernet."""
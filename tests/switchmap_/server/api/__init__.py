@@ -0,0 +1,9 @@
+"""Define the tests.switchmap_.server.api package.
+
+Args:
+    None
+
+Returns:
+    None
+
+"""
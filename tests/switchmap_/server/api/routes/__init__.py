@@ -0,0 +1,9 @@
+"""Define the tests.switchmap_.server.api.routes package.
+
+Args:
+    None
+
+Returns:
+    None
+
+"""
@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""Test the post module."""
+
+import os
+import sys
+import gzip
+import hashlib
+import json
+import unittest
+
+import yaml
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(
+                            os.path.join(
+                                os.path.abspath(
+                                    os.path.join(EXEC_DIR, os.pardir)
+                                ),
+                                os.pardir,
+                            )
+                        ),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = """\
+{0}switchmap-ng{0}tests{0}switchmap_{0}server{0}api{0}routes""".format(
+    os.sep
+)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+# Import other required libraries
+from mock import patch
+from switchmap.core import files
+from switchmap.core import fingerprint
+from switchmap.core import stream
+from switchmap.server.api import API
+from switchmap.server.api.routes import post as testimport
+from switchmap.server.configuration import ConfigServer
+from switchmap import API_PREFIX, API_POLLER_POST_URI, API_POLLER_BATCH_URI
+
+_POST_URI = "{}{}".format(API_PREFIX, API_POLLER_POST_URI)
+_BATCH_URI = "{}{}".format(API_PREFIX, API_POLLER_BATCH_URI)
+
+
+def _device(hostname):
+    """Create device data.
+
+    Args:
+        hostname: Hostname of the device
+
+    Returns:
+        result: Dict of device data
+
+    """
+    # Return
+    result = {
+        "misc": {"host": hostname, "zone": "test"},
+        "layer1": {"port": {"ifIndex": 1, "ifAlias": "x" * 100}},
+        "system": {"SNMPv2-MIB": {"sysUpTime": 100}},
+    }
+    return result
+
+
+def _name(data):
+    """Get the name of the cache file of a device without its extension.
+
+    Args:
+        data: Dict of device data
+
+    Returns:
+        result: Name of the file
+
+    """
+    # Return
+    result = "{}-{}".format(
+        data["misc"]["host"],
+        hashlib.md5(data["misc"]["zone"].encode("utf-8")).hexdigest()[:5],
+    )
+    return result
+
+
+class TestPost(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    # Required
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def setUp(self):
+        """Execute these steps before each test."""
+        # Initialize key variables
+        self.config = ConfigServer()
+        self.client = API.test_client()
+        self._clean()
+
+    def tearDown(self):
+        """Execute these steps after each test."""
+        # Remove the files created by the test
+        self._clean()
+
+    def _clean(self):
+        """Remove the cache and ingested files of the test devices.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        # Remove files
+        for directory in [
+            self.config.cache_directory(),
+            os.path.dirname(files.ingested_file("test", self.config)),
+        ]:
+            for filename in os.listdir(directory):
+                if filename.startswith("post-test-") is True:
+                    os.remove(os.path.join(directory, filename))
+
+    def _cached(self):
+        """Get the device data in cache files.
+
+        Args:
+            None
+
+        Returns:
+            result: Dict of device data keyed by hostname
+
+        """
+        # Initialize key variables
+        result = {}
+        directory = self.config.cache_directory()
+
+        # Read files
+        for filename in sorted(os.listdir(directory)):
+            if filename.startswith("post-test-") is False:
+                continue
+            data = files.read_yaml_file(os.path.join(directory, filename))
+            result[data["misc"]["host"]] = data
+
+        # Return
+        return result
+
+    def _temporary(self):
+        """Get the temporary files left in the cache directory.
+
+        Args:
+            None
+
+        Returns:
+            result: List of filenames
+
+        """
+        # Return
+        result = [
+            _
+            for _ in os.listdir(self.config.cache_directory())
+            if _.startswith("post-test-") is True and _.endswith(".tmp")
+        ]
+        return result
+
+    def _ingested(self, data):
+        """Save device data as the data last ingested for the device.
+
+        Args:
+            data: Dict of device data
+
+        Returns:
+            None
+
+        """
+        # Write
+        filename = files.ingested_file(_name(data), self.config)
+        with open(filename, "w") as f_handle:
+            yaml.dump(data, f_handle)
+
+    def _batch(self, items):
+        """Post a batch of device data.
+
+        Args:
+            items: List of dicts of device data
+
+        Returns:
+            result: Response object
+
+        """
+        # Return
+        result = self.client.post(
+            _BATCH_URI,
+            data=gzip.compress(json.dumps(items).encode()),
+            content_type="application/json",
+            headers={"Content-Encoding": "gzip"},
+        )
+        return result
+
+    def test_post_device_data(self):
+        """Testing function post_device_data."""
+        # Uncompressed JSON
+        data = _device("post-test-identity")
+        response = self.client.post(_POST_URI, json=data)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._cached()["post-test-identity"], data)
+
+        # Uncompressed JSON with the identity encoding
+        data = _device("post-test-explicit")
+        response = self.client.post(
+            _POST_URI,
+            data=json.dumps(data),
+            content_type="application/json",
+            headers={"Content-Encoding": "identity"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._cached()["post-test-explicit"], data)
+
+        # Compressed JSON
+        data = _device("post-test-gzip")
+        response = self.client.post(
+            _POST_URI,
+            data=gzip.compress(json.dumps(data).encode()),
+            content_type="application/json",
+            headers={"Content-Encoding": "gzip"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._cached()["post-test-gzip"], data)
+
+        # Compressed stream of chunks
+        data = _device("post-test-stream")
+        response = self.client.post(
+            _POST_URI,
+            data=gzip.compress(b"".join(stream.encode(data))),
+            content_type=stream.CONTENT_TYPE,
+            headers={"Content-Encoding": "gzip"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._cached()["post-test-stream"], data)
+
+    def test_post_device_data_invalid(self):
+        """Testing function post_device_data with invalid data."""
+        # Unsupported encodings
+        data = _device("post-test-br")
+        response = self.client.post(
+            _POST_URI,
+            data=json.dumps(data),
+            content_type="application/json",
+            headers={"Content-Encoding": "br"},
+        )
+        self.assertEqual(response.status_code, 415)
+
+        # Truncated compressed data
+        data = _device("post-test-truncated")
+        response = self.client.post(
+            _POST_URI,
+            data=gzip.compress(json.dumps(data).encode())[:-10],
+            content_type="application/json",
+            headers={"Content-Encoding": "gzip"},
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self._cached(), {})
+
+    def test_post_device_data_too_large(self):
+        """Testing function post_device_data with too much data."""
+        # Data that is small when compressed, but not when decompressed
+        data = _device("post-test-bomb")
+        data["layer1"]["port"]["ifAlias"] = "x" * 10000
+        body = json.dumps(data).encode()
+        for content_type, encoded in [
+            ("application/json", body),
+            (stream.CONTENT_TYPE, b"".join(stream.encode(data))),
+        ]:
+            with patch.object(
+                ConfigServer, "api_max_data_size", return_value=1024
+            ):
+                response = self.client.post(
+                    _POST_URI,
+                    data=gzip.compress(encoded),
+                    content_type=content_type,
+                    headers={"Content-Encoding": "gzip"},
+                )
+            self.assertEqual(response.status_code, 413)
+        self.assertEqual(self._cached(), {})
+
+        # Data up to the limit is accepted
+        with patch.object(
+            ConfigServer, "api_max_data_size", return_value=len(body)
+        ):
+            response = self.client.post(
+                _POST_URI,
+                data=gzip.compress(body),
+                content_type="application/json",
+                headers={"Content-Encoding": "gzip"},
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._cached()["post-test-bomb"], data)
+
+    def test_post_device_batch(self):
+        """Testing function post_device_batch."""
+        # Devices posted in full
+        items = [_device("post-test-batch-1"), _device("post-test-batch-2")]
+        response = self._batch(items)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self._cached(),
+            {"post-test-batch-1": items[0], "post-test-batch-2": items[1]},
+        )
+        self.assertEqual(self._temporary(), [])
+
+        # Cache files that exist aren't updated
+        data = _device("post-test-batch-1")
+        data["layer1"]["port"]["ifAlias"] = "changed"
+        response = self._batch([data])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._cached()["post-test-batch-1"], items[0])
+
+    def test_post_device_batch_unchanged(self):
+        """Testing function post_device_batch with unchanged devices."""
+        # Data last ingested for a device
+        previous = _device("post-test-unchanged")
+        previous["misc"]["fingerprint"] = fingerprint.fingerprint(previous)
+        self._ingested(previous)
+
+        # The device is posted as unchanged with a new uptime, along with
+        # a device posted in full
+        data = _device("post-test-unchanged")
+        data["misc"]["fingerprint"] = previous["misc"]["fingerprint"]
+        data["misc"]["timestamp"] = 1000
+        data["system"]["SNMPv2-MIB"]["sysUpTime"] = 200
+        full = _device("post-test-full")
+        response = self._batch([fingerprint.unchanged(data), full])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self._cached(),
+            {"post-test-unchanged": data, "post-test-full": full},
+        )
+        self.assertEqual(self._temporary(), [])
+
+    def test_post_device_batch_stale(self):
+        """Testing function post_device_batch with stale devices."""
+        # The data last ingested isn't the unchanged data
+        previous = _device("post-test-stale")
+        previous["misc"]["fingerprint"] = "old"
+        self._ingested(previous)
+
+        # Devices posted as unchanged without data the server has are
+        # listed. The other devices are cached.
+        data = _device("post-test-stale")
+        data["misc"]["fingerprint"] = "new"
+        missing = _device("post-test-missing")
+        missing["misc"]["fingerprint"] = "new"
+        full = _device("post-test-full")
+        response = self._batch(
+            [
+                fingerprint.unchanged(data),
+                fingerprint.unchanged(missing),
+                full,
+            ]
+        )
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(
+            response.get_json(),
+            {"stale": ["post-test-stale", "post-test-missing"]},
+        )
+        self.assertEqual(self._cached(), {"post-test-full": full})
+
+    def test_post_device_batch_invalid(self):
+        """Testing function post_device_batch with invalid data."""
+        # Batches must be lists
+        response = self._batch(_device("post-test-dict"))
+        self.assertEqual(response.status_code, 400)
+
+        # Unsupported encodings
+        response = self.client.post(
+            _BATCH_URI,
+            data=json.dumps([_device("post-test-br")]),
+            content_type="application/json",
+            headers={"Content-Encoding": "br"},
+        )
+        self.assertEqual(response.status_code, 415)
+        self.assertEqual(self._cached(), {})
+
+    def test__cache(self):
+        """Testing function _cache."""
+        # Files are only created when all of them are written
+        items = [_device("post-test-cache-1"), _device("post-test-cache-2")]
+        with patch.object(
+            testimport.yaml, "dump", side_effect=[None, OSError("Full")]
+        ):
+            with self.assertRaises(OSError):
+                testimport._cache(items, self.config)
+        self.assertEqual(self._cached(), {})
+        self.assertEqual(self._temporary(), [])
+
+        # Files are written
+        result = testimport._cache(items, self.config)
+        self.assertEqual(result, [])
+        self.assertEqual(
+            self._cached(),
+            {"post-test-cache-1": items[0], "post-test-cache-2": items[1]},
+        )
+        self.assertEqual(self._temporary(), [])
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
@@ -3,10 +3,13 @@
 
 import os
 import sys
+import tempfile
 import unittest
 from copy import deepcopy
 
 
+import yaml
+from mock import patch
 from sqlalchemy import select
 
 # Try to create a working PYTHONPATH
@@ -73,6 +76,9 @@ from switchmap.server.db.models import IpPort
 from switchmap.server.db.table import RIpPort
 from switchmap.server.db.table import IZone
 from switchmap.server.db.table import IOui
+from switchmap.core import files
+from switchmap import AGENT_POLLER
+from switchmap.server.configuration import ConfigServer
 
 from tests.testlib_ import db as dblib
 from tests.testlib_ import data as datalib
@@ -225,6 +231,159 @@ class TestFunctions(unittest.TestCase):
         self.assertEqual(result[: self.max_loops * 3], expected)
 
 
+class TestIngest(unittest.TestCase):
+    """Checks the Ingest class."""
+
+    def test_process(self):
+        """Testing method process."""
+        # Initialize key variables
+        config = ConfigServer()
+        lockfile = files.lock_file(AGENT_POLLER, config)
+        ingested = []
+
+        def _setup(directory, _):
+            """Record the files being ingested.
+
+            Args:
+                directory: Directory of the files
+                _: ConfigServer object
+
+            Returns:
+                result: False
+
+            """
+            ingested.extend(sorted(os.listdir(directory)))
+            return False
+
+        # Files are ingested while the poller is polling devices
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, "device.yaml"), "w") as f_handle:
+                yaml.dump({"misc": {"zone": "test"}}, f_handle)
+            with open(os.path.join(directory, "other.yaml.1.tmp"), "w"):
+                pass
+            open(lockfile, "a").close()
+            try:
+                with patch.object(ingest, "setup", side_effect=_setup):
+                    ingest.Ingest(
+                        config, test=True, test_cache_directory=directory
+                    ).process()
+            finally:
+                os.remove(lockfile)
+
+            # Files being written aren't ingested
+            self.assertEqual(ingested, ["device.yaml"])
+            self.assertEqual(os.listdir(directory), ["other.yaml.1.tmp"])
+
+
+class TestComplete(unittest.TestCase):
+    """Checks the completion of partial device data."""
+
+    def test__complete(self):
+        """Testing function _complete."""
+        # Initialize key variables
+        config = ConfigServer()
+        name = "test-complete-{}".format(os.getpid())
+        filename = files.ingested_file(name, config)
+        complete = {
+            "misc": {"zone": "test"},
+            "layer1": {1: {"ifIndex": 1}},
+            "layer2": {2: {"dot1qVlanStaticName": "two"}},
+            "layer3": {"ipNetToMediaTable": {}},
+            "system": {"SNMPv2-MIB": {}},
+        }
+        partial = deepcopy(complete)
+        partial["misc"]["partial"] = ["layer1", "system"]
+        partial["layer1"] = None
+        partial["system"] = None
+        partial["layer2"] = {3: {"dot1qVlanStaticName": "three"}}
+
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, "{}.yaml".format(name))
+            try:
+                # Partial data can't be completed without previous data
+                if os.path.isfile(filename) is True:
+                    os.remove(filename)
+                result = ingest._complete(partial, filepath, config)
+                self.assertIsNone(result)
+                self.assertFalse(os.path.isfile(filename))
+
+                # Complete data is saved as is
+                with open(filepath, "w") as f_handle:
+                    yaml.dump(complete, f_handle)
+                result = ingest._complete(complete, filepath, config)
+                self.assertEqual(result, complete)
+                self.assertEqual(files.read_yaml_file(filename), complete)
+                self.assertFalse(os.path.isfile(filepath))
+
+                # Partial data gets the previous values of missing layers
+                result = ingest._complete(deepcopy(partial), filepath, config)
+                self.assertEqual(result["layer1"], complete["layer1"])
+                self.assertEqual(result["system"], complete["system"])
+                self.assertEqual(result["layer2"], partial["layer2"])
+                self.assertEqual(files.read_yaml_file(filename), result)
+                self.assertEqual(
+                    [
+                        _
+                        for _ in os.listdir(os.path.dirname(filename))
+                        if _.startswith(name) and _.endswith(".tmp")
+                    ],
+                    [],
+                )
+            finally:
+                if os.path.isfile(filename) is True:
+                    os.remove(filename)
+
+    def test__replace(self):
+        """Testing function _replace."""
+        # Initialize key variables
+        replace = os.replace
+        calls = []
+
+        def _cross_device(src, dst):
+            """Fail to move files, like os.replace() across filesystems.
+
+            Args:
+                src: File to move
+                dst: File to replace
+
+            Returns:
+                None
+
+            """
+            calls.append((src, dst))
+            if len(calls) == 1:
+                raise OSError(18, "Invalid cross-device link")
+            replace(src, dst)
+
+        with tempfile.TemporaryDirectory() as directory:
+            src = os.path.join(directory, "src.yaml")
+            dst = os.path.join(directory, "dst.yaml")
+
+            # Files are moved
+            for filename, value in [(src, "new"), (dst, "old")]:
+                with open(filename, "w") as f_handle:
+                    f_handle.write(value)
+            ingest._replace(src, dst)
+            self.assertFalse(os.path.isfile(src))
+            with open(dst) as f_handle:
+                self.assertEqual(f_handle.read(), "new")
+
+            # Files on other filesystems are copied next to the file they
+            # replace first
+            with open(src, "w") as f_handle:
+                f_handle.write("newer")
+            with patch.object(ingest.os, "replace", side_effect=_cross_device):
+                ingest._replace(src, dst)
+            self.assertEqual(len(calls), 2)
+            self.assertTrue(calls[1][0].startswith(dst))
+            self.assertEqual(calls[1][1], dst)
+            self.assertEqual(
+                sorted(os.listdir(directory)), ["dst.yaml", "src.yaml"]
+            )
+            with open(dst) as f_handle:
+                self.assertEqual(f_handle.read(), "newer")
+
+
 if __name__ == "__main__":
     # Do the unit test
     unittest.main()
@@ -205,6 +205,7 @@ class TestPollUpdateTopologyFunctions(unittest.TestCase):
                 sys_objectid=".1.3.6.1.4.1.9.1.516",
                 sys_uptime=300982385,
                 last_polled=1656692061,
+                poller_node=None,
                 enabled=1,
                 ts_modified=None,
                 ts_created=None,
@@ -253,6 +254,11 @@ class TestPollUpdateTopologyFunctions(unittest.TestCase):
                     ),
                     sys_uptime=row.sys_uptime,
                     last_polled=row.last_polled,
+                    poller_node=(
+                        None
+                        if bool(row.poller_node) is False
+                        else row.poller_node.decode()
+                    ),
                     enabled=row.enabled,
                     ts_created=None,
                     ts_modified=None,
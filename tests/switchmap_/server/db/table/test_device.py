@@ -221,6 +221,7 @@ class TestDbTableDevice(unittest.TestCase):
             sys_objectid=row.sys_objectid,
             sys_uptime=row.sys_uptime,
             last_polled=row.last_polled,
+            poller_node=data.random_string(),
             enabled=row.enabled,
         )
         testimport.update_row(idx, updated_row)
@@ -256,6 +257,7 @@ def _convert(row):
         sys_objectid=row.sys_objectid,
         sys_uptime=row.sys_uptime,
         last_polled=row.last_polled,
+        poller_node=row.poller_node,
         enabled=row.enabled,
     )
     return result
@@ -281,6 +283,7 @@ def _row():
         sys_objectid=data.random_string(),
         sys_uptime=random.randint(0, 1000000),
         last_polled=random.randint(0, 1000000),
+        poller_node=data.random_string(),
         enabled=1,
     )
     return result
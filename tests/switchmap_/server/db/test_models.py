@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Test the models module."""
+
+import unittest
+import os
+import sys
+
+# Try to create a working PYTHONPATH
+EXEC_DIR = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIR = os.path.abspath(
+    os.path.join(
+        os.path.abspath(
+            os.path.join(
+                os.path.abspath(
+                    os.path.join(
+                        os.path.abspath(os.path.join(EXEC_DIR, os.pardir)),
+                        os.pardir,
+                    )
+                ),
+                os.pardir,
+            )
+        ),
+        os.pardir,
+    )
+)
+_EXPECTED = "{0}switchmap-ng{0}tests{0}switchmap_{0}server{0}db".format(os.sep)
+if EXEC_DIR.endswith(_EXPECTED) is True:
+    # We need to prepend the path in case the repo has been installed
+    # elsewhere on the system using PIP. This could corrupt expected results
+    sys.path.insert(0, ROOT_DIR)
+else:
+    print(
+        """This script is not installed in the "{0}" directory. Please fix.\
+""".format(
+            _EXPECTED
+        )
+    )
+    sys.exit(2)
+
+
+# Create the necessary configuration to load the module
+from tests.testlib_ import setup
+
+CONFIG = setup.config()
+CONFIG.save()
+
+from sqlalchemy import inspect, text
+
+from switchmap.server.db import models as testimport
+from switchmap.server.db import ENGINE
+
+from tests.testlib_ import db
+
+
+def _columns(table):
+    """Get the columns of a database table.
+
+    Args:
+        table: Name of the table
+
+    Returns:
+        result: List of column names
+
+    """
+    # Return
+    with ENGINE.connect() as connection:
+        result = [_["name"] for _ in inspect(connection).get_columns(table)]
+    return result
+
+
+class TestDbModels(unittest.TestCase):
+    """Checks all functions and methods."""
+
+    #########################################################################
+    # General object setup
+    #########################################################################
+
+    @classmethod
+    def setUpClass(cls):
+        """Execute these steps before starting tests."""
+        # Load the configuration in case it's been deleted after loading the
+        # configuration above. Sometimes this happens when running
+        # `python3 -m unittest discover` where another the tearDownClass of
+        # another test module prematurely deletes the configuration required
+        # for this module
+        config = setup.config()
+        config.save()
+
+        # Create database tables
+        testimport.create_all_tables()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Execute these steps when all tests are completed."""
+        # Drop tables
+        database = db.Database()
+        database.drop()
+
+        # Cleanup the
+        CONFIG.cleanup()
+
+    def test_create_all_tables(self):
+        """Testing function create_all_tables."""
+        # Tables created by older versions are upgraded
+        with ENGINE.begin() as connection:
+            connection.execute(
+                text("ALTER TABLE smap_device DROP COLUMN poller_node")
+            )
+        self.assertNotIn("poller_node", _columns("smap_device"))
+        testimport.create_all_tables()
+        self.assertIn("poller_node", _columns("smap_device"))
+
+    def test_upgrade_tables(self):
+        """Testing function upgrade_tables."""
+        # Missing columns are added once
+        with ENGINE.begin() as connection:
+            connection.execute(
+                text("ALTER TABLE smap_device DROP COLUMN poller_node")
+            )
+            result = testimport.upgrade_tables(connection)
+        self.assertEqual(result, ["smap_device.poller_node"])
+        with ENGINE.begin() as connection:
+            result = testimport.upgrade_tables(connection)
+        self.assertEqual(result, [])
+
+
+if __name__ == "__main__":
+    # Do the unit test
+    unittest.main()
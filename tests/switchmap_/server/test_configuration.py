@@ -69,6 +69,13 @@ class Test_ConfigServer(unittest.TestCase):
         result = self.config.api_bind_port()
         self.assertEqual(result, expected)
 
+    def test_api_max_data_size(self):
+        """Testing function api_max_data_size."""
+        # Run test
+        expected = 1024 * 1048576
+        result = self.config.api_max_data_size()
+        self.assertEqual(result, expected)
+
     def test_cache_directory(self):
         """Testing function cache_directory."""
         # Run test
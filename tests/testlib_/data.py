@@ -85,6 +85,8 @@ dashboard:
 poller:
   username: nv2Mwx7gu9AbLGyz
   polling_interval: 21600
+  polling_engine: threads
+  polling_concurrency: 50
   server_address: bwSeAzPmAygg8rcJ
   server_bind_port: 9876
   server_username: null
@@ -92,6 +94,9 @@ poller:
   server_https: False
   zones:
     - zone: SITE-A
+      polling_interval: 300
+      polling_intervals:
+        hostname1: 60
       hostnames:
         - hostname1
         - hostname2
@@ -172,6 +172,7 @@ def populate():
             sys_objectid=data.random_string(),
             sys_uptime=random.randint(0, 1000000),
             last_polled=random.randint(0, 1000000),
+            poller_node=data.random_string(),
             enabled=1,
         )
     ]